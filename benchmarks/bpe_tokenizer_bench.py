@@ -0,0 +1,89 @@
+"""
+Micro-benchmark: BPE merging of long pieces.
+
+Compares the legacy merge loop (rescans every adjacent pair after each
+merge, O(n²) per piece) against BpeTokenizer._merge in
+src/backend/analyzers/bpe_tokenizer.py, which hands pieces longer than
+SHORT_PIECE_BYTES to a heap-based merge. Long runs of a single character
+(indentation, '=' rulers, minified or generated files) are the worst case:
+the pre-tokenizer keeps them as one piece.
+
+Run from the repo root:
+    python benchmarks/bpe_tokenizer_bench.py
+"""
+import os
+import random
+import string
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.backend.analyzers.bpe_tokenizer import get_tokenizer
+
+
+def legacy_merge(ranks, piece):
+    """The original rescan-every-pair merge (kept for comparison)."""
+    parts = [piece[i:i + 1] for i in range(len(piece))]
+    while len(parts) > 1:
+        best_rank = None
+        best_index = -1
+        for i in range(len(parts) - 1):
+            rank = ranks.get(parts[i] + parts[i + 1])
+            if rank is not None and (best_rank is None or rank < best_rank):
+                best_rank, best_index = rank, i
+        if best_rank is None:
+            break
+        parts[best_index:best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+    return parts
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(legacy_limit=4_000):
+    tokenizer = get_tokenizer()
+    if tokenizer is None:
+        print("No tokenizer vocabulary found (see assets/tokenizer/README.md)")
+        return
+
+    rng = random.Random(0)
+    letters = lambda n: ''.join(rng.choice(string.ascii_letters) for _ in range(n)).encode()
+
+    # Equivalence: random pieces of every size class, plus single-character runs
+    for _ in range(500):
+        piece = letters(rng.randint(1, 300))
+        assert legacy_merge(tokenizer.ranks, piece) == tokenizer._merge(piece), "Output mismatch"
+    for char in b" =x-#":
+        piece = bytes([char]) * 1_000
+        assert legacy_merge(tokenizer.ranks, piece) == tokenizer._merge(piece), "Output mismatch"
+
+    cases = [
+        ("4k spaces", b" " * 4_000),
+        ("20k spaces", b" " * 20_000),
+        ("20k '='", b"=" * 20_000),
+        ("20k 'x'", b"x" * 20_000),
+        ("2k random letters", letters(2_000)),
+        ("8k random letters", letters(8_000)),
+        ("32k random letters", letters(32_000)),
+    ]
+
+    print(f"Tokenizer: {tokenizer.name}; legacy timed up to {legacy_limit:,} bytes\n")
+    print(f"{'case':<22}{'tokens':>8}{'legacy':>12}{'new':>12}{'speedup':>10}")
+    for label, piece in cases:
+        t_new, parts = timed(lambda: tokenizer._merge(piece))
+        if len(piece) <= legacy_limit:
+            t_old, old_parts = timed(lambda: legacy_merge(tokenizer.ranks, piece))
+            assert old_parts == parts, "Output mismatch"
+            old_col, speedup = f"{t_old * 1000:>10.1f}ms", f"{t_old / t_new:>9.1f}x"
+        else:
+            old_col, speedup = f"{'(skipped)':>12}", f"{'-':>10}"
+        print(f"{label:<22}{len(parts):>8}{old_col}{t_new * 1000:>10.1f}ms{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark: PDF content sanitization.
+
+Compares the legacy per-character loop against the translation-table
+implementation in src/backend/exporter.py, using this repository's own
+Python sources as realistic input.
+
+Run from the repo root:
+    python benchmarks/pdf_sanitize_bench.py
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.backend.exporter import (
+    MAX_FILE_SIZE_FOR_PDF,
+    _prepare_content_for_pdf,
+    _sanitize_content_for_pdf,
+    _truncate_content,
+)
+
+
+def legacy_sanitize(content):
+    """The original per-character implementation (kept for comparison)."""
+    if not content:
+        return ""
+    content = content.replace('\x00', '')
+    content = content.replace('\t', '    ')
+    sanitized = []
+    for char in content:
+        if char == '\n' or char == '\r' or (ord(char) >= 32 and ord(char) < 127) or ord(char) >= 160:
+            sanitized.append(char)
+        else:
+            sanitized.append(' ')
+    return ''.join(sanitized)
+
+
+def load_corpus(target_chars=MAX_FILE_SIZE_FOR_PDF):
+    """Concatenate the repo's .py files into one ~100 KB 'file', with a few odd chars mixed in."""
+    chunks = []
+    for folder, _, files in os.walk(os.path.join(ROOT, 'src')):
+        for name in sorted(files):
+            if name.endswith('.py'):
+                with open(os.path.join(folder, name), 'r', encoding='utf-8') as f:
+                    chunks.append(f.read())
+    text = '\n'.join(chunks) + '\t\x00\x07\x1b[0m — ✔ 📄\n'
+    while len(text) < target_chars:
+        text += text
+    return text[:target_chars]
+
+
+def main(repeat=5, files=20):
+    text = load_corpus()
+    ascii_text = text.encode('ascii', 'ignore').decode('ascii')
+    oversized = text * 3  # Exercises the truncate-before-sanitize path
+
+    for sample in (text, ascii_text):
+        assert legacy_sanitize(sample) == _sanitize_content_for_pdf(sample), "Output mismatch"
+
+    cases = [
+        ("sanitize 100 KB (unicode)", lambda: legacy_sanitize(text), lambda: _sanitize_content_for_pdf(text)),
+        ("sanitize 100 KB (ascii)",
+         lambda: legacy_sanitize(ascii_text),
+         lambda: _sanitize_content_for_pdf(ascii_text)),
+        ("300 KB file (sanitize+truncate)",
+         lambda: _truncate_content(legacy_sanitize(oversized)),
+         lambda: _prepare_content_for_pdf(oversized)),
+    ]
+
+    print(f"Corpus: {len(text):,} chars of Python source, {files} files per run, best of {repeat}\n")
+    print(f"{'case':<34}{'legacy':>12}{'new':>12}{'speedup':>10}")
+    for label, old, new in cases:
+        t_old = min(timeit.repeat(old, number=files, repeat=repeat))
+        t_new = min(timeit.repeat(new, number=files, repeat=repeat))
+        print(f"{label:<34}{t_old * 1000:>10.1f}ms{t_new * 1000:>10.1f}ms{t_old / t_new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Micro-benchmark: opening preview tabs.
+
+Compares the legacy setup (a new lexer per tab, themed with a font probed
+through QFontInfo for every style) against the pooled lexers and the
+session-wide editor font in src/frontend/components/canvas_preview.py.
+Each round opens one tab per language using this repository's own files
+as content, then closes them all, through preview_file() and close_tab().
+Whole tabs are timed from preview_file() to the editor being ready, and
+the lexer setup inside each of them on its own.
+
+Run from the repo root (no window is shown):
+    python benchmarks/tab_open_bench.py
+"""
+import os
+import sys
+import statistics
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QApplication
+
+from src.frontend.components import canvas_preview
+from src.frontend.components.canvas_preview import CanvasPreview, resolve_editor_font
+
+SAMPLE_EXTENSIONS = ['.py', '.json', '.md', '.js', '.css', '.html', '.yaml', '.sh', '.sql', '.cpp']
+
+
+class LegacyCanvasPreview(CanvasPreview):
+    """The original setup: a fresh lexer per tab, every style probing the font families."""
+
+    def _themed_lexer(self, ext):
+        lexer_class = self._lexer_class(ext)
+        if lexer_class is None:
+            return None
+        lexer = lexer_class()
+        lexer.setDefaultFont(resolve_editor_font())
+        lexer.setDefaultPaper(QColor("#FFFFFF"))
+        lexer.setDefaultColor(QColor("#24292E"))
+        saved = canvas_preview.get_editor_font
+        canvas_preview.get_editor_font = resolve_editor_font
+        try:
+            self._apply_vscode_theme(lexer)
+        finally:
+            canvas_preview.get_editor_font = saved
+        return lexer
+
+    def _release_lexer(self, editor):
+        lexer = editor.lexer()
+        if lexer is not None:
+            editor.setLexer(None)
+            lexer.deleteLater()
+
+
+def load_samples():
+    """One (name, content) per sample extension, from the repo's files where it has one."""
+    found = {}
+    for folder, dirs, files in os.walk(ROOT):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ('__pycache__', 'User_Data')]
+        for name in sorted(files):
+            ext = os.path.splitext(name)[1].lower()
+            if ext in SAMPLE_EXTENSIONS and ext not in found:
+                try:
+                    with open(os.path.join(folder, name), 'r', encoding='utf-8') as f:
+                        content = f.read(20_000)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                found[ext] = (name, content)
+    filler = "\n".join(f"line {i}" for i in range(200))
+    return [found.get(ext, (f"sample{ext}", filler)) for ext in SAMPLE_EXTENSIONS]
+
+
+def time_tabs(preview, samples, rounds):
+    """
+    (tab open, lexer setup) latencies in ms over rounds of opening and
+    closing one tab per sample, timing the preview's own lexer setup.
+    """
+    tab_latencies, lexer_latencies = [], []
+    themed_lexer = preview._themed_lexer
+
+    def timed_lexer(ext):
+        start = time.perf_counter()
+        lexer = themed_lexer(ext)
+        lexer_latencies.append((time.perf_counter() - start) * 1000)
+        return lexer
+
+    preview._themed_lexer = timed_lexer
+    for round_no in range(rounds):
+        for name, content in samples:
+            node = {"name": name, "content": content, "size_bytes": len(content)}
+            start = time.perf_counter()
+            preview.preview_file(node, f"/bench/{round_no}/{name}")
+            tab_latencies.append((time.perf_counter() - start) * 1000)
+            if preview._lexer_class(os.path.splitext(name)[1]) is not None:
+                assert preview.tabs.currentWidget().lexer() is not None, f"{name} opened without a lexer"
+        while preview.tabs.count():
+            preview.close_tab(0)
+    del preview._themed_lexer
+    return tab_latencies, lexer_latencies
+
+
+def report(label, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<22}{latencies[0]:>10.3f}ms{statistics.median(latencies):>8.3f}ms"
+          f"{statistics.mean(latencies):>8.3f}ms{p95:>8.3f}ms")
+
+
+def main(rounds=10):
+    app = QApplication.instance() or QApplication(sys.argv)
+    samples = load_samples()
+
+    print(f"{len(samples)} languages per round, {rounds} rounds\n")
+    print(f"{'case':<22}{'first':>12}{'median':>10}{'mean':>10}{'p95':>10}")
+    for label, preview_class in (("legacy", LegacyCanvasPreview), ("pooled", CanvasPreview)):
+        preview = preview_class()
+        tabs, lexers = time_tabs(preview, samples, rounds)
+        report(f"lexer setup ({label})", lexers)
+        report(f"tab open ({label})", tabs)
+        preview.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Calibration: per-language token estimator vs a reference BPE tokenizer.
+
+Collects a sample corpus per language family, counts reference tokens with
+a local tiktoken vocabulary (e.g. cl100k_base.tiktoken), fits non-negative
+coefficients per family, and reports the error of the flat len/4 rule and
+of the calibrated estimator on a held-out half of the corpus.
+
+Paste the printed COEFFICIENTS / TREE_CHARS_PER_TOKEN into
+src/backend/analyzers/token_heuristics.py to apply a new fit.
+
+Run from the repo root:
+    python benchmarks/token_calibration.py --vocab path/to/cl100k_base.tiktoken [--corpus DIR ...]
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.backend.analyzers.bpe_tokenizer import BpeTokenizer, find_vocab_file
+from src.backend.analyzers.token_heuristics import (
+    COEFFICIENTS, FEATURES, LANGUAGE_FAMILIES, classify_language, estimate_text_tokens, text_features,
+)
+from src.backend.exporter import generate_tree_text
+from src.backend.scanner import scan_directory_structure
+
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv', 'proc', 'sys'}
+
+
+def collect_corpus(roots, per_family, min_bytes=200, max_bytes=200_000):
+    """{family: [(path, text), ...]} with at most per_family files each."""
+    corpus = {family: [] for family in list(LANGUAGE_FAMILIES) + ['default']}
+    for root in roots:
+        for folder, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                family = classify_language(name)
+                if family == 'default' or len(corpus[family]) >= per_family:
+                    continue
+                path = os.path.join(folder, name)
+                try:
+                    if not min_bytes <= os.path.getsize(path) <= max_bytes:
+                        continue
+                    with open(path, 'r', encoding='utf-8') as f:
+                        corpus[family].append((path, f.read()))
+                except (OSError, UnicodeDecodeError):
+                    continue
+            if all(len(files) >= per_family for fam, files in corpus.items() if fam != 'default'):
+                return corpus
+    return corpus
+
+
+# Lower bound per coefficient. Non-ASCII text (CJK, emoji) is rare in most
+# samples, so its weight is kept near the ~1 token/char it really costs.
+LOWER_BOUNDS = {**dict.fromkeys(FEATURES, 0.0), 'non_ascii': 0.7}
+
+
+def fit_nnls(rows, targets, iterations=2000):
+    """Bounded least squares, each row weighted by 1/target (relative error)."""
+    n = len(FEATURES)
+    a = [[0.0] * n for _ in range(n)]
+    b = [0.0] * n
+    for x, y in zip(rows, targets):
+        w = 1.0 / max(y, 1)
+        for i in range(n):
+            b[i] += w * x[i] * y
+            for j in range(n):
+                a[i][j] += w * x[i] * x[j]
+    lower = [LOWER_BOUNDS[f] for f in FEATURES]
+    beta = list(lower)
+    for _ in range(iterations):
+        for j in range(n):
+            if a[j][j] <= 0:
+                continue
+            grad = b[j] - sum(a[j][k] * beta[k] for k in range(n))
+            beta[j] = max(lower[j], beta[j] + grad / a[j][j])
+    return tuple(round(v, 4) for v in beta)
+
+
+def mean_abs_error(pairs):
+    """Mean absolute relative error (per file) and error of the summed total."""
+    if not pairs:
+        return 0.0, 0.0
+    per_file = sum(abs(est - ref) / ref for est, ref in pairs) / len(pairs)
+    total_est, total_ref = sum(p[0] for p in pairs), sum(p[1] for p in pairs)
+    return per_file, (total_est - total_ref) / total_ref
+
+
+def is_holdout(path):
+    return hashlib.md5(path.encode()).digest()[0] & 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vocab', default=find_vocab_file(), help="tiktoken rank file used as reference")
+    parser.add_argument('--corpus', nargs='*', default=[ROOT, os.path.dirname(os.__file__)])
+    parser.add_argument('--per-family', type=int, default=400)
+    args = parser.parse_args()
+
+    if not args.vocab or not os.path.isfile(args.vocab):
+        sys.exit("No reference vocabulary: pass --vocab path/to/cl100k_base.tiktoken")
+
+    reference = BpeTokenizer.from_file(args.vocab)
+    corpus = collect_corpus(args.corpus, args.per_family)
+
+    fitted = {}
+    report = []
+    all_rows, all_targets = [], []
+    for family, files in corpus.items():
+        if family == 'default':
+            continue
+        train, test = [], []
+        for path, text in files:
+            ref = reference.count_uncached(text)
+            if ref:
+                (test if is_holdout(path) else train).append((path, text, ref))
+        if len(train) < 10:
+            fitted[family] = None  # Falls back to the fit on all families
+            report.append((family, len(train), len(test), None, None))
+            continue
+
+        rows = [text_features(text) for _, text, _ in train]
+        targets = [ref for _, _, ref in train]
+        fitted[family] = fit_nnls(rows, targets)
+        all_rows.extend(rows)
+        all_targets.extend(targets)
+
+        flat = [(max(1, len(text) // 4), ref) for _, text, ref in test]
+        calibrated = [
+            (sum(c * f for c, f in zip(fitted[family], text_features(text))), ref) for _, text, ref in test
+        ]
+        report.append((family, len(train), len(test), mean_abs_error(flat), mean_abs_error(calibrated)))
+
+    fitted['default'] = fit_nnls(all_rows, all_targets) if all_rows else COEFFICIENTS['default']
+    for family, coefficients in fitted.items():
+        if coefficients is None:
+            fitted[family] = fitted['default']
+
+    # Tree section: one chars-per-token ratio (it is only known as a length in the estimator)
+    tree_chars = tree_tokens = 0
+    for root in args.corpus:
+        for entry in sorted(os.listdir(root))[:20]:
+            path = os.path.join(root, entry)
+            if os.path.isdir(path) and entry not in SKIP_DIRS:
+                tree = generate_tree_text(scan_directory_structure(path))
+                tree_chars += len(tree)
+                tree_tokens += reference.count_uncached(tree)
+
+    print(f"Reference: {reference.name} ({args.vocab})")
+    print(f"Held-out error per file (mean |est-ref|/ref) and on the total\n")
+    print(f"{'family':<10}{'train':>7}{'test':>6}   {'len/4 file':>10}{'total':>8}   {'calib file':>10}{'total':>8}")
+    for family, n_train, n_test, flat, calibrated in report:
+        if flat is None:
+            print(f"{family:<10}{n_train:>7}{n_test:>6}   (too few files, default coefficients)")
+            continue
+        print(f"{family:<10}{n_train:>7}{n_test:>6}   {flat[0]:>10.1%}{flat[1]:>+8.1%}   "
+              f"{calibrated[0]:>10.1%}{calibrated[1]:>+8.1%}")
+
+    print("\nCOEFFICIENTS = {")
+    for family, coefficients in fitted.items():
+        values = ', '.join(f"{v:.4f}" for v in coefficients)
+        print(f"    {repr(family) + ':':<11}({values}),")
+    print("}")
+    if tree_chars:
+        print(f"TREE_CHARS_PER_TOKEN = {tree_chars / max(tree_tokens, 1):.3f}")
+
+    # Speed of the estimator itself
+    sample = ''.join(text for files in corpus.values() for _, text in files[:50])
+    start = time.perf_counter()
+    estimate_text_tokens(sample, 'x.py')
+    elapsed = time.perf_counter() - start
+    print(f"\nEstimator speed: {len(sample) / elapsed / 1e6:.0f} M chars/s ({len(sample):,} chars)")
+
+
+if __name__ == "__main__":
+    main()
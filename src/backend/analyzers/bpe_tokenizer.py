@@ -0,0 +1,226 @@
+import os
+import re
+import base64
+import hashlib
+import heapq
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from src.config import resource_path, get_config_dir
+
+logger = logging.getLogger(__name__)
+
+# ---- PRE-TOKENIZATION ----
+
+# cl100k_base split pattern, rewritten for the stdlib `re` module
+# (no \p{..} classes): letters = [^\W\d_], numbers = \d, "not letter/number" = (?:_|[^\w]).
+CL100K_PATTERN = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)"
+    r"|(?:_|[^\r\n\w])?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:_|[^\s\w])+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+# Where a vocabulary is looked up: one the user installed first, then the bundled one
+VOCAB_DIRS = (os.path.join(get_config_dir(), "tokenizer"), resource_path("assets/tokenizer"))
+VOCAB_PREFERENCE = ("o200k_base.tiktoken", "cl100k_base.tiktoken")
+
+# Longer pieces are merged with a heap instead of rescanning every pair
+SHORT_PIECE_BYTES = 64
+
+
+def load_tiktoken_ranks(path):
+    """Read a tiktoken rank file: one `<base64 token> <rank>` pair per line."""
+    ranks = {}
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            token, rank = line.split()
+            ranks[base64.b64decode(token)] = int(rank)
+    return ranks
+
+
+class BpeTokenizer:
+    """
+    Pure-Python byte-level BPE (same merge rule as tiktoken).
+
+    Text is split with the pre-tokenization regex, and each piece is merged
+    independently. Pieces repeat a lot in source code (keywords, indentation,
+    operators), so per-piece token counts are memoized in an LRU cache, and
+    whole-text counts are cached by content hash for unchanged files.
+    """
+
+    def __init__(self, ranks, pattern=CL100K_PATTERN, name="bpe", piece_cache_size=200_000, text_cache_size=50_000):
+        self.name = name
+        self.ranks = ranks
+        self._decoder = None
+        self._split = re.compile(pattern).findall
+        self._piece_tokens = lru_cache(maxsize=piece_cache_size)(self._piece_tokens_uncached)
+        self._text_cache = OrderedDict()  # digest -> token count
+        self._text_cache_size = text_cache_size
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path):
+        name = os.path.basename(path).split('.')[0]
+        return cls(load_tiktoken_ranks(path), name=name)
+
+    # --- BPE core ---
+
+    def _merge(self, piece):
+        """Split piece (bytes) into BPE tokens by repeatedly merging the lowest ranked adjacent pair."""
+        if len(piece) > SHORT_PIECE_BYTES:
+            return self._merge_long(piece)
+        ranks = self.ranks
+        parts = [piece[i:i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            best_rank = None
+            best_index = -1
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best_index = rank, i
+            if best_rank is None:
+                break
+            parts[best_index:best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+        return parts
+
+    def _merge_long(self, piece):
+        """
+        _merge() for long pieces (minified code, long runs of one character):
+        same merges in the same order, in O(n log n) instead of O(n²).
+
+        Parts are a linked list of byte offsets, and candidate pairs sit in a
+        heap keyed by (rank, offset): the lowest rank, leftmost first, as in
+        the rescan. A merge only adds the two pairs next to the merged part;
+        heap entries whose parts changed since they were pushed are skipped.
+        """
+        ranks = self.ranks
+        n = len(piece)
+        ends = list(range(1, n + 1))  # ends[i]: end offset of the part starting at i
+        prevs = list(range(-1, n - 1))
+        alive = [True] * n
+
+        heap = []
+        for i in range(n - 1):
+            rank = ranks.get(piece[i:i + 2])
+            if rank is not None:
+                heap.append((rank, i, i + 2))
+        heapq.heapify(heap)
+
+        def push(start):
+            mid = ends[start]
+            if mid < n:
+                rank = ranks.get(piece[start:ends[mid]])
+                if rank is not None:
+                    heapq.heappush(heap, (rank, start, ends[mid]))
+
+        while heap:
+            _, start, end = heapq.heappop(heap)
+            mid = ends[start] if alive[start] else n
+            if mid >= n or ends[mid] != end:
+                continue  # One of the two parts changed since this pair was pushed
+            ends[start] = end
+            alive[mid] = False
+            if end < n:
+                prevs[end] = start
+            push(start)
+            if prevs[start] >= 0:
+                push(prevs[start])
+
+        parts = []
+        i = 0
+        while i < n:
+            parts.append(piece[i:ends[i]])
+            i = ends[i]
+        return parts
+
+    def _piece_tokens_uncached(self, piece):
+        data = piece.encode('utf-8', 'surrogatepass')
+        if data in self.ranks:
+            return 1
+        return len(self._merge(data))
+
+    def encode(self, text):
+        """Token ids for text (bytes missing from the vocabulary are skipped)."""
+        ids = []
+        for piece in self._split(text):
+            data = piece.encode('utf-8', 'surrogatepass')
+            if data in self.ranks:
+                ids.append(self.ranks[data])
+            else:
+                ids.extend(self.ranks[p] for p in self._merge(data) if p in self.ranks)
+        return ids
+
+    def decode(self, ids):
+        if self._decoder is None:
+            self._decoder = {rank: token for token, rank in self.ranks.items()}
+        return b''.join(self._decoder[i] for i in ids).decode('utf-8', 'replace')
+
+    # --- Counting ---
+
+    def count_uncached(self, text):
+        piece_tokens = self._piece_tokens
+        return sum(piece_tokens(piece) for piece in self._split(text))
+
+    def count(self, text):
+        """Token count of text, cached by content hash."""
+        if not text:
+            return 0
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            if key in self._text_cache:
+                self._text_cache.move_to_end(key)
+                return self._text_cache[key]
+
+        count = self.count_uncached(text)
+
+        with self._lock:
+            self._text_cache[key] = count
+            while len(self._text_cache) > self._text_cache_size:
+                self._text_cache.popitem(last=False)
+        return count
+
+
+def find_vocab_file():
+    """First available *.tiktoken vocabulary (preferred names first), or None."""
+    for folder in VOCAB_DIRS:
+        if not os.path.isdir(folder):
+            continue
+        for name in VOCAB_PREFERENCE:
+            path = os.path.join(folder, name)
+            if os.path.isfile(path):
+                return path
+        for name in sorted(os.listdir(folder)):
+            if name.endswith('.tiktoken'):
+                return os.path.join(folder, name)
+    return None
+
+
+_tokenizer = None
+_tokenizer_loaded = False
+_load_lock = threading.Lock()
+
+
+def get_tokenizer():
+    """Shared BPE tokenizer, or None if no vocabulary file is installed (loaded once)."""
+    global _tokenizer, _tokenizer_loaded
+    if _tokenizer_loaded:
+        return _tokenizer
+    with _load_lock:
+        if not _tokenizer_loaded:
+            path = find_vocab_file()
+            if path:
+                try:
+                    _tokenizer = BpeTokenizer.from_file(path)
+                    logger.info(f"Loaded BPE vocabulary {path} ({len(_tokenizer.ranks):,} tokens)")
+                except Exception as e:
+                    logger.error(f"Could not load BPE vocabulary {path}: {e}")
+            _tokenizer_loaded = True
+    return _tokenizer
@@ -0,0 +1,127 @@
+import re
+from dataclasses import dataclass, asdict, fields
+from datetime import datetime
+
+# ---- SCORING CONFIG ----
+
+# File names that usually start or describe a project
+ENTRY_POINT_NAMES = {
+    'main.py', '__main__.py', 'app.py', 'manage.py', 'setup.py', 'pyproject.toml', 'requirements.txt',
+    'index.js', 'index.ts', 'main.js', 'main.ts', 'server.js', 'app.js', 'app.tsx', 'package.json',
+    'main.go', 'go.mod', 'main.rs', 'lib.rs', 'Cargo.toml', 'Program.cs', 'Main.java', 'pom.xml',
+    'Makefile', 'Dockerfile', 'README.md', 'README.rst', 'README.txt', 'README',
+}
+
+_TEST_PATH = re.compile(
+    r'(^|/)(tests?|__tests__|spec|specs)/'      # test folders
+    r'|(^|/)test_[^/]*$|_test\.[^/]+$'          # test_x.py, x_test.go
+    r'|\.(test|spec)\.[^/]+$'                   # x.test.js, x.spec.ts
+    r'|(^|/)conftest\.py$',
+    re.IGNORECASE
+)
+
+
+@dataclass
+class RankingWeights:
+    """
+    Weight of each factor in a file's score. Every factor is scaled to 0..1,
+    so weights are directly comparable. Set a weight to 0 to ignore a factor.
+    """
+    entry_point: float = 3.0   # Known entry / manifest file names
+    recency: float = 1.5       # Newest modification = 1, oldest = 0
+    small_size: float = 1.0    # Small files cost little and are read whole
+    shallow: float = 1.0       # Files near the root
+    non_test: float = 1.0      # Not a test file / not under a tests folder
+
+    @classmethod
+    def from_dict(cls, values):
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: float(v) for k, v in (values or {}).items() if k in known})
+
+    def to_dict(self):
+        return asdict(self)
+
+
+DEFAULT_WEIGHTS = RankingWeights()
+
+
+def is_test_path(path):
+    return bool(_TEST_PATH.search(path.replace('\\', '/')))
+
+
+def _timestamp(node):
+    try:
+        return datetime.fromisoformat(node.get('last_modified') or '').timestamp()
+    except ValueError:
+        return None
+
+
+# ---- RANKING ----
+
+@dataclass
+class RankedFile:
+    node: dict
+    tokens: int
+    score: float
+
+
+@dataclass
+class BudgetSelection:
+    included: list    # [RankedFile], best first
+    excluded: list    # [RankedFile], best first
+    tokens: int       # Tokens used by included files (plus any reserve)
+
+
+class FileRanker:
+    """
+    Scores every file once, then picks files for any token budget.
+
+    Token counts come from `token_counter(node)` and are computed once per
+    file in the constructor; `select()` is a single pass over the ranked
+    list, so trying different budgets stays interactive on large trees.
+    """
+
+    def __init__(self, file_nodes, token_counter, weights=None):
+        self.weights = weights or DEFAULT_WEIGHTS
+        nodes = list(file_nodes)
+        tokens = [token_counter(node) for node in nodes]
+
+        stamps = [_timestamp(node) for node in nodes]
+        known = [s for s in stamps if s is not None]
+        oldest, newest = (min(known), max(known)) if known else (0.0, 0.0)
+        span = (newest - oldest) or 1.0
+
+        w = self.weights
+        self.files = []
+        for node, count, stamp in zip(nodes, tokens, stamps):
+            path = node.get('path', '')
+            score = (
+                w.entry_point * (node.get('name') in ENTRY_POINT_NAMES)
+                + w.recency * ((stamp - oldest) / span if stamp is not None else 0.0)
+                + w.small_size * (1.0 / (1.0 + count / 1000))
+                + w.shallow * (1.0 / (1.0 + path.replace('\\', '/').count('/')))
+                + w.non_test * (not is_test_path(path))
+            )
+            self.files.append(RankedFile(node, count, score))
+
+        # Best first; ties keep scan order
+        self.files.sort(key=lambda f: f.score, reverse=True)
+
+    @property
+    def total_tokens(self):
+        return sum(f.tokens for f in self.files)
+
+    def select(self, token_budget, reserved=0):
+        """
+        Greedy fill: walk files best first and take each one that still fits.
+        A file that does not fit is skipped, smaller lower-ranked files may still go in.
+        """
+        used = reserved
+        included, excluded = [], []
+        for ranked in self.files:
+            if used + ranked.tokens <= token_budget:
+                included.append(ranked)
+                used += ranked.tokens
+            else:
+                excluded.append(ranked)
+        return BudgetSelection(included, excluded, used)
@@ -0,0 +1,259 @@
+import threading
+from dataclasses import dataclass
+
+from src.backend.utils import get_file_heading, sanitize_content
+from src.backend.redactor import get_redactor
+from src.backend.file_iterator import FileIterator
+from src.backend.analyzers.bpe_tokenizer import get_tokenizer
+from src.backend.analyzers.token_logic import estimate_tokens_from_text
+from src.backend.analyzers.token_heuristics import TREE_CHARS_PER_TOKEN
+
+# Private key on scan nodes holding their NodeTokens (stripped from JSON exports)
+TOKENS_KEY = '_tokens'
+
+# Aggregation may run on a worker thread while the GUI detaches nodes
+_lock = threading.RLock()
+
+# ---- EXPORT LAYOUT (mirrors exporter.generate_tree_text / generate_full_text) ----
+
+TREE_MAX_DEPTH = 50                      # _build_tree_string max_depth
+TREE_TRUNCATED = "... (truncated - too deep)"
+TREE_PREFIX_CHARS = 4                    # '│   ' / '    ' per level
+TREE_LINE_CHARS = 4 + 2                  # connector '├── ' + '📁 ' / '📄 '
+SECTION_EXTRA_CHARS = 1 + 1 + 52 + 1     # '\n' heading '\n' content + separator, + join '\n'
+CONTENTS_HEADER_CHARS = 51 + 18 + 51 + 3  # "Code File Contents" banner + join newlines
+SECTION_SEPARATOR = "\n" + "=" * 50 + "\n"
+CONTENTS_HEADER = "\n".join(("\n" + "=" * 50, "Code File Contents", "=" * 50 + "\n"))
+
+
+@dataclass
+class NodeTokens:
+    """
+    One node's share of the text export.
+    tree_chars:     length of the node's rendered subtree in the tree section (folders)
+    content_chars:  length of the file sections below (or of) this node
+    files:          number of files with exported content
+    content_tokens: tokens of those file sections (BPE if installed, else calibrated per language)
+    """
+    tree_chars: int
+    content_chars: int
+    files: int
+    source: object = None         # (content, redactor, tokenizer) a file's count was computed from
+    content_tokens: int = 0
+
+    @property
+    def tokens(self):
+        return self.content_tokens
+
+
+def file_tokens(node):
+    """Cached NodeTokens for a file node. Recomputed only if its content, the redaction rules or the tokenizer change."""
+    content = node.get('content')
+    source = (content, get_redactor(), get_tokenizer())
+    cached = node.get(TOKENS_KEY)
+    if cached is not None and cached.source is not None \
+            and all(a is b for a, b in zip(cached.source, source)):
+        return cached
+
+    if content:
+        heading = get_file_heading(node.get('path', 'unknown'))
+        sanitized = sanitize_content(content)
+        chars = len(heading) + len(sanitized) + SECTION_EXTRA_CHARS
+        section = '\n'.join((heading, sanitized, SECTION_SEPARATOR))
+        result = NodeTokens(0, chars, 1, source, estimate_tokens_from_text(section, node.get('path')))
+    else:
+        result = NodeTokens(0, 0, 0, source, 0)
+    node[TOKENS_KEY] = result
+    return result
+
+
+def _fold_folder(node, depth):
+    """NodeTokens of a folder from its children's (already computed) counts."""
+    content_chars = files = 0
+    tree_chars = elements = 0
+    content_tokens = 0
+    line_base = TREE_PREFIX_CHARS * depth + TREE_LINE_CHARS
+
+    for child in node.get('children', []):
+        name_len = len(child.get('name', 'unknown'))
+        if child.get('type') == 'folder':
+            agg = child[TOKENS_KEY]
+            tree_chars += line_base + name_len + 1  # trailing '/'
+            elements += 1
+            if agg.tree_chars:
+                tree_chars += agg.tree_chars
+                elements += 1
+        else:
+            tree_chars += line_base + name_len
+            elements += 1
+            if child.get('type') != 'file':
+                continue
+            agg = file_tokens(child)
+        content_chars += agg.content_chars
+        files += agg.files
+        content_tokens += agg.content_tokens
+
+    if depth > TREE_MAX_DEPTH:
+        tree_chars = TREE_PREFIX_CHARS * depth + len(TREE_TRUNCATED)
+    elif elements:
+        tree_chars += elements - 1  # '\n' between lines
+    return NodeTokens(tree_chars, content_chars, files, content_tokens=content_tokens)
+
+
+def aggregate_tokens(root, refresh=False):
+    """
+    Compute NodeTokens bottom-up for every folder (and file) under root and
+    cache them on the nodes. Only files whose content changed are re-measured,
+    so a refresh is O(nodes) with no text building.
+
+    Once computed, the root total is kept up to date by detach_child() and
+    returned as is; pass refresh=True after changing the tree any other way.
+    """
+    if not root:
+        return NodeTokens(0, 0, 0)
+    with _lock:
+        if not refresh and TOKENS_KEY in root:
+            return root[TOKENS_KEY]
+        return _aggregate(root)
+
+
+def _aggregate(root):
+    stack = [(root, 0, False)]
+    while stack:
+        node, depth, children_done = stack.pop()
+        if children_done:
+            node[TOKENS_KEY] = _fold_folder(node, depth)
+            continue
+        stack.append((node, depth, True))
+        for child in node.get('children', []):
+            if child.get('type') == 'folder':
+                stack.append((child, depth + 1, False))
+    return root[TOKENS_KEY]
+
+
+# ---- INCREMENTAL UPDATES ----
+
+def _tree_line_chars(child, depth):
+    """Length of child's own line in its parent's tree (parent at depth)."""
+    chars = TREE_PREFIX_CHARS * depth + TREE_LINE_CHARS + len(child.get('name', 'unknown'))
+    return chars + 1 if child.get('type') == 'folder' else chars
+
+
+def detach_child(ancestors, child):
+    """
+    Remove child from ancestors[-1]['children'] and subtract its cached counts
+    from every ancestor: O(depth) instead of re-aggregating the tree.
+    ancestors is the chain from the root (depth 0) to the parent.
+
+    Does nothing to the counts if the tree was never aggregated.
+    """
+    detach_children(ancestors, [child])
+
+
+def detach_children(ancestors, children):
+    """detach_child() for several children of the same parent; its children list is rebuilt once."""
+    with _lock:
+        parent = ancestors[-1]
+        gone = set(map(id, children))
+        parent['children'] = [c for c in parent.get('children', []) if id(c) not in gone]
+        if TOKENS_KEY not in ancestors[0]:
+            return
+        last = len(children) - 1
+        for i, child in enumerate(children):
+            _detach(ancestors, child, emptied=i == last and not parent['children'])
+
+
+def _detach(ancestors, child, emptied):
+    parent = ancestors[-1]
+    removed = child.get(TOKENS_KEY)
+    if removed is None:
+        removed = file_tokens(child) if child.get('type') == 'file' else aggregate_tokens(child)
+
+    # Tree text: the parent loses the child's line and, for folders, its subtree
+    depth = len(ancestors) - 1
+    parent_tree = parent[TOKENS_KEY].tree_chars
+    if depth <= TREE_MAX_DEPTH:
+        if emptied:
+            parent_tree = 0
+        else:
+            parent_tree -= _tree_line_chars(child, depth) + 1
+            if child.get('type') == 'folder' and removed.tree_chars:
+                parent_tree -= removed.tree_chars + 1
+
+    # Walk up: each ancestor reacts to the change of its child's subtree length
+    child_old = child_new = None
+    for level in range(depth, -1, -1):
+        agg = ancestors[level][TOKENS_KEY]
+        if level == depth:
+            tree = parent_tree
+        elif level > TREE_MAX_DEPTH or child_old == child_new:
+            tree = agg.tree_chars
+        elif child_new:
+            tree = agg.tree_chars + child_new - child_old
+        else:
+            tree = agg.tree_chars - child_old - 1  # Subtree line block and its newline are gone
+        child_old, child_new = agg.tree_chars, tree
+        ancestors[level][TOKENS_KEY] = NodeTokens(
+            tree, agg.content_chars - removed.content_chars, agg.files - removed.files,
+            content_tokens=agg.content_tokens - removed.content_tokens
+        )
+
+
+def carry_over_tokens(old_root, new_root):
+    """
+    Reuse file counts from a previous scan of the same folder: files whose
+    content is unchanged keep their count, so after a rescan only new or
+    edited files are measured.
+    """
+    if not old_root or not new_root or TOKENS_KEY not in old_root:
+        return
+    if old_root.get('abs_path') != new_root.get('abs_path'):
+        return
+    previous = {
+        node.get('path'): node for node in FileIterator(old_root, content_only=True)
+        if node.get(TOKENS_KEY) is not None
+    }
+    redactor, tokenizer = get_redactor(), get_tokenizer()
+    for node in FileIterator(new_root, content_only=True):
+        old = previous.get(node.get('path'))
+        if old is None:
+            continue
+        cached = old[TOKENS_KEY]
+        if cached.source and cached.source[1] is redactor and cached.source[2] is tokenizer \
+                and old.get('content') == node.get('content'):
+            node[TOKENS_KEY] = NodeTokens(
+                0, cached.content_chars, cached.files, (node.get('content'), redactor, tokenizer), cached.content_tokens
+            )
+
+
+def export_chars(data, tree_only=False):
+    """Exact length of generate_tree_text(data), or of generate_full_text(data)."""
+    if not data:
+        return 0
+    agg = aggregate_tokens(data)
+    header = len(f"Project Directory Structure: {data.get('name', 'Unknown')}\n") + 1 \
+        + len(f"📁 {data.get('path', '')}") + 1
+    tree_text = header + agg.tree_chars
+    if tree_only:
+        return tree_text
+    return tree_text + CONTENTS_HEADER_CHARS + agg.content_chars
+
+
+def estimate_export_tokens(data, tree_only=False):
+    """
+    Token count of the text export without building it: cached per-file
+    counts plus the tree section. With a BPE vocabulary installed the tree
+    text is tokenized; otherwise it is estimated from its exact length.
+    """
+    if not data:
+        return 0
+    tokenizer = get_tokenizer()
+    if tokenizer is not None:
+        from src.backend.exporter import generate_tree_text
+        tree_tokens = tokenizer.count(generate_tree_text(data))
+    else:
+        tree_tokens = round(export_chars(data, tree_only=True) / TREE_CHARS_PER_TOKEN)
+    if tree_only:
+        return max(1, tree_tokens)
+    agg = aggregate_tokens(data)
+    return max(1, tree_tokens + estimate_tokens_from_text(CONTENTS_HEADER) + agg.content_tokens)
@@ -0,0 +1,90 @@
+import os
+import string
+
+# ---- LANGUAGE FAMILIES ----
+# Groups of scanner.ALLOWED_CODE_EXTENSIONS / config.FILE_TYPE_MAP keys that tokenize alike.
+
+LANGUAGE_FAMILIES = {
+    'python': {'.py', '.pyw'},
+    'c_like': {
+        '.js', '.jsx', '.ts', '.tsx', '.c', '.cpp', '.h', '.hpp', '.java', '.cs', '.go', '.rs',
+        '.swift', '.kt', '.kts', '.php', '.vue', '.svelte', '.m', '.vb', '.lua', '.pl', '.r', '.rb',
+    },
+    'markup': {'.html', '.htm', '.xml'},
+    'style': {'.css', '.scss', '.sass', '.less'},
+    'data': {'.json', '.yaml', '.yml', '.toml', '.ini', '.conf', '.env', '.gitignore'},
+    'prose': {'.md', '.txt', 'readme', 'readme.md', 'license', 'changelog'},
+    'shell': {'.sh', '.bat', '.ps1', '.dockerfile', 'dockerfile', 'makefile', 'cmakelists.txt'},
+    'sql': {'.sql'},
+}
+
+_FAMILY_BY_KEY = {key: family for family, keys in LANGUAGE_FAMILIES.items() for key in keys}
+
+
+def classify_language(path):
+    """Language family of a file from its name, then its extension ('default' if unknown)."""
+    if not path:
+        return 'default'
+    name = os.path.basename(path).lower()
+    if name in _FAMILY_BY_KEY:
+        return _FAMILY_BY_KEY[name]
+    return _FAMILY_BY_KEY.get(os.path.splitext(name)[1], 'default')
+
+
+# ---- CHARACTER-CLASS FEATURES ----
+
+# One translate() pass maps ASCII to class symbols; anything else stays as is.
+_CLASS_TABLE = str.maketrans({
+    **{c: 'a' for c in string.ascii_letters + '_'},
+    **{c: '0' for c in string.digits},
+    **{c: '.' for c in string.punctuation if c != '_'},
+    ' ': ' ', '\t': ' ', '\r': '\n', '\n': '\n',
+})
+# Second view of the classed text: everything but letters becomes a separator
+_WORDS_ONLY = str.maketrans({'0': ' ', '.': ' ', '\n': ' '})
+
+FEATURES = ('word_runs', 'letters', 'digits', 'punct', 'double_spaces', 'newlines', 'non_ascii')
+
+
+def text_features(text):
+    """Counts used by the estimator, in FEATURES order."""
+    classes = text.translate(_CLASS_TABLE)
+    letters = classes.count('a')
+    digits = classes.count('0')
+    punct = classes.count('.')
+    spaces = classes.count(' ')
+    newlines = classes.count('\n')
+    non_ascii = len(classes) - letters - digits - punct - spaces - newlines
+    if non_ascii and text.isascii():
+        non_ascii = 0  # Other ASCII control characters
+    word_runs = len(classes.translate(_WORDS_ONLY).split()) if letters else 0
+    return (word_runs, letters, digits, punct, classes.count('  '), newlines, non_ascii)
+
+
+# ---- COEFFICIENTS ----
+# Tokens per feature unit, fitted offline against cl100k_base on a sample corpus
+# (benchmarks/token_calibration.py prints a fresh table and the error report).
+
+COEFFICIENTS = {
+    'python':  (0.2700, 0.1898, 1.0636, 0.6241, 0.0000, 0.6913, 0.7000),
+    'c_like':  (1.1530, 0.0000, 0.6425, 0.6994, 0.8476, 0.0000, 0.7000),
+    'markup':  (0.0000, 0.2602, 1.0166, 0.4546, 0.1975, 0.6503, 1.2419),
+    'style':   (1.4094, 0.0000, 1.4756, 0.0385, 0.4734, 0.9040, 0.7000),
+    'data':    (1.0855, 0.0000, 1.7745, 0.7002, 0.0024, 0.9986, 1.3690),
+    'prose':   (0.7386, 0.0573, 0.5786, 0.4616, 0.5224, 1.9018, 0.8964),
+    'shell':   (0.4040, 0.1671, 0.9940, 0.8341, 0.1709, 0.0000, 0.7000),
+    'sql':     (0.3695, 0.1804, 0.6201, 0.5754, 0.1829, 0.3418, 1.0814),
+    'default': (0.3695, 0.1804, 0.6201, 0.5754, 0.1829, 0.3418, 1.0814),
+}
+
+# The export's tree section (box-drawing characters and emoji icons)
+TREE_CHARS_PER_TOKEN = 2.161
+
+
+def estimate_text_tokens(text, path=None):
+    """Calibrated token estimate for text (language picked from path; 'default' without one)."""
+    if not text:
+        return 0
+    coefficients = COEFFICIENTS[classify_language(path)]
+    estimate = sum(c * f for c, f in zip(coefficients, text_features(text)))
+    return max(1, round(estimate))
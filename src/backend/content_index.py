@@ -0,0 +1,296 @@
+import re
+import threading
+import time
+from array import array
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+from src.backend.node_table import node_table
+
+# Private key on the scan root holding its ContentIndex (stripped from JSON exports)
+CONTENT_INDEX_KEY = '_content'
+
+MAX_HITS = 2000          # Per query
+MAX_HITS_PER_FILE = 100
+
+# Past these, files are kept unindexed: every query reads them in full
+MAX_INDEX_FILES = 20_000
+MAX_INDEX_CHARS = 32 * 1024 * 1024
+
+
+def _trigrams(text):
+    """
+    Distinct trigrams of text's case-folded UTF-8 bytes, each packed into
+    an int (the index is case-insensitive), as an array.
+    """
+    data = text.casefold().encode('utf-8', 'surrogatepass')
+    return array('i', {(a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:]))})
+
+
+class ContentIndex:
+    """
+    Trigram index over the text of every scanned file.
+
+    Each file gets a document number; every distinct trigram of its
+    case-folded text maps to the sorted array of documents containing it.
+    A query only reads the files whose documents hold all of its
+    trigrams, so the regex engine runs on a handful of candidates
+    instead of the whole project.
+
+    Only the first MAX_INDEX_FILES files, up to MAX_INDEX_CHARS of text,
+    get postings. The rest are unindexed documents that every query
+    reads, so results stay complete on huge trees.
+
+    Updates are append-only: a changed file gets a new document and its
+    old one is marked dead (the postings are compacted once dead documents
+    outnumber live ones). A rescan of the same folder reuses the index and
+    re-reads only the files whose content changed.
+    """
+
+    def __init__(self):
+        self.table = None
+        self._postings = {}  # trigram -> array of doc numbers (ascending)
+        self._docs = []      # doc -> (node_id, rel_path, content), None once replaced or removed
+        self._by_path = {}   # rel_path -> live doc
+        self._unindexed = set()  # Live docs without postings (over the caps)
+        self._dead = 0
+        self._lock = threading.Lock()  # Rescans and watcher updates run while a query reads
+        self._sync_lock = threading.Lock()  # One sync at a time (scans in a row reuse the same index)
+
+    def __len__(self):
+        return len(self._by_path)
+
+    def sync(self, root, cancelled=None):
+        """
+        Index root's text files, re-reading only files new or changed since the last sync.
+        False (and the index unchanged) if cancelled() turned true first.
+        """
+        with self._sync_lock:
+            return self._sync(root, cancelled)
+
+    def _sync(self, root, cancelled):
+        table = node_table(root)
+        seen = set()
+        kept, added = [], []
+        indexed_chars = 0
+        for node_id in table.walk():
+            if cancelled is not None and cancelled():
+                return False
+            node = table.node(node_id)
+            content = node.get('content')
+            if node.get('type') != 'file' or not isinstance(content, str) or not content:
+                continue
+            path = node.get('path', '')
+            seen.add(path)
+            indexed = len(seen) <= MAX_INDEX_FILES and indexed_chars + len(content) <= MAX_INDEX_CHARS
+            if indexed:
+                indexed_chars += len(content)
+            doc = self._by_path.get(path)
+            if doc is not None and self._docs[doc][2] == content and (doc in self._unindexed) != indexed:
+                kept.append((doc, (node_id, path, content)))
+            elif indexed:
+                added.append((node_id, path, content, _trigrams(content)))
+                time.sleep(0)  # Let the GUI thread run between files
+            else:
+                added.append((node_id, path, content, None))
+
+        with self._lock:
+            self.table = table
+            for doc, entry in kept:
+                self._docs[doc] = entry  # Same text: only the node id changes
+            for path in [p for p in self._by_path if p not in seen]:
+                self._kill(self._by_path.pop(path))
+            for node_id, path, content, grams in added:
+                self._add(node_id, path, content, grams)
+            self._compact_if_needed()
+        return True
+
+    def update_file(self, rel_path, content):
+        """Re-index one file from new text (e.g. a watcher event). False if the file is not indexed."""
+        indexed = self._by_path.get(rel_path) not in self._unindexed
+        grams = _trigrams(content) if content and indexed else None
+        with self._lock:
+            doc = self._by_path.get(rel_path)
+            if doc is None:
+                return False
+            node_id = self._docs[doc][0]
+            if content:
+                self._add(node_id, rel_path, content, grams)
+            else:
+                self._kill(self._by_path.pop(rel_path))
+            self._compact_if_needed()
+        return True
+
+    def _add(self, node_id, path, content, grams):
+        old = self._by_path.get(path)
+        if old is not None:
+            self._kill(old)
+        doc = len(self._docs)
+        self._docs.append((node_id, path, content))
+        self._by_path[path] = doc
+        if grams is None:
+            self._unindexed.add(doc)
+            return
+        postings = self._postings
+        for gram in grams:
+            docs = postings.get(gram)
+            if docs is None:
+                docs = postings[gram] = array('i')
+            docs.append(doc)
+
+    def _kill(self, doc):
+        self._docs[doc] = None
+        self._unindexed.discard(doc)
+        self._dead += 1
+
+    def _compact_if_needed(self):
+        if self._dead <= max(len(self._by_path), 1000):
+            return
+        renumber = array('i', [-1]) * len(self._docs)
+        docs = []
+        for doc, entry in enumerate(self._docs):
+            if entry is not None:
+                renumber[doc] = len(docs)
+                docs.append(entry)
+        postings = {}
+        for gram, old in self._postings.items():
+            new = array('i', [renumber[d] for d in old if renumber[d] >= 0])
+            if new:
+                postings[gram] = new
+        self._postings = postings
+        self._docs = docs
+        self._by_path = {entry[1]: doc for doc, entry in enumerate(docs)}
+        self._unindexed = {renumber[doc] for doc in self._unindexed}
+        self._dead = 0
+
+    def candidates(self, grams):
+        """(node_id, rel_path, content) of the live files holding every trigram in grams, by path."""
+        with self._lock:
+            if not grams:
+                entries = [self._docs[doc] for doc in self._by_path.values()]
+            else:
+                lists = [self._postings.get(gram) for gram in grams]
+                if all(lists):
+                    lists.sort(key=len)
+                    docs = set(lists[0])
+                    for other in lists[1:]:
+                        docs.intersection_update(other)
+                        if not docs:
+                            break
+                else:
+                    docs = set()
+                docs |= self._unindexed
+                entries = [self._docs[doc] for doc in docs if self._docs[doc] is not None]
+        entries.sort(key=lambda entry: entry[1])
+        return entries
+
+
+# ---- QUERIES ----
+
+def _literal_runs(items, runs):
+    """Collect the literal strings every match of a parsed regex must contain."""
+    run = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        runs.append(''.join(run))
+        run = []
+        if op is sre_parse.SUBPATTERN:
+            _literal_runs(av[-1], runs)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            _literal_runs(av[2], runs)
+        # Anything else (alternation, classes, wildcards...) guarantees no literal
+    runs.append(''.join(run))
+
+
+def required_trigrams(pattern, flags=0):
+    """Trigrams any text matching the regex must contain (empty: no prefilter possible)."""
+    runs = []
+    try:
+        _literal_runs(sre_parse.parse(pattern, flags), runs)
+    except Exception:
+        return set()
+    grams = set()
+    for run in runs:
+        if len(run) >= 3:
+            grams.update(_trigrams(run))
+    return grams
+
+
+def compile_query(text, regex=False, case_sensitive=False):
+    """
+    (compiled pattern, trigrams) for a content query.
+    Raises re.error for an invalid regex.
+    """
+    flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+    if regex:
+        return re.compile(text, flags), required_trigrams(text, flags)
+    return re.compile(re.escape(text), flags), set(_trigrams(text))
+
+
+def search_content(index, pattern, grams, cancelled=None, max_hits=MAX_HITS):
+    """
+    Yield (node_id, rel_path, hits) for each matching file, in path order.
+    hits: [(line, column, length, line_text)], lines 1-based, one hit per line.
+    Stops after max_hits lines or as soon as cancelled() is true.
+    """
+    table = index.table
+    total = 0
+    for node_id, path, content in index.candidates(grams):
+        if cancelled is not None and cancelled():
+            return
+        if table is not None and not table.is_attached(node_id):
+            continue  # Removed from the explorer since the scan
+        hits = []
+        line = 1
+        pos = 0
+        last_line = 0
+        for match in pattern.finditer(content):
+            start, end = match.span()
+            if start == end:
+                continue
+            line += content.count('\n', pos, start)
+            pos = start
+            if line == last_line:
+                continue
+            last_line = line
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', start)
+            if line_end == -1:
+                line_end = len(content)
+            hits.append((line, start - line_start, min(end, line_end) - start, content[line_start:line_end]))
+            if len(hits) >= MAX_HITS_PER_FILE or total + len(hits) >= max_hits:
+                break
+        if hits:
+            total += len(hits)
+            yield node_id, path, hits
+            if total >= max_hits:
+                return
+
+
+_index_lock = threading.Lock()
+
+
+def content_index(root, previous=None, cancelled=None):
+    """
+    The ContentIndex of a scan tree, built on first use and kept on the root.
+    Pass the previous scan of the same folder to reuse its index.
+    None if cancelled() turned true before it was built.
+    """
+    index = root.get(CONTENT_INDEX_KEY)
+    if index is None:
+        with _index_lock:
+            index = root.get(CONTENT_INDEX_KEY)
+            if index is None:
+                if previous and previous.get('abs_path') == root.get('abs_path'):
+                    index = previous.get(CONTENT_INDEX_KEY)
+                if index is None:
+                    index = ContentIndex()
+                if not index.sync(root, cancelled):
+                    return None
+                root[CONTENT_INDEX_KEY] = index
+    return index
@@ -1,455 +1,715 @@
-import os
-import json
-import io
-import html
-import logging
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Flowable, Preformatted, XPreformatted
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER
-from reportlab.lib.colors import black
-from src.backend.utils import get_file_heading, sanitize_content, get_unique_path
-
-logger = logging.getLogger(__name__)
-
-# --- Constants for Large File Handling ---
-MAX_FILE_SIZE_FOR_PDF = 100_000  # 100KB max per file in PDF (prevents memory issues)
-MAX_FILES_IN_PDF = 500  # Maximum files to include in PDF
-MAX_TOC_DEPTH = 10  # Maximum folder depth for TOC
-
-# --- Text & JSON Export Helpers ---
-
-def _build_tree_string(node, prefix='', depth=0, max_depth=50):
-    """Build tree with depth limit to prevent stack overflow on deep structures."""
-    if depth > max_depth:
-        return f"{prefix}... (truncated - too deep)"
-    
-    output = []
-    children = node.get('children', [])
-    if not children:
-        return ''
-    
-    sorted_children = sorted(children, key=lambda x: x.get('name', ''))
-    for index, child in enumerate(sorted_children):
-        is_last = index == len(sorted_children) - 1
-        connector = '└── ' if is_last else '├── '
-        new_prefix = prefix + ('    ' if is_last else '│   ')
-
-        name = child.get('name', 'unknown')
-        if child.get('type') == 'folder':
-            output.append(f"{prefix}{connector}📁 {name}/")
-            subtree = _build_tree_string(child, new_prefix, depth + 1, max_depth)
-            if subtree:
-                output.append(subtree)
-        else:
-            output.append(f"{prefix}{connector}📄 {name}")
-    return '\n'.join(output)
-
-def generate_tree_text(data):
-    if not data:
-        return ""
-    output = []
-    output.append(f"Project Directory Structure: {data.get('name', 'Unknown')}\n")
-    output.append(f"📁 {data.get('path', '')}")
-    output.append(_build_tree_string(data))
-    return '\n'.join(output)
-
-def generate_full_text(data):
-    if not data:
-        return ""
-    output = []
-    output.append(generate_tree_text(data))
-    
-    output.append("\n" + "=" * 50)
-    output.append("Code File Contents")
-    output.append("=" * 50 + "\n")
-    
-    # Iterative file collection (prevents stack overflow)
-    all_files = _collect_all_files(data)
-    
-    for file_node in all_files:
-        path = file_node.get('path', 'unknown')
-        content = file_node.get('content')
-        if content:
-            output.append(get_file_heading(path))
-            output.append(sanitize_content(content))
-            output.append("\n" + "=" * 50 + "\n")
-            
-    return '\n'.join(output)
-
-def _collect_all_files(data, max_files=10000):
-    """Iteratively collect all files to avoid recursion limits."""
-    all_files = []
-    stack = [data]
-    
-    while stack and len(all_files) < max_files:
-        node = stack.pop(0)
-        for child in node.get('children', []):
-            if child.get('type') == 'folder':
-                stack.append(child)
-            elif child.get('type') == 'file' and child.get('content') is not None:
-                all_files.append(child)
-                if len(all_files) >= max_files:
-                    break
-    
-    return all_files
-
-
-# --- PDF Export Helpers ---
-
-def _sanitize_pdf_anchor(name):
-    """
-    Sanitize a path/name for use as PDF anchor (bookmark + link target).
-    Must be consistent between NamedDestination and TOC links.
-    Uses only alphanumeric characters and underscores for maximum compatibility.
-    """
-    if not name:
-        return "file_unknown"
-    
-    # Convert to safe anchor: only alphanumeric and underscore
-    safe_chars = []
-    for char in name:
-        if char.isalnum():
-            safe_chars.append(char)
-        else:
-            safe_chars.append('_')
-    
-    safe_name = ''.join(safe_chars)
-    
-    # Ensure it starts with a letter (required for some PDF readers)
-    if safe_name and not safe_name[0].isalpha():
-        safe_name = 'f_' + safe_name
-    
-    # Limit length and ensure uniqueness with hash suffix for long paths
-    if len(safe_name) > 80:
-        import hashlib
-        hash_suffix = hashlib.md5(name.encode()).hexdigest()[:8]
-        safe_name = safe_name[:70] + '_' + hash_suffix
-    
-    return safe_name if safe_name else "file_unknown"
-
-
-class NamedDestination(Flowable):
-    """PDF bookmark destination."""
-    def __init__(self, name):
-        Flowable.__init__(self)
-        # Use shared sanitization
-        self.name = _sanitize_pdf_anchor(name)
-        
-    def draw(self):
-        try:
-            self.canv.bookmarkPage(self.name)
-            self.canv.addOutlineEntry(self.name, self.name, 0, 0)
-        except Exception as e:
-            logger.warning(f"Could not create bookmark for {self.name}: {e}")
-
-
-def _escape_xml(text):
-    """Escape text for safe XML/PDF rendering."""
-    if not text:
-        return ""
-    return html.escape(str(text))
-
-
-def _truncate_content(content, max_chars=MAX_FILE_SIZE_FOR_PDF):
-    """Truncate file content if too large for PDF."""
-    if not content:
-        return ""
-    if len(content) > max_chars:
-        return content[:max_chars] + f"\n\n... [TRUNCATED - File too large ({len(content):,} chars)]"
-    return content
-
-
-def _sanitize_content_for_pdf(content):
-    """
-    Sanitize content for ReportLab PDF rendering.
-    Handles special characters, null bytes, and encoding issues.
-    """
-    if not content:
-        return ""
-    
-    # Remove null bytes and other problematic characters
-    content = content.replace('\x00', '')
-    
-    # Replace tabs with spaces for consistent rendering
-    content = content.replace('\t', '    ')
-    
-    # Remove control characters except newlines
-    sanitized = []
-    for char in content:
-        if char == '\n' or char == '\r' or (ord(char) >= 32 and ord(char) < 127) or ord(char) >= 160:
-            sanitized.append(char)
-        else:
-            sanitized.append(' ')  # Replace control chars with space
-    
-    return ''.join(sanitized)
-
-
-def generate_pdf(data, output_path):
-    """
-    Generate PDF with robust error handling for large projects.
-    """
-    if not data:
-        raise ValueError("No data provided for PDF generation")
-    
-    buffer = io.BytesIO()
-    
-    try:
-        doc = SimpleDocTemplate(
-            buffer, 
-            pagesize=letter,
-            rightMargin=72, 
-            leftMargin=72,
-            topMargin=72, 
-            bottomMargin=72
-        )
-        
-        styles = getSampleStyleSheet()
-        
-        # Add custom styles (with error handling for duplicates)
-        if 'FileHeadingStyle' not in [s.name for s in styles.byName.values()]:
-            styles.add(ParagraphStyle(
-                name='FileHeadingStyle', 
-                fontName='Helvetica-Bold', 
-                fontSize=14, 
-                leading=16, 
-                spaceAfter=12
-            ))
-        
-        if 'CodePreformattedStyle' not in [s.name for s in styles.byName.values()]:
-            styles.add(ParagraphStyle(
-                name='CodePreformattedStyle', 
-                fontName='Courier', 
-                fontSize=8, 
-                leading=10, 
-                textColor=black, 
-                spaceBefore=6, 
-                spaceAfter=6
-            ))
-        
-        story = []
-
-        # Title Page
-        title_style = ParagraphStyle(
-            'TitleStyle', 
-            fontSize=24, 
-            fontName='Helvetica-Bold', 
-            alignment=TA_CENTER, 
-            spaceAfter=24
-        )
-        
-        project_name = _escape_xml(data.get('name', 'Unknown Project'))
-        project_path = _escape_xml(data.get('path', ''))
-        
-        story.append(Paragraph(f"Project Scan Report: {project_name}", title_style))
-        story.append(Paragraph(f"Path: {project_path}", styles['Normal']))
-        story.append(Spacer(1, 0.2 * inch))
-
-        # Table of Contents (with depth limit)
-        story.append(Paragraph("Table of Contents", styles['Heading1']))
-        story.append(Spacer(1, 0.2 * inch))
-        
-        toc_items = []
-        _build_toc_items(data, toc_items, styles, level=0, max_items=500)
-        story.extend(toc_items)
-        
-        story.append(PageBreak())
-
-        # Code File Contents
-        story.append(Paragraph("Code File Contents", styles['Heading1']))
-        
-        # Collect files with limits
-        all_files = _collect_all_files(data, max_files=MAX_FILES_IN_PDF)
-        
-        if len(all_files) >= MAX_FILES_IN_PDF:
-            story.append(Paragraph(
-                f"<i>Note: Showing first {MAX_FILES_IN_PDF} files. "
-                f"Total files may exceed this limit.</i>",
-                styles['Normal']
-            ))
-            story.append(Spacer(1, 0.1 * inch))
-
-        for i, file_node in enumerate(all_files):
-            try:
-                if i > 0:
-                    story.append(PageBreak())
-
-                file_path = file_node.get('path', 'unknown')
-                story.append(NamedDestination(file_path))
-                
-                heading_text = _escape_xml(get_file_heading(file_path))
-                story.append(Paragraph(heading_text, styles['FileHeadingStyle']))
-
-                # Get and sanitize content
-                raw_content = file_node.get('content', '')
-                content = _sanitize_content_for_pdf(raw_content)
-                content = _truncate_content(content)
-                
-                if content:
-                    # Use XPreformatted for better handling of special content
-                    try:
-                        story.append(Preformatted(content, styles['CodePreformattedStyle']))
-                    except Exception as e:
-                        # Fallback: escape and use paragraph
-                        logger.warning(f"Preformatted failed for {file_path}: {e}")
-                        escaped = _escape_xml(content[:5000])  # Limit fallback
-                        story.append(Paragraph(f"<pre>{escaped}</pre>", styles['Normal']))
-                else:
-                    story.append(Paragraph("<i>(Empty or binary file)</i>", styles['Normal']))
-                    
-                story.append(Spacer(1, 0.2 * inch))
-                
-            except Exception as e:
-                logger.error(f"Error processing file {file_node.get('path', '?')}: {e}")
-                story.append(Paragraph(
-                    f"<i>Error rendering file: {_escape_xml(str(e))}</i>",
-                    styles['Normal']
-                ))
-
-        # Build PDF
-        doc.build(story)
-        
-        # Write to file
-        with open(output_path, "wb") as f:
-            f.write(buffer.getvalue())
-            
-    except Exception as e:
-        logger.error(f"PDF generation failed: {e}")
-        raise RuntimeError(f"PDF generation failed: {e}") from e
-    finally:
-        buffer.close()
-
-
-def _build_toc_items(node, items_list, styles, level=0, max_items=500, current_count=None):
-    """
-    Build TOC items iteratively with limits.
-    """
-    if current_count is None:
-        current_count = [0]  # Mutable counter
-    
-    if level > MAX_TOC_DEPTH or current_count[0] >= max_items:
-        return
-    
-    children = node.get('children', [])
-    if not children:
-        return
-        
-    sorted_children = sorted(children, key=lambda x: (x.get('type') != 'folder', x.get('name', '')))
-    indent_size = 12
-    
-    for child in sorted_children:
-        if current_count[0] >= max_items:
-            items_list.append(Paragraph(
-                f"<i>... and more items (TOC truncated at {max_items})</i>",
-                styles['Normal']
-            ))
-            return
-            
-        current_count[0] += 1
-        child_name = _escape_xml(child.get('name', 'unknown'))
-        
-        if child.get('type') == 'folder':
-            style = ParagraphStyle(
-                f'TOCFolderLevel{level}_{current_count[0]}', 
-                parent=styles['Normal'], 
-                leftIndent=indent_size * level, 
-                spaceAfter=2
-            )
-            items_list.append(Paragraph(f"📁 {child_name}/", style))
-            _build_toc_items(child, items_list, styles, level + 1, max_items, current_count)
-        else:
-            style = ParagraphStyle(
-                f'TOCFileLevel{level}_{current_count[0]}', 
-                parent=styles['Normal'], 
-                leftIndent=indent_size * level, 
-                spaceAfter=2
-            )
-            file_path = child.get('path', '')
-            has_content = child.get('content') is not None
-            
-            if has_content:
-                # Only create clickable link if file has content (will have a bookmark destination)
-                safe_path = _sanitize_pdf_anchor(file_path)
-                items_list.append(Paragraph(
-                    f"<a href='#{safe_path}'><font color='blue'>📄 {child_name}</font></a>", 
-                    style
-                ))
-            else:
-                # Non-linkable entry for binary/unsupported files
-                items_list.append(Paragraph(f"📄 {child_name}", style))
-
-
-# --- Main Export Function ---
-
-def export_data(data, target_dir, formats):
-    """
-    Exports the data to the specified formats in the target directory.
-    formats: list of strings ['json', 'txt_tree', 'txt_full', 'pdf']
-    
-    Returns list of created file paths.
-    Raises exceptions with descriptive messages on failure.
-    """
-    if not data:
-        raise ValueError("No data to export")
-    
-    if not target_dir or not os.path.isdir(target_dir):
-        raise ValueError(f"Invalid target directory: {target_dir}")
-    
-    base_name = data.get('name', 'export')
-    # Sanitize filename
-    base_name = "".join(c for c in base_name if c.isalnum() or c in (' ', '-', '_', '.')).strip()
-    if not base_name:
-        base_name = 'export'
-    
-    results = []
-    errors = []
-    
-    if 'json' in formats:
-        try:
-            out = get_unique_path(os.path.join(target_dir, f"{base_name}.json"))
-            with open(out, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False, default=str)
-            results.append(out)
-        except Exception as e:
-            errors.append(f"JSON export failed: {e}")
-            logger.error(f"JSON export failed: {e}")
-        
-    if 'txt_tree' in formats:
-        try:
-            out = get_unique_path(os.path.join(target_dir, f"{base_name}.tree.txt"))
-            with open(out, 'w', encoding='utf-8') as f:
-                f.write(generate_tree_text(data))
-            results.append(out)
-        except Exception as e:
-            errors.append(f"Tree text export failed: {e}")
-            logger.error(f"Tree text export failed: {e}")
-
-    if 'txt_full' in formats:
-        try:
-            out = get_unique_path(os.path.join(target_dir, f"{base_name}.full.txt"))
-            with open(out, 'w', encoding='utf-8') as f:
-                f.write(generate_full_text(data))
-            results.append(out)
-        except Exception as e:
-            errors.append(f"Full text export failed: {e}")
-            logger.error(f"Full text export failed: {e}")
-        
-    if 'pdf' in formats:
-        try:
-            out = get_unique_path(os.path.join(target_dir, f"{base_name}.pdf"))
-            generate_pdf(data, out)
-            results.append(out)
-        except Exception as e:
-            errors.append(f"PDF export failed: {e}")
-            logger.error(f"PDF export failed: {e}")
-    
-    # If all exports failed, raise an error
-    if not results and errors:
-        raise RuntimeError("All exports failed: " + "; ".join(errors))
-    
-    # If some succeeded but some failed, log warnings but return successes
-    if errors:
-        logger.warning(f"Some exports failed: {errors}")
-        
-    return results
+import os
+import re
+import json
+import io
+import html
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Flowable, Preformatted, XPreformatted
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.colors import black
+from src.backend.utils import get_file_heading, sanitize_content, get_unique_path
+from src.backend.file_iterator import FileIterator, BREADTH_FIRST
+from src.backend.analyzers.token_logic import estimate_tokens_from_text
+from src.backend.analyzers.file_ranker import FileRanker, DEFAULT_WEIGHTS
+from src.backend.analyzers.token_aggregates import aggregate_tokens, file_tokens
+from src.backend.analyzers.bpe_tokenizer import get_tokenizer
+from src.backend.redactor import get_redactor
+
+logger = logging.getLogger(__name__)
+
+# --- Constants for Large File Handling ---
+MAX_FILE_SIZE_FOR_PDF = 100_000  # 100KB max per file in PDF (prevents memory issues)
+MAX_FILES_IN_PDF = 500  # Maximum files to include in PDF
+MAX_TOC_DEPTH = 10  # Maximum folder depth for TOC
+
+# --- Text & JSON Export Helpers ---
+
+def _build_tree_string(node, prefix='', depth=0, max_depth=50, marks=None):
+    """
+    Build tree with depth limit to prevent stack overflow on deep structures.
+    marks: optional {id(file node): text} appended to those files' lines.
+    """
+    if depth > max_depth:
+        return f"{prefix}... (truncated - too deep)"
+    
+    output = []
+    children = node.get('children', [])
+    if not children:
+        return ''
+    
+    sorted_children = sorted(children, key=lambda x: x.get('name', ''))
+    for index, child in enumerate(sorted_children):
+        is_last = index == len(sorted_children) - 1
+        connector = '└── ' if is_last else '├── '
+        new_prefix = prefix + ('    ' if is_last else '│   ')
+
+        name = child.get('name', 'unknown')
+        if child.get('type') == 'folder':
+            output.append(f"{prefix}{connector}📁 {name}/")
+            subtree = _build_tree_string(child, new_prefix, depth + 1, max_depth, marks)
+            if subtree:
+                output.append(subtree)
+        elif marks and id(child) in marks:
+            output.append(f"{prefix}{connector}📄 {name}{marks[id(child)]}")
+        else:
+            output.append(f"{prefix}{connector}📄 {name}")
+    return '\n'.join(output)
+
+def _public_tree(data):
+    """Copy of the scan tree without private ('_'-prefixed) cache keys, for JSON export."""
+    copy = {k: v for k, v in data.items() if not k.startswith('_')}
+    stack = [copy]
+    while stack:
+        node = stack.pop()
+        if 'children' in node:
+            node['children'] = [
+                {k: v for k, v in child.items() if not k.startswith('_')}
+                for child in node['children']
+            ]
+            stack.extend(node['children'])
+    return copy
+
+def generate_tree_text(data, marks=None):
+    if not data:
+        return ""
+    output = []
+    output.append(f"Project Directory Structure: {data.get('name', 'Unknown')}\n")
+    output.append(f"📁 {data.get('path', '')}")
+    output.append(_build_tree_string(data, marks=marks))
+    return '\n'.join(output)
+
+def _render_file_section(file_node):
+    """Heading + sanitized content + separator for one file, or None if it has no text."""
+    content = file_node.get('content')
+    if not content:
+        return None
+    return '\n'.join((
+        get_file_heading(file_node.get('path', 'unknown')),
+        sanitize_content(content),
+        "\n" + "=" * 50 + "\n",
+    ))
+
+def generate_full_text(data, order=BREADTH_FIRST):
+    if not data:
+        return ""
+    output = []
+    output.append(generate_tree_text(data))
+    
+    output.append("\n" + "=" * 50)
+    output.append("Code File Contents")
+    output.append("=" * 50 + "\n")
+    
+    # Lazy, iterative file walk (no recursion limits, no silent file cap)
+    for file_node in FileIterator(data, order=order):
+        section = _render_file_section(file_node)
+        if section:
+            output.append(section)
+            
+    return '\n'.join(output)
+
+
+# --- Sharded Text Export ---
+
+@dataclass
+class TextShard:
+    """One ready-to-paste part of a sharded full text export."""
+    index: int
+    tokens: int
+    files: list = field(default_factory=list)  # [(file_node, section_tokens)]
+
+
+def _manifest_line(file_node, tokens):
+    return f"  - {file_node.get('path', 'unknown')}  (~{tokens:,} tokens)"
+
+
+def _shard_banner(index, count, shard):
+    return (
+        "\n" + "=" * 50 + "\n"
+        f"Part {index} of {count}: {len(shard.files):,} files, ~{shard.tokens:,} tokens\n"
+        "Files in this part:"
+    )
+
+
+@lru_cache(maxsize=None)
+def _shard_frame_tokens():
+    """Tokens of the constant framing around each shard (part banner + contents banner)."""
+    return estimate_tokens_from_text(
+        _shard_banner(99, 99, TextShard(0, 9_999_999)) + "\n\n" + "=" * 50 + "\nCode File Contents\n" + "=" * 50 + "\n"
+    )
+
+
+def plan_text_shards(data, token_budget, order=BREADTH_FIRST):
+    """
+    Split the full text export into shards at file boundaries.
+    Every shard repeats the tree header, so the budget available for
+    file contents is token_budget minus the header.
+
+    A single file larger than the remaining budget gets a shard of its
+    own (it cannot be split at a file boundary).
+
+    Returns (tree_text, [TextShard, ...]).
+    """
+    tree_text = generate_tree_text(data)
+    base_tokens = estimate_tokens_from_text(tree_text) + _shard_frame_tokens()
+    if base_tokens >= token_budget:
+        raise ValueError(
+            f"The directory tree alone needs ~{base_tokens:,} tokens, "
+            f"which does not fit a {token_budget:,} token budget"
+        )
+
+    shards = []
+    current = None
+    for file_node in FileIterator(data, order=order):
+        section = _render_file_section(file_node)
+        if not section:
+            continue
+        tokens = estimate_tokens_from_text(section, file_node.get('path'))
+        cost = tokens + estimate_tokens_from_text(_manifest_line(file_node, tokens))
+
+        if current is None or (current.files and current.tokens + cost > token_budget):
+            current = TextShard(index=len(shards) + 1, tokens=base_tokens)
+            shards.append(current)
+        current.files.append((file_node, tokens))
+        current.tokens += cost
+
+    if not shards:
+        shards.append(TextShard(index=1, tokens=base_tokens))
+    return tree_text, shards
+
+
+def _write_text_shard(path, tree_text, shard, shard_count):
+    """Stream one shard to disk, one file section at a time."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(tree_text)
+        f.write(_shard_banner(shard.index, shard_count, shard) + "\n")
+        for file_node, tokens in shard.files:
+            f.write(_manifest_line(file_node, tokens) + "\n")
+        f.write("\n" + "=" * 50 + "\nCode File Contents\n" + "=" * 50 + "\n")
+        for file_node, _ in shard.files:
+            # Re-rendering hits the redaction cache filled while planning
+            f.write("\n" + _render_file_section(file_node))
+
+
+def export_text_shards(data, target_dir, base_name, token_budget, order=BREADTH_FIRST, max_workers=4):
+    """
+    Write the full text export as N shards that each fit token_budget.
+    Shards are planned first (token counts only, no text kept in memory)
+    and then written in parallel.
+    Returns the list of created file paths, in part order.
+    """
+    tree_text, shards = plan_text_shards(data, token_budget, order=order)
+    count = len(shards)
+
+    paths = [
+        get_unique_path(os.path.join(target_dir, f"{base_name}.part{shard.index:02d}-of-{count:02d}.txt"))
+        for shard in shards
+    ]
+    for shard in shards:
+        if shard.tokens > token_budget:
+            logger.warning(f"Shard {shard.index} exceeds the budget: single file of ~{shard.tokens:,} tokens")
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count))) as pool:
+        futures = [
+            pool.submit(_write_text_shard, path, tree_text, shard, count)
+            for path, shard in zip(paths, shards)
+        ]
+        for future in futures:
+            future.result()  # Re-raise write errors
+
+    return paths
+
+
+# --- Best Fit (Budget) Export ---
+
+# Private key on the scan root holding its cached FileRankers (stripped from JSON exports)
+RANKERS_KEY = '_rankers'
+
+
+def _excluded_mark(ranked):
+    return f"  [excluded, ~{ranked.tokens:,} tokens]"
+
+
+def build_file_ranker(data, weights=None):
+    """
+    Rank every file with content once; reuse the ranker to try several budgets.
+
+    Token counts are the cached per-file counts of the token estimator, so no
+    file is rendered again. The ranker is cached on the scan root per set of
+    weights, and rebuilt once files are removed from the scan or the
+    redaction rules or the tokenizer change.
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    totals = aggregate_tokens(data)  # Replaced by a new object whenever files are detached
+    source = (totals, get_redactor(), get_tokenizer())
+    key = tuple(weights.to_dict().items())
+    cached = data.get(RANKERS_KEY, {}).get(key)
+    if cached is not None and all(a is b for a, b in zip(cached[0], source)):
+        return cached[1]
+
+    files = (node for node in FileIterator(data) if node.get('content'))
+    ranker = FileRanker(files, lambda node: file_tokens(node).content_tokens, weights)
+    rankers = {k: v for k, v in data.get(RANKERS_KEY, {}).items() if v[0][0] is totals}
+    rankers[key] = (source, ranker)
+    data[RANKERS_KEY] = rankers
+    return ranker
+
+
+def select_files_for_budget(data, token_budget, weights=None, ranker=None):
+    """
+    Pick the highest ranked files that fit token_budget together with the
+    tree, in which every excluded file is marked.
+    Returns (tree_text, BudgetSelection); tree_text carries the marks.
+    """
+    plain_tree = generate_tree_text(data)
+    ranker = ranker or build_file_ranker(data, weights)
+
+    base = estimate_tokens_from_text(plain_tree) + _shard_frame_tokens()
+    if base >= token_budget:
+        raise ValueError(
+            f"The directory tree alone needs ~{base:,} tokens, "
+            f"which does not fit a {token_budget:,} token budget"
+        )
+
+    # The marks are not known before selecting, and reserving room for them
+    # leaves more files out: grow the reserve until the marks fit in it.
+    reserved = base
+    while True:
+        selection = ranker.select(token_budget, reserved=reserved)
+        needed = base + sum(estimate_tokens_from_text(_excluded_mark(f)) for f in selection.excluded)
+        if needed <= reserved:
+            break
+        reserved = needed
+
+    marks = {id(f.node): _excluded_mark(f) for f in selection.excluded}
+    return generate_tree_text(data, marks), selection
+
+
+def generate_budget_text(data, token_budget, order=BREADTH_FIRST, weights=None, ranker=None):
+    """Full text export limited to the best ranked files that fit token_budget."""
+    if not data:
+        return ""
+    tree_text, selection = select_files_for_budget(data, token_budget, weights, ranker)
+
+    output = [tree_text]
+    output.append("\n" + "=" * 50)
+    output.append(
+        f"Best fit for ~{token_budget:,} tokens: {len(selection.included):,} files included, "
+        f"{len(selection.excluded):,} excluded (marked [excluded] in the tree above)"
+    )
+
+    output.append("\n" + "=" * 50)
+    output.append("Code File Contents")
+    output.append("=" * 50 + "\n")
+
+    # Included files keep the normal export order so the layout stays readable
+    included = {id(f.node) for f in selection.included}
+    for file_node in FileIterator(data, order=order):
+        if id(file_node) in included:
+            output.append(_render_file_section(file_node))
+
+    return '\n'.join(output)
+
+
+# --- PDF Export Helpers ---
+
+def _sanitize_pdf_anchor(name):
+    """
+    Sanitize a path/name for use as PDF anchor (bookmark + link target).
+    Must be consistent between NamedDestination and TOC links.
+    Uses only alphanumeric characters and underscores for maximum compatibility.
+    """
+    if not name:
+        return "file_unknown"
+    
+    # Convert to safe anchor: only alphanumeric and underscore
+    safe_chars = []
+    for char in name:
+        if char.isalnum():
+            safe_chars.append(char)
+        else:
+            safe_chars.append('_')
+    
+    safe_name = ''.join(safe_chars)
+    
+    # Ensure it starts with a letter (required for some PDF readers)
+    if safe_name and not safe_name[0].isalpha():
+        safe_name = 'f_' + safe_name
+    
+    # Limit length and ensure uniqueness with hash suffix for long paths
+    if len(safe_name) > 80:
+        import hashlib
+        hash_suffix = hashlib.md5(name.encode()).hexdigest()[:8]
+        safe_name = safe_name[:70] + '_' + hash_suffix
+    
+    return safe_name if safe_name else "file_unknown"
+
+
+class NamedDestination(Flowable):
+    """PDF bookmark destination."""
+    def __init__(self, name):
+        Flowable.__init__(self)
+        # Use shared sanitization
+        self.name = _sanitize_pdf_anchor(name)
+        
+    def draw(self):
+        try:
+            self.canv.bookmarkPage(self.name)
+            self.canv.addOutlineEntry(self.name, self.name, 0, 0)
+        except Exception as e:
+            logger.warning(f"Could not create bookmark for {self.name}: {e}")
+
+
+def _escape_xml(text):
+    """Escape text for safe XML/PDF rendering."""
+    if not text:
+        return ""
+    return html.escape(str(text))
+
+
+def _truncate_content(content, max_chars=MAX_FILE_SIZE_FOR_PDF):
+    """Truncate file content if too large for PDF."""
+    if not content:
+        return ""
+    if len(content) > max_chars:
+        return content[:max_chars] + f"\n\n... [TRUNCATED - File too large ({len(content):,} chars)]"
+    return content
+
+
+# Precomputed ReportLab-safe character mapping: null bytes are dropped,
+# tabs become 4 spaces and every other control character (C0 except CR/LF,
+# DEL and C1) becomes a single space.
+_PDF_TRANSLATION = {0: None, ord('\t'): '    '}
+for _code in [*range(1, 32), *range(127, 160)]:
+    if _code not in (ord('\t'), ord('\n'), ord('\r')):
+        _PDF_TRANSLATION[_code] = ' '
+del _code
+
+_PDF_CONTROL_CHARS = re.compile('[\x01-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+
+
+def _sanitize_content_for_pdf(content):
+    """
+    Sanitize content for ReportLab PDF rendering.
+    Handles special characters, null bytes, and encoding issues.
+    """
+    if not content:
+        return ""
+
+    # str.translate has a C fast path for pure-ASCII text only;
+    # anything else goes through one compiled-regex pass instead.
+    if content.isascii():
+        return content.translate(_PDF_TRANSLATION)
+
+    content = content.replace('\x00', '').replace('\t', '    ')
+    return _PDF_CONTROL_CHARS.sub(' ', content)
+
+
+def _prepare_content_for_pdf(content, max_chars=MAX_FILE_SIZE_FOR_PDF):
+    """Truncate first, then sanitize only the part that ends up in the PDF."""
+    return _sanitize_content_for_pdf(_truncate_content(content, max_chars))
+
+
+def generate_pdf(data, output_path, order=BREADTH_FIRST):
+    """
+    Generate PDF with robust error handling for large projects.
+    order: file order (see file_iterator.ORDERINGS), as in the text exports
+    """
+    if not data:
+        raise ValueError("No data provided for PDF generation")
+    
+    buffer = io.BytesIO()
+    
+    try:
+        doc = SimpleDocTemplate(
+            buffer, 
+            pagesize=letter,
+            rightMargin=72, 
+            leftMargin=72,
+            topMargin=72, 
+            bottomMargin=72
+        )
+        
+        styles = getSampleStyleSheet()
+        
+        # Add custom styles (with error handling for duplicates)
+        if 'FileHeadingStyle' not in [s.name for s in styles.byName.values()]:
+            styles.add(ParagraphStyle(
+                name='FileHeadingStyle', 
+                fontName='Helvetica-Bold', 
+                fontSize=14, 
+                leading=16, 
+                spaceAfter=12
+            ))
+        
+        if 'CodePreformattedStyle' not in [s.name for s in styles.byName.values()]:
+            styles.add(ParagraphStyle(
+                name='CodePreformattedStyle', 
+                fontName='Courier', 
+                fontSize=8, 
+                leading=10, 
+                textColor=black, 
+                spaceBefore=6, 
+                spaceAfter=6
+            ))
+        
+        story = []
+
+        # Title Page
+        title_style = ParagraphStyle(
+            'TitleStyle', 
+            fontSize=24, 
+            fontName='Helvetica-Bold', 
+            alignment=TA_CENTER, 
+            spaceAfter=24
+        )
+        
+        project_name = _escape_xml(data.get('name', 'Unknown Project'))
+        project_path = _escape_xml(data.get('path', ''))
+        
+        story.append(Paragraph(f"Project Scan Report: {project_name}", title_style))
+        story.append(Paragraph(f"Path: {project_path}", styles['Normal']))
+        story.append(Spacer(1, 0.2 * inch))
+
+        # Table of Contents (with depth limit)
+        story.append(Paragraph("Table of Contents", styles['Heading1']))
+        story.append(Spacer(1, 0.2 * inch))
+        
+        # Select the PDF files up front so the TOC only links to files
+        # that actually get a bookmark destination.
+        all_files = FileIterator(data, order=order, limit=MAX_FILES_IN_PDF)
+        pdf_files = list(all_files)
+        linked_paths = {node.get('path', '') for node in pdf_files}
+
+        toc_items = []
+        _build_toc_items(data, toc_items, styles, level=0, max_items=500, linked_paths=linked_paths)
+        story.extend(toc_items)
+        
+        story.append(PageBreak())
+
+        # Code File Contents
+        story.append(Paragraph("Code File Contents", styles['Heading1']))
+        
+        if all_files.truncated:
+            logger.warning(f"PDF export limited to {all_files.yielded} of {all_files.total} files")
+            story.append(Paragraph(
+                f"<i>Note: Showing first {all_files.yielded:,} of {all_files.total:,} files "
+                f"(PDF limit is {MAX_FILES_IN_PDF}).</i>",
+                styles['Normal']
+            ))
+            story.append(Spacer(1, 0.1 * inch))
+
+        for i, file_node in enumerate(pdf_files):
+            try:
+                if i > 0:
+                    story.append(PageBreak())
+
+                file_path = file_node.get('path', 'unknown')
+                story.append(NamedDestination(file_path))
+                
+                heading_text = _escape_xml(get_file_heading(file_path))
+                story.append(Paragraph(heading_text, styles['FileHeadingStyle']))
+
+                # Get and sanitize content
+                raw_content = file_node.get('content', '')
+                content = _prepare_content_for_pdf(raw_content)
+                
+                if content:
+                    # Use XPreformatted for better handling of special content
+                    try:
+                        story.append(Preformatted(content, styles['CodePreformattedStyle']))
+                    except Exception as e:
+                        # Fallback: escape and use paragraph
+                        logger.warning(f"Preformatted failed for {file_path}: {e}")
+                        escaped = _escape_xml(content[:5000])  # Limit fallback
+                        story.append(Paragraph(f"<pre>{escaped}</pre>", styles['Normal']))
+                else:
+                    story.append(Paragraph("<i>(Empty or binary file)</i>", styles['Normal']))
+                    
+                story.append(Spacer(1, 0.2 * inch))
+                
+            except Exception as e:
+                logger.error(f"Error processing file {file_node.get('path', '?')}: {e}")
+                story.append(Paragraph(
+                    f"<i>Error rendering file: {_escape_xml(str(e))}</i>",
+                    styles['Normal']
+                ))
+
+        # Build PDF
+        doc.build(story)
+        
+        # Write to file
+        with open(output_path, "wb") as f:
+            f.write(buffer.getvalue())
+            
+    except Exception as e:
+        logger.error(f"PDF generation failed: {e}")
+        raise RuntimeError(f"PDF generation failed: {e}") from e
+    finally:
+        buffer.close()
+
+
+def _build_toc_items(node, items_list, styles, level=0, max_items=500, current_count=None, linked_paths=None):
+    """
+    Build TOC items iteratively with limits.
+    linked_paths: paths of files rendered in the PDF (only these get links).
+    """
+    if current_count is None:
+        current_count = [0]  # Mutable counter
+    
+    if level > MAX_TOC_DEPTH or current_count[0] >= max_items:
+        return
+    
+    children = node.get('children', [])
+    if not children:
+        return
+        
+    sorted_children = sorted(children, key=lambda x: (x.get('type') != 'folder', x.get('name', '')))
+    indent_size = 12
+    
+    for child in sorted_children:
+        if current_count[0] >= max_items:
+            items_list.append(Paragraph(
+                f"<i>... and more items (TOC truncated at {max_items})</i>",
+                styles['Normal']
+            ))
+            return
+            
+        current_count[0] += 1
+        child_name = _escape_xml(child.get('name', 'unknown'))
+        
+        if child.get('type') == 'folder':
+            style = ParagraphStyle(
+                f'TOCFolderLevel{level}_{current_count[0]}', 
+                parent=styles['Normal'], 
+                leftIndent=indent_size * level, 
+                spaceAfter=2
+            )
+            items_list.append(Paragraph(f"📁 {child_name}/", style))
+            _build_toc_items(child, items_list, styles, level + 1, max_items, current_count, linked_paths)
+        else:
+            style = ParagraphStyle(
+                f'TOCFileLevel{level}_{current_count[0]}', 
+                parent=styles['Normal'], 
+                leftIndent=indent_size * level, 
+                spaceAfter=2
+            )
+            file_path = child.get('path', '')
+            has_content = child.get('content') is not None
+            if linked_paths is not None:
+                has_content = has_content and file_path in linked_paths
+            
+            if has_content:
+                # Only create clickable link if file has content (will have a bookmark destination)
+                safe_path = _sanitize_pdf_anchor(file_path)
+                items_list.append(Paragraph(
+                    f"<a href='#{safe_path}'><font color='blue'>📄 {child_name}</font></a>", 
+                    style
+                ))
+            else:
+                # Non-linkable entry for binary/unsupported files
+                items_list.append(Paragraph(f"📄 {child_name}", style))
+
+
+# --- Main Export Function ---
+
+def export_data(data, target_dir, formats, order=BREADTH_FIRST, token_budget=None, ranking_weights=None):
+    """
+    Exports the data to the specified formats in the target directory.
+    formats: list of strings ['json', 'txt_tree', 'txt_full', 'txt_shards', 'txt_budget', 'pdf']
+    order: file order for the full text and PDF exports (see file_iterator.ORDERINGS)
+    token_budget: tokens per part ('txt_shards') or in total ('txt_budget')
+    ranking_weights: file_ranker.RankingWeights for 'txt_budget' (defaults if None)
+    
+    Returns list of created file paths.
+    Raises exceptions with descriptive messages on failure.
+    """
+    if not data:
+        raise ValueError("No data to export")
+    
+    if not target_dir or not os.path.isdir(target_dir):
+        raise ValueError(f"Invalid target directory: {target_dir}")
+    
+    base_name = data.get('name', 'export')
+    # Sanitize filename
+    base_name = "".join(c for c in base_name if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+    if not base_name:
+        base_name = 'export'
+    
+    results = []
+    errors = []
+    
+    if 'json' in formats:
+        try:
+            out = get_unique_path(os.path.join(target_dir, f"{base_name}.json"))
+            with open(out, 'w', encoding='utf-8') as f:
+                json.dump(_public_tree(data), f, indent=4, ensure_ascii=False, default=str)
+            results.append(out)
+        except Exception as e:
+            errors.append(f"JSON export failed: {e}")
+            logger.error(f"JSON export failed: {e}")
+        
+    if 'txt_tree' in formats:
+        try:
+            out = get_unique_path(os.path.join(target_dir, f"{base_name}.tree.txt"))
+            with open(out, 'w', encoding='utf-8') as f:
+                f.write(generate_tree_text(data))
+            results.append(out)
+        except Exception as e:
+            errors.append(f"Tree text export failed: {e}")
+            logger.error(f"Tree text export failed: {e}")
+
+    if 'txt_full' in formats:
+        try:
+            out = get_unique_path(os.path.join(target_dir, f"{base_name}.full.txt"))
+            with open(out, 'w', encoding='utf-8') as f:
+                f.write(generate_full_text(data, order=order))
+            results.append(out)
+        except Exception as e:
+            errors.append(f"Full text export failed: {e}")
+            logger.error(f"Full text export failed: {e}")
+        
+    if 'txt_shards' in formats:
+        try:
+            if not token_budget:
+                raise ValueError("No token budget selected")
+            results.extend(export_text_shards(data, target_dir, base_name, token_budget, order=order))
+        except Exception as e:
+            errors.append(f"Split text export failed: {e}")
+            logger.error(f"Split text export failed: {e}")
+
+    if 'txt_budget' in formats:
+        try:
+            if not token_budget:
+                raise ValueError("No token budget selected")
+            out = get_unique_path(os.path.join(target_dir, f"{base_name}.bestfit.txt"))
+            with open(out, 'w', encoding='utf-8') as f:
+                f.write(generate_budget_text(data, token_budget, order=order, weights=ranking_weights))
+            results.append(out)
+        except Exception as e:
+            errors.append(f"Best fit export failed: {e}")
+            logger.error(f"Best fit export failed: {e}")
+
+    if 'pdf' in formats:
+        try:
+            out = get_unique_path(os.path.join(target_dir, f"{base_name}.pdf"))
+            generate_pdf(data, out, order=order)
+            results.append(out)
+        except Exception as e:
+            errors.append(f"PDF export failed: {e}")
+            logger.error(f"PDF export failed: {e}")
+    
+    # If all exports failed, raise an error
+    if not results and errors:
+        raise RuntimeError("All exports failed: " + "; ".join(errors))
+    
+    # If some succeeded but some failed, log warnings but return successes
+    if errors:
+        logger.warning(f"Some exports failed: {errors}")
+        
+    return results
@@ -0,0 +1,110 @@
+import heapq
+from collections import deque
+
+# Supported orderings for FileIterator
+BREADTH_FIRST = 'breadth_first'     # Folder by folder, shallow files first (export default)
+DEPTH_FIRST = 'depth_first'         # Same order as the tree view, subfolders inline
+PATH_SORTED = 'path'                # Alphabetical by relative path
+SMALLEST_FIRST = 'smallest_first'   # By size_bytes, ascending
+RECENT_FIRST = 'recent_first'       # By last_modified, newest first
+
+ORDERINGS = (BREADTH_FIRST, DEPTH_FIRST, PATH_SORTED, SMALLEST_FIRST, RECENT_FIRST)
+
+
+def _walk_breadth_first(root):
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for child in node.get('children', []):
+            if child.get('type') == 'folder':
+                queue.append(child)
+            elif child.get('type') == 'file':
+                yield child
+
+
+def _walk_depth_first(root):
+    # Stack of child iterators instead of recursion (deep trees are safe)
+    stack = [iter(root.get('children', []))]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif child.get('type') == 'folder':
+            stack.append(iter(child.get('children', [])))
+        elif child.get('type') == 'file':
+            yield child
+
+
+_SORT_KEYS = {
+    PATH_SORTED: (lambda n: n.get('path', ''), False),
+    SMALLEST_FIRST: (lambda n: n.get('size_bytes') or 0, False),
+    RECENT_FIRST: (lambda n: n.get('last_modified') or '', True),
+}
+
+
+class FileIterator:
+    """
+    Lazy iterator over the file nodes of a scan tree.
+
+    Walk orders (breadth/depth first) stream in O(n). Sorted orders need
+    every node first: O(n log n), or O(n log limit) when a limit is set.
+
+    Limits are reported instead of silently applied: once iteration
+    finishes, `yielded`, `total` and `truncated` describe what was left out.
+
+    Usage:
+        files = FileIterator(data, order='path', limit=500)
+        for node in files: ...
+        if files.truncated: print(f"{files.total - files.yielded} files skipped")
+    """
+
+    def __init__(self, root, order=BREADTH_FIRST, limit=None, content_only=True):
+        if order not in ORDERINGS:
+            raise ValueError(f"Unknown file order '{order}'. Expected one of: {', '.join(ORDERINGS)}")
+        self.root = root or {}
+        self.order = order
+        self.limit = limit
+        self.content_only = content_only
+
+        self.yielded = 0
+        self.total = None  # Known once iteration is complete
+
+    @property
+    def truncated(self):
+        return self.total is not None and self.total > self.yielded
+
+    def _matches(self, node):
+        return not self.content_only or node.get('content') is not None
+
+    def _candidates(self):
+        walk = _walk_depth_first if self.order == DEPTH_FIRST else _walk_breadth_first
+        return (node for node in walk(self.root) if self._matches(node))
+
+    def __iter__(self):
+        self.yielded = 0
+        self.total = None
+
+        if self.order in _SORT_KEYS:
+            key, reverse = _SORT_KEYS[self.order]
+            nodes = list(self._candidates())
+            self.total = len(nodes)
+            if self.limit is not None and self.limit < len(nodes):
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                nodes = select(self.limit, nodes, key=key)
+            else:
+                nodes.sort(key=key, reverse=reverse)
+            for node in nodes:
+                self.yielded += 1
+                yield node
+            return
+
+        candidates = self._candidates()
+        for node in candidates:
+            if self.limit is not None and self.yielded >= self.limit:
+                # Keep counting (no yields) so the caller can report the overflow
+                self.total = self.yielded + 1 + sum(1 for _ in candidates)
+                return
+            self.yielded += 1
+            yield node
+        self.total = self.yielded
+
@@ -0,0 +1,86 @@
+from array import array
+from bisect import bisect_left
+
+CHUNK_BYTES = 1 << 16
+MAX_LINE_BYTES = 1 << 14  # Longer lines are cut in the preview (minified files, binary junk)
+
+
+class LineIndex:
+    """
+    Where the lines of a (large) text file start, without keeping the text.
+
+    One checkpoint per 64 KB chunk records how many newlines come before
+    that byte offset. A line is found by seeking to the checkpoint before
+    it and counting newlines inside that one chunk, so a multi-hundred-MB
+    log costs one sequential read and a few thousand checkpoints to index.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = 0
+        self._offsets = array('q', [0])  # Checkpoint byte offsets
+        self._lines = array('q', [0])    # Newlines before each checkpoint
+
+    def build(self, cancelled=None):
+        """Read the file once and record its checkpoints. False if cancelled."""
+        offsets = array('q', [0])
+        lines = array('q', [0])
+        pos = 0
+        count = 0
+        with open(self.path, 'rb') as f:
+            while True:
+                if cancelled is not None and cancelled():
+                    return False
+                chunk = f.read(CHUNK_BYTES)
+                if not chunk:
+                    break
+                count += chunk.count(b'\n')
+                pos += len(chunk)
+                offsets.append(pos)
+                lines.append(count)
+        self.size = pos
+        self._offsets = offsets
+        self._lines = lines
+        return True
+
+    @property
+    def line_count(self):
+        return self._lines[-1] + 1
+
+    def _line_offset(self, f, line):
+        """Byte offset where a 0-based line starts (the end of the file past the last line)."""
+        if line <= 0:
+            return 0
+        if line > self._lines[-1]:
+            return self.size
+        # Last checkpoint with fewer newlines before it than the line: the line starts in its chunk
+        i = bisect_left(self._lines, line) - 1
+        f.seek(self._offsets[i])
+        data = f.read(self._offsets[i + 1] - self._offsets[i])
+        pos = -1
+        for _ in range(line - self._lines[i]):
+            pos = data.find(b'\n', pos + 1)
+            if pos == -1:
+                return self._offsets[i] + len(data)  # Changed since it was indexed
+        return self._offsets[i] + pos + 1
+
+    def read_lines(self, start, count):
+        """Up to count lines from a 0-based line, decoded as UTF-8, without line endings."""
+        result = []
+        with open(self.path, 'rb') as f:
+            f.seek(self._line_offset(f, start))
+            for _ in range(count):
+                raw = f.readline(MAX_LINE_BYTES)
+                if not raw:
+                    break
+                cut = len(raw) == MAX_LINE_BYTES and not raw.endswith(b'\n')
+                if cut:
+                    # Skip the rest of the line
+                    while True:
+                        rest = f.readline(CHUNK_BYTES)
+                        if not rest or rest.endswith(b'\n'):
+                            break
+                text = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+                result.append(text + " …" if cut else text)
+        return result
+
@@ -1,143 +1,367 @@
-import os
-import json
-from PyQt5.QtGui import QIcon
-from src.config import resource_path
-
-class IconManager:
-    _instance = None
-    _icon_cache = {}
-    _mappings = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(IconManager, cls).__new__(cls)
-            cls._instance.base_path = resource_path("assets/Files Icon")
-            cls._instance._load_mappings()
-        return cls._instance
-
-    def _load_mappings(self):
-        """Load icon mappings from the JSON file."""
-        if self._mappings is not None:
-            return
-            
-        mapping_path = resource_path("assets/icon_mappings.json")
-        try:
-            with open(mapping_path, 'r', encoding='utf-8') as f:
-                self._mappings = json.load(f)
-        except Exception as e:
-            print(f"Error loading icon mappings: {e}")
-            self._mappings = {
-                "fileNames": {},
-                "fileExtensions": {},
-                "folderNames": {},
-                "folderNamesExpanded": {}
-            }
-
-    def _get_icon(self, icon_name: str) -> QIcon:
-        """Helper to load and cache QIcon from svg name."""
-        if not icon_name:
-            return QIcon()
-            
-        if icon_name in self._icon_cache:
-            return self._icon_cache[icon_name]
-        
-        # Some icons in the theme have .clone.svg suffix in definitions, 
-        # but our moved files usually keep the base name. 
-        # The mappings from the JSON give us the icon identity.
-        path = os.path.join(self.base_path, f"{icon_name}.svg")
-        
-        # Fallback for clones or unusual names
-        if not os.path.exists(path):
-             # Try without potential suffix if mapping was "python.clone" or similar
-             base_id = icon_name.split('.')[0]
-             path = os.path.join(self.base_path, f"{base_id}.svg")
-             
-        if not os.path.exists(path):
-            return QIcon()
-            
-        icon = QIcon(path)
-        self._icon_cache[icon_name] = icon
-        return icon
-
-    def get_file_icon(self, filename: str) -> QIcon:
-        """Get icon for a file based on name or extension (Material Theme logic)."""
-        name_lower = filename.lower()
-        
-        # 1. Check exact filename matches (e.g. package.json, dockerfile)
-        file_names = self._mappings.get("fileNames", {})
-        if name_lower in file_names:
-            icon = self._get_icon(file_names[name_lower])
-            if not icon.isNull():
-                return icon
-
-        # 2. Check Extension Match (multi-part support like .test.js)
-        exts = self._mappings.get("fileExtensions", {})
-        parts = name_lower.split('.')
-        
-        # Iterate from longest extension to shortest (.test.js -> .js)
-        # index 0 is usually name, so start from 1
-        for i in range(1, len(parts)):
-            candidate = ".".join(parts[i:])
-            if candidate in exts:
-                icon = self._get_icon(exts[candidate])
-                if not icon.isNull():
-                    return icon
-
-        # 3. Fallback: try raw extension if not found in mappings
-        # Some icons are named directly after the extension (e.g. dart.svg, zig.svg)
-        ext = os.path.splitext(name_lower)[1]
-        if ext and ext.startswith('.'):
-            bare_ext = ext[1:]
-            # Try mapping first
-            if bare_ext in exts:
-                icon = self._get_icon(exts[bare_ext])
-                if not icon.isNull():
-                    return icon
-            
-            # Try using the extension name directly as the icon ID
-            icon = self._get_icon(bare_ext)
-            if not icon.isNull():
-                return icon
-
-        # 4. Final Fallback: Generic File
-        return self._get_icon("file")
-
-    def get_folder_icon(self, foldername: str, is_open: bool = False) -> QIcon:
-        """Get icon for a folder (Material Theme logic)."""
-        name_lower = foldername.lower()
-        
-        folder_names = self._mappings.get("folderNames", {})
-        folder_names_expanded = self._mappings.get("folderNamesExpanded", {})
-        
-        # 1. Try specific folder name match
-        icons_to_check = folder_names_expanded if is_open else folder_names
-        
-        if name_lower in icons_to_check:
-            icon = self._get_icon(icons_to_check[name_lower])
-            if not icon.isNull():
-                return icon
-        
-        # 2. Derive state from alternate state if only one exists
-        alt_icons = folder_names if is_open else folder_names_expanded
-        if name_lower in alt_icons:
-            icon_id = alt_icons[name_lower]
-            suffix = "-open" if is_open else ""
-            # Strip potential existing state suffixes and apply target suffix
-            base_id = icon_id.replace("-open", "").replace("_open", "")
-            derived_id = f"{base_id}{suffix}"
-            
-            icon = self._get_icon(derived_id)
-            if not icon.isNull():
-                return icon
-            # Use the alt ID as final specific fallback
-            icon = self._get_icon(icon_id)
-            if not icon.isNull():
-                return icon
-
-        # 3. Generic folder fallback
-        generic_id = "folder-open" if is_open else "folder"
-        icon = self._get_icon(generic_id)
-        if not icon.isNull():
-            return icon
-            
-        return QIcon()
+import os
+import json
+import hashlib
+from PyQt5.QtCore import Qt, QRectF, QThread, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+from src.config import resource_path, get_config_dir
+from src.backend.utils import save_png
+
+# Compiled lookup table cached in User_Data; bump the version when its layout changes
+ICON_TABLE_VERSION = 1
+ICON_TABLE_FILE = "icon_table.json"
+
+# Pre-rendered PNGs in User_Data, one folder per icon set, size and device pixel ratio
+ICON_CACHE_DIR = "icon_cache"
+
+NO_ICON = -1
+
+
+def compile_icon_table(mappings, icon_files):
+    """
+    Resolve the Material theme mappings against the SVGs that actually exist,
+    once, into a table of icon indexes:
+      icons:      SVG file names (an index points into this list)
+      fileNames:  lowercase file name -> index
+      extensions: lowercase multi-part extension ('test.js', 'js') -> index
+      folders:    lowercase folder name -> [closed index, open index]
+      file / folder / folderOpen: generic fallbacks
+    Entries whose icon is missing are dropped, so lookups never touch the disk.
+    """
+    icons = sorted(icon_files)
+    index = {name: i for i, name in enumerate(icons)}
+
+    def resolve(icon_id):
+        if not icon_id:
+            return NO_ICON
+        # Some icons in the theme have .clone.svg suffix in definitions, but our
+        # moved files usually keep the base name
+        found = index.get(f"{icon_id}.svg")
+        if found is None:
+            found = index.get(f"{icon_id.split('.')[0]}.svg", NO_ICON)
+        return found
+
+    def resolved(table):
+        result = {}
+        for key, icon_id in table.items():
+            found = resolve(icon_id)
+            if found != NO_ICON:
+                result[key] = found
+        return result
+
+    generic_closed, generic_open = resolve("folder"), resolve("folder-open")
+    closed_names = mappings.get("folderNames", {})
+    open_names = mappings.get("folderNamesExpanded", {})
+
+    def folder(name, is_open):
+        own, alt = (open_names, closed_names) if is_open else (closed_names, open_names)
+        found = resolve(own.get(name))
+        if found == NO_ICON and name in alt:
+            # Derive the state from the alternate one: strip state suffixes, apply ours
+            icon_id = alt[name]
+            base_id = icon_id.replace("-open", "").replace("_open", "")
+            found = resolve(f"{base_id}-open" if is_open else base_id)
+            if found == NO_ICON:
+                found = resolve(icon_id)
+        if found == NO_ICON:
+            found = generic_open if is_open else generic_closed
+        return found
+
+    extensions = resolved(mappings.get("fileExtensions", {}))
+    return {
+        "icons": icons,
+        "fileNames": resolved(mappings.get("fileNames", {})),
+        "extensions": extensions,
+        "extensionParts": max((ext.count('.') + 1 for ext in extensions), default=1),
+        "folders": {name: [folder(name, False), folder(name, True)] for name in set(closed_names) | set(open_names)},
+        "file": resolve("file"),
+        "folder": generic_closed,
+        "folderOpen": generic_open,
+    }
+
+
+def load_icon_table(mapping_path, icons_dir):
+    """
+    The compiled icon table, from the User_Data cache when it was built from
+    the same mappings and icon set, otherwise compiled now and cached.
+    """
+    icon_files = [f for f in os.listdir(icons_dir) if f.endswith('.svg')] if os.path.isdir(icons_dir) else []
+    with open(mapping_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.md5(raw)
+    digest.update('\n'.join(sorted(icon_files)).encode('utf-8'))
+    signature = f"{ICON_TABLE_VERSION}:{digest.hexdigest()}"
+
+    cache_path = os.path.join(get_config_dir(), ICON_TABLE_FILE)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("signature") == signature:
+            return cached["table"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    table = compile_icon_table(json.loads(raw), icon_files)
+    table["signature"] = signature
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"signature": signature, "table": table}, f, separators=(',', ':'))
+    except OSError as e:
+        print(f"Error caching icon table: {e}")
+    return table
+
+
+def rasterize_icon(svg_path, png_path, pixels):
+    """
+    QImage of an icon, pixels wide: the cached PNG if there is one, otherwise
+    rendered from the SVG and cached. Safe to call off the GUI thread.
+    """
+    if os.path.exists(png_path):
+        image = QImage(png_path)
+        if not image.isNull():
+            return image
+
+    renderer = QSvgRenderer(svg_path)
+    if not renderer.isValid():
+        return None
+    image = QImage(pixels, pixels, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    # Keep the SVG's aspect ratio, centered
+    view = renderer.defaultSize()
+    scale = pixels / max(view.width(), view.height(), 1)
+    width, height = view.width() * scale, view.height() * scale
+    painter = QPainter(image)
+    renderer.render(painter, QRectF((pixels - width) / 2, (pixels - height) / 2, width, height))
+    painter.end()
+
+    save_png(image, png_path)
+    return image
+
+
+class IconRasterThread(QThread):
+    """
+    Pre-renders icons off the GUI thread (see IconManager.warm_icons).
+    Gets plain (index, svg path, png path) jobs, so it never reads the
+    scan tree or the manager's memos while the GUI thread uses them.
+    """
+    icons_ready = pyqtSignal(object, object)  # raster key, [(icon index, QImage)]
+
+    def __init__(self, jobs, key, pixels, parent=None):
+        super().__init__(parent)
+        self.jobs = jobs
+        self.key = key
+        self.pixels = pixels
+
+    def run(self):
+        try:
+            images = []
+            for index, svg_path, png_path in self.jobs:
+                image = rasterize_icon(svg_path, png_path, self.pixels)
+                if image is not None:
+                    images.append((index, image))
+        except Exception as e:
+            print(f"Error rendering icons: {e}")
+            return
+        self.icons_ready.emit(self.key, images)
+
+
+class IconManager:
+    _instance = None
+
+    # Memos in front of the table: most names repeat (index.js, __init__.py, src...)
+    MEMO_LIMIT = 200_000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(IconManager, cls).__new__(cls)
+            cls._instance.base_path = resource_path("assets/Files Icon")
+            cls._instance._load_table()
+        return cls._instance
+
+    def _load_table(self):
+        """Load the compiled icon table (built from assets/icon_mappings.json on first run)."""
+        try:
+            table = load_icon_table(resource_path("assets/icon_mappings.json"), self.base_path)
+        except Exception as e:
+            print(f"Error loading icon mappings: {e}")
+            table = compile_icon_table({}, [])
+
+        self._icon_files = table["icons"]
+        self._file_names = table["fileNames"]
+        self._extensions = table["extensions"]
+        self._extension_parts = table["extensionParts"]
+        self._folders = table["folders"]
+        self._default_file = table["file"]
+        self._default_folder = (table["folder"], table["folderOpen"])
+        self._signature = table.get("signature", "")
+        # Icons named after an extension (e.g. dart.svg, zig.svg) are used when no mapping matches
+        self._bare_extensions = {
+            name[:-4]: i for i, name in enumerate(self._icon_files) if '.' not in name[:-4]
+        }
+
+        self._icons = [None] * len(self._icon_files)  # index -> QIcon, created on first use
+        self._raster_key = None  # (logical size, device pixel ratio) icons are pre-rendered at
+        self._rastered = set()   # Indexes whose QIcon is a pre-rendered pixmap
+        self._file_memo = {}     # file name -> QIcon
+        self._suffix_memo = {}   # (longest candidate extension, has a real extension) -> icon index
+        self._folder_memo = {}   # (folder name, is_open) -> QIcon
+
+    def _icon(self, index) -> QIcon:
+        if index == NO_ICON:
+            return QIcon()
+        icon = self._icons[index]
+        if icon is None:
+            # A PNG rendered by an earlier run loads without parsing the SVG
+            png_path = self._png_path(index, self._raster_key) if self._raster_key else None
+            image = QImage(png_path) if png_path and os.path.exists(png_path) else None
+            if image is not None and not image.isNull():
+                icon = self._pixmap_icon(image, self._raster_key)
+                self._rastered.add(index)
+            else:
+                icon = QIcon(self._svg_path(index))  # Not rendered yet, or unreadable
+            self._icons[index] = icon
+        return icon
+
+    # --- Pre-rendering ---
+
+    def _svg_path(self, index):
+        return os.path.join(self.base_path, self._icon_files[index])
+
+    @staticmethod
+    def _pixels(key):
+        size, ratio = key
+        return max(1, round(size * ratio))
+
+    def _png_path(self, index, key):
+        size, ratio = key
+        folder = f"{self._signature.rpartition(':')[2][:12] or 'default'}/{size}@{ratio:g}x"
+        return os.path.join(get_config_dir(), ICON_CACHE_DIR, folder, f"{self._icon_files[index][:-4]}.png")
+
+    @staticmethod
+    def _pixmap_icon(image, key):
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[1])
+        return QIcon(pixmap)
+
+    def set_raster_size(self, size, ratio):
+        """Size and device pixel ratio the views paint icons at (a change drops the pre-rendered ones)."""
+        key = (int(size), float(ratio))
+        if key == self._raster_key:
+            return
+        self._raster_key = key
+        self._icons = [None] * len(self._icon_files)
+        self._rastered.clear()
+        self._file_memo.clear()
+        self._folder_memo.clear()
+
+    def icon_indexes(self, root):
+        """Indexes of every icon a scan tree shows (files, and folders in both states)."""
+        indexes = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.get('type') == 'folder':
+                indexes.update(self._folders.get(node.get('name', '').lower(), self._default_folder))
+                stack.extend(node.get('children', ()))
+            else:
+                indexes.add(self._file_icon_index(node.get('name', '')))
+        indexes.discard(NO_ICON)
+        return indexes
+
+    def warm_icons(self, root, parent=None):
+        """
+        Start rendering the icons root uses in the background, from cached PNGs
+        or their SVGs, so rows never render an SVG while painting. Connect the
+        returned thread's icons_ready to add_rendered_icons, then start it.
+        None if there is nothing to render.
+
+        The icons to render are picked here, on the GUI thread: the scan tree
+        and the memos are only ever touched from it.
+        """
+        key = self._raster_key
+        if key is None:
+            return None
+        indexes = sorted(self.icon_indexes(root) - self._rastered)
+        if not indexes:
+            return None
+        jobs = [(index, self._svg_path(index), self._png_path(index, key)) for index in indexes]
+        return IconRasterThread(jobs, key, self._pixels(key), parent)
+
+    def add_rendered_icons(self, key, images):
+        """Swap in the icons pre-rendered by an IconRasterThread (GUI thread). False if none applied."""
+        if key != self._raster_key or not images:
+            return False
+        for index, image in images:
+            self._icons[index] = self._pixmap_icon(image, key)
+            self._rastered.add(index)
+        # The memos still hold the SVG icons
+        self._file_memo.clear()
+        self._folder_memo.clear()
+        return True
+
+    def get_file_icon(self, filename: str) -> QIcon:
+        """Get icon for a file based on name or extension (Material Theme logic)."""
+        icon = self._file_memo.get(filename)
+        if icon is None:
+            if len(self._file_memo) >= self.MEMO_LIMIT:
+                self._file_memo.clear()
+            icon = self._file_memo[filename] = self._icon(self._file_icon_index(filename))
+        return icon
+
+    def _file_icon_index(self, filename):
+        name_lower = filename.lower()
+
+        # 1. Exact filename matches (e.g. package.json, dockerfile)
+        found = self._file_names.get(name_lower)
+        if found is not None:
+            return found
+
+        # 2. Extension match, longest first (.test.js -> .js); only as many parts as any mapping has
+        last_dot = name_lower.rfind('.')
+        if last_dot == -1:
+            return self._default_file
+        start = last_dot
+        for _ in range(self._extension_parts - 1):
+            dot = name_lower.rfind('.', 0, start)
+            if dot == -1:
+                break
+            start = dot
+        key = (name_lower[start + 1:], name_lower[:last_dot].strip('.') != '')
+        found = self._suffix_memo.get(key)
+        if found is None:
+            found = self._match_extension(*key)
+            if len(self._suffix_memo) >= self.MEMO_LIMIT:
+                self._suffix_memo.clear()
+            self._suffix_memo[key] = found
+        return found
+
+    def _match_extension(self, suffix, has_extension):
+        candidate = suffix
+        while True:
+            found = self._extensions.get(candidate)
+            if found is not None:
+                return found
+            dot = candidate.find('.')
+            if dot == -1:
+                break
+            candidate = candidate[dot + 1:]
+
+        # 3. Fallback: an icon named after the raw extension
+        if has_extension:
+            found = self._bare_extensions.get(candidate)
+            if found is not None:
+                return found
+
+        # 4. Final Fallback: Generic File
+        return self._default_file
+
+    def get_folder_icon(self, foldername: str, is_open: bool = False) -> QIcon:
+        """Get icon for a folder (Material Theme logic)."""
+        key = (foldername, is_open)
+        icon = self._folder_memo.get(key)
+        if icon is None:
+            states = self._folders.get(foldername.lower(), self._default_folder)
+            if len(self._folder_memo) >= self.MEMO_LIMIT:
+                self._folder_memo.clear()
+            icon = self._folder_memo[key] = self._icon(states[1] if is_open else states[0])
+        return icon
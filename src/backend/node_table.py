@@ -0,0 +1,122 @@
+import os
+import threading
+
+# Private key on the scan root holding its NodeTable (stripped from JSON exports)
+NODE_TABLE_KEY = '_nodes'
+
+ROOT_ID = 0
+NO_PARENT = -1
+
+
+class NodeTable:
+    """
+    Stable integer ids for the nodes of one scan tree.
+
+    Views keep ids instead of references or copies of the node dicts. Ids
+    are handed out lazily, one folder at a time, when its children are
+    first asked for. The same node always keeps the same id.
+
+    Absolute paths are not stored. They are derived on demand from the
+    root's abs_path and the node's relative path.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._nodes = [root]           # id -> node
+        self._parents = [NO_PARENT]    # id -> parent id
+        self._children = {}            # id -> (children list the ids were taken from, [child ids])
+        self._by_path = {root.get('path', '.'): ROOT_ID}  # Relative path -> id (nodes with ids only)
+        self._lock = threading.Lock()  # Indexes are built on worker threads while the view fetches rows
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def node(self, node_id):
+        return self._nodes[node_id]
+
+    def parent_id(self, node_id):
+        return self._parents[node_id]
+
+    def child_ids(self, node_id):
+        """Ids of a node's current children, in scan order."""
+        children = self._nodes[node_id].get('children')
+        if not children:
+            return ()
+        cached = self._children.get(node_id)
+        if cached is not None and cached[0] is children and len(cached[1]) == len(children):
+            return cached[1]
+
+        with self._lock:
+            # First request, or the children list was replaced (e.g. a removal): keep known ids
+            cached = self._children.get(node_id)
+            known = {id(self._nodes[i]): i for i in cached[1]} if cached else {}
+            ids = []
+            for child in children:
+                child_id = known.get(id(child))
+                if child_id is None:
+                    child_id = len(self._nodes)
+                    self._nodes.append(child)
+                    self._parents.append(node_id)
+                    self._by_path[child.get('path')] = child_id
+                ids.append(child_id)
+            self._children[node_id] = (children, ids)
+        return ids
+
+    def id_of(self, rel_path):
+        """Id of the node at a relative path (None if there is none), without walking the tree."""
+        node_id = self._by_path.get(rel_path)
+        if node_id is None and rel_path:
+            # Not handed out yet: give ids to the parent folder's children
+            parent = os.path.dirname(rel_path)
+            parent_id = self.id_of(parent) if parent else ROOT_ID
+            if parent_id is None:
+                return None
+            self.child_ids(parent_id)
+            node_id = self._by_path.get(rel_path)
+        return node_id
+
+    def is_attached(self, node_id):
+        """False once the node, or a folder above it, was removed from the tree."""
+        while node_id != ROOT_ID:
+            parent = self._parents[node_id]
+            if node_id not in self.child_ids(parent):
+                return False
+            node_id = parent
+        return True
+
+    def walk(self, node_id=ROOT_ID):
+        """Ids of node_id and all its descendants (pre-order, assigning ids as it goes)."""
+        stack = [node_id]
+        nodes = self._nodes
+        while stack:
+            current = stack.pop()
+            yield current
+            if 'children' in nodes[current]:
+                stack.extend(reversed(self.child_ids(current)))
+
+    def rel_path(self, node_id):
+        return self._nodes[node_id].get('path', '')
+
+    def abs_path(self, node_id):
+        """Absolute path of a node, resolved against the scanned folder (not the process cwd)."""
+        base = self.root.get('abs_path') or ''
+        path = self.rel_path(node_id)
+        if node_id == ROOT_ID or not path or path == '.':
+            return base
+        if os.path.isabs(path):
+            return os.path.normpath(path)
+        return os.path.normpath(os.path.join(base, path))
+
+
+_table_lock = threading.Lock()
+
+
+def node_table(root):
+    """The NodeTable of a scan tree, created on first use and kept on the root."""
+    table = root.get(NODE_TABLE_KEY)
+    if table is None:
+        with _table_lock:
+            table = root.get(NODE_TABLE_KEY)
+            if table is None:
+                table = root[NODE_TABLE_KEY] = NodeTable(root)
+    return table
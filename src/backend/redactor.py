@@ -0,0 +1,181 @@
+import re
+import math
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+REDACTED = '***REDACTED***'
+
+# Key names whose assigned value is always redacted (`password = ...`, `token: ...`)
+SENSITIVE_KEYS = ['api_key', 'token', 'secret', 'password']
+
+# --- Rule Definitions ---
+
+@dataclass(frozen=True)
+class RedactionRule:
+    """
+    One secret shape.
+    pattern:     regex for the secret. If it has capture groups, only the last
+                 participating group is replaced and the rest is kept
+                 (e.g. the `password = ` part); otherwise the whole match is.
+                 Named groups are not allowed. Patterns whose branches all
+                 start with a literal character keep the combined scan fast.
+    min_entropy: if set, a match is only redacted when the replaced text
+                 reaches this Shannon entropy (bits per char) and mixes
+                 lower case, upper case and digits.
+    """
+    name: str
+    pattern: str
+    min_entropy: float = 0.0
+
+
+def key_assignment_rule(keys=SENSITIVE_KEYS):
+    """`<key> = value` / `<key>: value` (case-insensitive), value redacted to end of line."""
+    branches = []
+    for key in keys:
+        # Spell out both cases of the first letter instead of a global (?i)
+        # so the regex engine can skip ahead on a first-character set.
+        head, tail = key[0], re.escape(key[1:])
+        for first in sorted({head.lower(), head.upper()}):
+            branches.append(rf'{re.escape(first)}(?i:{tail})\s*[:=]\s*(.+)')
+    return RedactionRule('key_assignment', '|'.join(branches))
+
+
+TOKEN_SHAPE_RULES = [
+    RedactionRule(
+        'pem_private_key',
+        r'-----BEGIN [A-Z0-9 ]*PRIVATE KEY-----[\s\S]*?-----END [A-Z0-9 ]*PRIVATE KEY-----'
+    ),
+    RedactionRule('aws_access_key_id', r'A[KS]IA[0-9A-Z]{16}(?![0-9A-Za-z])'),
+    RedactionRule(
+        'aws_secret_access_key',
+        r'a(?i:ws_secret_access_key)\s*[:=]\s*["\']?([A-Za-z0-9/+=]{40})'
+        r'|A(?i:WS_SECRET_ACCESS_KEY)\s*[:=]\s*["\']?([A-Za-z0-9/+=]{40})'
+    ),
+    RedactionRule('github_token', r'gh[pousr]_[A-Za-z0-9]{36,255}|github_pat_[A-Za-z0-9_]{22,255}'),
+]
+
+# Long base64 / url-safe runs that look random (API keys, signed blobs).
+# Hex digests top out at 4 bits/char, so git SHAs and checksums are left alone.
+# Opt-in: it starts on any character, which makes the combined scan slower.
+HIGH_ENTROPY_RULE = RedactionRule(
+    'high_entropy_string',
+    r'(?<![A-Za-z0-9+/=_-])[A-Za-z0-9+/_-]{32,}={0,2}(?![A-Za-z0-9+/=_-])',
+    min_entropy=4.5
+)
+
+
+def build_rules(keys=SENSITIVE_KEYS, token_shapes=True, high_entropy=False):
+    """Assemble a rule set. Order matters: earlier rules win at the same position."""
+    rules = []
+    if token_shapes:
+        rules.extend(TOKEN_SHAPE_RULES)
+    if keys:
+        rules.append(key_assignment_rule(keys))
+    if high_entropy:
+        rules.append(HIGH_ENTROPY_RULE)
+    return rules
+
+
+def shannon_entropy(text):
+    """Shannon entropy of the character distribution, in bits per char."""
+    if not text:
+        return 0.0
+    length = len(text)
+    return -sum((n / length) * math.log2(n / length) for n in Counter(text).values())
+
+
+def _looks_random(text, min_entropy):
+    # Alphabets, identifiers and URL paths have high entropy too;
+    # generated secrets mix all three character classes.
+    return (
+        shannon_entropy(text) >= min_entropy
+        and any(c.isdigit() for c in text)
+        and any(c.islower() for c in text)
+        and any(c.isupper() for c in text)
+        and text.count('/') < 3
+    )
+
+
+# --- Engine ---
+
+class SecretRedactor:
+    """
+    Compiles a rule set once into a single alternation and redacts a file
+    in one scanner pass. Results are cached by content hash, so unchanged
+    files are not re-scanned by repeated exports and token estimates.
+    """
+
+    def __init__(self, rules=None, cache_size=50_000):
+        self.rules = tuple(build_rules() if rules is None else rules)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # digest -> redacted text, or None if unchanged
+        self._lock = threading.Lock()
+
+        # The combined scanner only finds *where* something matches; which
+        # rule matched is resolved afterwards (matches are rare) by re-running
+        # the rules in order at that position, which mirrors alternation order.
+        self._compiled = [(rule, re.compile(rule.pattern)) for rule in self.rules]
+        self._scanner = re.compile('|'.join(rule.pattern for rule in self.rules)) if self.rules else None
+
+    def _replace(self, match):
+        text, pos = match.string, match.start()
+        for rule, regex in self._compiled:
+            found = regex.match(text, pos)
+            if found:
+                break
+        else:
+            return match.group(0)
+
+        group = found.lastindex or 0
+        start, end = found.span(group)
+        if rule.min_entropy and not _looks_random(text[start:end], rule.min_entropy):
+            return match.group(0)
+        return text[pos:start] + REDACTED + text[end:match.end()]
+
+    def redact_uncached(self, text):
+        if not text or self._scanner is None:
+            return text
+        return self._scanner.sub(self._replace, text)
+
+    def redact(self, text):
+        if not text or self._scanner is None:
+            return text
+
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                cached = self._cache[key]
+                return text if cached is None else cached
+
+        redacted = self.redact_uncached(text)
+
+        with self._lock:
+            self._cache[key] = None if redacted == text else redacted
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return redacted
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+_default_redactor = None
+
+
+def get_redactor():
+    """Shared redactor used by exports and token estimates."""
+    global _default_redactor
+    if _default_redactor is None:
+        _default_redactor = SecretRedactor()
+    return _default_redactor
+
+
+def configure_redaction(rules):
+    """Replace the shared rule set (and its cache)."""
+    global _default_redactor
+    _default_redactor = SecretRedactor(rules)
+    return _default_redactor
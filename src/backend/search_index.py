@@ -0,0 +1,311 @@
+import fnmatch
+import os
+import re
+import threading
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate, compress, islice
+
+from src.backend.node_table import node_table, ROOT_ID, NO_PARENT
+
+# Private key on the scan root holding its SearchIndex (stripped from JSON exports)
+SEARCH_INDEX_KEY = '_search'
+
+
+class SearchIndex:
+    """
+    Name and path index of one scan tree, built once per scan.
+
+    Every lowercased node name is joined into one newline-separated string
+    with a table of start offsets. A query is a single C-level regex scan
+    of that string, and each hit maps back to its node id with a bisect.
+    No per-node Python work is done while the user types.
+
+    A query containing a path separator ('components/tree') is matched
+    against the nodes' relative paths instead, joined the same way on
+    first use.
+    """
+
+    def __init__(self, root):
+        self.table = node_table(root)
+        self.ids = list(self.table.walk())
+        self._removed = set()  # Ids removed from the tree since the scan (with their descendants)
+        nodes = [self.table.node(node_id) for node_id in self.ids]
+
+        # Exact names -> ids, for removals by name ("Ignore This File/Folder")
+        self._by_name = {}
+        for node_id, node in zip(self.ids, nodes):
+            name = node.get('name', '')
+            if name in self._by_name:
+                self._by_name[name].append(node_id)
+            else:
+                self._by_name[name] = [node_id]
+
+        names = [node.get('name', '').lower() for node in nodes]
+        self._names, self._starts = _joined(names)
+        self._paths = None  # (joined relative paths, starts), built by the first path query
+
+        # Quick-open: file paths ('/'-separated, lowercased), shortest first (the usual tie-break)
+        files = [
+            (node.get('path', '').replace('\\', '/').lower(), node_id)
+            for node_id, node in zip(self.ids, nodes) if node.get('type') == 'file'
+        ]
+        files.sort(key=lambda f: len(f[0]))
+        self.file_ids = [node_id for _, node_id in files]
+        self.paths = [path for path, _ in files]
+        self.names = [path[path.rfind('/') + 1:] for path in self.paths]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def match_names(self, text):
+        """
+        Ids of nodes whose name contains text (case-insensitive), or whose
+        relative path does if text contains '/' or '\\'.
+        """
+        text = text.lower()
+        if not text or '\n' in text:
+            return []
+        if '/' in text or '\\' in text:
+            if self._paths is None:
+                self._paths = _joined([
+                    self.table.node(node_id).get('path', '').replace('\\', '/').lower() for node_id in self.ids
+                ])
+            haystack, starts = self._paths
+            text = text.replace('\\', '/')
+        else:
+            haystack, starts = self._names, self._starts
+        ids, removed = self.ids, self._removed
+        matched = []
+        last = -1
+        for hit in re.finditer(re.escape(text), haystack):
+            index = bisect_right(starts, hit.start()) - 1
+            if index != last:
+                if ids[index] not in removed:
+                    matched.append(ids[index])
+                last = index
+        return matched
+
+    def forget(self, node_ids):
+        """Drop removed nodes and everything below them, so later queries skip them."""
+        removed, by_name, table = self._removed, self._by_name, self.table
+        for node_id in node_ids:
+            for sub_id in table.walk(node_id):
+                if sub_id in removed:
+                    continue
+                removed.add(sub_id)
+                name = table.node(sub_id).get('name', '')
+                same_name = by_name.get(name)
+                if same_name and sub_id in same_name:
+                    same_name.remove(sub_id)
+                    if not same_name:
+                        del by_name[name]
+
+    def ids_named(self, names):
+        """Ids of the nodes (below the root) called exactly one of names, ancestors first."""
+        ids = []
+        for name in set(names):
+            ids.extend(self._by_name.get(name, ()))
+        ids.sort()  # Ids are handed out top-down, so a folder sorts before its contents
+        return [node_id for node_id in ids if node_id != ROOT_ID]
+
+    def names_matching(self, patterns):
+        """Distinct node names matching any ignore pattern (fnmatch rules, one regex pass)."""
+        if not patterns:
+            return []
+        matcher = re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+        return [name for name in self._by_name if matcher.match(os.path.normcase(name))]
+
+    def filter(self, text):
+        """
+        (visible, expand) id sets for the explorer filter: matching nodes and
+        every ancestor of a match, and the ancestors alone (folders to open).
+        """
+        matched = self.match_names(text)
+        visible = set(matched)
+        expand = set()
+        parent_id = self.table.parent_id
+        for node_id in matched:
+            parent = parent_id(node_id)
+            while parent != NO_PARENT and parent not in expand:
+                expand.add(parent)
+                parent = parent_id(parent)
+        visible |= expand
+        return visible, expand
+
+
+def _joined(keys):
+    """(keys joined by newlines, start offset of each key)."""
+    return '\n'.join(keys), list(accumulate((len(key) + 1 for key in keys[:-1]), initial=0))
+
+
+# ---- QUICK OPEN (fzf-style fuzzy matching on relative paths) ----
+
+SCORE_MATCH = 16
+BONUS_PATH_BOUNDARY = 10   # Match right after '/'
+BONUS_WORD_BOUNDARY = 8    # Match right after '_', '-', '.' or ' '
+BONUS_CONSECUTIVE = 6
+BONUS_FILE_NAME = 8        # Match inside the file name rather than its folders
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+
+
+def _subsequence_pattern(query):
+    """Regex for 'query's characters in order': a[^b]*b[^c]*c (no backtracking)."""
+    parts = [re.escape(query[0])]
+    for ch in query[1:]:
+        escaped = re.escape(ch)
+        parts.append(f"[^{escaped}]*{escaped}")
+    return ''.join(parts)
+
+
+def _align(query, path, start):
+    """
+    Positions of query in path[start:] (fzf v1): scan forward for the
+    earliest complete match, then backward from its end for the tightest
+    window. None if query is not a subsequence.
+    """
+    pos = start - 1
+    for ch in query:
+        pos = path.find(ch, pos + 1)
+        if pos < 0:
+            return None
+    positions = []
+    end = pos + 1
+    for ch in reversed(query):
+        end = path.rfind(ch, start, end)
+        positions.append(end)
+    positions.reverse()
+    return positions
+
+
+def _score_positions(path, positions, name_start):
+    score = 0
+    previous = -1
+    for pos in positions:
+        score += SCORE_MATCH
+        before = path[pos - 1] if pos else '/'
+        if before == '/':
+            score += BONUS_PATH_BOUNDARY
+        elif before in '_-. ':
+            score += BONUS_WORD_BOUNDARY
+        if previous >= 0:
+            if pos == previous + 1:
+                score += BONUS_CONSECUTIVE
+            else:
+                score -= PENALTY_GAP_START + PENALTY_GAP_EXTENSION * (pos - previous - 2)
+        if pos >= name_start:
+            score += BONUS_FILE_NAME
+        previous = pos
+    return score
+
+
+def fuzzy_score(query, path, name_start=0):
+    """
+    Score of query as a subsequence of path (both lowercased), or None.
+    The match is tried inside the file name and across the whole path,
+    and the better one counts: boundaries, consecutive runs and file-name
+    characters earn bonuses, gaps cost.
+    """
+    best = None
+    for start in (name_start, 0) if name_start else (0,):
+        positions = _align(query, path, start)
+        if positions is not None:
+            score = _score_positions(path, positions, name_start)
+            if best is None or score > best:
+                best = score
+    return best
+
+
+class QuickOpenMatcher:
+    """
+    Incremental fuzzy file finder over a SearchIndex.
+
+    Candidates are the paths containing the query as a subsequence. The
+    last exact candidate list is kept, and a keystroke that extends the
+    query only re-checks those paths (compress/map keep the loop in C).
+    Broad one- and two-letter queries scan lazily in shortest-first order
+    and stop once SCORE_POOL matches are found. Only that pool is scored:
+    the shortest matches, plus the shortest paths whose file name contains
+    the query as is.
+    """
+
+    SCORE_POOL = 500
+    EXACT_FROM = 3  # Shorter queries only scan until the pool is full
+
+    def __init__(self, index):
+        self.index = index
+        self._query = None
+        self._candidates = None  # Exact matches of _query (positions in index.paths, shortest first)
+
+    def _scan(self, source, check, values):
+        """Up to SCORE_POOL positions from source whose value passes check."""
+        return list(islice(compress(source, map(check, map(values.__getitem__, source))), self.SCORE_POOL))
+
+    def search(self, query, limit=50):
+        """[(node_id, score)] best first."""
+        query = ''.join(query.lower().split())
+        if not query:
+            self._query = self._candidates = None
+            return []
+
+        index = self.index
+        paths, names = index.paths, index.names
+        if not (self._query and query.startswith(self._query)):
+            first = query[0]
+            self._query, self._candidates = first, [k for k, path in enumerate(paths) if first in path]
+        source = self._candidates
+
+        if query == self._query:
+            matches = source
+        elif len(query) >= self.EXACT_FROM:
+            # Selective enough to narrow the candidates for good (one pass over the previous ones)
+            check = re.compile(_subsequence_pattern(query)).search
+            matches = list(compress(source, map(check, map(paths.__getitem__, source))))
+            self._query, self._candidates = query, matches
+        else:
+            matches = self._scan(source, re.compile(_subsequence_pattern(query)).search, paths)
+            if len(matches) < self.SCORE_POOL:
+                self._query, self._candidates = query, matches  # Scanned to the end: exact
+
+        pool = matches[:self.SCORE_POOL]
+        if len(matches) >= self.SCORE_POOL:
+            in_name = self._scan(source, partial(_contains, query), names)
+            pool = sorted(set(pool).union(in_name))
+
+        scored = []
+        for k in pool:
+            path = paths[k]
+            score = fuzzy_score(query, path, len(path) - len(names[k]))
+            if score is not None:
+                scored.append((score, k))
+        # Best score first, then shortest path (the pool is already shortest first)
+        scored.sort(key=lambda s: -s[0])
+
+        results = []
+        table = index.table
+        for score, k in scored:
+            node_id = index.file_ids[k]
+            if table.is_attached(node_id):  # Skip files removed since the scan
+                results.append((node_id, score))
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def _contains(query, text):
+    return query in text
+
+
+_index_lock = threading.Lock()
+
+
+def search_index(root):
+    """The SearchIndex of a scan tree, built on first use and kept on the root."""
+    index = root.get(SEARCH_INDEX_KEY)
+    if index is None:
+        with _index_lock:
+            index = root.get(SEARCH_INDEX_KEY)
+            if index is None:
+                index = root[SEARCH_INDEX_KEY] = SearchIndex(root)
+    return index
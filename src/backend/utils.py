@@ -1,54 +1,68 @@
-import os
-from src.config import FILE_TYPE_MAP
-
-def get_file_heading(file_path):
-    """
-    Determines the appropriate emoji and file type for a given file path.
-    """
-    filename = os.path.basename(file_path)
-    # Check exact filename first
-    if filename in FILE_TYPE_MAP:
-        emoji, file_type = FILE_TYPE_MAP[filename]
-        return f"--- {emoji} {file_type}: {file_path} ---"
-
-    # Check extension
-    extension = os.path.splitext(filename)[1].lower()
-    if extension in FILE_TYPE_MAP:
-        emoji, file_type = FILE_TYPE_MAP[extension]
-    else:
-        emoji, file_type = FILE_TYPE_MAP['default']
-        
-    return f"--- {emoji} {file_type}: {file_path} ---"
-
-import re
-
-SENSITIVE_KEYS = ['api_key', 'token', 'secret', 'password']
-
-def sanitize_content(text):
-    if not text:
-        return text
-
-    for key in SENSITIVE_KEYS:
-        text = re.sub(
-            rf'({key}\s*[:=]\s*)(.+)',
-            r'\1***REDACTED***',
-            text,
-            flags=re.IGNORECASE
-        )
-    return text
-
-def get_unique_path(path):
-    """
-    If path exists, appends an incrementing number to the filename until a unique path is found.
-    Example: 'file.txt' -> 'file1.txt' -> 'file2.txt'
-    """
-    if not os.path.exists(path):
-        return path
-    
-    base, ext = os.path.splitext(path)
-    counter = 1
-    while True:
-        new_path = f"{base}{counter}{ext}"
-        if not os.path.exists(new_path):
-            return new_path
-        counter += 1
+import os
+import threading
+from src.config import FILE_TYPE_MAP
+
+def get_file_heading(file_path):
+    """
+    Determines the appropriate emoji and file type for a given file path.
+    """
+    filename = os.path.basename(file_path)
+    # Check exact filename first
+    if filename in FILE_TYPE_MAP:
+        emoji, file_type = FILE_TYPE_MAP[filename]
+        return f"--- {emoji} {file_type}: {file_path} ---"
+
+    # Check extension
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in FILE_TYPE_MAP:
+        emoji, file_type = FILE_TYPE_MAP[extension]
+    else:
+        emoji, file_type = FILE_TYPE_MAP['default']
+        
+    return f"--- {emoji} {file_type}: {file_path} ---"
+
+from src.backend.redactor import SENSITIVE_KEYS, get_redactor
+
+def sanitize_content(text):
+    """Redact secrets from file text (single cached pass, see redactor.py)."""
+    if not text:
+        return text
+    return get_redactor().redact(text)
+
+def get_unique_path(path):
+    """
+    If path exists, appends an incrementing number to the filename until a unique path is found.
+    Example: 'file.txt' -> 'file1.txt' -> 'file2.txt'
+    """
+    if not os.path.exists(path):
+        return path
+    
+    base, ext = os.path.splitext(path)
+    counter = 1
+    while True:
+        new_path = f"{base}{counter}{ext}"
+        if not os.path.exists(new_path):
+            return new_path
+        counter += 1
+
+
+def save_png(image, path, quality=-1):
+    """
+    Write image (a QImage or QPixmap) as a PNG through a temporary file, so
+    a crash or a concurrent reader never sees a partly written file.
+    False if it could not be saved.
+    """
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if not image.save(tmp_path, "PNG", quality):
+            raise OSError(f"could not write {tmp_path}")
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        print(f"Error caching image: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
@@ -1,502 +1,726 @@
-"""
-Canvas Preview Panel - VS Code-like file/image preview in the editor area.
-"""
-from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
-    QScrollArea, QSizePolicy, QStackedWidget, QApplication,
-    QTabWidget, QTabBar
-)
-from PyQt5.QtGui import QFont, QColor, QFontInfo, QPixmap
-from PyQt5.QtCore import Qt
-from src.config import resource_path
-from src.frontend.components.zoomable_image_viewer import ZoomableImageViewer
-import os
-
-# QScintilla for code preview
-from PyQt5.Qsci import (
-    QsciScintilla,
-    QsciLexerPython,
-    QsciLexerJSON,
-    QsciLexerCPP,
-    QsciLexerHTML,
-    QsciLexerCSS,
-    QsciLexerJavaScript,
-    QsciLexerMarkdown,
-    QsciLexerSQL,
-    QsciLexerXML,
-    QsciLexerYAML,
-    QsciLexerBash
-)
-
-
-def get_editor_font():
-    # VS Code Default Font Stack preferences
-    for name in ["Cascadia Code", "Cascadia Mono", "Consolas", "Menlo", "Monaco", "Courier New"]:
-        font = QFont(name)
-        font.setPointSizeF(10.5) # 10.5pt ≈ 14px (VS Code Standard) based on 96 DPI
-        if QFontInfo(font).family() == name:
-            return font
-    
-    font = QFont("Monospace")
-    font.setPointSizeF(10.5)
-    return font
-
-
-class AutoScrollEditor(QsciScintilla):
-    """QsciScintilla subclass with auto-hiding scrollbars."""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setMouseTracking(True)
-
-    def enterEvent(self, event):
-        self.verticalScrollBar().setProperty("active", "true")
-        self.horizontalScrollBar().setProperty("active", "true")
-        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
-        self.verticalScrollBar().style().polish(self.verticalScrollBar())
-        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
-        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.verticalScrollBar().setProperty("active", "false")
-        self.horizontalScrollBar().setProperty("active", "false")
-        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
-        self.verticalScrollBar().style().polish(self.verticalScrollBar())
-        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
-        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
-        super().leaveEvent(event)
-
-
-class CanvasPreview(QWidget):
-    """
-    A VS Code-like preview panel that supports multiple open tabs (Editors/Images).
-    """
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.open_files = {} # Key: unique_path, Value: widget_instance
-
-        # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        # Stacked widget to switch between "Empty" and "Tabbed View"
-        self.stack = QStackedWidget()
-        
-        # 1. Empty State (Welcome)
-        self.empty_widget = self._build_empty_state()
-        self.stack.addWidget(self.empty_widget)
-        
-        # 2. Tabbed Interface
-        self.tabs = QTabWidget()
-        self.tabs.setTabsClosable(True)
-        self.tabs.setMovable(True)
-        self.tabs.setDocumentMode(True) # Removes standard frame, looks cleaner
-        self.tabs.setUsesScrollButtons(True) # Enable scrolling for tabs
-        self.tabs.setElideMode(Qt.ElideRight) # Truncate long names
-        
-        close_icon = resource_path("assets/close.png").replace("\\", "/")
-        
-        # VS Code-like Tab Styling
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border-top: 1px solid #E5E7EB; /* Subtle separator */
-                background: #FFFFFF;
-                top: -1px; /* Overlap border */
-            }}
-            QTabBar {{
-                background: #F3F4F6; /* Sidebar/Tabbar gray */
-            }}
-            QTabBar::tab {{
-                background: #F3F4F6; 
-                color: #6B7280;
-                border-right: 1px solid #E5E7EB;
-                border-bottom: 1px solid #E5E7EB;
-                padding: 6px 10px;
-                padding-right: 24px; /* Space for close button */
-                min-width: 120px;
-                max-width: 220px;
-                height: 24px;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 13px;
-                border-top: 1px solid transparent; 
-            }}
-            QTabBar::tab:selected {{
-                background: #FFFFFF;
-                color: #1F2937;
-                border-top: 2px solid #007AFF; /* Active Blue Top Border */
-                border-bottom: 1px solid #FFFFFF; /* Merge with content */
-                font-weight: 500;
-            }}
-            QTabBar::tab:hover:!selected {{
-                background: #FFFFFF;
-                color: #1F2937;
-            }}
-            QTabBar::close-button {{
-                subcontrol-position: right;
-                margin-right: 6px;
-                image: url({close_icon});
-                width: 25px;
-                height: 25px;
-                border-radius: 4px;
-            }}
-            QTabBar::close-button:hover {{
-                background-color: #E5E7EB; /* Subtle hover block */
-            }}
-            QTabBar::scroller {{
-                width: 0px; 
-                height: 0px;
-            }}
-        """)
-        
-        self.tabs.tabCloseRequested.connect(self.close_tab)
-        self.stack.addWidget(self.tabs)
-        
-        layout.addWidget(self.stack)
-        
-        # Start with empty state
-        self.show_empty()
-    
-    def _build_empty_state(self):
-        """Build the welcome/empty state view."""
-        widget = QWidget()
-        widget.setStyleSheet("background-color: #FFFFFF;")
-        
-        layout = QVBoxLayout(widget)
-        layout.setAlignment(Qt.AlignCenter)
-        
-        # Welcome message
-        title = QLabel("No file selected")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 500;
-            color: #9CA3AF;
-            font-family: 'Segoe UI', sans-serif;
-        """)
-        title.setAlignment(Qt.AlignCenter)
-        
-        subtitle = QLabel("Click on a file in the Explorer to preview")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #D1D5DB;
-            font-family: 'Segoe UI', sans-serif;
-        """)
-        subtitle.setAlignment(Qt.AlignCenter)
-        
-        layout.addWidget(title)
-        layout.addWidget(subtitle)
-        
-        return widget
-
-    def _create_code_editor(self, content, ext):
-        """Factory: Create a new code editor instance."""
-        editor = AutoScrollEditor()
-        font = get_editor_font()
-        editor.setFont(font)
-        editor.setMarginsFont(font)
-        
-        # Light theme styling (VS Code Light)
-        editor.setStyleSheet("""
-            QsciScintilla {
-                background-color: #FFFFFF;
-                color: #1F2937;
-                border: none;
-            }
-            
-            /* VS Code Auto-Hide Slim Blue Scrollbars */
-            QScrollBar:vertical {
-                border: none;
-                background: transparent;
-                width: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: transparent;
-                min-height: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar[active="true"]::handle:vertical {
-                background: #007AFF;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #0069D9;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            
-            QScrollBar:horizontal {
-                border: none;
-                background: transparent;
-                height: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: transparent;
-                min-width: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar[active="true"]::handle:horizontal {
-                background: #007AFF;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #0069D9;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: none;
-            }
-        """)
-        
-        # Editor Configuration
-        editor.setMarginType(1, QsciScintilla.SymbolMargin)
-        editor.setMarginWidth(1, 12)
-        editor.setMarginsBackgroundColor(QColor("#FFFFFF"))
-        editor.setMarginSensitivity(1, False)
-        
-        editor.setMarginType(0, QsciScintilla.NumberMargin)
-        editor.setMarginWidth(0, "00000")
-        editor.setMarginLineNumbers(0, True)
-        editor.setMarginsForegroundColor(QColor("#6E7681"))
-        
-        editor.setCaretLineVisible(True)
-        editor.setCaretLineBackgroundColor(QColor("#F0F0F0"))
-        editor.setCaretForegroundColor(QColor("#000000"))
-        editor.setCaretWidth(2)
-        
-        editor.setSelectionBackgroundColor(QColor("#ADD6FF"))
-        editor.setSelectionForegroundColor(QColor("#000000"))
-        
-        editor.setFolding(QsciScintilla.PlainFoldStyle)
-        editor.setMarginType(2, QsciScintilla.SymbolMargin)
-        editor.setMarginWidth(2, 12)
-        editor.setFoldMarginColors(QColor("#FFFFFF"), QColor("#FFFFFF"))
-        
-        editor.setBraceMatching(QsciScintilla.SloppyBraceMatch)
-        editor.setMatchedBraceBackgroundColor(QColor("#D7D7D7"))
-        editor.setMatchedBraceForegroundColor(QColor("#000000"))
-
-        editor.setIndentationsUseTabs(False)
-        editor.setTabWidth(4)
-        editor.setAutoIndent(False)
-        editor.setWrapMode(QsciScintilla.WrapNone)
-        editor.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded) # Smart: only show if needed
-        editor.setReadOnly(True)
-        
-        editor.setPaper(QColor("#FFFFFF"))
-        editor.setColor(QColor("#1F2937"))
-        
-        # Set Content & Lexer
-        lexer = self._get_lexer(ext)
-        if lexer:
-             lexer.setDefaultFont(font)
-             lexer.setDefaultPaper(QColor("#FFFFFF"))
-             lexer.setDefaultColor(QColor("#24292E"))
-             self._apply_vscode_theme(lexer)
-             editor.setLexer(lexer)
-        else:
-             editor.setLexer(None)
-             editor.setFont(font)
-             
-        editor.setText(content)
-        return editor
-
-    def _create_image_viewer(self, abs_path):
-        """Factory: Create a new image viewer instance."""
-        viewer = ZoomableImageViewer()
-        viewer.setStyleSheet("background-color: #FFFFFF;")
-        if abs_path and os.path.exists(abs_path):
-            pixmap = QPixmap(abs_path)
-            viewer.set_image(pixmap)
-        return viewer
-
-    def _get_lexer(self, ext):
-        """Get the appropriate lexer for a file extension."""
-        ext = ext.lower()
-        if ext in ['.py', '.pyw']: return QsciLexerPython()
-        if ext in ['.json']: return QsciLexerJSON()
-        if ext in ['.html', '.htm', '.xml', '.svg']: return QsciLexerHTML()
-        if ext in ['.css', '.scss', '.less']: return QsciLexerCSS()
-        if ext in ['.js', '.jsx', '.ts', '.tsx', '.mjs']: return QsciLexerJavaScript()
-        if ext in ['.c', '.cpp', '.h', '.hpp', '.cs', '.java', '.go']: return QsciLexerCPP()
-        if ext in ['.sh', '.bash', '.zsh']: return QsciLexerBash()
-        if ext in ['.yaml', '.yml']: return QsciLexerYAML()
-        if ext in ['.sql']: return QsciLexerSQL()
-        if ext in ['.md', '.markdown']: return QsciLexerMarkdown()
-        return None
-    
-    def _apply_vscode_theme(self, lexer):
-        """Apply VS Code Light syntax highlighting to the lexer."""
-        if not lexer: return
-        
-        c_background = QColor("#FFFFFF")
-        c_default = QColor("#24292E")
-        c_keyword = QColor("#0000FF")
-        c_string = QColor("#A31515")
-        c_comment = QColor("#008000")
-        c_number = QColor("#098658")
-        c_class = QColor("#267F99")
-        c_function = QColor("#795E26")
-        c_operator = QColor("#24292E")
-        c_identifier = QColor("#24292E")
-
-        def set_style(style_id, color, paper=c_background, bold=False, italic=False):
-            lexer.setColor(color, style_id)
-            lexer.setPaper(paper, style_id)
-            font = get_editor_font()
-            if bold: font.setBold(True)
-            if italic: font.setItalic(True)
-            lexer.setFont(font, style_id)
-
-        if isinstance(lexer, QsciLexerPython):
-            set_style(QsciLexerPython.Default, c_default)
-            set_style(QsciLexerPython.Comment, c_comment)
-            set_style(QsciLexerPython.CommentBlock, c_comment)
-            set_style(QsciLexerPython.Number, c_number)
-            set_style(QsciLexerPython.DoubleQuotedString, c_string)
-            set_style(QsciLexerPython.SingleQuotedString, c_string)
-            set_style(QsciLexerPython.Keyword, c_keyword)
-            set_style(QsciLexerPython.TripleSingleQuotedString, c_string)
-            set_style(QsciLexerPython.TripleDoubleQuotedString, c_string)
-            set_style(QsciLexerPython.ClassName, c_class)
-            set_style(QsciLexerPython.FunctionMethodName, c_function)
-            set_style(QsciLexerPython.Operator, c_operator)
-            set_style(QsciLexerPython.Identifier, c_identifier)
-            set_style(QsciLexerPython.Decorator, QColor("#AF00DB"))
-            
-        elif isinstance(lexer, QsciLexerJSON):
-            set_style(QsciLexerJSON.Default, c_default)
-            set_style(QsciLexerJSON.Number, c_number)
-            set_style(QsciLexerJSON.String, c_string)
-            set_style(QsciLexerJSON.Property, QColor("#0451A5"))
-            set_style(QsciLexerJSON.Operator, c_operator)
-            set_style(QsciLexerJSON.Keyword, c_keyword)
-            
-        elif isinstance(lexer, (QsciLexerHTML, QsciLexerXML)):
-             set_style(QsciLexerHTML.Default, c_default)
-             set_style(QsciLexerHTML.Tag, QColor("#800000")) 
-             set_style(QsciLexerHTML.Attribute, QColor("#FF0000")) 
-             set_style(QsciLexerHTML.Value, QColor("#0000FF"))
-             set_style(QsciLexerHTML.HTMLComment, c_comment)
-             
-        elif isinstance(lexer, QsciLexerJavaScript):
-             set_style(QsciLexerJavaScript.Default, c_default)
-             set_style(QsciLexerJavaScript.Comment, c_comment)
-             set_style(QsciLexerJavaScript.CommentLine, c_comment)
-             set_style(QsciLexerJavaScript.Keyword, c_keyword)
-             set_style(QsciLexerJavaScript.DoubleQuotedString, c_string)
-             set_style(QsciLexerJavaScript.SingleQuotedString, c_string)
-             set_style(QsciLexerJavaScript.Number, c_number)
-
-    def show_empty(self):
-        """Show the empty/welcome state."""
-        self.stack.setCurrentWidget(self.empty_widget)
-
-    def close_tab(self, index):
-        """Close the tab at the given index."""
-        widget = self.tabs.widget(index)
-        
-        # Remove from tracking dict
-        # We need to find the key (path) for this widget
-        path_to_remove = None
-        for path, w in self.open_files.items():
-            if w == widget:
-                path_to_remove = path
-                break
-        
-        if path_to_remove:
-            del self.open_files[path_to_remove]
-            
-        self.tabs.removeTab(index)
-        
-        # If no tabs left, show empty state
-        if self.tabs.count() == 0:
-            self.show_empty()
-
-    def preview_file(self, file_node, abs_path=None):
-        """
-        Open or switch to a file tab.
-        """
-        if not file_node:
-            # If explicit None passed, do nothing or show empty? 
-            # Usually we don't clear everything on just a missing node unless intended.
-            return
-        
-        name = file_node.get("name", "Unknown")
-        
-        # Use abs_path as key if available, otherwise name (fallback)
-        key = abs_path if abs_path else name
-        
-        # 1. Check if already open
-        if key in self.open_files:
-            self.stack.setCurrentWidget(self.tabs)
-            self.tabs.setCurrentWidget(self.open_files[key])
-            return
-
-        # 2. Create New Tab
-        _, ext = os.path.splitext(name)
-        ext = ext.lower()
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.ico', '.webp', '.tif', '.tiff'}
-        
-        new_widget = None
-        
-        if ext in image_extensions:
-            if abs_path:
-                new_widget = self._create_image_viewer(abs_path)
-            else:
-                # Fallback for image without path? Just show empty placeholder or message
-                new_widget = QLabel("Image preview unavailable")
-                new_widget.setAlignment(Qt.AlignCenter)
-        else:
-            # Code/Text
-            content = file_node.get("content")
-            if content is None:
-                content = "// Content not available\n"
-            new_widget = self._create_code_editor(content, ext)
-
-        if new_widget:
-            # Add to Tabs
-            index = self.tabs.addTab(new_widget, name)
-            self.tabs.setCurrentIndex(index)
-            self.tabs.setTabToolTip(index, key) # Show full path on hover
-            
-            # Track it
-            self.open_files[key] = new_widget
-            
-            # Ensure visible
-            self.stack.setCurrentWidget(self.tabs)
-
-    def reload_file_content(self, path, content=None):
-        """Update the content of an open file (e.g. from external change)."""
-        widget = self.open_files.get(path)
-        if not widget:
-            return
-
-        if isinstance(widget, QsciScintilla):
-            if content is None:
-                return
-            
-            # Save state
-            line, index = widget.getCursorPosition()
-            first_line = widget.firstVisibleLine()
-            
-            # Check if content actually changed to avoid flicker
-            if widget.text() != content:
-                widget.setText(content)
-                
-                # Restore state
-                widget.setCursorPosition(line, index)
-                # setFirstVisibleLine not always available or behaves differently in some versions
-                # verticalScrollBar().setValue(...) is more robust if needed, but try method first
-                widget.setFirstVisibleLine(first_line)
-            
-        elif isinstance(widget, ZoomableImageViewer):
-            if path and os.path.exists(path):
-                pixmap = QPixmap(path)
-                widget.set_image(pixmap)
+"""
+Canvas Preview Panel - VS Code-like file/image preview in the editor area.
+"""
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
+    QScrollArea, QSizePolicy, QStackedWidget, QApplication,
+    QTabWidget, QTabBar
+)
+from PyQt5.QtGui import QFont, QColor, QFontInfo
+from PyQt5.QtCore import Qt
+from src.config import resource_path
+from src.frontend.components.zoomable_image_viewer import ZoomableImageViewer, ImageLoadThread
+from src.frontend.components.large_file_view import LargeFileView
+from src.backend.managers.settings_manager import SettingsManager
+from collections import OrderedDict
+import os
+
+# Bigger files open in the paged large-file view (plain text, read from disk)
+LARGE_FILE_BYTES = 1024 * 1024
+
+# QScintilla for code preview
+from PyQt5.Qsci import (
+    QsciScintilla,
+    QsciLexerPython,
+    QsciLexerJSON,
+    QsciLexerCPP,
+    QsciLexerHTML,
+    QsciLexerCSS,
+    QsciLexerJavaScript,
+    QsciLexerMarkdown,
+    QsciLexerSQL,
+    QsciLexerXML,
+    QsciLexerYAML,
+    QsciLexerBash
+)
+
+
+_editor_font = None
+
+
+def get_editor_font():
+    """The editor font, resolved once per session (returns a copy the caller may change)."""
+    global _editor_font
+    if _editor_font is None:
+        _editor_font = resolve_editor_font()
+    return QFont(_editor_font)
+
+
+def resolve_editor_font():
+    # VS Code Default Font Stack preferences
+    for name in ["Cascadia Code", "Cascadia Mono", "Consolas", "Menlo", "Monaco", "Courier New"]:
+        font = QFont(name)
+        font.setPointSizeF(10.5) # 10.5pt ≈ 14px (VS Code Standard) based on 96 DPI
+        if QFontInfo(font).family() == name:
+            return font
+    
+    font = QFont("Monospace")
+    font.setPointSizeF(10.5)
+    return font
+
+
+class AutoScrollEditor(QsciScintilla):
+    """QsciScintilla subclass with auto-hiding scrollbars."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)
+
+    def enterEvent(self, event):
+        self.verticalScrollBar().setProperty("active", "true")
+        self.horizontalScrollBar().setProperty("active", "true")
+        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
+        self.verticalScrollBar().style().polish(self.verticalScrollBar())
+        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
+        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.verticalScrollBar().setProperty("active", "false")
+        self.horizontalScrollBar().setProperty("active", "false")
+        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
+        self.verticalScrollBar().style().polish(self.verticalScrollBar())
+        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
+        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
+        super().leaveEvent(event)
+
+
+class SuspendedTab(QWidget):
+    """Empty stand-in for a tab whose widget was freed, holding where it was scrolled to."""
+
+    def __init__(self, state=None, parent=None):
+        super().__init__(parent)
+        self.state = state
+
+
+class CanvasPreview(QWidget):
+    """
+    A VS Code-like preview panel that supports multiple open tabs (Editors/Images).
+
+    Only the most recently used tabs keep their widget (max_live_tabs); older
+    ones are suspended to a SuspendedTab, keeping their label and scroll and
+    cursor position, and rebuilt when activated. Editors of closed or
+    suspended tabs are recycled for the next tab.
+    """
+    
+    LEXER_POOL_SIZE = 4  # Free lexers kept per language
+    EDITOR_POOL_SIZE = 4  # Free editors kept for new tabs
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.open_files = {} # Key: unique_path, Value: widget_instance
+        self._lexer_pool = {} # Lexer class -> themed lexers released by closed tabs
+        self._editor_pool = [] # Editors released by closed or suspended tabs
+        self._tab_sources = {} # Key -> (file node, abs_path) a suspended tab is rebuilt from
+        self._live = OrderedDict() # Keys of tabs with a live widget, least recently used first
+        self._swapping = False
+        self.max_live_tabs = SettingsManager().get_max_live_tabs()
+
+        # Main layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        # Stacked widget to switch between "Empty" and "Tabbed View"
+        self.stack = QStackedWidget()
+        
+        # 1. Empty State (Welcome)
+        self.empty_widget = self._build_empty_state()
+        self.stack.addWidget(self.empty_widget)
+        
+        # 2. Tabbed Interface
+        self.tabs = QTabWidget()
+        self.tabs.setTabsClosable(True)
+        self.tabs.setMovable(True)
+        self.tabs.setDocumentMode(True) # Removes standard frame, looks cleaner
+        self.tabs.setUsesScrollButtons(True) # Enable scrolling for tabs
+        self.tabs.setElideMode(Qt.ElideRight) # Truncate long names
+        
+        close_icon = resource_path("assets/close.png").replace("\\", "/")
+        
+        # VS Code-like Tab Styling
+        self.tabs.setStyleSheet(f"""
+            QTabWidget::pane {{
+                border-top: 1px solid #E5E7EB; /* Subtle separator */
+                background: #FFFFFF;
+                top: -1px; /* Overlap border */
+            }}
+            QTabBar {{
+                background: #F3F4F6; /* Sidebar/Tabbar gray */
+            }}
+            QTabBar::tab {{
+                background: #F3F4F6; 
+                color: #6B7280;
+                border-right: 1px solid #E5E7EB;
+                border-bottom: 1px solid #E5E7EB;
+                padding: 6px 10px;
+                padding-right: 24px; /* Space for close button */
+                min-width: 120px;
+                max-width: 220px;
+                height: 24px;
+                font-family: 'Segoe UI', sans-serif;
+                font-size: 13px;
+                border-top: 1px solid transparent; 
+            }}
+            QTabBar::tab:selected {{
+                background: #FFFFFF;
+                color: #1F2937;
+                border-top: 2px solid #007AFF; /* Active Blue Top Border */
+                border-bottom: 1px solid #FFFFFF; /* Merge with content */
+                font-weight: 500;
+            }}
+            QTabBar::tab:hover:!selected {{
+                background: #FFFFFF;
+                color: #1F2937;
+            }}
+            QTabBar::close-button {{
+                subcontrol-position: right;
+                margin-right: 6px;
+                image: url({close_icon});
+                width: 25px;
+                height: 25px;
+                border-radius: 4px;
+            }}
+            QTabBar::close-button:hover {{
+                background-color: #E5E7EB; /* Subtle hover block */
+            }}
+            QTabBar::scroller {{
+                width: 0px; 
+                height: 0px;
+            }}
+        """)
+        
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(self._on_current_changed)
+        self.stack.addWidget(self.tabs)
+        
+        layout.addWidget(self.stack)
+        
+        # Start with empty state
+        self.show_empty()
+    
+    def _build_empty_state(self):
+        """Build the welcome/empty state view."""
+        widget = QWidget()
+        widget.setStyleSheet("background-color: #FFFFFF;")
+        
+        layout = QVBoxLayout(widget)
+        layout.setAlignment(Qt.AlignCenter)
+        
+        # Welcome message
+        title = QLabel("No file selected")
+        title.setStyleSheet("""
+            font-size: 18px;
+            font-weight: 500;
+            color: #9CA3AF;
+            font-family: 'Segoe UI', sans-serif;
+        """)
+        title.setAlignment(Qt.AlignCenter)
+        
+        subtitle = QLabel("Click on a file in the Explorer to preview")
+        subtitle.setStyleSheet("""
+            font-size: 13px;
+            color: #D1D5DB;
+            font-family: 'Segoe UI', sans-serif;
+        """)
+        subtitle.setAlignment(Qt.AlignCenter)
+        
+        layout.addWidget(title)
+        layout.addWidget(subtitle)
+        
+        return widget
+
+    def _create_code_editor(self, content, ext):
+        """Factory: A code editor showing content, recycled from a closed tab when one is free."""
+        if self._editor_pool:
+            editor = self._editor_pool.pop()
+        else:
+            editor = self._new_code_editor()
+
+        # Set Content & Lexer
+        lexer = self._themed_lexer(ext)
+        if lexer:
+             lexer.setParent(editor)  # Nothing else holds it while the tab shows it
+             editor.setLexer(lexer)
+        else:
+             editor.setLexer(None)
+             editor.setFont(get_editor_font())
+             
+        editor.setText(content)
+        editor.setCursorPosition(0, 0)
+        editor.setFirstVisibleLine(0)
+        return editor
+
+    def _new_code_editor(self):
+        """Factory: Create a new, empty code editor instance."""
+        editor = AutoScrollEditor()
+        font = get_editor_font()
+        editor.setFont(font)
+        editor.setMarginsFont(font)
+        
+        # Light theme styling (VS Code Light)
+        editor.setStyleSheet("""
+            QsciScintilla {
+                background-color: #FFFFFF;
+                color: #1F2937;
+                border: none;
+            }
+            
+            /* VS Code Auto-Hide Slim Blue Scrollbars */
+            QScrollBar:vertical {
+                border: none;
+                background: transparent;
+                width: 6px;
+                margin: 0px;
+            }
+            QScrollBar::handle:vertical {
+                background: transparent;
+                min-height: 20px;
+                border-radius: 3px;
+            }
+            QScrollBar[active="true"]::handle:vertical {
+                background: #007AFF;
+            }
+            QScrollBar::handle:vertical:hover {
+                background: #0069D9;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+                background: none;
+            }
+            
+            QScrollBar:horizontal {
+                border: none;
+                background: transparent;
+                height: 6px;
+                margin: 0px;
+            }
+            QScrollBar::handle:horizontal {
+                background: transparent;
+                min-width: 20px;
+                border-radius: 3px;
+            }
+            QScrollBar[active="true"]::handle:horizontal {
+                background: #007AFF;
+            }
+            QScrollBar::handle:horizontal:hover {
+                background: #0069D9;
+            }
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+                width: 0px;
+            }
+            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+                background: none;
+            }
+        """)
+        
+        # Editor Configuration
+        editor.setMarginType(1, QsciScintilla.SymbolMargin)
+        editor.setMarginWidth(1, 12)
+        editor.setMarginsBackgroundColor(QColor("#FFFFFF"))
+        editor.setMarginSensitivity(1, False)
+        
+        editor.setMarginType(0, QsciScintilla.NumberMargin)
+        editor.setMarginWidth(0, "00000")
+        editor.setMarginLineNumbers(0, True)
+        editor.setMarginsForegroundColor(QColor("#6E7681"))
+        
+        editor.setCaretLineVisible(True)
+        editor.setCaretLineBackgroundColor(QColor("#F0F0F0"))
+        editor.setCaretForegroundColor(QColor("#000000"))
+        editor.setCaretWidth(2)
+        
+        editor.setSelectionBackgroundColor(QColor("#ADD6FF"))
+        editor.setSelectionForegroundColor(QColor("#000000"))
+        
+        editor.setFolding(QsciScintilla.PlainFoldStyle)
+        editor.setMarginType(2, QsciScintilla.SymbolMargin)
+        editor.setMarginWidth(2, 12)
+        editor.setFoldMarginColors(QColor("#FFFFFF"), QColor("#FFFFFF"))
+        
+        editor.setBraceMatching(QsciScintilla.SloppyBraceMatch)
+        editor.setMatchedBraceBackgroundColor(QColor("#D7D7D7"))
+        editor.setMatchedBraceForegroundColor(QColor("#000000"))
+
+        editor.setIndentationsUseTabs(False)
+        editor.setTabWidth(4)
+        editor.setAutoIndent(False)
+        editor.setWrapMode(QsciScintilla.WrapNone)
+        editor.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded) # Smart: only show if needed
+        editor.setReadOnly(True)
+        
+        editor.setPaper(QColor("#FFFFFF"))
+        editor.setColor(QColor("#1F2937"))
+        return editor
+
+    def _create_large_file_view(self, abs_path):
+        """Factory: Create a paged, plain-text view of a large file."""
+        return LargeFileView(abs_path, self._new_code_editor())
+
+    def _create_image_viewer(self, abs_path):
+        """Factory: Create a new image viewer instance."""
+        viewer = ZoomableImageViewer()
+        viewer.setStyleSheet("background-color: #FFFFFF;")
+        if abs_path and os.path.exists(abs_path):
+            viewer.load_image(abs_path)  # Decoded in the background
+        return viewer
+
+    def _themed_lexer(self, ext):
+        """A themed lexer for a file extension: one released by a closed tab if free, else a new one."""
+        lexer_class = self._lexer_class(ext)
+        if lexer_class is None:
+            return None
+        free = self._lexer_pool.get(lexer_class)
+        if free:
+            return free.pop()
+        lexer = lexer_class()
+        lexer.setDefaultFont(get_editor_font())
+        lexer.setDefaultPaper(QColor("#FFFFFF"))
+        lexer.setDefaultColor(QColor("#24292E"))
+        self._apply_vscode_theme(lexer)
+        return lexer
+
+    def _release_lexer(self, editor):
+        """Detach a closing tab's lexer and keep it for the next tab of that language."""
+        lexer = editor.lexer()
+        if lexer is None:
+            return
+        editor.setLexer(None)
+        free = self._lexer_pool.setdefault(type(lexer), [])
+        if len(free) < self.LEXER_POOL_SIZE:
+            lexer.setParent(None)  # Held by the pool from now on
+            free.append(lexer)
+        else:
+            lexer.deleteLater()
+
+    @staticmethod
+    def _lexer_class(ext):
+        """The lexer class for a file extension (None for plain text)."""
+        ext = ext.lower()
+        if ext in ['.py', '.pyw']: return QsciLexerPython
+        if ext in ['.json']: return QsciLexerJSON
+        if ext in ['.html', '.htm', '.xml', '.svg']: return QsciLexerHTML
+        if ext in ['.css', '.scss', '.less']: return QsciLexerCSS
+        if ext in ['.js', '.jsx', '.ts', '.tsx', '.mjs']: return QsciLexerJavaScript
+        if ext in ['.c', '.cpp', '.h', '.hpp', '.cs', '.java', '.go']: return QsciLexerCPP
+        if ext in ['.sh', '.bash', '.zsh']: return QsciLexerBash
+        if ext in ['.yaml', '.yml']: return QsciLexerYAML
+        if ext in ['.sql']: return QsciLexerSQL
+        if ext in ['.md', '.markdown']: return QsciLexerMarkdown
+        return None
+
+    def _apply_vscode_theme(self, lexer):
+        """Apply VS Code Light syntax highlighting to the lexer."""
+        if not lexer: return
+        
+        c_background = QColor("#FFFFFF")
+        c_default = QColor("#24292E")
+        c_keyword = QColor("#0000FF")
+        c_string = QColor("#A31515")
+        c_comment = QColor("#008000")
+        c_number = QColor("#098658")
+        c_class = QColor("#267F99")
+        c_function = QColor("#795E26")
+        c_operator = QColor("#24292E")
+        c_identifier = QColor("#24292E")
+
+        def set_style(style_id, color, paper=c_background, bold=False, italic=False):
+            lexer.setColor(color, style_id)
+            lexer.setPaper(paper, style_id)
+            font = get_editor_font()
+            if bold: font.setBold(True)
+            if italic: font.setItalic(True)
+            lexer.setFont(font, style_id)
+
+        if isinstance(lexer, QsciLexerPython):
+            set_style(QsciLexerPython.Default, c_default)
+            set_style(QsciLexerPython.Comment, c_comment)
+            set_style(QsciLexerPython.CommentBlock, c_comment)
+            set_style(QsciLexerPython.Number, c_number)
+            set_style(QsciLexerPython.DoubleQuotedString, c_string)
+            set_style(QsciLexerPython.SingleQuotedString, c_string)
+            set_style(QsciLexerPython.Keyword, c_keyword)
+            set_style(QsciLexerPython.TripleSingleQuotedString, c_string)
+            set_style(QsciLexerPython.TripleDoubleQuotedString, c_string)
+            set_style(QsciLexerPython.ClassName, c_class)
+            set_style(QsciLexerPython.FunctionMethodName, c_function)
+            set_style(QsciLexerPython.Operator, c_operator)
+            set_style(QsciLexerPython.Identifier, c_identifier)
+            set_style(QsciLexerPython.Decorator, QColor("#AF00DB"))
+            
+        elif isinstance(lexer, QsciLexerJSON):
+            set_style(QsciLexerJSON.Default, c_default)
+            set_style(QsciLexerJSON.Number, c_number)
+            set_style(QsciLexerJSON.String, c_string)
+            set_style(QsciLexerJSON.Property, QColor("#0451A5"))
+            set_style(QsciLexerJSON.Operator, c_operator)
+            set_style(QsciLexerJSON.Keyword, c_keyword)
+            
+        elif isinstance(lexer, (QsciLexerHTML, QsciLexerXML)):
+             set_style(QsciLexerHTML.Default, c_default)
+             set_style(QsciLexerHTML.Tag, QColor("#800000")) 
+             set_style(QsciLexerHTML.Attribute, QColor("#FF0000")) 
+             set_style(QsciLexerHTML.HTMLValue, QColor("#0000FF"))
+             set_style(QsciLexerHTML.HTMLComment, c_comment)
+             
+        elif isinstance(lexer, QsciLexerJavaScript):
+             set_style(QsciLexerJavaScript.Default, c_default)
+             set_style(QsciLexerJavaScript.Comment, c_comment)
+             set_style(QsciLexerJavaScript.CommentLine, c_comment)
+             set_style(QsciLexerJavaScript.Keyword, c_keyword)
+             set_style(QsciLexerJavaScript.DoubleQuotedString, c_string)
+             set_style(QsciLexerJavaScript.SingleQuotedString, c_string)
+             set_style(QsciLexerJavaScript.Number, c_number)
+
+    def show_empty(self):
+        """Show the empty/welcome state."""
+        self.stack.setCurrentWidget(self.empty_widget)
+
+    def close_tab(self, index):
+        """Close the tab at the given index."""
+        widget = self.tabs.widget(index)
+        key = self._key_of(widget)
+        if key is not None:
+            del self.open_files[key]
+            self._tab_sources.pop(key, None)
+            self._live.pop(key, None)
+
+        self._swapping = True
+        self.tabs.removeTab(index)
+        self._swapping = False
+        self._recycle(widget)
+
+        # If no tabs left, show empty state
+        if self.tabs.count() == 0:
+            self.show_empty()
+        else:
+            self._on_current_changed(self.tabs.currentIndex())
+
+    def _key_of(self, widget):
+        for path, w in self.open_files.items():
+            if w is widget:
+                return path
+        return None
+
+    def preview_file(self, file_node, abs_path=None):
+        """
+        Open or switch to a file tab.
+        """
+        if not file_node:
+            # If explicit None passed, do nothing or show empty? 
+            # Usually we don't clear everything on just a missing node unless intended.
+            return
+        
+        name = file_node.get("name", "Unknown")
+        
+        # Use abs_path as key if available, otherwise name (fallback)
+        key = abs_path if abs_path else name
+        
+        # 1. Check if already open (a suspended tab is rebuilt as it becomes current)
+        if key in self.open_files:
+            self.stack.setCurrentWidget(self.tabs)
+            self.tabs.setCurrentWidget(self.open_files[key])
+            return
+
+        # 2. Create New Tab
+        new_widget = self._create_widget(file_node, abs_path)
+        if new_widget:
+            # Add to Tabs
+            self._swapping = True
+            index = self.tabs.addTab(new_widget, name)
+            self._swapping = False
+            self.tabs.setTabToolTip(index, key) # Show full path on hover
+            
+            # Track it
+            self.open_files[key] = new_widget
+            self._tab_sources[key] = (file_node, abs_path)
+            self._live[key] = None
+
+            self.tabs.setCurrentIndex(index)
+            self._on_current_changed(index)
+            
+            # Ensure visible
+            self.stack.setCurrentWidget(self.tabs)
+
+    def _create_widget(self, file_node, abs_path):
+        """The widget previewing a file: image viewer, paged large-file view or code editor."""
+        name = file_node.get("name", "Unknown")
+        _, ext = os.path.splitext(name)
+        ext = ext.lower()
+        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.ico', '.webp', '.tif', '.tiff'}
+        
+        new_widget = None
+        
+        if ext in image_extensions:
+            if abs_path:
+                new_widget = self._create_image_viewer(abs_path)
+            else:
+                # Fallback for image without path? Just show empty placeholder or message
+                new_widget = QLabel("Image preview unavailable")
+                new_widget.setAlignment(Qt.AlignCenter)
+        elif abs_path and os.path.isfile(abs_path) and (
+                file_node.get("too_large") or (
+                    file_node.get("content") is not None and file_node.get("size_bytes", 0) > LARGE_FILE_BYTES)):
+            # Text too big to lex and lay out in one go (or never read by the scan): page it from disk
+            new_widget = self._create_large_file_view(abs_path)
+        else:
+            # Code/Text
+            content = file_node.get("content")
+            if content is None:
+                content = "// Content not available\n"
+            new_widget = self._create_code_editor(content, ext)
+        return new_widget
+
+    # --- Suspension ---
+
+    def set_max_live_tabs(self, count):
+        """Change (and persist) how many tabs keep their widget."""
+        self.max_live_tabs = max(1, int(count))
+        SettingsManager().set_max_live_tabs(self.max_live_tabs)
+        self._evict()
+
+    def _on_current_changed(self, index):
+        if self._swapping or index < 0:
+            return
+        widget = self.tabs.widget(index)
+        key = self._key_of(widget)
+        if key is None:
+            return
+        if isinstance(widget, SuspendedTab):
+            self._resume(key, index)
+        else:
+            self._live.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        """Suspend the least recently used tabs beyond max_live_tabs (never the current one)."""
+        current = self.tabs.currentWidget()
+        while len(self._live) > self.max_live_tabs:
+            victim = next((key for key in self._live if self.open_files[key] is not current), None)
+            if victim is None:
+                return
+            self._suspend(victim)
+
+    def _suspend(self, key):
+        widget = self.open_files[key]
+        placeholder = SuspendedTab(self._widget_state(widget))
+        self._replace_page(self.tabs.indexOf(widget), placeholder)
+        self.open_files[key] = placeholder
+        del self._live[key]
+        self._recycle(widget)
+
+    def _resume(self, key, index):
+        placeholder = self.open_files[key]
+        file_node, abs_path = self._tab_sources[key]
+        widget = self._create_widget(file_node, abs_path)
+        self._replace_page(index, widget)
+        self.open_files[key] = widget
+        self._live[key] = None
+        self._restore_state(widget, placeholder.state)
+        placeholder.deleteLater()
+
+    def _replace_page(self, index, widget):
+        """Swap the widget of a tab, keeping its label, tooltip and position."""
+        label, tooltip = self.tabs.tabText(index), self.tabs.tabToolTip(index)
+        current = self.tabs.currentIndex() == index
+        self._swapping = True
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, label)
+        self.tabs.setTabToolTip(index, tooltip)
+        if current:
+            self.tabs.setCurrentIndex(index)
+        self._swapping = False
+
+    @staticmethod
+    def _widget_state(widget):
+        """Scroll and cursor position to restore when a suspended tab is rebuilt."""
+        if isinstance(widget, LargeFileView):
+            return widget.top_line()
+        if isinstance(widget, QsciScintilla):
+            return (widget.firstVisibleLine(), *widget.getCursorPosition())
+        return None
+
+    @staticmethod
+    def _restore_state(widget, state):
+        if state is None:
+            return
+        if isinstance(widget, LargeFileView):
+            widget.scroll_to(state)
+        elif isinstance(widget, QsciScintilla):
+            first_line, line, index = state
+            widget.setCursorPosition(line, index)
+            widget.setFirstVisibleLine(first_line)
+
+    def _recycle(self, widget):
+        """Free a widget that left the tabs, keeping plain editors (up to EDITOR_POOL_SIZE) for reuse."""
+        if isinstance(widget, LargeFileView):
+            widget.shutdown()
+        elif isinstance(widget, QsciScintilla):
+            self._release_lexer(widget)
+            widget.setText("")  # Drop the document
+            if len(self._editor_pool) < self.EDITOR_POOL_SIZE:
+                self._editor_pool.append(widget)
+                return
+        widget.deleteLater()
+
+    def go_to_line(self, key, line, column=0, length=0):
+        """Scroll an open code tab to a 1-based line and select the match there."""
+        widget = self.open_files.get(key)
+        if isinstance(widget, LargeFileView):
+            self.tabs.setCurrentWidget(widget)
+            widget.go_to_line(line - 1, column, length)
+            return
+        if not isinstance(widget, QsciScintilla):
+            return
+        self.tabs.setCurrentWidget(widget)
+        line = max(0, min(line - 1, widget.lines() - 1))
+        widget.setCursorPosition(line, column)
+        if length:
+            widget.setSelection(line, column, line, column + length)
+        widget.ensureLineVisible(line)
+        widget.setFocus()
+
+    def reload_file_content(self, path, content=None):
+        """Update the content of an open file (e.g. from external change)."""
+        widget = self.open_files.get(path)
+        if not widget:
+            return
+
+        if isinstance(widget, SuspendedTab):
+            # Rebuilt from disk or from the new text when activated
+            file_node, abs_path = self._tab_sources[path]
+            if content is not None and file_node.get("content") is not None:
+                self._tab_sources[path] = (dict(file_node, content=content), abs_path)
+
+        elif isinstance(widget, LargeFileView):
+            widget.reload()  # Reads what it shows from disk itself
+
+        elif isinstance(widget, QsciScintilla):
+            if content is None:
+                return
+            
+            # Save state
+            line, index = widget.getCursorPosition()
+            first_line = widget.firstVisibleLine()
+            
+            # Check if content actually changed to avoid flicker
+            if widget.text() != content:
+                widget.setText(content)
+                
+                # Restore state
+                widget.setCursorPosition(line, index)
+                # setFirstVisibleLine not always available or behaves differently in some versions
+                # verticalScrollBar().setValue(...) is more robust if needed, but try method first
+                widget.setFirstVisibleLine(first_line)
+            
+        elif isinstance(widget, ZoomableImageViewer):
+            if path and os.path.exists(path):
+                widget.load_image(path)
+
+    def shutdown(self):
+        """Stop the large-file views' background reads and image decodes (before the window closes)."""
+        for widget in self.open_files.values():
+            if isinstance(widget, LargeFileView):
+                widget.shutdown()
+        ImageLoadThread.wait_all()
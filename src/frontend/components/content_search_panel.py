@@ -0,0 +1,264 @@
+import os
+import re
+import time
+import logging
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QListWidget, QListWidgetItem, QLabel
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+from src.backend.managers.icon_manager import IconManager
+from src.backend.content_index import content_index, compile_query, search_content, MAX_HITS
+
+logger = logging.getLogger(__name__)
+
+HIT_ROLE = Qt.UserRole  # (node_id, line, column, length) of a hit row
+LINE_PREVIEW_CHARS = 160
+
+
+class ContentSearchWorker(QThread):
+    """Runs one content query off the GUI thread, streaming hits in small batches."""
+    hits_found = pyqtSignal(int, object)     # generation, [(node_id, rel_path, hits)]
+    search_done = pyqtSignal(int, int)       # generation, total hit lines
+
+    BATCH_SECONDS = 0.05
+
+    def __init__(self, data, pattern, grams, generation, parent=None):
+        super().__init__(parent)
+        self.data = data
+        self.pattern = pattern
+        self.grams = grams
+        self.generation = generation
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        total = 0
+        try:
+            index = content_index(self.data)  # Waits if the post-scan build is still running
+            batch = []
+            last_emit = time.perf_counter()
+            for result in search_content(index, self.pattern, self.grams, cancelled=lambda: self._cancelled):
+                batch.append(result)
+                total += len(result[2])
+                if time.perf_counter() - last_emit >= self.BATCH_SECONDS:
+                    self.hits_found.emit(self.generation, batch)
+                    batch = []
+                    last_emit = time.perf_counter()
+            if batch:
+                self.hits_found.emit(self.generation, batch)
+        except Exception as e:
+            logger.error(f"Content search failed: {e}")
+        self.search_done.emit(self.generation, total)
+
+
+class ContentSearchPanel(QWidget):
+    """
+    Find in files: literal or regex search over the scanned file contents,
+    backed by the project's trigram index. Hits stream in grouped by file,
+    with line numbers; activating one emits hitActivated.
+    """
+    hitActivated = pyqtSignal(int, int, int, int)  # node_id, line (1-based), column, length
+    closeRequested = pyqtSignal()
+
+    DEBOUNCE_MS = 250
+
+    def __init__(self, parent=None, data_getter=None):
+        super().__init__(parent)
+        self.data_getter = data_getter
+        self.icon_manager = IconManager()
+
+        # One query at a time; a newer query cancels it and reruns once it stops
+        self._generation = 0
+        self._worker = None
+        self._restart_pending = False
+        self._file_count = 0
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._start_search)
+
+        self._file_font = QFont()
+        self._file_font.setWeight(QFont.DemiBold)
+
+        self._build_ui()
+
+    def _build_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.setSpacing(4)
+
+        row = QHBoxLayout()
+        row.setSpacing(4)
+        self.input = QLineEdit()
+        self.input.setPlaceholderText("Search in files...")
+        self.input.setStyleSheet("""
+            QLineEdit {
+                border: 1px solid #D1D5DB;
+                border-radius: 4px;
+                padding: 3px 8px;
+                background-color: #FFFFFF;
+                font-size: 12px;
+                color: #111827;
+            }
+            QLineEdit:focus { border: 1px solid #007AFF; }
+        """)
+        self.input.textChanged.connect(lambda _: self._debounce.start())
+        self.input.returnPressed.connect(self._start_search)
+        row.addWidget(self.input, 1)
+
+        option_style = """
+            QPushButton {
+                background-color: transparent;
+                border: 1px solid transparent;
+                border-radius: 4px;
+                font-size: 11px;
+                color: #374151;
+            }
+            QPushButton:hover { background-color: #E5E7EB; }
+            QPushButton:checked { background-color: #DCEAFE; border-color: #007AFF; color: #1D4ED8; }
+        """
+        self.btn_case = QPushButton("Aa")
+        self.btn_case.setToolTip("Match Case")
+        self.btn_regex = QPushButton(".*")
+        self.btn_regex.setToolTip("Use Regular Expression")
+        for btn in (self.btn_case, self.btn_regex):
+            btn.setCheckable(True)
+            btn.setFixedSize(26, 24)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setStyleSheet(option_style)
+            btn.toggled.connect(lambda _: self._start_search())
+            row.addWidget(btn)
+
+        btn_close = QPushButton("✕")
+        btn_close.setToolTip("Close (Esc)")
+        btn_close.setFixedSize(24, 24)
+        btn_close.setCursor(Qt.PointingHandCursor)
+        btn_close.setStyleSheet(option_style)
+        btn_close.clicked.connect(self.closeRequested.emit)
+        row.addWidget(btn_close)
+        layout.addLayout(row)
+
+        self.status = QLabel("")
+        self.status.setStyleSheet("color: #6B7280; font-size: 11px; border: none;")
+        layout.addWidget(self.status)
+
+        self.results = QListWidget()
+        self.results.setUniformItemSizes(True)
+        self.results.setStyleSheet("""
+            QListWidget { border: none; background: transparent; font-size: 12px; outline: 0; }
+            QListWidget::item { height: 22px; color: #111827; border-radius: 4px; }
+            QListWidget::item:selected { background-color: #DCEAFE; color: #1D4ED8; }
+            QListWidget::item:hover { background-color: #E5E7EB; }
+        """)
+        self.results.itemActivated.connect(self._on_item_activated)
+        self.results.itemClicked.connect(self._on_item_activated)
+        layout.addWidget(self.results, 1)
+
+    def focus_input(self, text=None):
+        if text:
+            self.input.setText(text)
+        self.input.setFocus()
+        self.input.selectAll()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.closeRequested.emit()
+            return
+        super().keyPressEvent(event)
+
+    # --- Querying ---
+
+    def refresh(self):
+        """Rerun the current query (e.g. after a rescan or a watcher update)."""
+        if self.input.text():
+            self._debounce.start()
+
+    def _start_search(self):
+        self._debounce.stop()
+        self._generation += 1
+        self.results.clear()
+        self._file_count = 0
+
+        text = self.input.text()
+        data = self.data_getter() if self.data_getter else None
+        if not text or not data:
+            self.status.setText("")
+            self._cancel_worker()
+            return
+        try:
+            pattern, grams = compile_query(text, regex=self.btn_regex.isChecked(), case_sensitive=self.btn_case.isChecked())
+        except re.error as e:
+            self.status.setText(f"Invalid regular expression: {e}")
+            self._cancel_worker()
+            return
+
+        self.status.setText("Searching...")
+        if self._worker is not None and self._worker.isRunning():
+            self._worker.cancel()
+            self._restart_pending = True
+            return
+        self._worker = ContentSearchWorker(data, pattern, grams, self._generation, self)
+        self._worker.hits_found.connect(self._on_hits)
+        self._worker.search_done.connect(self._on_done)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.start()
+
+    def _cancel_worker(self):
+        self._restart_pending = False
+        if self._worker is not None and self._worker.isRunning():
+            self._worker.cancel()
+
+    def _on_worker_finished(self):
+        if self._restart_pending:
+            self._restart_pending = False
+            self._start_search()
+
+    def _on_hits(self, generation, batch):
+        if generation != self._generation:
+            return  # Results of a query the user already changed
+        self.results.setUpdatesEnabled(False)
+        for node_id, rel_path, hits in batch:
+            self._file_count += 1
+            header = QListWidgetItem(self.icon_manager.get_file_icon(os.path.basename(rel_path)), f"{rel_path}  ({len(hits)})")
+            header.setFont(self._file_font)
+            header.setFlags(Qt.ItemIsEnabled)
+            header.setData(HIT_ROLE, (node_id, hits[0][0], hits[0][1], hits[0][2]))
+            self.results.addItem(header)
+            for line, column, length, text in hits:
+                item = QListWidgetItem(f"    {line}:  {self._preview(text, column)}")
+                item.setData(HIT_ROLE, (node_id, line, column, length))
+                item.setToolTip(text.strip()[:500])
+                self.results.addItem(item)
+        self.results.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _preview(text, column):
+        """The hit's line, trimmed so the match stays visible."""
+        stripped = text.lstrip()
+        column -= len(text) - len(stripped)
+        if len(stripped) <= LINE_PREVIEW_CHARS:
+            return stripped
+        start = max(0, min(column - 20, len(stripped) - LINE_PREVIEW_CHARS))
+        return ("..." if start else "") + stripped[start:start + LINE_PREVIEW_CHARS] + "..."
+
+    def _on_done(self, generation, total):
+        if generation != self._generation:
+            return
+        if not total:
+            self.status.setText("No results")
+            return
+        capped = " (limit reached)" if total >= MAX_HITS else ""
+        self.status.setText(f"{total:,} results in {self._file_count:,} files{capped}")
+
+    def _on_item_activated(self, item):
+        hit = item.data(HIT_ROLE)
+        if hit:
+            self.hitActivated.emit(*hit)
+
+    def shutdown(self):
+        """Stop the running query (before the window closes)."""
+        self._debounce.stop()
+        self._cancel_worker()
+        if self._worker is not None:
+            self._worker.wait()
@@ -0,0 +1,190 @@
+import os
+import logging
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QFrame, QLabel
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from src.backend.managers.icon_manager import IconManager
+from src.backend.search_index import QuickOpenMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class QuickOpenWorker(QThread):
+    """Runs one quick-open query off the GUI thread."""
+    results_ready = pyqtSignal(int, object)  # generation, [(node_id, score)]
+
+    def __init__(self, matcher, query, generation, limit, parent=None):
+        super().__init__(parent)
+        self.matcher = matcher
+        self.query = query
+        self.generation = generation
+        self.limit = limit
+
+    def run(self):
+        try:
+            results = self.matcher.search(self.query, self.limit)
+        except Exception as e:
+            logger.error(f"Quick open failed: {e}")
+            return
+        self.results_ready.emit(self.generation, results)
+
+
+class QuickOpenDialog(QDialog):
+    """
+    "Go to file" palette (Ctrl+P): fuzzy-matches the query against every
+    file's relative path and emits the chosen file's NodeTable id.
+    """
+    fileChosen = pyqtSignal(int)
+
+    MAX_RESULTS = 50
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.matcher = QuickOpenMatcher(index)
+        self.icon_manager = IconManager()
+
+        # One query at a time; keystrokes typed meanwhile collapse into one rerun
+        self._generation = 0
+        self._worker = None
+        self._restart_pending = False
+
+        self.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setFixedSize(560, 420)
+
+        self._build_ui()
+
+    def _build_ui(self):
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+
+        card = QFrame()
+        card.setObjectName("QuickOpenCard")
+        card.setStyleSheet("""
+            QFrame#QuickOpenCard {
+                background-color: #FFFFFF;
+                border: 1px solid #D1D5DB;
+                border-radius: 10px;
+            }
+        """)
+
+        layout = QVBoxLayout(card)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+
+        self.input = QLineEdit()
+        self.input.setPlaceholderText("Go to file...")
+        self.input.setStyleSheet("""
+            QLineEdit {
+                background-color: #F9FAFB;
+                border: 1px solid #007AFF;
+                border-radius: 6px;
+                padding: 6px 10px;
+                font-size: 13px;
+                color: #111827;
+            }
+        """)
+        self.input.textChanged.connect(self._on_text_changed)
+        self.input.returnPressed.connect(self._choose_current)
+        layout.addWidget(self.input)
+
+        self.results = QListWidget()
+        self.results.setFocusPolicy(Qt.NoFocus)
+        self.results.setStyleSheet("""
+            QListWidget { border: none; background: transparent; font-size: 13px; outline: 0; }
+            QListWidget::item { height: 26px; padding-left: 4px; color: #111827; border-radius: 4px; }
+            QListWidget::item:selected { background-color: #DCEAFE; color: #1D4ED8; }
+            QListWidget::item:hover { background-color: #F3F4F6; }
+        """)
+        self.results.itemActivated.connect(lambda item: self._choose(item))
+        self.results.itemClicked.connect(lambda item: self._choose(item))
+        layout.addWidget(self.results, 1)
+
+        self.status = QLabel(f"{len(self.index.paths):,} files")
+        self.status.setStyleSheet("color: #6B7280; font-size: 11px;")
+        layout.addWidget(self.status)
+
+        root.addWidget(card)
+        self.input.setFocus()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Top center of the window that opened us (like an editor's command palette)
+        parent = self.parentWidget()
+        if parent:
+            top_left = parent.mapToGlobal(parent.rect().topLeft())
+            self.move(top_left.x() + (parent.width() - self.width()) // 2, top_left.y() + 60)
+
+    # --- Querying ---
+
+    def _on_text_changed(self, text):
+        self._generation += 1
+        if not text.strip():
+            self.results.clear()
+            self.status.setText(f"{len(self.index.paths):,} files")
+            return
+        self._start_worker()
+
+    def _start_worker(self):
+        if self._worker is not None and self._worker.isRunning():
+            self._restart_pending = True
+            return
+        self._worker = QuickOpenWorker(self.matcher, self.input.text(), self._generation, self.MAX_RESULTS, self)
+        self._worker.results_ready.connect(self._on_results)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.start()
+
+    def _on_worker_finished(self):
+        if self._restart_pending:
+            self._restart_pending = False
+            if self.input.text().strip():
+                self._start_worker()
+
+    def _on_results(self, generation, results):
+        if generation != self._generation:
+            return  # The text changed meanwhile
+        self.results.clear()
+        table = self.index.table
+        for node_id, score in results:
+            rel_path = table.rel_path(node_id)
+            name = os.path.basename(rel_path)
+            folder = os.path.dirname(rel_path)
+            item = QListWidgetItem(self.icon_manager.get_file_icon(name), f"{name}    {folder}" if folder else name)
+            item.setData(Qt.UserRole, node_id)
+            item.setToolTip(rel_path)
+            self.results.addItem(item)
+        if results:
+            self.results.setCurrentRow(0)
+        if not results:
+            self.status.setText("No matching files")
+        elif len(results) >= self.MAX_RESULTS:
+            # The list is cut at MAX_RESULTS (broad queries stop counting early)
+            self.status.setText(f"Top {len(results)} matches")
+        else:
+            self.status.setText(f"{len(results)} match" if len(results) == 1 else f"{len(results)} matches")
+
+    # --- Choosing ---
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Down, Qt.Key_Up) and self.results.count():
+            step = 1 if event.key() == Qt.Key_Down else -1
+            row = max(0, min(self.results.count() - 1, self.results.currentRow() + step))
+            self.results.setCurrentRow(row)
+            return
+        super().keyPressEvent(event)
+
+    def _choose_current(self):
+        item = self.results.currentItem()
+        if item is not None:
+            self._choose(item)
+
+    def _choose(self, item):
+        self.fileChosen.emit(item.data(Qt.UserRole))
+        self.accept()
+
+    def done(self, result):
+        # Never destroy a running worker thread
+        if self._worker is not None and self._worker.isRunning():
+            self._restart_pending = False
+            self._worker.wait()
+        super().done(result)
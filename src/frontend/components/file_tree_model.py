@@ -0,0 +1,433 @@
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
+from PyQt5.QtGui import QFont, QColor
+from src.backend.analyzers.token_aggregates import TOKENS_KEY
+from src.backend.node_table import node_table, ROOT_ID
+
+PATH_ROLE = Qt.UserRole + 1  # Relative path of the row's node
+TOKEN_COLUMN = 1
+
+# Heat map colors by share of the project's tokens
+HEAT_COLORS = ((0.20, "#DC2626"), (0.05, "#D97706"), (0.0, "#9CA3AF"))
+
+
+def format_tokens(count):
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.1f}K"
+    return str(count)
+
+
+def node_tokens(node):
+    agg = node.get(TOKENS_KEY)
+    return agg.tokens if agg is not None else 0
+
+
+# Row ids are NodeTable ids; a folder's "(empty)" placeholder row is its id with this bit set
+PLACEHOLDER_BIT = 1 << 62
+
+
+class FileTreeModel(QAbstractItemModel):
+    """
+    Lazy model over the scanner's dict tree.
+
+    Rows exist only for folders that were expanded (canFetchMore/fetchMore),
+    so opening a huge project creates a single row. Each index carries the
+    NodeTable id of its scan node (no references or copies of the dicts);
+    names, icons, fonts and token cells are read from the node in data()
+    when a row is painted.
+    """
+
+    def __init__(self, icon_manager, parent=None):
+        super().__init__(parent)
+        self.icon_manager = icon_manager
+        self.sort_by_tokens = False
+        self.token_total = 0
+        self.table = None
+        self._top = []          # [ROOT_ID] while a tree is shown
+        self._rows = {}         # id -> child ids shown under it (fetched folders only)
+        self._row = {}          # id -> row under its parent
+        self._open = set()      # Expanded folder ids (open folder icon)
+        self._visible = None    # Ids shown while a search is active
+
+        self._root_font = QFont()
+        self._root_font.setWeight(QFont.Bold)
+        self._folder_font = QFont()
+        self._folder_font.setWeight(QFont.DemiBold)
+        self._heat_colors = tuple((threshold, QColor(color)) for threshold, color in HEAT_COLORS)
+
+    # --- Content ---
+
+    def root_node(self):
+        return self.table.root if self.table else None
+
+    def set_root(self, data, visible=None):
+        """Show a new scan tree (or nothing); only the root row is created."""
+        self.beginResetModel()
+        self.table = node_table(data) if data else None
+        self._rows = {}
+        self._row = {ROOT_ID: 0}
+        self._open.clear()
+        self._visible = visible
+        self._top = [ROOT_ID] if data and (visible is None or ROOT_ID in visible) else []
+        self.token_total = node_tokens(data) if data else 0
+        self.endResetModel()
+
+    def replace_root(self, data):
+        """
+        Show a rescan of the same folder without resetting the view.
+
+        Fetched rows are matched to the new scan by relative path, so only
+        rows that vanished are removed, new ones inserted and changed files
+        repainted; expansion, selection and scroll position survive. Work is
+        proportional to the rows that exist (the lazy model never needs a
+        diff of the whole tree). Another folder falls back to set_root().
+        """
+        old = self.table
+        if old is None or not data or not self._top or data.get('abs_path') != old.root.get('abs_path'):
+            return self.set_root(data)
+        new = node_table(data)
+
+        # Old row id -> new id (rows whose node vanished or changed type are left out)
+        ids = {}
+        for node_id in self._top + [i for rows in self._rows.values() for i in rows]:
+            if node_id & PLACEHOLDER_BIT:
+                continue
+            new_id = new.id_of(old.rel_path(node_id))
+            if new_id is not None and new.node(new_id).get('type') == old.node(node_id).get('type'):
+                ids[node_id] = new_id
+        for node_id in [i for rows in self._rows.values() for i in rows if i & PLACEHOLDER_BIT]:
+            folder = ids.get(node_id & ~PLACEHOLDER_BIT)
+            if folder is not None:
+                ids[node_id] = folder | PLACEHOLDER_BIT
+        if self._visible is not None:
+            visible = (new.id_of(old.rel_path(i)) for i in self._visible)
+            self._visible = {i for i in visible if i is not None}
+
+        # 1. Remove rows that are gone (still against the old table)
+        for parent_id in [None] + list(self._rows):
+            rows = self._top if parent_id is None else self._rows.get(parent_id)
+            if rows is None:
+                continue  # Its folder was removed above
+            parent_index = QModelIndex() if parent_id is None else self.index_of(parent_id)
+            self._sync_rows(parent_index, rows, [i for i in rows if i in ids])
+
+        # 2. Switch to the new ids and order (same rows, so a layout change)
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        self.table = new
+        self._top = [ids[i] for i in self._top]
+        self._rows = {ids[parent]: [ids[i] for i in rows] for parent, rows in self._rows.items() if parent in ids}
+        self._open = {ids[i] for i in self._open if i in ids}
+        self._row = {}
+        self._renumber(self._top, 0)
+        for parent_id, rows in self._rows.items():
+            order = {node_id: n for n, node_id in enumerate(self._shown_ids(parent_id))}
+            rows.sort(key=lambda i: order.get(i, -1))
+            self._renumber(rows, 0)
+        new_indexes = []
+        for index in old_indexes:
+            node_id = ids.get(index.internalId())
+            new_indexes.append(
+                self.createIndex(self._row[node_id], index.column(), node_id) if node_id in self._row else QModelIndex()
+            )
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+        self.token_total = node_tokens(data)
+
+        # 3. Insert rows that are new
+        stack = list(self._top)
+        if not self._sync_rows(QModelIndex(), self._top, [ROOT_ID] if self._visible is None or ROOT_ID in self._visible else []):
+            return self.set_root(data, self._visible)
+        while stack:
+            node_id = stack.pop()
+            rows = self._rows.get(node_id)
+            if rows is None:
+                continue
+            if not self._sync_rows(self.index_of(node_id), rows, self._shown_ids(node_id)):
+                return self.set_root(data, self._visible)
+            stack.extend(i for i in rows if i in self._rows)
+
+        # 4. Repaint files whose size or modification time changed
+        for old_id, new_id in ids.items():
+            if new_id & PLACEHOLDER_BIT or new_id not in self._row:
+                continue
+            before, after = old.node(old_id), new.node(new_id)
+            if before.get('size_bytes') != after.get('size_bytes') or before.get('last_modified') != after.get('last_modified'):
+                self.dataChanged.emit(self.index_of(new_id), self.index_of(new_id, TOKEN_COLUMN))
+
+    def set_filter(self, visible):
+        """Restrict rows to the node ids in visible (None shows everything)."""
+        self.set_root(self.root_node(), visible)
+
+    def apply_filter(self, visible):
+        """
+        Switch the filter by inserting and removing only the rows whose
+        visibility changed (fetched folders only; the rest filter on fetch).
+        Expanded folders that stay visible keep their state.
+        """
+        if self.table is None:
+            return
+        self._visible = visible
+        top = [ROOT_ID] if visible is None or ROOT_ID in visible else []
+        if not self._sync_rows(QModelIndex(), self._top, top):
+            return self.set_filter(visible)
+        stack = list(self._top)
+        while stack:
+            node_id = stack.pop()
+            rows = self._rows.get(node_id)
+            if rows is None:
+                continue
+            if not self._sync_rows(self.index_of(node_id), rows, self._shown_ids(node_id)):
+                return self.set_filter(visible)
+            stack.extend(i for i in rows if i in self._rows)
+
+    def _sync_rows(self, parent_index, rows, desired):
+        """Turn rows into desired in place with grouped remove/insert calls (False if the order differs)."""
+        wanted = set(desired)
+        row = len(rows) - 1
+        while row >= 0:
+            if rows[row] in wanted:
+                row -= 1
+                continue
+            end = row
+            while row > 0 and rows[row - 1] not in wanted:
+                row -= 1
+            self.beginRemoveRows(parent_index, row, end)
+            removed = rows[row:end + 1]
+            del rows[row:end + 1]
+            self._renumber(rows, row)
+            for node_id in removed:
+                self._forget(node_id)
+            self.endRemoveRows()
+            row -= 1
+
+        kept = set(rows)
+        if rows != [i for i in desired if i in kept]:
+            return False  # Sort order changed (e.g. token counts): caller resets instead
+
+        row = 0
+        while row < len(desired):
+            if row < len(rows) and rows[row] == desired[row]:
+                row += 1
+                continue
+            end = row
+            present = rows[row] if row < len(rows) else None
+            while end + 1 < len(desired) and desired[end + 1] != present:
+                end += 1
+            self.beginInsertRows(parent_index, row, end)
+            rows[row:row] = desired[row:end + 1]
+            self._renumber(rows, row)
+            self.endInsertRows()
+            row = end + 1
+        return True
+
+    def _renumber(self, rows, start):
+        self._row.update((rows[i], i) for i in range(start, len(rows)))
+
+    def _child_ids(self, node_id):
+        ids = self.table.child_ids(node_id)
+        if self._visible is not None:
+            ids = [i for i in ids if i in self._visible]
+        node = self.table.node
+        if self.sort_by_tokens:
+            # Heaviest first
+            return sorted(ids, key=lambda i: (-node_tokens(node(i)), node(i)['name'].lower()))
+        # Folders first, then files
+        return sorted(ids, key=lambda i: (node(i)['type'] != 'folder', node(i)['name'].lower()))
+
+    # --- Index plumbing ---
+
+    def id_at(self, index):
+        """NodeTable id of a row (None for the top level and placeholders)."""
+        if not index.isValid() or index.internalId() & PLACEHOLDER_BIT:
+            return None
+        return index.internalId()
+
+    def node_at(self, index):
+        node_id = self.id_at(index)
+        return self.table.node(node_id) if node_id is not None else None
+
+    def index_of(self, node_id, column=0):
+        """Index of a fetched row (invalid if its parent was never expanded)."""
+        if node_id is None or node_id not in self._row:
+            return QModelIndex()
+        return self.createIndex(self._row[node_id], column, node_id)
+
+    def _shown(self, parent):
+        if not parent.isValid():
+            return self._top
+        return self._rows.get(parent.internalId())
+
+    def index(self, row, column, parent=QModelIndex()):
+        rows = self._shown(parent)
+        if not rows or not 0 <= row < len(rows):
+            return QModelIndex()
+        return self.createIndex(row, column, rows[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        node_id = index.internalId()
+        if node_id & PLACEHOLDER_BIT:
+            return self.index_of(node_id & ~PLACEHOLDER_BIT)
+        if node_id == ROOT_ID:
+            return QModelIndex()
+        return self.index_of(self.table.parent_id(node_id))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        rows = self._shown(parent)
+        return len(rows) if rows else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def _is_folder(self, node_id):
+        return node_id is not None and self.table.node(node_id).get('type') == 'folder'
+
+    def hasChildren(self, parent=QModelIndex()):
+        rows = self._shown(parent)
+        if rows is not None:
+            return bool(rows)
+        return self._is_folder(self.id_at(parent))
+
+    def canFetchMore(self, parent):
+        node_id = self.id_at(parent)
+        return node_id not in self._rows and self._is_folder(node_id)
+
+    def _shown_ids(self, node_id):
+        ids = self._child_ids(node_id)
+        if not ids and self._visible is None:
+            ids = [node_id | PLACEHOLDER_BIT]  # "(empty)"
+        return ids
+
+    def fetchMore(self, parent):
+        node_id = self.id_at(parent)
+        if node_id is None or node_id in self._rows:
+            return
+        ids = self._shown_ids(node_id)
+        if not ids:
+            self._rows[node_id] = []
+            return
+        self.beginInsertRows(parent, 0, len(ids) - 1)
+        self._rows[node_id] = ids
+        self._row.update((child_id, row) for row, child_id in enumerate(ids))
+        self.endInsertRows()
+
+    def fetch(self, node_id):
+        """Materialize a row's children now (e.g. before expanding it from code)."""
+        if node_id not in self._rows:
+            self.fetchMore(self.index_of(node_id))
+        return [i for i in self._rows.get(node_id, ()) if not i & PLACEHOLDER_BIT]
+
+    def top_ids(self):
+        return list(self._top)
+
+    # --- Display ---
+
+    def flags(self, index):
+        if self.id_at(index) is None:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node_id = index.internalId()
+        if node_id & PLACEHOLDER_BIT:
+            if index.column() == 0 and role == Qt.DisplayRole:
+                return "(empty)"
+            if role == Qt.ForegroundRole:
+                return QColor(Qt.gray)
+            return None
+
+        node = self.table.node(node_id)
+        if index.column() == TOKEN_COLUMN:
+            return self._token_data(node, role)
+
+        if role == Qt.DisplayRole:
+            return node['name']
+        if role == Qt.DecorationRole:
+            if node['type'] == 'folder':
+                return self.icon_manager.get_folder_icon(node['name'], is_open=node_id in self._open)
+            return self.icon_manager.get_file_icon(node['name'])
+        if role == Qt.FontRole:
+            if node_id == ROOT_ID:
+                return self._root_font
+            if node['type'] == 'folder':
+                return self._folder_font
+        if role == PATH_ROLE:
+            return node.get('path', '')
+        return None
+
+    def _token_data(self, node, role):
+        """Token count and share of the project for one row (read from the cached aggregates)."""
+        if role not in (Qt.DisplayRole, Qt.ForegroundRole, Qt.ToolTipRole, Qt.TextAlignmentRole):
+            return None
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        tokens = node_tokens(node)
+        share = tokens / self.token_total if self.token_total else 0.0
+        if role == Qt.DisplayRole:
+            return f"{format_tokens(tokens)}  {share:.1%}" if tokens else ""
+        if role == Qt.ToolTipRole:
+            return f"~{tokens:,} tokens ({share:.1%} of the export)"
+        return next(color for threshold, color in self._heat_colors if share >= threshold)
+
+    def set_open(self, index, is_open):
+        """Track expanded folders so data() can return the open folder icon."""
+        node_id = self.id_at(index)
+        if node_id is None:
+            return
+        if is_open:
+            self._open.add(node_id)
+        else:
+            self._open.discard(node_id)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def open_ids(self):
+        return list(self._open)
+
+    def refresh_tokens(self):
+        root = self.root_node()
+        self.token_total = node_tokens(root) if root else 0
+
+    # --- Removal ---
+
+    def remove_ids(self, node_ids):
+        """Remove the fetched rows of these nodes, one grouped call per run of adjacent rows."""
+        by_parent = {}
+        for node_id in node_ids:
+            if node_id in self._row and node_id != ROOT_ID:
+                by_parent.setdefault(self.table.parent_id(node_id), []).append(self._row[node_id])
+        for parent_id, row_numbers in by_parent.items():
+            rows = self._rows.get(parent_id)
+            if not rows:
+                continue
+            parent_index = self.index_of(parent_id)
+            row_numbers.sort(reverse=True)
+            i = 0
+            while i < len(row_numbers):
+                end = start = row_numbers[i]
+                while i + 1 < len(row_numbers) and row_numbers[i + 1] == start - 1:
+                    i += 1
+                    start -= 1
+                self.beginRemoveRows(parent_index, start, end)
+                removed = rows[start:end + 1]
+                del rows[start:end + 1]
+                self._renumber(rows, start)
+                for node_id in removed:
+                    self._forget(node_id)
+                self.endRemoveRows()
+                i += 1
+
+    def _forget(self, node_id):
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            self._open.discard(current)
+            self._row.pop(current, None)
+            stack.extend(self._rows.pop(current, ()))
@@ -0,0 +1,264 @@
+"""
+Paged preview for files too large to load into one editor.
+"""
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QScrollBar
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.Qsci import QsciScintilla
+from src.backend.line_index import LineIndex
+
+
+class LineIndexThread(QThread):
+    """Indexes the file's lines off the GUI thread."""
+    indexed = pyqtSignal(int, object)  # generation, LineIndex (None if it failed)
+
+    def __init__(self, path, generation, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.generation = generation
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        index = LineIndex(self.path)
+        try:
+            if not index.build(cancelled=lambda: self._cancelled):
+                return
+        except OSError as e:
+            print(f"Error indexing {self.path}: {e}")
+            index = None
+        self.indexed.emit(self.generation, index)
+
+
+class WindowReadThread(QThread):
+    """Reads one window of lines off the GUI thread."""
+    window_ready = pyqtSignal(int, int, object)  # generation, first line, [lines]
+
+    def __init__(self, index, start, count, generation, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.start_line = start
+        self.count = count
+        self.generation = generation
+
+    def run(self):
+        try:
+            lines = self.index.read_lines(self.start_line, self.count)
+        except OSError as e:
+            print(f"Error reading {self.index.path}: {e}")
+            lines = []
+        self.window_ready.emit(self.generation, self.start_line, lines)
+
+
+class LargeFileView(QWidget):
+    """
+    Read-only preview of a large text file, paged from disk.
+
+    The editor only ever holds a window of lines around the viewport, as
+    plain text (no lexer). A separate scroll bar spans the whole file; when
+    the viewport nears the edge of the window, the window around it is
+    read in the background and swapped in. Line numbers are drawn in a
+    text margin, so they show file lines rather than window lines.
+    """
+
+    WINDOW_LINES = 2000
+    EDGE_LINES = 300  # Re-center once the viewport is this close to the window's edge
+
+    def __init__(self, path, editor, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.editor = editor
+
+        self._generation = 0
+        self._index = None
+        self._index_thread = None
+        self._read_thread = None
+        self._read_pending = None   # First line of a window to read once the current read is done
+        self._window_start = 0
+        self._window_len = 0
+        self._top = 0                # File line shown at the top of the viewport
+        self._pending_selection = None
+        self._syncing = False
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        editor.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        editor.setFolding(QsciScintilla.NoFoldStyle)
+        editor.setMarginType(0, QsciScintilla.TextMarginRightJustified)
+        editor.SCN_UPDATEUI.connect(self._on_editor_updated)  # Its own scroll bar is hidden and stays still
+        layout.addWidget(editor, 1)
+
+        self.scroll_bar = QScrollBar(Qt.Vertical)
+        self.scroll_bar.setStyleSheet("""
+            QScrollBar:vertical { border: none; background: transparent; width: 6px; margin: 0px; }
+            QScrollBar::handle:vertical { background: #C7CCD4; min-height: 20px; border-radius: 3px; }
+            QScrollBar::handle:vertical:hover { background: #0069D9; }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: none; }
+        """)
+        self.scroll_bar.setRange(0, 0)
+        self.scroll_bar.valueChanged.connect(self._on_scroll_bar)
+        layout.addWidget(self.scroll_bar)
+
+        self.reload()
+
+    # --- Loading ---
+
+    def reload(self):
+        """Re-index the file (e.g. after it changed on disk) and re-read the lines in view."""
+        self._generation += 1
+        if self._index_thread is not None and self._index_thread.isRunning():
+            self._index_thread.cancel()
+        self._index_thread = LineIndexThread(self.path, self._generation, self)
+        self._index_thread.indexed.connect(self._on_indexed)
+        self._index_thread.start()
+        if self._index is None:
+            # The first window needs no index: show it right away
+            self._request_window(0, LineIndex(self.path))
+
+    def _on_indexed(self, generation, index):
+        if generation != self._generation:
+            return
+        if index is None:
+            self.editor.setText("// Content not available\n")
+            return
+        self._index = index
+        self._top = min(self._top, max(0, index.line_count - 1))
+        digits = len(str(index.line_count))
+        self.editor.setMarginWidth(0, "0" * (digits + 1))
+        self._update_scroll_range()
+        self._request_window(self._window_origin(self._top))
+
+    def _window_origin(self, line):
+        """First line of the window that centers line."""
+        return max(0, line - self.WINDOW_LINES // 2)
+
+    def _request_window(self, start, index=None):
+        index = index or self._index
+        if index is None:
+            return
+        if self._read_thread is not None and self._read_thread.isRunning():
+            self._read_pending = start  # Only the newest request is worth reading
+            return
+        self._read_thread = WindowReadThread(index, start, self.WINDOW_LINES, self._generation, self)
+        self._read_thread.window_ready.connect(self._on_window_ready)
+        self._read_thread.finished.connect(self._on_read_finished)
+        self._read_thread.start()
+
+    def _on_read_finished(self):
+        start, self._read_pending = self._read_pending, None
+        if start is not None:
+            self._request_window(start)
+
+    def _on_window_ready(self, generation, start, lines):
+        if generation != self._generation:
+            return
+        caret_line, caret_column = self.editor.getCursorPosition()
+        caret_line += self._window_start
+
+        self._syncing = True
+        self.editor.setText("\n".join(lines))
+        self._window_start = start
+        self._window_len = len(lines)
+        self.editor.clearMarginText()
+        for i in range(len(lines)):
+            self.editor.setMarginText(i, str(start + i + 1), QsciScintilla.STYLE_LINENUMBER)
+        if start <= caret_line < start + len(lines):
+            self.editor.setCursorPosition(caret_line - start, caret_column)
+        self.editor.setFirstVisibleLine(self._top - start)
+        self._syncing = False
+
+        if self._pending_selection is not None:
+            line, column, length = self._pending_selection
+            if start <= line < start + len(lines):
+                self._pending_selection = None
+                self._select(line - start, column, length)
+
+    # --- Scrolling ---
+
+    def _visible_lines(self):
+        return max(1, self.editor.SendScintilla(QsciScintilla.SCI_LINESONSCREEN))
+
+    def _update_scroll_range(self):
+        if self._index is None:
+            return
+        visible = self._visible_lines()
+        self._syncing = True
+        self.scroll_bar.setRange(0, max(0, self._index.line_count - visible))
+        self.scroll_bar.setPageStep(visible)
+        self.scroll_bar.setValue(self._top)
+        self._syncing = False
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scroll_range()
+
+    def _in_window(self, top):
+        """Whether top can be shown from the loaded window without nearing an unloaded edge."""
+        start, end = self._window_start, self._window_start + self._window_len
+        total = self._index.line_count if self._index else end
+        low = start if start == 0 else start + self.EDGE_LINES
+        high = end if end >= total else end - self.EDGE_LINES
+        return low <= top and top + self._visible_lines() <= high
+
+    def _on_scroll_bar(self, value):
+        if self._syncing:
+            return
+        self._top = value
+        if self._in_window(value):
+            self._syncing = True
+            self.editor.setFirstVisibleLine(value - self._window_start)
+            self._syncing = False
+        else:
+            self._request_window(self._window_origin(value))
+
+    def _on_editor_updated(self, updated):
+        if not updated & QsciScintilla.SC_UPDATE_V_SCROLL or self._syncing or self._index is None:
+            return
+        self._top = self._window_start + self.editor.firstVisibleLine()
+        self._syncing = True
+        self.scroll_bar.setValue(self._top)
+        self._syncing = False
+        if not self._in_window(self._top):
+            self._request_window(self._window_origin(self._top))
+
+    def top_line(self):
+        """0-based file line at the top of the viewport."""
+        return self._top
+
+    def scroll_to(self, line):
+        """Show a 0-based file line at the top of the viewport (once the file is indexed)."""
+        self._top = max(0, line)
+        if self._index is not None:
+            self._update_scroll_range()
+            self._request_window(self._window_origin(self._top))
+
+    def go_to_line(self, line, column=0, length=0):
+        """Scroll to a 0-based file line and select a match there (reading its window if needed)."""
+        self._top = max(0, line - self._visible_lines() // 2)
+        if self._window_start <= line < self._window_start + self._window_len and self._in_window(self._top):
+            self._on_scroll_bar(self._top)
+            self._update_scroll_range()
+            self._select(line - self._window_start, column, length)
+            return
+        self._pending_selection = (line, column, length)
+        self._update_scroll_range()
+        self._request_window(self._window_origin(line))
+
+    def _select(self, line, column, length):
+        self.editor.setCursorPosition(line, column)
+        if length:
+            self.editor.setSelection(line, column, line, column + length)
+        self.editor.setFocus()
+
+    def shutdown(self):
+        """Stop background reads (before the tab is closed)."""
+        self._read_pending = None
+        for thread in (self._index_thread, self._read_thread):
+            if thread is not None:
+                if isinstance(thread, LineIndexThread):
+                    thread.cancel()
+                thread.wait()
@@ -1,168 +1,267 @@
-from PyQt5.QtWidgets import QPushButton, QMenu, QWidgetAction, QMessageBox
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt
-import os
-
-from src.config import resource_path
-from src.frontend.components.token_estimator_panel import TokenEstimatorPanel
-from src.backend.exporter import generate_full_text, generate_tree_text
-from src.backend.analyzers.token_logic import (
-    estimate_tokens_from_text,
-    analyze_models,
-    overall_token_status
-)
-
-class TokenEstimateButton(QPushButton):
-    """
-    A dropdown button that reveals the Token Estimator Panel.
-    """
-    
-    def __init__(self, parent=None, data_getter=None, format_getter=None):
-        """
-        Args:
-            parent: Parent widget
-            data_getter: Callable that returns the current project data (dict).
-            format_getter: Callable returning list of selected formats.
-        """
-        super().__init__("Token Estimate", parent)
-        self.data_getter = data_getter
-        self.format_getter = format_getter
-        self.last_status = None # 'safe' or 'overflow'
-        
-        self.setCursor(Qt.PointingHandCursor)
-        self.setFixedSize(140, 40)
-        
-        # Panel Instance
-        self.panel = TokenEstimatorPanel(self)
-        
-        self._apply_styles()
-        self._build_menu()
-        
-    def _apply_styles(self, state="closed"):
-        # Resolve Icons
-        if state == "open":
-            raw_path = resource_path("assets/chevron_up.png")
-            icon_path = raw_path.replace("\\", "/") if os.path.exists(raw_path) else ""
-        else:
-            raw_path = resource_path("assets/chevron_left.png")
-            icon_path = raw_path.replace("\\", "/") if os.path.exists(raw_path) else ""
-            
-        # Default Neutral
-        bg_col = "#F3F4F6"
-        hover_col = "#E5E7EB"
-        txt_col = "#374151"
-        brd_col = "#E5E7EB"
-
-        # Apply Status Colors if set
-        if self.last_status == "safe":
-            bg_col = "#ECFDF5"
-            hover_col = "#D1FAE5"
-            txt_col = "#065F46" 
-            brd_col = "#10B981" 
-        elif self.last_status == "overflow":
-            bg_col = "#FEF2F2"
-            hover_col = "#FEE2E2"
-            txt_col = "#7F1D1D"
-            brd_col = "#EF4444"
-
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_col};
-                color: {txt_col};
-                border: 1px solid {brd_col};
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding-left: 10px;
-                padding-right: 10px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_col};
-                border-color: #D1D5DB;
-            }}
-            QPushButton::menu-indicator {{ 
-                subcontrol-origin: padding; 
-                subcontrol-position: right center;
-                margin-right: 10px;
-                width: 12px;
-                image: url({icon_path});
-            }}
-        """)
-
-    def _build_menu(self):
-        token_menu = QMenu(self)
-        
-        # Enable transparency to remove standard OS shadow/square corners
-        token_menu.setWindowFlags(token_menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-        token_menu.setAttribute(Qt.WA_TranslucentBackground)
-        
-        # Clean menu style - transparent so only the panel border shows
-        token_menu.setStyleSheet("""
-            QMenu {
-                background-color: transparent;
-                border: none;
-                border-radius: 0px;
-                padding: 0px; 
-            }
-        """)
-
-        # Container Action for the Panel
-        container_action = QWidgetAction(token_menu)
-        container_action.setDefaultWidget(self.panel)
-        token_menu.addAction(container_action)
-        
-        # Signals
-        token_menu.aboutToShow.connect(self._on_menu_show)
-        token_menu.aboutToHide.connect(lambda: self._apply_styles("closed"))
-        
-        self.setMenu(token_menu)
-
-    def _on_menu_show(self):
-        # When opening, force 'open' state during update
-        self.update_estimate(state_override="open")
-
-    def update_estimate(self, state_override=None):
-        """
-        Recalculates estimate based on current data/formats and updates UI.
-        Public method called by MainWindow.
-        Args:
-            state_override: If set, forces the button style to this state ('open'/'closed').
-                            If None, detects state from menu visibility.
-        """
-        if not self.data_getter:
-            return
-            
-        data = self.data_getter()
-        if not data:
-            self.panel.update_from_text("")
-            self.last_status = None
-            self._apply_styles("closed")
-            return
-
-        # Determine Text Source
-        formats = self.format_getter() if self.format_getter else ["txt_full"]
-        
-        # Exact logic: Tree only -> Tree text. Default/Full -> Full text.
-        if "txt_tree" in formats and "txt_full" not in formats:
-            text = generate_tree_text(data)
-        else:
-            text = generate_full_text(data)
-            
-        # 1. Update Panel
-        self.panel.update_from_text(text)
-        
-        # 2. Update Button Status (Sync)
-        # Re-calc locally to determine button color
-        count = estimate_tokens_from_text(text)
-        analysis = analyze_models(count)
-        self.last_status = overall_token_status(analysis)
-        
-        # Refresh style
-        if state_override:
-            state = state_override
-        else:
-            state = "open" if self.menu() and self.menu().isVisible() else "closed"
-            
-        self._apply_styles(state)
-
+from PyQt5.QtWidgets import QPushButton, QMenu, QWidgetAction, QMessageBox
+from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+import os
+import logging
+
+from src.config import resource_path
+from src.frontend.components.token_estimator_panel import TokenEstimatorPanel
+from src.backend.analyzers.token_aggregates import estimate_export_tokens
+from src.backend.analyzers.token_logic import (
+    analyze_models,
+    overall_token_status
+)
+
+logger = logging.getLogger(__name__)
+
+class TokenEstimateWorker(QThread):
+    """Computes the export token count off the GUI thread."""
+    estimate_ready = pyqtSignal(int, int)  # generation, token count (-1 on failure)
+
+    def __init__(self, data, tree_only, generation, parent=None):
+        super().__init__(parent)
+        self.data = data
+        self.tree_only = tree_only
+        self.generation = generation
+
+    def run(self):
+        try:
+            count = estimate_export_tokens(self.data, tree_only=self.tree_only)
+        except Exception as e:
+            logger.error(f"Token estimation failed: {e}")
+            count = -1
+        self.estimate_ready.emit(self.generation, count)
+
+
+class TokenEstimateButton(QPushButton):
+    """
+    A dropdown button that reveals the Token Estimator Panel.
+    """
+    estimateUpdated = pyqtSignal(int)  # Emitted with the token count when a fresh estimate lands
+
+    DEBOUNCE_MS = 200
+    
+    def __init__(self, parent=None, data_getter=None, format_getter=None):
+        """
+        Args:
+            parent: Parent widget
+            data_getter: Callable that returns the current project data (dict).
+            format_getter: Callable returning list of selected formats.
+        """
+        super().__init__("Token Estimate", parent)
+        self.data_getter = data_getter
+        self.format_getter = format_getter
+        self.last_status = None # 'safe', 'overflow' or 'error'
+        self.last_count = None
+
+        # Background estimation state
+        self._generation = 0          # Bumped on every request; older results are discarded
+        self._worker = None
+        self._restart_pending = False
+        self._state_override = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._start_worker)
+        
+        self.setCursor(Qt.PointingHandCursor)
+        self.setFixedSize(140, 40)
+        
+        # Panel Instance
+        self.panel = TokenEstimatorPanel(self)
+        
+        self._apply_styles()
+        self._build_menu()
+        
+    def _apply_styles(self, state="closed"):
+        # Resolve Icons
+        if state == "open":
+            raw_path = resource_path("assets/chevron_up.png")
+            icon_path = raw_path.replace("\\", "/") if os.path.exists(raw_path) else ""
+        else:
+            raw_path = resource_path("assets/chevron_left.png")
+            icon_path = raw_path.replace("\\", "/") if os.path.exists(raw_path) else ""
+            
+        # Default Neutral
+        bg_col = "#F3F4F6"
+        hover_col = "#E5E7EB"
+        txt_col = "#374151"
+        brd_col = "#E5E7EB"
+
+        # Apply Status Colors if set
+        if self.last_status == "safe":
+            bg_col = "#ECFDF5"
+            hover_col = "#D1FAE5"
+            txt_col = "#065F46" 
+            brd_col = "#10B981" 
+        elif self.last_status == "overflow":
+            bg_col = "#FEF2F2"
+            hover_col = "#FEE2E2"
+            txt_col = "#7F1D1D"
+            brd_col = "#EF4444"
+        elif self.last_status == "error":
+            bg_col = "#FFFBEB"
+            hover_col = "#FEF3C7"
+            txt_col = "#92400E"
+            brd_col = "#F59E0B"
+
+        self.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {bg_col};
+                color: {txt_col};
+                border: 1px solid {brd_col};
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+                padding-left: 10px;
+                padding-right: 10px;
+                text-align: left;
+            }}
+            QPushButton:hover {{
+                background-color: {hover_col};
+                border-color: #D1D5DB;
+            }}
+            QPushButton::menu-indicator {{ 
+                subcontrol-origin: padding; 
+                subcontrol-position: right center;
+                margin-right: 10px;
+                width: 12px;
+                image: url({icon_path});
+            }}
+        """)
+
+    def _build_menu(self):
+        token_menu = QMenu(self)
+        
+        # Enable transparency to remove standard OS shadow/square corners
+        token_menu.setWindowFlags(token_menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
+        token_menu.setAttribute(Qt.WA_TranslucentBackground)
+        
+        # Clean menu style - transparent so only the panel border shows
+        token_menu.setStyleSheet("""
+            QMenu {
+                background-color: transparent;
+                border: none;
+                border-radius: 0px;
+                padding: 0px; 
+            }
+        """)
+
+        # Container Action for the Panel
+        container_action = QWidgetAction(token_menu)
+        container_action.setDefaultWidget(self.panel)
+        token_menu.addAction(container_action)
+        
+        # Signals
+        token_menu.aboutToShow.connect(self._on_menu_show)
+        token_menu.aboutToHide.connect(lambda: self._apply_styles("closed"))
+        
+        self.setMenu(token_menu)
+
+    def _on_menu_show(self):
+        # When opening, force 'open' state; the panel keeps the last result
+        self._apply_styles("open")
+        if self.last_count is None:
+            self.update_estimate(state_override="open")
+
+    def update_estimate(self, state_override=None):
+        """
+        Schedules a recalculation based on current data/formats.
+        Public method called by MainWindow.
+
+        Bursts of calls within DEBOUNCE_MS collapse into one computation,
+        which runs on a worker thread; results of superseded requests are dropped.
+        Args:
+            state_override: If set, forces the button style to this state ('open'/'closed').
+                            If None, detects state from menu visibility.
+        """
+        if not self.data_getter:
+            return
+
+        # Any estimate already in flight is now stale
+        self._generation += 1
+        self._state_override = state_override
+
+        data = self.data_getter()
+        if not data:
+            self._debounce.stop()
+            self.panel.update_from_text("")
+            self.last_status = None
+            self.last_count = None
+            self.setText("Token Estimate")
+            self._apply_styles("closed")
+            return
+
+        self.setText("Estimating...")
+        self._debounce.start()
+
+    def _start_worker(self):
+        if self._worker is not None and self._worker.isRunning():
+            # Run once more when the current worker is done (with the newest data)
+            self._restart_pending = True
+            return
+
+        data = self.data_getter() if self.data_getter else None
+        if not data:
+            return
+
+        # Determine Text Source
+        formats = self.format_getter() if self.format_getter else ["txt_full"]
+        
+        # Exact logic: Tree only -> Tree text. Default/Full -> Full text.
+        # Counted from per-node aggregates (same number, no export text built)
+        tree_only = "txt_tree" in formats and "txt_full" not in formats
+
+        self._worker = TokenEstimateWorker(data, tree_only, self._generation, self)
+        self._worker.estimate_ready.connect(self._on_estimate_ready)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.start()
+
+    def _on_worker_finished(self):
+        worker = self.sender()
+        if worker is not None:
+            worker.deleteLater()
+        if worker is self._worker:
+            self._worker = None
+        if self._restart_pending:
+            self._restart_pending = False
+            self._start_worker()
+
+    def _on_estimate_ready(self, generation, count):
+        if generation != self._generation:
+            return  # Superseded by a newer request
+
+        if count < 0:
+            # Failed (logged by the worker): show it, and retry next time the panel opens
+            self.last_count = None
+            self.last_status = "error"
+            self.panel.show_error()
+            self.setText("Estimate Failed")
+            self._apply_styles(self._current_state())
+            return
+
+        # 1. Update Panel
+        self.last_count = count
+        self.panel.update_from_count(count)
+        
+        # 2. Update Button Status
+        analysis = analyze_models(count)
+        self.last_status = overall_token_status(analysis)
+        self.setText("Token Estimate")
+        
+        # Refresh style
+        self._apply_styles(self._current_state())
+        self.estimateUpdated.emit(count)
+
+    def _current_state(self):
+        if self._state_override:
+            return self._state_override
+        return "open" if self.menu() and self.menu().isVisible() else "closed"
+
+    def shutdown(self):
+        """Drop pending estimates and wait for a running one (before the window closes)."""
+        self._debounce.stop()
+        self._generation += 1
+        self._restart_pending = False
+        if self._worker is not None:
+            self._worker.wait()
@@ -1,414 +1,554 @@
-from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem, QApplication, QTreeWidgetItemIterator
-from PyQt5.QtCore import Qt, QDateTime, QLocale, QSettings, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont
-from src.config import resource_path
-from src.frontend.components.tree_context_menu.menu import TreeContextMenu
-from src.backend.managers.icon_manager import IconManager
-import os
-
-class FileTreeWidget(QTreeWidget):
-    filePreviewRequested = pyqtSignal(dict)
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.settings = QSettings("StructurePro", "Crawlsee")
-        self.icon_manager = IconManager()
-        
-        # Load Chevron Icons for Tree
-        chevron_right = resource_path("assets/chevron_right.png").replace("\\", "/")
-        chevron_down = resource_path("assets/chevron_down.png").replace("\\", "/")
-
-        # New VS Code properties
-        self.setHeaderHidden(True)
-        self.setIndentation(16)
-        self.setRootIsDecorated(True)
-        self.setAnimated(True)
-
-        # Restore column widths
-        for i in range(self.columnCount()):
-            width = self.settings.value(f"tree/column_width_{i}")
-            if width:
-                self.setColumnWidth(i, int(width))
-                
-        # Save upon resize
-        self.header().sectionResized.connect(self.save_column_widths)
-        
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
-        # VS Code Stylesheet
-        self.setStyleSheet(f"""
-        QTreeWidget {{
-            background-color: transparent;
-            border: none;
-            padding: 4px;
-            outline: 0;
-        }}
-
-        /* Row Styling */
-        QTreeWidget::item {{
-            height: 26px;
-            padding-left: 6px;
-            color: #111827;
-            border: none;
-        }}
-
-        QTreeWidget::item:hover {{
-            background-color: #E5E7EB;
-            border-radius: 4px;
-        }}
-
-        QTreeWidget::item:selected {{
-            background-color: #DCEAFE;
-            color: #1D4ED8;
-            border-radius: 4px;
-        }}
-
-        QTreeWidget::item:selected:!active {{
-            background-color: #E5E7EB;
-            color: #111827;
-        }}
-
-        /* Branch Icons */
-        QTreeWidget::branch:has-children:!has-siblings:closed,
-        QTreeWidget::branch:closed:has-children:has-siblings {{ image: url({chevron_right}); }}
-
-        QTreeWidget::branch:open:has-children:!has-siblings,
-        QTreeWidget::branch:open:has-children:has-siblings {{ image: url({chevron_down}); }}
-
-        QTreeWidget::branch {{ background: transparent; }}
-        
-        /* Auto-Hide Scrollbars Logic (Vertical Only) */
-        QScrollBar:vertical {{
-            border: none;
-            background: transparent;
-            width: 6px;
-            margin: 0px;
-        }}
-        QScrollBar::handle:vertical {{
-            background: transparent; /* Hidden by default */
-            min-height: 20px;
-            border-radius: 3px;
-        }}
-        /* Show when parent is hovered (via dynamic property) */
-        QScrollBar[active="true"]::handle:vertical {{
-            background: #007AFF;
-        }}
-        QScrollBar::handle:vertical:hover {{
-            background: #0069D9;
-        }}
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
-        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
-        """)
-
-        self.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.customContextMenuRequested.connect(self._open_context_menu)
-        
-        # Connect item click for preview
-        self.itemClicked.connect(self._on_item_clicked)
-        
-        # Connect expansion for dynamic icons
-        self.itemExpanded.connect(self._on_item_expanded)
-        self.itemCollapsed.connect(self._on_item_collapsed)
-        
-        # Mouse tracking for auto-hide scrollbars
-        self.setMouseTracking(True)
-
-    def enterEvent(self, event):
-        """Show scrollbars on hover."""
-        self.verticalScrollBar().setProperty("active", "true")
-        self.horizontalScrollBar().setProperty("active", "true")
-        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
-        self.verticalScrollBar().style().polish(self.verticalScrollBar())
-        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
-        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        """Hide scrollbars when mouse leaves."""
-        self.verticalScrollBar().setProperty("active", "false")
-        self.horizontalScrollBar().setProperty("active", "false")
-        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
-        self.verticalScrollBar().style().polish(self.verticalScrollBar())
-        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
-        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
-        super().leaveEvent(event)
-
-    def _on_item_expanded(self, item):
-        self._update_folder_icon(item, is_expanded=True)
-
-    def _on_item_collapsed(self, item):
-        self._update_folder_icon(item, is_expanded=False)
-
-    def _update_folder_icon(self, item, is_expanded):
-        data = item.data(0, Qt.UserRole)
-        if data and data.get('type') == 'folder':
-            icon = self.icon_manager.get_folder_icon(data['name'], is_open=is_expanded)
-            item.setIcon(0, icon)
-    
-    def _on_item_clicked(self, item, column):
-        """Handle item click to show preview in canvas."""
-        data = item.data(0, Qt.UserRole)
-        if not data:
-            return
-        
-        # Only preview files, not folders
-        if data.get('type') == 'file':
-            self.filePreviewRequested.emit(data)
-
-    def _open_context_menu(self, pos):
-        item = self.itemAt(pos)
-        if not item:
-            return
-
-        data = item.data(0, Qt.UserRole)
-        if not data:
-            return
-
-        # Ensure we have access to ignore_manager, via window()
-        ignore_mgr = self.window().ignore_manager if hasattr(self.window(), 'ignore_manager') else None
-        
-        TreeContextMenu(
-            parent=self,
-            tree=self,
-            ignore_manager=ignore_mgr
-        ).open(self.viewport().mapToGlobal(pos), data)
-
-    def copy_tree_snippet(self, folder_data):
-        from src.backend.exporter import generate_tree_text
-        snippet = generate_tree_text(folder_data)
-        QApplication.clipboard().setText(snippet)
-
-    # --- Proxies for Menu Actions ---
-    
-    def rescan_folder(self, abs_path):
-        """Legacy rescan - triggers full reload. Use only when necessary."""
-        if hasattr(self.window(), 'reload_scan'):
-             self.window().reload_scan() 
-        else:
-             print("Rescan function not found on main window")
-
-    def fast_remove_item(self, item_name: str):
-        """
-        FAST client-side removal without re-scanning.
-        Removes matching items from tree UI AND from current_data in memory.
-        """
-        main_window = self.window()
-        
-        # 1. Remove from in-memory data (so export is correct)
-        if hasattr(main_window, 'current_data') and main_window.current_data:
-            self._filter_out_name(main_window.current_data, item_name)
-        
-        # 2. Remove from tree UI (instant visual feedback)
-        self._remove_items_by_name(self.invisibleRootItem(), item_name)
-        
-        # 3. Update token estimator (reflects the reduced content)
-        if hasattr(main_window, 'token_btn'):
-            main_window.token_btn.update_estimate()
-    
-    def _filter_out_name(self, node: dict, name_to_remove: str):
-        """Recursively remove children matching name from data dict."""
-        if 'children' not in node:
-            return
-        
-        # Filter out matching children
-        node['children'] = [
-            child for child in node['children']
-            if child.get('name') != name_to_remove
-        ]
-        
-        # Recurse into remaining children
-        for child in node['children']:
-            if child.get('type') == 'folder':
-                self._filter_out_name(child, name_to_remove)
-    
-    def _remove_items_by_name(self, parent_item, name_to_remove: str):
-        """Recursively remove QTreeWidgetItems matching name."""
-        items_to_remove = []
-        
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            data = child.data(0, Qt.UserRole)
-            
-            if data and data.get('name') == name_to_remove:
-                items_to_remove.append((parent_item, i))
-            else:
-                # Recurse into child
-                self._remove_items_by_name(child, name_to_remove)
-        
-        # Remove in reverse order to avoid index shifting issues
-        for parent, index in reversed(items_to_remove):
-            parent.takeChild(index)
-
-    def export_subfolder(self, abs_path, tree_only=False):
-        if hasattr(self.window(), 'export_folder'):
-            self.window().export_folder(abs_path, tree_only)
-        else:
-            print("Export function not found on main window")
-
-    def open_file_external(self, path):
-         if hasattr(self.window(), 'open_file_external'):
-             self.window().open_file_external(path)
-         else:
-             print("External open function not found on main window")
-
-    # preview_file_internal proxy removed
-
-    def reveal_in_explorer(self, path):
-        if hasattr(self.window(), 'reveal_in_explorer'):
-            self.window().reveal_in_explorer(path)
-        else:
-            print("Reveal function not found on main window")
-
-    def save_column_widths(self, *args):
-        for i in range(self.columnCount()):
-            self.settings.setValue(
-                f"tree/column_width_{i}",
-                self.columnWidth(i)
-            )
-
-    # get_icon_for_item Removed/Integrated into populate
-
-
-    def populate(self, data):
-        """
-        Populate the tree with dictionary data from scanner.
-        """
-        # Save expansion state
-        expanded_paths = self.get_expanded_paths()
-        
-        self.clear()
-        if not data:
-            return
-
-        def add_items(parent, node_data):
-            children = node_data.get('children', [])
-
-            if not children:
-                empty_item = QTreeWidgetItem(["(empty)"])
-                empty_item.setDisabled(True)
-                empty_item.setForeground(0, Qt.gray)
-                parent.addChild(empty_item)
-                return
-
-            # Sort: Folders first, then files
-            children = sorted(children, 
-                            key=lambda x: (x['type'] != 'folder', x['name'].lower()))
-            
-            for child in children:
-                name = child['name']
-                item_type = child.get('display_type', "File")
-                if child['type'] == 'folder' and item_type == "File":
-                     item_type = "Folder" # Fallback safety
-
-                # New order: Name only
-                item = QTreeWidgetItem([name])
-                
-                # Attach data for context menu
-                # Copy child to ensure we have 'children', 'path', etc. for exporter
-                node_data = child.copy() 
-                node_data["abs_path"] = child["path"] if os.path.isabs(child["path"]) else os.path.abspath(child["path"])
-                node_data["rel_path"] = child.get("rel_path", child["path"])
-
-                item.setData(0, Qt.UserRole, node_data)
-                
-                if child['type'] == 'folder':
-                    font = QFont()
-                    font.setWeight(QFont.DemiBold)  # Semi-bold
-                    item.setFont(0, font)  # Name column only
-                
-                # Icons - Use IconManager
-                if child['type'] == 'folder':
-                    item.setIcon(0, self.icon_manager.get_folder_icon(name, is_open=False))
-                else:
-                    item.setIcon(0, self.icon_manager.get_file_icon(name))
-                
-                parent.addChild(item)
-                
-                if child['type'] == 'folder':
-                    add_items(item, child)
-
-        root_item = QTreeWidgetItem([data['name']])
-        
-        # Attach root data for context menu
-        root_data = data.copy()
-        root_data["abs_path"] = data["path"] if os.path.isabs(data["path"]) else os.path.abspath(data["path"])
-        root_data["rel_path"] = data.get("rel_path", ".") # Root relative path is usually dot or empty
-        root_item.setData(0, Qt.UserRole, root_data)
-
-        root_font = QFont()
-        root_font.setWeight(QFont.Bold)
-        root_item.setFont(0, root_font)
-        
-        self.addTopLevelItem(root_item)
-        add_items(root_item, data)
-        
-        # Restore expansion state
-        if expanded_paths:
-            self.restore_expanded_paths(expanded_paths)
-            # Ensure root is expanded if it was (or if we want to force it initially)
-            # But restoring state should cover it if it was open.
-            # If it's a fresh load (empty paths), force root open:
-        else:
-             root_item.setExpanded(True)
-        
-        # Max width cap for Type column - Removed
-        # max_type_width = 260
-        # if self.columnWidth(2) > max_type_width:
-        #    self.setColumnWidth(2, max_type_width)
-
-    def filter_items(self, text):
-        """
-        Filter tree items based on text.
-        """
-        text = text.lower()
-        
-        def check_item(item):
-            # Check current item
-            match = text in item.text(0).lower() 
-            
-            # Check children
-            child_match = False
-            for i in range(item.childCount()):
-                if check_item(item.child(i)):
-                    child_match = True
-            
-            # Logic: Show if match OR child matches
-            should_show = match or child_match
-            item.setHidden(not should_show)
-            
-            # Expand if child matches to reveal it
-            if child_match:
-                item.setExpanded(True)
-                
-            return should_show
-
-        # Iterate top level items (root is usually one, but loop to be safe)
-        for i in range(self.topLevelItemCount()):
-            check_item(self.topLevelItem(i))
-
-    def get_expanded_paths(self):
-        """Return a set of absolute paths for currently expanded items."""
-        expanded = set()
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            if item.isExpanded():
-                data = item.data(0, Qt.UserRole)
-                if data and "abs_path" in data:
-                    expanded.add(data["abs_path"])
-            iterator += 1
-        return expanded
-
-    def restore_expanded_paths(self, expanded_paths):
-        """Restore expansion state based on a set of paths."""
-        if not expanded_paths:
-            return
-            
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            data = item.data(0, Qt.UserRole)
-            if data and "abs_path" in data:
-                if data["abs_path"] in expanded_paths:
-                    item.setExpanded(True)
-            iterator += 1
+from PyQt5.QtWidgets import QTreeView, QApplication, QHeaderView, QStyle
+from PyQt5.QtCore import Qt, QSettings, QThread, QTimer, pyqtSignal
+from src.config import resource_path
+from src.frontend.components.tree_context_menu.menu import TreeContextMenu
+from src.frontend.components.file_tree_model import FileTreeModel, TOKEN_COLUMN
+from src.backend.managers.icon_manager import IconManager
+from src.backend.managers.settings_manager import SettingsManager
+from src.backend.analyzers.token_aggregates import detach_children, aggregate_tokens
+from src.backend.search_index import search_index
+from src.backend.node_table import NO_PARENT
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SearchWorker(QThread):
+    """Runs an explorer filter query against the scan's search index off the GUI thread."""
+    results_ready = pyqtSignal(int, object, object, object)  # generation, root, visible ids, ids to expand
+
+    def __init__(self, root, text, generation, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.text = text
+        self.generation = generation
+
+    def run(self):
+        try:
+            visible, expand = search_index(self.root).filter(self.text)
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            return
+        self.results_ready.emit(self.generation, self.root, visible, expand)
+
+
+class FileTreeWidget(QTreeView):
+    filePreviewRequested = pyqtSignal(dict)
+
+    SEARCH_DEBOUNCE_MS = 150
+    AUTO_EXPAND_LIMIT = 2000  # Broader results stay collapsed (expanding them all would stall the GUI)
+    SAVE_EXPANSION_MS = 2000
+    MAX_SAVED_EXPANDED = 1000
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.settings = QSettings("StructurePro", "Crawlsee")
+        self.icon_manager = IconManager()
+        
+        # Load Chevron Icons for Tree
+        chevron_right = resource_path("assets/chevron_right.png").replace("\\", "/")
+        chevron_down = resource_path("assets/chevron_down.png").replace("\\", "/")
+
+        # Lazy model over the scan tree: rows are created when a folder is expanded
+        self._model = FileTreeModel(self.icon_manager, self)
+        self.setModel(self._model)
+        self.setUniformRowHeights(True)
+        self._pre_search_expanded = None  # Expansion state to restore when the search is cleared
+
+        # Background search (debounced; older results are discarded)
+        self._search_text = ""
+        self._search_generation = 0
+        self._search_worker = None
+        self._search_restart_pending = False
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_debounce.timeout.connect(self._start_search)
+
+        # Expanded folders are saved per project a moment after they change
+        self._save_expansion_timer = QTimer(self)
+        self._save_expansion_timer.setSingleShot(True)
+        self._save_expansion_timer.setInterval(self.SAVE_EXPANSION_MS)
+        self._save_expansion_timer.timeout.connect(self.save_expansion_state)
+
+        # Icons of each scan are pre-rendered off the GUI thread (one pass at a time)
+        self._icon_thread = None
+        self._icon_warm_pending = None
+
+        # Token heat map column (name | tokens + share)
+        self.sort_by_tokens = self.settings.value("tree/sort_by_tokens", False, type=bool)
+        self.header().setStretchLastSection(False)
+        self.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.header().setSectionResizeMode(TOKEN_COLUMN, QHeaderView.ResizeToContents)
+
+        # New VS Code properties
+        self.setHeaderHidden(True)
+        self.setIndentation(16)
+        self.setRootIsDecorated(True)
+        self.setAnimated(True)
+
+        # Restore column widths
+        for i in range(self._model.columnCount()):
+            width = self.settings.value(f"tree/column_width_{i}")
+            if width:
+                self.setColumnWidth(i, int(width))
+                
+        # Save upon resize
+        self.header().sectionResized.connect(self.save_column_widths)
+        
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        
+        # VS Code Stylesheet
+        self.setStyleSheet(f"""
+        QTreeView {{
+            background-color: transparent;
+            border: none;
+            padding: 4px;
+            outline: 0;
+        }}
+
+        /* Row Styling */
+        QTreeView::item {{
+            height: 26px;
+            padding-left: 6px;
+            color: #111827;
+            border: none;
+        }}
+
+        QTreeView::item:hover {{
+            background-color: #E5E7EB;
+            border-radius: 4px;
+        }}
+
+        QTreeView::item:selected {{
+            background-color: #DCEAFE;
+            color: #1D4ED8;
+            border-radius: 4px;
+        }}
+
+        QTreeView::item:selected:!active {{
+            background-color: #E5E7EB;
+            color: #111827;
+        }}
+
+        /* Branch Icons */
+        QTreeView::branch:has-children:!has-siblings:closed,
+        QTreeView::branch:closed:has-children:has-siblings {{ image: url({chevron_right}); }}
+
+        QTreeView::branch:open:has-children:!has-siblings,
+        QTreeView::branch:open:has-children:has-siblings {{ image: url({chevron_down}); }}
+
+        QTreeView::branch {{ background: transparent; }}
+        
+        /* Auto-Hide Scrollbars Logic (Vertical Only) */
+        QScrollBar:vertical {{
+            border: none;
+            background: transparent;
+            width: 6px;
+            margin: 0px;
+        }}
+        QScrollBar::handle:vertical {{
+            background: transparent; /* Hidden by default */
+            min-height: 20px;
+            border-radius: 3px;
+        }}
+        /* Show when parent is hovered (via dynamic property) */
+        QScrollBar[active="true"]::handle:vertical {{
+            background: #007AFF;
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background: #0069D9;
+        }}
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
+        """)
+
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._open_context_menu)
+        
+        # Connect item click for preview
+        self.clicked.connect(self._on_item_clicked)
+        
+        # Connect expansion for dynamic icons
+        self.expanded.connect(self._on_item_expanded)
+        self.collapsed.connect(self._on_item_collapsed)
+        
+        # Mouse tracking for auto-hide scrollbars
+        self.setMouseTracking(True)
+
+    def enterEvent(self, event):
+        """Show scrollbars on hover."""
+        self.verticalScrollBar().setProperty("active", "true")
+        self.horizontalScrollBar().setProperty("active", "true")
+        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
+        self.verticalScrollBar().style().polish(self.verticalScrollBar())
+        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
+        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        """Hide scrollbars when mouse leaves."""
+        self.verticalScrollBar().setProperty("active", "false")
+        self.horizontalScrollBar().setProperty("active", "false")
+        self.verticalScrollBar().style().unpolish(self.verticalScrollBar())
+        self.verticalScrollBar().style().polish(self.verticalScrollBar())
+        self.horizontalScrollBar().style().unpolish(self.horizontalScrollBar())
+        self.horizontalScrollBar().style().polish(self.horizontalScrollBar())
+        super().leaveEvent(event)
+
+    def _on_item_expanded(self, index):
+        self._model.set_open(index, True)
+        self._save_expansion_timer.start()
+
+    def _on_item_collapsed(self, index):
+        self._model.set_open(index, False)
+        self._save_expansion_timer.start()
+
+    def _item_payload(self, node_id):
+        """Node data handed to the context menu (built for one row, on demand)."""
+        table = self._model.table
+        node_data = dict(table.node(node_id))
+        node_data["abs_path"] = table.abs_path(node_id)
+        node_data["rel_path"] = table.rel_path(node_id)
+        return node_data
+    
+    def _on_item_clicked(self, index):
+        """Handle item click to show preview in canvas."""
+        node = self._model.node_at(index)
+        if not node:
+            return
+        
+        # Only preview files, not folders
+        if node.get('type') == 'file':
+            self.filePreviewRequested.emit(node)
+
+    def _open_context_menu(self, pos):
+        node_id = self._model.id_at(self.indexAt(pos))
+        if node_id is None:
+            return
+
+        # Ensure we have access to ignore_manager, via window()
+        ignore_mgr = self.window().ignore_manager if hasattr(self.window(), 'ignore_manager') else None
+        
+        TreeContextMenu(
+            parent=self,
+            tree=self,
+            ignore_manager=ignore_mgr
+        ).open(self.viewport().mapToGlobal(pos), self._item_payload(node_id))
+
+    def copy_tree_snippet(self, folder_data):
+        from src.backend.exporter import generate_tree_text
+        snippet = generate_tree_text(folder_data)
+        QApplication.clipboard().setText(snippet)
+
+    # --- Proxies for Menu Actions ---
+    
+    def rescan_folder(self, abs_path):
+        """Legacy rescan - triggers full reload. Use only when necessary."""
+        if hasattr(self.window(), 'reload_scan'):
+             self.window().reload_scan() 
+        else:
+             print("Rescan function not found on main window")
+
+    def fast_remove_item(self, item_name: str):
+        """
+        FAST client-side removal without re-scanning.
+        Removes matching items from tree UI AND from current_data in memory.
+        """
+        self.fast_remove_items([item_name])
+
+    def fast_remove_matching(self, patterns):
+        """Apply new ignore patterns to the loaded scan in one pass (no re-scan)."""
+        main_window = self.window()
+        data = getattr(main_window, 'current_data', None)
+        if data:
+            self.fast_remove_items(search_index(data).names_matching(patterns))
+
+    def fast_remove_items(self, names):
+        """
+        Remove every node called one of names, found through the scan's name
+        index: only the matching nodes and their ancestors' token counts are
+        touched, in one batched pass however many names are given.
+        """
+        main_window = self.window()
+        data = getattr(main_window, 'current_data', None)
+        if not data or not names:
+            return
+
+        # 1. Remove from in-memory data (so export is correct)
+        index = search_index(data)
+        removed = self._detach_nodes(index.table, index.ids_named(names))
+        index.forget(removed)  # Explorer search no longer finds them
+
+        # 2. Remove from tree UI (instant visual feedback)
+        self._model.remove_ids(removed)
+        self.refresh_token_column()
+
+        # 3. Update token estimator (reflects the reduced content)
+        if removed and hasattr(main_window, 'token_btn'):
+            main_window.token_btn.update_estimate()
+
+    def _detach_nodes(self, table, node_ids):
+        """Detach nodes (ancestors first) from the scan tree, grouped by parent. Returns the ids detached."""
+        removed = set()
+        by_parent = {}
+        for node_id in node_ids:
+            chain = []
+            parent = table.parent_id(node_id)
+            while parent != NO_PARENT and parent not in removed:
+                chain.append(parent)
+                parent = table.parent_id(parent)
+            if parent != NO_PARENT or not table.is_attached(node_id):
+                continue  # Inside a folder removed in this pass, or detached earlier
+            removed.add(node_id)
+            by_parent.setdefault(chain[0], (chain, []))[1].append(node_id)
+
+        for chain, child_ids in by_parent.values():
+            ancestors = [table.node(i) for i in reversed(chain)]
+            detach_children(ancestors, [table.node(i) for i in child_ids])
+        return removed
+
+    def export_subfolder(self, abs_path, tree_only=False):
+        if hasattr(self.window(), 'export_folder'):
+            self.window().export_folder(abs_path, tree_only)
+        else:
+            print("Export function not found on main window")
+
+    def open_file_external(self, path):
+         if hasattr(self.window(), 'open_file_external'):
+             self.window().open_file_external(path)
+         else:
+             print("External open function not found on main window")
+
+    # preview_file_internal proxy removed
+
+    def reveal_in_explorer(self, path):
+        if hasattr(self.window(), 'reveal_in_explorer'):
+            self.window().reveal_in_explorer(path)
+        else:
+            print("Reveal function not found on main window")
+
+    def save_column_widths(self, *args):
+        for i in range(self._model.columnCount()):
+            self.settings.setValue(
+                f"tree/column_width_{i}",
+                self.columnWidth(i)
+            )
+
+    def clear(self):
+        self.save_expansion_state()
+        self._pre_search_expanded = None
+        self._model.set_root(None)
+
+    def populate(self, data):
+        """
+        Populate the tree with dictionary data from scanner.
+        Only the root row is created here; folders fill in as they are expanded.
+        """
+        # Token cells are read from the cached aggregates; the estimator computes
+        # them in the background and calls refresh_token_column() when done.
+        # Sorting by tokens needs them now.
+        if data:
+            self._warm_icons(data)
+        if data and self.sort_by_tokens:
+            aggregate_tokens(data)
+        self._model.sort_by_tokens = self.sort_by_tokens
+
+        # A rescan of the shown folder patches the rows in place (no flicker; expansion,
+        # selection and scroll position are kept)
+        previous = self._model.root_node()
+        if previous is not None and data and previous.get('abs_path') == data.get('abs_path'):
+            self._model.replace_root(data)
+            return
+
+        # Another project: save this one's expansion state, then load the new one's
+        self.save_expansion_state()
+        self._pre_search_expanded = None
+        self._model.set_root(data)
+        if not data:
+            return
+
+        # Restore expansion state (a project seen for the first time opens the root)
+        self.restore_expanded_paths(SettingsManager().get_expanded_folders(data.get('abs_path')))
+        if not self._model.open_ids():
+            self.expand(self._model.index(0, 0))
+
+    # --- Icons ---
+
+    def _warm_icons(self, data):
+        """Pre-render the scan's icons in the background at this view's icon size and pixel ratio."""
+        size = self.iconSize().width() if self.iconSize().isValid() else self.style().pixelMetric(QStyle.PM_SmallIconSize, None, self)
+        self.icon_manager.set_raster_size(size, self.devicePixelRatioF())
+        if self._icon_thread is not None and self._icon_thread.isRunning():
+            self._icon_warm_pending = data  # Rerun for the newest scan when this pass is done
+            return
+        self._icon_thread = self.icon_manager.warm_icons(data, self)
+        if self._icon_thread is None:
+            return
+        self._icon_thread.icons_ready.connect(self._on_icons_rendered)
+        self._icon_thread.finished.connect(self._on_icon_thread_finished)
+        self._icon_thread.start()
+
+    def _on_icons_rendered(self, key, images):
+        if self.icon_manager.add_rendered_icons(key, images):
+            self.viewport().update()
+
+    def _on_icon_thread_finished(self):
+        data, self._icon_warm_pending = self._icon_warm_pending, None
+        if data is not None:
+            self._warm_icons(data)
+
+    def shutdown(self):
+        """Wait for the icon pass (before the window closes)."""
+        self._icon_warm_pending = None
+        if self._icon_thread is not None:
+            self._icon_thread.wait()
+
+    # --- Token Heat Map ---
+
+    def refresh_token_column(self, *args):
+        """Re-read token counts after they were computed or changed in place (e.g. fast removal)."""
+        self._model.refresh_tokens()
+        self.viewport().update()  # Cells are read from the nodes when painted
+
+    def set_sort_by_tokens(self, enabled: bool):
+        """Toggle 'heaviest first' ordering (persisted) and rebuild the tree."""
+        self.sort_by_tokens = enabled
+        self.settings.setValue("tree/sort_by_tokens", enabled)
+        main_window = self.window()
+        if getattr(main_window, 'current_data', None):
+            self.populate(main_window.current_data)
+
+    def filter_items(self, text):
+        """
+        Filter tree items based on text (debounced).
+        The query runs against the scan's search index on a worker thread;
+        only the rows whose visibility changed are then updated.
+        """
+        self._search_text = text.lower()
+        self._search_generation += 1
+        if not self._search_text:
+            self._search_debounce.stop()
+            self._clear_filter()
+        else:
+            self._search_debounce.start()
+
+    def _start_search(self):
+        root = self._model.root_node()
+        if root is None or not self._search_text:
+            return
+        if self._search_worker is not None and self._search_worker.isRunning():
+            # Run once more when the current query is done (with the newest text)
+            self._search_restart_pending = True
+            return
+        self._search_worker = SearchWorker(root, self._search_text, self._search_generation, self)
+        self._search_worker.results_ready.connect(self._on_search_results)
+        self._search_worker.finished.connect(self._on_search_finished)
+        self._search_worker.start()
+
+    def _on_search_finished(self):
+        if self._search_restart_pending:
+            self._search_restart_pending = False
+            self._start_search()
+
+    def _on_search_results(self, generation, root, visible, expand):
+        if generation != self._search_generation or root is not self._model.root_node():
+            return  # Superseded by newer text or a new scan
+        if self._pre_search_expanded is None:
+            self._pre_search_expanded = self.get_expanded_paths()
+
+        self.setUpdatesEnabled(False)
+        self._model.apply_filter(visible)
+
+        # Expand folders with matches to reveal them (skipped for very broad queries)
+        if len(visible) <= self.AUTO_EXPAND_LIMIT:
+            stack = self._model.top_ids()
+            while stack:
+                node_id = stack.pop()
+                if node_id in expand:
+                    stack.extend(self._model.fetch(node_id))
+                    self.expand(self._model.index_of(node_id))
+        self.setUpdatesEnabled(True)
+
+    def _clear_filter(self):
+        """Show everything again and go back to the expansion from before the search."""
+        if self._pre_search_expanded is None or self._model.table is None:
+            return
+        before = self._pre_search_expanded
+        self._pre_search_expanded = None
+
+        self.setUpdatesEnabled(False)
+        self._model.apply_filter(None)
+        table = self._model.table
+        for node_id in self._model.open_ids():
+            if table.rel_path(node_id) not in before:
+                self.collapse(self._model.index_of(node_id))
+        self.restore_expanded_paths(before)
+        self.setUpdatesEnabled(True)
+
+    def _ancestor_ids(self, node_id):
+        """Ids of the folders above a node, root first."""
+        table = self._model.table
+        chain = []
+        parent = table.parent_id(node_id)
+        while parent != NO_PARENT:
+            chain.append(parent)
+            parent = table.parent_id(parent)
+        chain.reverse()
+        return chain
+
+    def reveal_node(self, node_id):
+        """Expand the folders above a node, then select it and scroll it into view."""
+        if self._model.table is None:
+            return
+        for folder_id in self._ancestor_ids(node_id):
+            self._model.fetch(folder_id)
+            self.expand(self._model.index_of(folder_id))
+
+        index = self._model.index_of(node_id)
+        if index.isValid():  # Hidden rows (filtered out by a search) stay hidden
+            self.setCurrentIndex(index)
+            self.scrollTo(index)
+
+    def get_expanded_paths(self):
+        """Return a set of relative paths for currently expanded items."""
+        table = self._model.table
+        if table is None:
+            return set()
+        return {table.rel_path(node_id) for node_id in self._model.open_ids()}
+
+    def restore_expanded_paths(self, expanded_paths):
+        """
+        Restore expansion state based on a set of relative paths.
+        Each path is looked up directly, so the cost follows the number of
+        expanded folders, not the size of the tree.
+        """
+        table = self._model.table
+        if not expanded_paths or table is None:
+            return
+
+        self.setUpdatesEnabled(False)
+        for rel_path in sorted(expanded_paths, key=len):  # Parents before their subfolders
+            node_id = table.id_of(rel_path)
+            if node_id is None or table.node(node_id).get('type') != 'folder':
+                continue
+            # Folders on the way get rows too (they may stay collapsed)
+            for folder_id in self._ancestor_ids(node_id):
+                self._model.fetch(folder_id)
+            self.expand(self._model.index_of(node_id))
+        self.setUpdatesEnabled(True)
+
+    def _expansion_state(self):
+        """Expanded paths to keep: the ones from before a search while one is active."""
+        if self._pre_search_expanded is not None:
+            return self._pre_search_expanded
+        return self.get_expanded_paths()
+
+    def save_expansion_state(self):
+        """Persist the expanded folders of the shown project (per project, across sessions)."""
+        self._save_expansion_timer.stop()
+        root = self._model.root_node()
+        if not root or not root.get('abs_path'):
+            return
+        paths = sorted(self._expansion_state(), key=len)[:self.MAX_SAVED_EXPANDED]
+        SettingsManager().set_expanded_folders(root['abs_path'], sorted(paths))
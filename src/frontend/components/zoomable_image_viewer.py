@@ -1,347 +1,510 @@
-"""
-Zoomable Image Viewer Widget - Like Microsoft Photos app.
-Supports Ctrl + Mouse wheel zoom and proper centering.
-"""
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QScrollArea, QSizePolicy, QApplication
-from PyQt5.QtGui import QPixmap, QPainter, QWheelEvent, QTransform
-from PyQt5.QtCore import Qt, QSize, QPoint
-
-
-class ImageLabel(QLabel):
-    """Custom label that can display images at various zoom levels."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAlignment(Qt.AlignCenter)
-        self.setMinimumSize(1, 1)
-        self._pixmap = None
-        self._scale = 1.0
-    
-    def setImage(self, pixmap, scale=1.0):
-        """Set the image with a specific scale."""
-        self._pixmap = pixmap
-        self._scale = scale
-        self._updateDisplay()
-    
-    def setScale(self, scale):
-        """Update the scale and redraw."""
-        self._scale = scale
-        self._updateDisplay()
-    
-    def _updateDisplay(self):
-        """Update the displayed pixmap based on current scale."""
-        if self._pixmap is None or self._pixmap.isNull():
-            self.clear()
-            return
-        
-        # Calculate scaled size
-        new_width = int(self._pixmap.width() * self._scale)
-        new_height = int(self._pixmap.height() * self._scale)
-        
-        if new_width <= 0 or new_height <= 0:
-            return
-        
-        # Scale the pixmap
-        scaled = self._pixmap.scaled(
-            new_width, new_height,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        
-        super().setPixmap(scaled)
-        self.setFixedSize(scaled.size())
-    
-    def getScale(self):
-        return self._scale
-    
-    def getOriginalPixmap(self):
-        return self._pixmap
-
-
-class ZoomableImageViewer(QScrollArea):
-    """
-    A scrollable, zoomable image viewer widget.
-    Supports Ctrl + Mouse wheel for zoom in/out.
-    Image is always centered when smaller than viewport.
-    """
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        
-        # Zoom state
-        self.min_scale = 0.1
-        self.max_scale = 5.0
-        self.current_scale = 1.0
-        self.base_scale = 1.0  # The "fit to view" scale, shown as 100% to user
-        
-        # Setup scroll area
-        self.setWidgetResizable(False)
-        self.setAlignment(Qt.AlignCenter)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        self.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #F3F4F6;
-            }
-            
-            /* Light scrollbars */
-            QScrollBar:vertical {
-                background: #E5E7EB;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #9CA3AF;
-                min-height: 30px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #6B7280;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            
-            QScrollBar:horizontal {
-                background: #E5E7EB;
-                height: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #9CA3AF;
-                min-width: 30px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #6B7280;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: none;
-            }
-        """)
-        
-        # Container widget to center the image
-        self.container = QWidget()
-        self.container.setStyleSheet("background-color: transparent;")
-        
-        # Image label
-        self.image_label = ImageLabel()
-        self.image_label.setStyleSheet("background-color: transparent;")
-        
-        # Layout to center label in container
-        layout = QVBoxLayout(self.container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self.image_label, 0, Qt.AlignCenter)
-        
-        self.setWidget(self.container)
-        
-        # Zoom indicator label (bottom-right corner)
-        self.zoom_indicator = QLabel("100%", self)
-        self.zoom_indicator.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 0.6);
-                color: #FFFFFF;
-                font-size: 12px;
-                font-weight: 600;
-                font-family: 'Segoe UI', sans-serif;
-                padding: 4px 10px;
-                border-radius: 4px;
-            }
-        """)
-        self.zoom_indicator.setAlignment(Qt.AlignCenter)
-        self.zoom_indicator.hide()  # Hidden until image is loaded
-        
-        # Original pixmap
-        self.original_pixmap = None
-    
-    def _updateZoomIndicator(self):
-        """Update the zoom indicator text and position."""
-        # Calculate zoom percentage relative to base_scale (fit-to-view = 100%)
-        if self.base_scale > 0:
-            zoom_percent = int((self.current_scale / self.base_scale) * 100)
-        else:
-            zoom_percent = 100
-        
-        self.zoom_indicator.setText(f"{zoom_percent}%")
-        self.zoom_indicator.adjustSize()
-        
-        # Position in bottom-right corner with padding
-        margin = 12
-        x = self.width() - self.zoom_indicator.width() - margin
-        y = self.height() - self.zoom_indicator.height() - margin
-        self.zoom_indicator.move(x, y)
-        self.zoom_indicator.show()
-    
-    def set_image(self, pixmap):
-        """Set the image to display."""
-        if pixmap is None or pixmap.isNull():
-            self.original_pixmap = None
-            self.image_label.clear()
-            self.image_label.setText("Could not load image")
-            self.image_label.setStyleSheet("""
-                font-size: 14px;
-                color: #6B7280;
-                background-color: transparent;
-            """)
-            self.image_label.setFixedSize(200, 50)
-            self._updateContainerSize()
-            return
-        
-        self.original_pixmap = pixmap
-        
-        # Calculate initial scale to fit in view
-        self._fitToView()
-        
-        # Store this as the base scale (100% for user)
-        self.base_scale = self.current_scale
-        
-        # Apply the image
-        self.image_label.setImage(pixmap, self.current_scale)
-        self.image_label.setStyleSheet("background-color: transparent;")
-        
-        # Update container size
-        self._updateContainerSize()
-        
-        # Update zoom indicator
-        self._updateZoomIndicator()
-    
-    def _fitToView(self):
-        """Calculate scale to fit image in viewport."""
-        if not self.original_pixmap:
-            return
-        
-        # Get viewport size
-        viewport_size = self.viewport().size()
-        padding = 48
-        
-        available_width = max(100, viewport_size.width() - padding)
-        available_height = max(100, viewport_size.height() - padding)
-        
-        img_width = self.original_pixmap.width()
-        img_height = self.original_pixmap.height()
-        
-        if img_width == 0 or img_height == 0:
-            self.current_scale = 1.0
-            return
-        
-        # Calculate scale to fit
-        scale_x = available_width / img_width
-        scale_y = available_height / img_height
-        
-        # Use smaller scale to fit entirely, but don't upscale beyond 1.0
-        self.current_scale = min(scale_x, scale_y, 1.0)
-    
-    def _updateContainerSize(self):
-        """Update container size to allow proper scrolling and centering."""
-        if not self.original_pixmap:
-            self.container.setMinimumSize(self.viewport().size())
-            return
-        
-        # Get the scaled image size
-        scaled_width = int(self.original_pixmap.width() * self.current_scale)
-        scaled_height = int(self.original_pixmap.height() * self.current_scale)
-        
-        # Get viewport size
-        viewport_size = self.viewport().size()
-        
-        # Container should be at least viewport size (for centering small images)
-        # or image size (for scrolling large images)
-        container_width = max(scaled_width, viewport_size.width())
-        container_height = max(scaled_height, viewport_size.height())
-        
-        self.container.setFixedSize(container_width, container_height)
-    
-    def _applyZoom(self):
-        """Apply current zoom level."""
-        if not self.original_pixmap:
-            return
-        
-        # Get scroll position center before zoom
-        h_bar = self.horizontalScrollBar()
-        v_bar = self.verticalScrollBar()
-        
-        # Calculate center point ratio
-        h_ratio = 0.5
-        v_ratio = 0.5
-        if h_bar.maximum() > 0:
-            h_ratio = (h_bar.value() + self.viewport().width() / 2) / self.container.width()
-        if v_bar.maximum() > 0:
-            v_ratio = (v_bar.value() + self.viewport().height() / 2) / self.container.height()
-        
-        # Update image
-        self.image_label.setImage(self.original_pixmap, self.current_scale)
-        
-        # Update container size
-        self._updateContainerSize()
-        
-        # Update zoom indicator
-        self._updateZoomIndicator()
-        
-        # Restore scroll position based on ratio
-        QApplication.processEvents()  # Ensure layout is updated
-        
-        new_h = int(h_ratio * self.container.width() - self.viewport().width() / 2)
-        new_v = int(v_ratio * self.container.height() - self.viewport().height() / 2)
-        
-        h_bar.setValue(max(0, new_h))
-        v_bar.setValue(max(0, new_v))
-    
-    def wheelEvent(self, event: QWheelEvent):
-        """Handle mouse wheel for zoom (with Ctrl) or scroll."""
-        if event.modifiers() & Qt.ControlModifier:
-            # Zoom with Ctrl + wheel
-            delta = event.angleDelta().y()
-            
-            if delta > 0:
-                self.zoom_in()
-            else:
-                self.zoom_out()
-            
-            event.accept()
-        else:
-            # Normal scroll
-            super().wheelEvent(event)
-    
-    def zoom_in(self):
-        """Zoom in by 15%."""
-        new_scale = self.current_scale * 1.15
-        if new_scale <= self.max_scale:
-            self.current_scale = new_scale
-            self._applyZoom()
-    
-    def zoom_out(self):
-        """Zoom out by 15%."""
-        new_scale = self.current_scale / 1.15
-        if new_scale >= self.min_scale:
-            self.current_scale = new_scale
-            self._applyZoom()
-    
-    def zoom_fit(self):
-        """Fit image to view."""
-        self._fitToView()
-        self._applyZoom()
-    
-    def zoom_actual(self):
-        """Show image at 100% (actual size)."""
-        self.current_scale = 1.0
-        self._applyZoom()
-    
-    def resizeEvent(self, event):
-        """Handle resize to update container size and zoom indicator position."""
-        super().resizeEvent(event)
-        if self.original_pixmap:
-            self._updateContainerSize()
-            self._updateZoomIndicator()
-    
-    def get_zoom_percent(self):
-        """Get current zoom level as percentage."""
-        return int(self.current_scale * 100)
+"""
+Zoomable Image Viewer Widget - Like Microsoft Photos app.
+Supports Ctrl + Mouse wheel zoom and proper centering.
+"""
+import os
+import hashlib
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QScrollArea, QSizePolicy, QApplication
+from PyQt5.QtGui import QPixmap, QPainter, QWheelEvent, QTransform, QImage, QImageReader
+from PyQt5.QtCore import Qt, QSize, QPoint, QThread, pyqtSignal
+from src.config import get_config_dir
+from src.backend.utils import save_png
+
+# Images are first decoded at most this many pixels on their longer side
+PREVIEW_MAX_SIDE = 1280
+
+# Downscaled previews are cached in User_Data, keyed by path, mtime and size
+THUMBNAIL_DIR = "thumbnails"
+THUMBNAIL_CACHE_LIMIT = 200
+
+
+def read_image(path, max_side=None):
+    """
+    (QImage, full-resolution QSize) of an image file, decoded at most max_side
+    pixels on its longer side (formats like JPEG decode straight to that size).
+    Safe to call off the GUI thread.
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    if max_side and size.isValid() and max(size.width(), size.height()) > max_side:
+        reader.setScaledSize(size.scaled(max_side, max_side, Qt.KeepAspectRatio))
+    image = reader.read()
+    return image, size if size.isValid() else image.size()
+
+
+def _thumbnail_path(path):
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{PREVIEW_MAX_SIDE}"
+    return os.path.join(get_config_dir(), THUMBNAIL_DIR, hashlib.md5(key.encode('utf-8')).hexdigest() + ".png")
+
+
+def _prune_thumbnails(folder):
+    """Keep the THUMBNAIL_CACHE_LIMIT most recently written previews."""
+    try:
+        paths = [os.path.join(folder, name) for name in os.listdir(folder) if name.endswith('.png')]
+        if len(paths) <= THUMBNAIL_CACHE_LIMIT:
+            return
+        paths.sort(key=os.path.getmtime)
+        for old in paths[:len(paths) - THUMBNAIL_CACHE_LIMIT]:
+            os.remove(old)
+    except OSError:
+        pass
+
+
+def cached_preview(path):
+    """(QImage, full-resolution QSize) of the cached preview of an unchanged image file, or None."""
+    try:
+        thumbnail = _thumbnail_path(path)
+    except OSError:
+        return None
+    if not os.path.exists(thumbnail):
+        return None
+    image = QImage(thumbnail)
+    width, _, height = image.text("full_size").partition("x")
+    if image.isNull() or not (width.isdigit() and height.isdigit()):
+        return None
+    return image, QSize(int(width), int(height))
+
+
+def cache_preview(path, image, size):
+    """Save a downscaled preview of an image file (full-size decodes are not worth caching)."""
+    if image.isNull() or image.size() == size:
+        return
+    try:
+        thumbnail = _thumbnail_path(path)
+    except OSError as e:
+        print(f"Error caching image preview: {e}")
+        return
+    image = QImage(image)  # Tagged as a copy: the viewer already has the one it was sent
+    image.setText("full_size", f"{size.width()}x{size.height()}")
+    if save_png(image, thumbnail, 80):  # Light compression: several times faster to write
+        _prune_thumbnails(os.path.dirname(thumbnail))
+
+
+class ImageLoadThread(QThread):
+    """Decodes one image off the GUI thread (the preview, or the full resolution)."""
+    image_ready = pyqtSignal(int, bool, object, object)  # generation, full resolution, QImage, full QSize
+
+    # Not parented to a viewer: a closed tab must not wait for (or kill) its decode
+    _running = set()
+
+    def __init__(self, path, generation, full):
+        super().__init__()
+        self.path = path
+        self.generation = generation
+        self.full = full
+        ImageLoadThread._running.add(self)
+        self.finished.connect(lambda: ImageLoadThread._running.discard(self))
+
+    def run(self):
+        cached = None
+        try:
+            if self.full:
+                image, size = read_image(self.path)
+            else:
+                cached = cached_preview(self.path)
+                image, size = cached or read_image(self.path, PREVIEW_MAX_SIDE)
+        except Exception as e:
+            print(f"Error loading image {self.path}: {e}")
+            image, size = QImage(), QSize()
+        self.image_ready.emit(self.generation, self.full, image, size)
+        if not self.full and cached is None:
+            cache_preview(self.path, image, size)  # After the viewer has it
+
+    @classmethod
+    def wait_all(cls):
+        """Wait for running decodes (before the application quits)."""
+        for thread in list(cls._running):
+            thread.wait()
+
+
+class ImageLabel(QLabel):
+    """Custom label that can display images at various zoom levels."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.setMinimumSize(1, 1)
+        self._pixmap = None
+        self._scale = 1.0
+    
+    def setImage(self, pixmap, scale=1.0):
+        """Set the image with a specific scale."""
+        self._pixmap = pixmap
+        self._scale = scale
+        self._updateDisplay()
+    
+    def setScale(self, scale):
+        """Update the scale and redraw."""
+        self._scale = scale
+        self._updateDisplay()
+    
+    def _updateDisplay(self):
+        """Update the displayed pixmap based on current scale."""
+        if self._pixmap is None or self._pixmap.isNull():
+            self.clear()
+            return
+        
+        # Calculate scaled size
+        new_width = int(self._pixmap.width() * self._scale)
+        new_height = int(self._pixmap.height() * self._scale)
+        
+        if new_width <= 0 or new_height <= 0:
+            return
+        
+        # Scale the pixmap
+        scaled = self._pixmap.scaled(
+            new_width, new_height,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        
+        super().setPixmap(scaled)
+        self.setFixedSize(scaled.size())
+    
+    def getScale(self):
+        return self._scale
+    
+    def getOriginalPixmap(self):
+        return self._pixmap
+
+
+class ZoomableImageViewer(QScrollArea):
+    """
+    A scrollable, zoomable image viewer widget.
+    Supports Ctrl + Mouse wheel for zoom in/out.
+    Image is always centered when smaller than viewport.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # Zoom state
+        self.min_scale = 0.1
+        self.max_scale = 5.0
+        self.current_scale = 1.0
+        self.base_scale = 1.0  # The "fit to view" scale, shown as 100% to user
+        
+        # Setup scroll area
+        self.setWidgetResizable(False)
+        self.setAlignment(Qt.AlignCenter)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        
+        self.setStyleSheet("""
+            QScrollArea {
+                border: none;
+                background-color: #F3F4F6;
+            }
+            
+            /* Light scrollbars */
+            QScrollBar:vertical {
+                background: #E5E7EB;
+                width: 10px;
+                border-radius: 5px;
+            }
+            QScrollBar::handle:vertical {
+                background: #9CA3AF;
+                min-height: 30px;
+                border-radius: 5px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background: #6B7280;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+                background: none;
+            }
+            
+            QScrollBar:horizontal {
+                background: #E5E7EB;
+                height: 10px;
+                border-radius: 5px;
+            }
+            QScrollBar::handle:horizontal {
+                background: #9CA3AF;
+                min-width: 30px;
+                border-radius: 5px;
+            }
+            QScrollBar::handle:horizontal:hover {
+                background: #6B7280;
+            }
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+                width: 0px;
+            }
+            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+                background: none;
+            }
+        """)
+        
+        # Container widget to center the image
+        self.container = QWidget()
+        self.container.setStyleSheet("background-color: transparent;")
+        
+        # Image label
+        self.image_label = ImageLabel()
+        self.image_label.setStyleSheet("background-color: transparent;")
+        
+        # Layout to center label in container
+        layout = QVBoxLayout(self.container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.image_label, 0, Qt.AlignCenter)
+        
+        self.setWidget(self.container)
+        
+        # Zoom indicator label (bottom-right corner)
+        self.zoom_indicator = QLabel("100%", self)
+        self.zoom_indicator.setStyleSheet("""
+            QLabel {
+                background-color: rgba(0, 0, 0, 0.6);
+                color: #FFFFFF;
+                font-size: 12px;
+                font-weight: 600;
+                font-family: 'Segoe UI', sans-serif;
+                padding: 4px 10px;
+                border-radius: 4px;
+            }
+        """)
+        self.zoom_indicator.setAlignment(Qt.AlignCenter)
+        self.zoom_indicator.hide()  # Hidden until image is loaded
+        
+        # Displayed pixmap (possibly a downscaled preview) and the image's full size
+        self.original_pixmap = None
+        self.image_size = QSize()
+
+        # Background decoding (see load_image)
+        self._path = None
+        self._generation = 0
+        self._full_requested = False
+    
+    def _updateZoomIndicator(self):
+        """Update the zoom indicator text and position."""
+        # Calculate zoom percentage relative to base_scale (fit-to-view = 100%)
+        if self.base_scale > 0:
+            zoom_percent = int((self.current_scale / self.base_scale) * 100)
+        else:
+            zoom_percent = 100
+        
+        self.zoom_indicator.setText(f"{zoom_percent}%")
+        self.zoom_indicator.adjustSize()
+        
+        # Position in bottom-right corner with padding
+        margin = 12
+        x = self.width() - self.zoom_indicator.width() - margin
+        y = self.height() - self.zoom_indicator.height() - margin
+        self.zoom_indicator.move(x, y)
+        self.zoom_indicator.show()
+    
+    def load_image(self, path):
+        """
+        Show an image file, decoded off the GUI thread: first a preview at most
+        PREVIEW_MAX_SIDE pixels across (from the thumbnail cache when possible),
+        then full resolution once the zoom needs more detail than that.
+        """
+        self._path = path
+        self._generation += 1
+        self._full_requested = False
+        self._start_load(full=False)
+
+    def _start_load(self, full):
+        thread = ImageLoadThread(self._path, self._generation, full)
+        thread.image_ready.connect(self._on_image_ready)
+        thread.start()
+
+    def _on_image_ready(self, generation, full, image, size):
+        if generation != self._generation:
+            return  # The file was reloaded meanwhile
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else None
+        if full and pixmap is not None and self.original_pixmap is not None:
+            # Same image, more pixels: keep the zoom and scroll position
+            self.original_pixmap = pixmap
+            self._applyZoom()
+            return
+        self.set_image(pixmap, size)
+        self._load_full_if_needed()
+
+    def _load_full_if_needed(self):
+        """Decode the full resolution once the zoom shows the preview beyond its own pixels."""
+        if self._full_requested or not self._path or not self.original_pixmap or not self.image_size.width():
+            return
+        if self.current_scale > self.original_pixmap.width() / self.image_size.width():
+            self._full_requested = True
+            self._start_load(full=True)
+
+    def set_image(self, pixmap, image_size=None):
+        """Set the image to display (image_size: its full size, when pixmap is a downscaled preview)."""
+        if pixmap is None or pixmap.isNull():
+            self.original_pixmap = None
+            self.image_size = QSize()
+            self.image_label.clear()
+            self.image_label.setText("Could not load image")
+            self.image_label.setStyleSheet("""
+                font-size: 14px;
+                color: #6B7280;
+                background-color: transparent;
+            """)
+            self.image_label.setFixedSize(200, 50)
+            self._updateContainerSize()
+            return
+        
+        self.original_pixmap = pixmap
+        self.image_size = image_size if image_size is not None and image_size.isValid() else pixmap.size()
+        
+        # Calculate initial scale to fit in view
+        self._fitToView()
+        
+        # Store this as the base scale (100% for user)
+        self.base_scale = self.current_scale
+        
+        # Apply the image
+        self.image_label.setImage(pixmap, self._pixmap_scale())
+        self.image_label.setStyleSheet("background-color: transparent;")
+        
+        # Update container size
+        self._updateContainerSize()
+        
+        # Update zoom indicator
+        self._updateZoomIndicator()
+    
+    def _fitToView(self):
+        """Calculate scale to fit image in viewport."""
+        if not self.original_pixmap:
+            return
+        
+        # Get viewport size
+        viewport_size = self.viewport().size()
+        padding = 48
+        
+        available_width = max(100, viewport_size.width() - padding)
+        available_height = max(100, viewport_size.height() - padding)
+        
+        img_width = self.image_size.width()
+        img_height = self.image_size.height()
+        
+        if img_width == 0 or img_height == 0:
+            self.current_scale = 1.0
+            return
+        
+        # Calculate scale to fit
+        scale_x = available_width / img_width
+        scale_y = available_height / img_height
+        
+        # Use smaller scale to fit entirely, but don't upscale beyond 1.0
+        self.current_scale = min(scale_x, scale_y, 1.0)
+    
+    def _updateContainerSize(self):
+        """Update container size to allow proper scrolling and centering."""
+        if not self.original_pixmap:
+            self.container.setMinimumSize(self.viewport().size())
+            return
+        
+        # Get the scaled image size
+        scaled_width = int(self.image_size.width() * self.current_scale)
+        scaled_height = int(self.image_size.height() * self.current_scale)
+        
+        # Get viewport size
+        viewport_size = self.viewport().size()
+        
+        # Container should be at least viewport size (for centering small images)
+        # or image size (for scrolling large images)
+        container_width = max(scaled_width, viewport_size.width())
+        container_height = max(scaled_height, viewport_size.height())
+        
+        self.container.setFixedSize(container_width, container_height)
+    
+    def _applyZoom(self):
+        """Apply current zoom level."""
+        if not self.original_pixmap:
+            return
+        
+        # Get scroll position center before zoom
+        h_bar = self.horizontalScrollBar()
+        v_bar = self.verticalScrollBar()
+        
+        # Calculate center point ratio
+        h_ratio = 0.5
+        v_ratio = 0.5
+        if h_bar.maximum() > 0:
+            h_ratio = (h_bar.value() + self.viewport().width() / 2) / self.container.width()
+        if v_bar.maximum() > 0:
+            v_ratio = (v_bar.value() + self.viewport().height() / 2) / self.container.height()
+        
+        # Update image
+        self.image_label.setImage(self.original_pixmap, self._pixmap_scale())
+        
+        # Update container size
+        self._updateContainerSize()
+        
+        # Update zoom indicator
+        self._updateZoomIndicator()
+        
+        # Restore scroll position based on ratio
+        QApplication.processEvents()  # Ensure layout is updated
+        
+        new_h = int(h_ratio * self.container.width() - self.viewport().width() / 2)
+        new_v = int(v_ratio * self.container.height() - self.viewport().height() / 2)
+        
+        h_bar.setValue(max(0, new_h))
+        v_bar.setValue(max(0, new_v))
+
+        self._load_full_if_needed()
+
+    def _pixmap_scale(self):
+        """current_scale (relative to the full image) applied to the displayed pixmap."""
+        if not self.original_pixmap.width():
+            return self.current_scale
+        return self.current_scale * self.image_size.width() / self.original_pixmap.width()
+    
+    def wheelEvent(self, event: QWheelEvent):
+        """Handle mouse wheel for zoom (with Ctrl) or scroll."""
+        if event.modifiers() & Qt.ControlModifier:
+            # Zoom with Ctrl + wheel
+            delta = event.angleDelta().y()
+            
+            if delta > 0:
+                self.zoom_in()
+            else:
+                self.zoom_out()
+            
+            event.accept()
+        else:
+            # Normal scroll
+            super().wheelEvent(event)
+    
+    def zoom_in(self):
+        """Zoom in by 15%."""
+        new_scale = self.current_scale * 1.15
+        if new_scale <= self.max_scale:
+            self.current_scale = new_scale
+            self._applyZoom()
+    
+    def zoom_out(self):
+        """Zoom out by 15%."""
+        new_scale = self.current_scale / 1.15
+        if new_scale >= self.min_scale:
+            self.current_scale = new_scale
+            self._applyZoom()
+    
+    def zoom_fit(self):
+        """Fit image to view."""
+        self._fitToView()
+        self._applyZoom()
+    
+    def zoom_actual(self):
+        """Show image at 100% (actual size)."""
+        self.current_scale = 1.0
+        self._applyZoom()
+    
+    def resizeEvent(self, event):
+        """Handle resize to update container size and zoom indicator position."""
+        super().resizeEvent(event)
+        if self.original_pixmap:
+            self._updateContainerSize()
+            self._updateZoomIndicator()
+    
+    def get_zoom_percent(self):
+        """Get current zoom level as percentage."""
+        return int(self.current_scale * 100)
@@ -1,1757 +1,1980 @@
-from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QStackedWidget, 
-    QLabel, QPushButton, QFileDialog, QMessageBox, QProgressBar, QCheckBox, QSizePolicy,
-    QLineEdit, QAction, QMenu, QApplication, QFrame, QSplitter, QDialog
-)
-from src.frontend.components.toggle_switch import ToggleSwitch
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect, QSize, QTimer
-# QSettings removed from imports as we use custom manager now
-from PyQt5.QtGui import QIcon, QPixmap
-
-from src.frontend.styles.theme import STYLESHEET, COLOR_PRIMARY
-from src.frontend.components.drop_zone import DropZone
-from src.frontend.components.tree_view import FileTreeWidget
-from src.frontend.components.canvas_preview import CanvasPreview
-
-from src.backend.scanner import scan_directory_structure
-from src.backend.exporter import export_data
-from src.config import IGNORED_PATTERNS
-from src.backend.managers.ignore_manager import IgnoreManager
-from src.frontend.components.advanced_ignore import AdvancedIgnoreWidget
-from src.backend.managers.recent_manager import load_recent, add_recent
-from src.frontend.components.recent_folders import RecentFoldersWidget
-from src.backend.managers.watcher_manager import WatcherManager
-from src.config import resource_path
-import os
-import subprocess
-import platform
-from src.backend.managers.settings_manager import SettingsManager
-
-class AddressBar(QLineEdit):
-    def __init__(self, text="", parent=None):
-        super().__init__(text, parent)
-        self._should_select_all = False
-        
-    def focusInEvent(self, event):
-        super().focusInEvent(event)
-        # Select all on tab focus
-        QTimer.singleShot(0, self.selectAll)
-
-    def mousePressEvent(self, event):
-        if not self.hasFocus():
-            self._should_select_all = True
-        super().mousePressEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        super().mouseReleaseEvent(event)
-        if self._should_select_all:
-            QTimer.singleShot(0, self.selectAll)
-            self._should_select_all = False
-
-    def contextMenuEvent(self, event):
-        from src.frontend.components.tree_context_menu.menu_base import ExplorerStyleMenu
-        menu = ExplorerStyleMenu(self)
-        
-        def add_action(name, shortcut, slot, icon_file=None):
-            from PyQt5.QtGui import QIcon
-            from src.config import resource_path
-            import os
-
-            icon = QIcon()
-            if icon_file:
-                p = resource_path(f"assets/{icon_file}")
-                if os.path.exists(p):
-                    icon = QIcon(p)
-            
-            action = menu.addAction(icon, name)
-            action.setShortcut(shortcut)
-            action.setShortcutVisibleInContextMenu(True)
-            action.triggered.connect(slot)
-
-        add_action("Cut", "Ctrl+X", self.cut, "cut.png")
-        add_action("Copy", "Ctrl+C", self.copy, "copy.png")
-        menu.addSeparator()
-        add_action("Select All", "Ctrl+A", self.selectAll)
-
-        menu.exec_(event.globalPos())
-
-class ScanThread(QThread):
-    scan_finished = pyqtSignal(dict)
-    progress_update = pyqtSignal(int, int) # current, total
-    
-    def __init__(self, path, ignore_manager=None):
-        super().__init__()
-        self.path = path
-        self.ignore_manager = ignore_manager
-        
-        # Pause Event (Set = Running, Clear = Paused)
-        from threading import Event
-        self.pause_event = Event()
-        self.pause_event.set() # Start running
-        
-        self.stop_event = Event()
-        self.stop_requested = False
-        
-    def run(self):
-        # 1. Pre-scan to get total files (for progress bar)
-        total_files = 0
-        try:
-           # Send initial status
-           self.progress_update.emit(0, 0)
-           
-           for root, dirs, files in os.walk(self.path):
-               if self.stop_event.is_set(): return
-               total_files += len(files)
-               # Optional: Emit "Calculating..." updates if really large
-        except Exception:
-            total_files = 100 
-            
-        if total_files == 0: total_files = 1
-        
-        # State for throttling
-        self._last_emit_percent = -1
-        self._last_emit_time = 0
-        import time
-        
-        # Define callback
-        def on_progress(count):
-            if self.stop_event.is_set(): return
-            
-            # Calculate percent
-            percent = int((count / total_files) * 100)
-            
-            # Throttle: Emit only if percent changes OR every 100ms
-            now = time.time()
-            if percent > self._last_emit_percent or (now - self._last_emit_time) > 0.1:
-                self.progress_update.emit(count, total_files)
-                self._last_emit_percent = percent
-                self._last_emit_time = now
-
-        # 2. Run Scan
-        result = scan_directory_structure(
-            self.path, 
-            self.ignore_manager, 
-            progress_callback=on_progress,
-            pause_event=self.pause_event,
-            stop_event=self.stop_event
-        )
-        self.scan_finished.emit(result)
-
-    def is_paused(self):
-        return not self.pause_event.is_set()
-
-    def pause(self):
-        self.pause_event.clear()
-
-    def resume(self):
-        self.pause_event.set()
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Crawlsee")
-        
-        # Window size presets (single source of truth)
-        self.HOME_WIDTH = 380
-        self.HOME_HEIGHT = 420
-        self.HOME_HEIGHT_ADV = 480
-        self.SIZE_RESULT = (940, 600) 
-
-        # Start in HOME size (Advanced enabled by default now)
-        self.setFixedSize(self.HOME_WIDTH, self.HOME_HEIGHT_ADV)
-        
-        # Load Settings Manager
-        self.settings = SettingsManager()
-        
-        # Pro-Desktop UI flags (Enable resize grips even if framed)
-        self.setWindowFlag(Qt.Window, True)
-        self.setMouseTracking(True)
-        
-        # Set App Icon
-        icon_path = resource_path("assets/app_icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        
-        # Apply Theme
-        self.setStyleSheet(STYLESHEET)
-        
-        # State Tracking
-        self.home_advanced_enabled = False
-        self.resize_anim = None
-        
-        # Central Widget & Stack
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        self.stack = QStackedWidget()
-        
-        # layouts
-        self.main_layout = QVBoxLayout(self.central_widget)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.addWidget(self.stack)
-        
-        # Initialize Views
-        # Initialize Views
-        self.init_home_view()
-        self.init_result_view()
-        
-        # Start Home
-        self.stack.setCurrentWidget(self.home_page)
-        
-        # Restore UI Intent (Geometry / Layout)
-        self.restore_ui_intent()
-        
-        self.current_data = None
-        self.scan_thread = None
-        self.selected_folder_path = None # Track selected folder
-        
-        # Watcher & Auto-Reload Throttling
-        self.watcher = WatcherManager()
-        self.watcher.file_changed.connect(self.on_file_changed)
-        self.watcher.directory_changed.connect(self.on_directory_changed)
-        
-        self.reload_cooldown_timer = QTimer()
-        self.reload_cooldown_timer.setSingleShot(True)
-        self.reload_cooldown_timer.setInterval(2000) # 2s cooldown for auto-reloads
-        self.reload_cooldown_timer.timeout.connect(self.quiet_reload_scan)
-
-    def restore_ui_intent(self):
-        """Restores the user's previously expressed UI layout intent."""
-        # 1. Window Geometry
-        geo = self.settings.get_window_geometry()
-        if geo:
-            self.restoreGeometry(geo)
-        else:
-            self.center_window()
-            
-        # 2. Splitter Sizes
-        sizes = self.settings.get_splitter_sizes()
-        if hasattr(self, 'content_splitter'):
-            self.content_splitter.setSizes(sizes)
-
-    def closeEvent(self, event):
-        """Save UI intent on close."""
-        self.settings.set_window_geometry(self.saveGeometry())
-        if hasattr(self, 'content_splitter'):
-            self.settings.set_splitter_sizes(self.content_splitter.sizes())
-        super().closeEvent(event)
-
-    def center_window(self):
-        """Centers the window on the primary screen and ensures it fits."""
-        screen = QApplication.primaryScreen()
-        if not screen:
-            return
-            
-        screen_geo = screen.availableGeometry()
-        window_geo = self.frameGeometry()
-        
-        # Center point
-        center_point = screen_geo.center()
-        window_geo.moveCenter(center_point)
-        
-        # Iterate to ensure Top-Left is visible (handling multi-monitor weirdness or huge scaling)
-        # Move window top-left to calculated position, but clamp to 0,0 relative to screen
-        new_x = window_geo.x()
-        new_y = window_geo.y()
-        
-        # Basic Clamp: Ensure title bar isn't off-screen top
-        if new_y < screen_geo.y():
-            new_y = screen_geo.y()
-            
-        self.move(new_x, new_y)
-
-    def lock_window(self, width, height):
-        """Lock window size (no user resize)."""
-        self.setMinimumSize(width, height)
-        self.setMaximumSize(width, height)
-        self.resize(width, height)
-
-    def animate_home_height(self, target_height):
-        # STOP any running animation
-        if hasattr(self, "home_height_anim") and self.home_height_anim:
-            if self.home_height_anim.state() == QPropertyAnimation.Running:
-                self.home_height_anim.stop()
-
-        fixed_width = self.width()  # 🔒 LOCK WIDTH
-
-        self.home_height_anim = QPropertyAnimation(self, b"size")
-        self.home_height_anim.setDuration(200)
-        self.home_height_anim.setEasingCurve(QEasingCurve.InOutCubic)
-        self.home_height_anim.setStartValue(self.size())
-        self.home_height_anim.setEndValue(QSize(fixed_width, target_height))
-
-        self.home_height_anim.finished.connect(
-            lambda: self.setFixedSize(fixed_width, target_height)
-        )
-
-        self.home_height_anim.start()
-
-    def animate_advanced_panel(self, expand: bool):
-        start = self.ignore_widget.maximumHeight()
-        end = 36 if expand else 0  # exact height of your widget
-
-        self.panel_anim = QPropertyAnimation(
-            self.ignore_widget, b"maximumHeight"
-        )
-        self.panel_anim.setDuration(180)
-        self.panel_anim.setEasingCurve(QEasingCurve.InOutCubic)
-        self.panel_anim.setStartValue(start)
-        self.panel_anim.setEndValue(end)
-        self.panel_anim.start()
-
-    def animate_window(self, target_rect, on_finished=None):
-        # Keep a strong reference and parent the animation to avoid GC
-        if hasattr(self, '_geometry_anim') and self._geometry_anim:
-            try:
-                self._geometry_anim.stop()
-            except Exception:
-                pass
-
-        self._geometry_anim = QPropertyAnimation(self, b"geometry", self)
-        self._geometry_anim.setDuration(350)  # Smoother, more premium feel
-        self._geometry_anim.setEasingCurve(QEasingCurve.OutCubic)  # Expands smoothly, decelerates at end
-        self._geometry_anim.setStartValue(self.geometry())
-        self._geometry_anim.setEndValue(target_rect)
-        
-        if on_finished is not None:
-            def _finish_and_release():
-                try:
-                    on_finished()
-                finally:
-                    self._geometry_anim = None
-            self._geometry_anim.finished.connect(_finish_and_release)
-        else:
-            def _release():
-                self._geometry_anim = None
-            self._geometry_anim.finished.connect(_release)
-            
-        self._geometry_anim.start()
-
-    def _clear_size_constraints(self):
-        try:
-            self.setMinimumSize(0, 0)
-            self.setMaximumSize(16777215, 16777215)
-            # Ensure central widget doesn't block
-            if self.centralWidget():
-                self.centralWidget().setMinimumSize(0, 0)
-        except Exception:
-            pass
-    
-    # Deprecated old resize animations in favor of animate_window
-    def animate_resize(self, width, height, lock_after=False, callback=None):
-        # Calculate centered position for the new size
-        screen = QApplication.primaryScreen()
-        target_rect = QRect(self.x(), self.y(), width, height)
-        
-        if screen:
-             avail = screen.availableGeometry()
-             # Center X
-             center_x = avail.center().x() - (width // 2)
-             # Center Y
-             center_y = avail.center().y() - (height // 2)
-             
-             # Clamp top safety
-             if center_y < avail.y(): 
-                 center_y = avail.y()
-             
-             target_rect = QRect(center_x, center_y, width, height)
-        
-        def _done():
-            if lock_after:
-                self.setFixedSize(width, height)
-            if callback:
-                callback()
-                
-        self._clear_size_constraints()
-        self.animate_window(target_rect, on_finished=_done)
-
-    def unlock_window(self, min_width=620, min_height=480):
-        """
-        Unlocks the window constraints so the user can resize.
-        Also performs a safety check to ensure window fits on screen.
-        """
-        self.setMinimumSize(min_width, min_height)
-        self.setMaximumSize(16777215, 16777215)
-        
-        screen = QApplication.primaryScreen()
-        if screen:
-            avail_geo = screen.availableGeometry()
-            screen_h = avail_geo.height()
-            screen_w = avail_geo.width()
-            
-            # If current height exceeds screen height, clamp it
-            current_h = self.height()
-            current_w = self.width()
-            
-            new_h = current_h
-            new_w = current_w
-            
-            if current_h > screen_h:
-                new_h = int(screen_h * 0.9) # 90% of screen height
-            
-            if current_w > screen_w:
-                new_w = int(screen_w * 0.9)
-                
-            if new_h != current_h or new_w != current_w:
-                self.resize(new_w, new_h)
-                self.center_window() # Re-center after forceful resize
-            elif self.y() < avail_geo.y():
-                # Just reposition if off-top without resize needed
-                self.move(self.x(), avail_geo.y())
-
-    def init_home_view(self):
-        self.home_page = QWidget()
-        layout = QVBoxLayout(self.home_page)
-        # Narrower margins for mobile-like width
-        layout.setContentsMargins(24, 0, 24, 0) # Top/Bottom handled by stretch
-        layout.setSpacing(0) # Spacing handled manually
-        
-        # Top Bar (More Menu)
-        top_bar = QHBoxLayout()
-        top_bar.setContentsMargins(0, 16, 0, 0) # Top margin for spacing
-        top_bar.addStretch()
-        
-        self.btn_more = QPushButton()
-        self.btn_more.setCursor(Qt.PointingHandCursor)
-        self.btn_more.setFixedSize(32, 32)
-        self.btn_more.setToolTip("More")
-        
-        # Try more.png first, fallback to settings.png
-        more_icon_path = resource_path("assets/more.png")
-        if os.path.exists(more_icon_path):
-            self.btn_more.setIcon(QIcon(more_icon_path))
-            self.btn_more.setIconSize(QSize(20, 20))
-            
-        self.btn_more.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #F3F4F6;
-            }
-            QPushButton:pressed {
-                background-color: #E5E7EB;
-            }
-            QPushButton::menu-indicator {
-                image: none;
-                width: 0px;
-            }
-        """)
-        
-        # Create More Menu
-        self._build_more_menu()
-        
-        top_bar.addWidget(self.btn_more)
-        layout.addLayout(top_bar)
-
-        # Drop Zone
-        self.drop_zone = DropZone()
-        self.drop_zone.setFixedSize(332, 260) # Fixed Card Size (380 - 48 margins = 332 available width)
-        self.drop_zone.folderDropped.connect(self.on_folder_ready)
-        self.drop_zone.clicked.connect(self.browse_folder)
-        
-        layout.addStretch(1)
-        layout.addWidget(self.drop_zone, 0, Qt.AlignCenter)
-        
-        layout.addSpacing(8)
-        
-        # Initialize Ignore Manager (Loads patterns + defaults)
-        self.ignore_manager = IgnoreManager(use_persistence=True)
-
-        # Advanced Ignore Toggle
-        self.advanced_check = ToggleSwitch("Advanced ignore patterns")
-        self.advanced_check.toggled.connect(self.toggle_advanced_ignore)
-        layout.addWidget(self.advanced_check, 0, Qt.AlignLeft)
-        
-        # Default: ON (User wants clarity)
-        # Note: SetChecked triggers toggled signal usually, so we need to handle state init first.
-        self.home_advanced_enabled = True 
-        self.advanced_check.setChecked(True)
-        
-        # Advanced Ignore Input (hidden by default)
-        self.ignore_widget = AdvancedIgnoreWidget(self.ignore_manager)
-        self.ignore_widget.patterns_changed.connect(self.reload_scan)
-        # self.ignore_widget.setVisible(False) <--- REMOVED
-        
-        # ✅ Correct Layout Initialization
-        # Since we default to ON, we need to set proper initial height
-        self.ignore_widget.setMaximumHeight(36) # Default expanded height
-        self.ignore_widget.setMinimumHeight(0)
-        self.ignore_widget.setSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Fixed
-        )
-        layout.addWidget(self.ignore_widget)
-        
-        # Recent Folders
-        self.recent_widget = RecentFoldersWidget()
-        self.recent_widget.set_folders(load_recent())
-        self.recent_widget.folderClicked.connect(self.on_folder_ready)
-        layout.addWidget(self.recent_widget)
-        
-        layout.addSpacing(8)
-        
-        # Start Scan Button (Bottom Right)
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        
-        self.btn_start = QPushButton("Start Scan")
-        self.btn_start.setCursor(Qt.PointingHandCursor)
-        self.btn_start.setFixedWidth(120)
-        self.btn_start.setFixedHeight(36)
-        self.btn_start.setEnabled(False) # Disabled initially
-        
-        self.btn_start.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #0069D9;
-            }
-            QPushButton:pressed {
-                background-color: #0056B3;
-            }
-            QPushButton:disabled {
-                background-color: #E5E7EB;
-                color: #9CA3AF;
-            }
-        """)
-        self.btn_start.clicked.connect(self.start_scan_action)
-        
-        btn_layout.addWidget(self.btn_start)
-        layout.addLayout(btn_layout)
-        
-        layout.addStretch(1)
-        
-        self.stack.addWidget(self.home_page)
-        
-        # State for pending scan
-        self.pending_path = None
-
-    def on_folder_ready(self, path):
-        """Called when folder is dropped, selected, or loaded from recent."""
-        
-        # CRITICAL: Stop any running/paused scan first
-        if hasattr(self, 'scan_thread') and self.scan_thread and self.scan_thread.isRunning():
-            self.scan_thread.stop_requested = True
-            self.scan_thread.stop_event.set()
-            self.scan_thread.pause_event.set()  # unblock if paused 
-            self.scan_thread.wait() # Ensure it's dead
-            self.scan_thread = None
-            
-        # Reset UI Control States (Button text, etc.)
-        self.btn_start.setText("Start Scan")
-        self.drop_zone.stop_scan_loader() # Clear any frozen progress bar state
-        
-        self.pending_path = path
-        
-        if path:
-            # Update recent folders immediately when folder is loaded
-            recent = add_recent(path)
-            self.recent_widget.set_folders(recent)
-            
-            # Enable scan button
-            self.btn_start.setEnabled(True)
-            
-            # Show loaded state in drop zone
-            self.drop_zone.set_loaded(path) # Ensure visual feedback with full path
-        else:
-            # Handle Removal / Clear
-            self.btn_start.setEnabled(False)
-            # Guard against recursion: Only clear if not already cleared
-            if self.drop_zone.is_loaded:
-                self.drop_zone.clear_loaded()
-                
-            self.current_data = None # Clear cached data on removal
-            self.tree.clear()
-
-    def start_scan_action(self):
-        """Triggered by button click - Supports Pause/Resume"""
-        # If currently scanning, handle Pause/Resume
-        if hasattr(self, 'scan_thread') and self.scan_thread and self.scan_thread.isRunning():
-            if self.scan_thread.is_paused():
-                self.scan_thread.resume()
-                self.btn_start.setText("Pause")
-                self.drop_zone.set_status_text("Resuming...")
-                self.drop_zone.setEnabled(False) # Lock UI
-            else:
-                self.scan_thread.pause()
-                self.btn_start.setText("Resume")
-                self.drop_zone.set_status_text("Paused - You can remove folder")
-                self.drop_zone.setEnabled(True) # Unlock UI so user can click 'X'
-            return
-
-        # Normal Start
-        if self.pending_path:
-             # Check for Smart Cache (Persist Session)
-            if self.current_data and self.current_data.get('path') == os.path.abspath(self.pending_path):
-                 # Reuse existing data without rescan
-                 self.stack.setCurrentWidget(self.result_page)
-                 
-                 # Logic to restore tree size/scroll if needed?
-                 self.animate_resize(*self.SIZE_RESULT, callback=lambda: self.unlock_window(min_width=620, min_height=480))
-                 return
-
-            self.start_scan(self.pending_path)
-
-    def init_result_view(self):
-        self.result_page = QWidget()
-        layout = QVBoxLayout(self.result_page)
-        layout.setContentsMargins(12, 12, 12, 10)
-        
-        # Header
-        # Header (Explorer Toolbar Style)
-        from PyQt5.QtWidgets import QFrame
-        header_container = QFrame()
-        header_container.setFixedHeight(48)
-        header_container.setStyleSheet("""
-            QFrame {
-                background-color: #F8F9FA;
-                border: 1px solid #E5E7EB;
-                border-radius: 4px;
-            }
-        """)
-        header_layout = QHBoxLayout(header_container)
-        header_layout.setContentsMargins(6, 6, 6, 6)
-        header_layout.setSpacing(8)
-        
-        # Back Button (Minimal)
-        back_btn = QPushButton()
-        back_btn.setCursor(Qt.PointingHandCursor)
-        back_btn.setFixedSize(32, 32)
-        back_btn.setToolTip("Back to Home")
-        
-        back_icon_path = resource_path("assets/left-arrow.png")
-        if os.path.exists(back_icon_path):
-            back_btn.setIcon(QIcon(back_icon_path))
-            back_btn.setIconSize(QSize(16, 16)) # Use 16-20px for toolbar icons
-        else:
-            back_btn.setText("←") # Fallback
-            
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px; /* Subtle hover shape */
-            }
-            QPushButton:hover {
-                background-color: #F3F4F6;
-            }
-            QPushButton:pressed { background-color: #E5E7EB; }
-        """)
-        back_btn.clicked.connect(self.go_home)
-        
-        # Refresh Button
-        self.btn_refresh = QPushButton()
-        self.btn_refresh.setCursor(Qt.PointingHandCursor)
-        self.btn_refresh.setFixedSize(30, 30)
-        self.btn_refresh.setToolTip("Refresh Folder")
-        
-        refresh_icon_path = resource_path("assets/refresh.png")
-        if os.path.exists(refresh_icon_path):
-            self.btn_refresh.setIcon(QIcon(refresh_icon_path))
-            self.btn_refresh.setIconSize(QSize(16, 16))
-        else:
-            self.btn_refresh.setText("⟳")
-            
-        self.btn_refresh.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #E5E7EB; }
-            QPushButton:pressed { background-color: #D1D5DB; }
-        """)
-        self.btn_refresh.clicked.connect(self.reload_scan)
-        
-        # Address Bar (Path)
-        self.path_bar = AddressBar("/path/to/project")
-        self.path_bar.setReadOnly(False)
-        self.path_bar.setStyleSheet("""
-            QLineEdit {
-                background-color: #F8F9FA;
-                border: 1px solid #D1D5DB;
-                border-radius: 4px;
-                padding: 4px 10px;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 13px;
-                color: #374151;
-            }
-            QLineEdit:hover { border-color: #9CA3AF; }
-            QLineEdit:focus { 
-                border: 1px solid #007AFF;
-                background-color: #FFFFFF;
-            }
-        """)
-        
-        # Search Bar
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search...")
-        self.search_bar.setFixedWidth(240) 
-        self.search_bar.setClearButtonEnabled(False) # Disable native, use custom
-        
-        # Actions Setup (Order matters for visual stacking)
-        # We want: [ Text ... (Clear) (Search) ]
-        # For TrailingPosition: First added is usually Rightmost? Or inner?
-        # PyQt behaviour: Actions are stacked. Let's add Search (Permanent) first, then Clear (Conditional).
-        
-        # 1. Search Icon (Rightmost)
-        search_icon_path = resource_path("assets/search.png")
-        if os.path.exists(search_icon_path):
-            self.search_bar.addAction(QIcon(search_icon_path), QLineEdit.TrailingPosition)
-            
-        # 2. Custom Clear Action (Left of search icon)
-        clear_icon_path = resource_path("assets/clear.png")
-        self.act_clear = QAction(self.search_bar)
-        if os.path.exists(clear_icon_path):
-            # Resize icon to standard toolbar size (16x16) for crisp look
-            pix = QPixmap(clear_icon_path)
-            scaled = pix.scaled(16, 16, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.act_clear.setIcon(QIcon(scaled))
-        else:
-            self.act_clear.setText("✕")
-        
-        self.act_clear.triggered.connect(self.search_bar.clear)
-        self.search_bar.addAction(self.act_clear, QLineEdit.TrailingPosition)
-        self.act_clear.setVisible(False) # Ensure hidden initially THIS IS CRITICAL
-
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #D1D5DB;
-                border-radius: 4px; 
-                padding: 4px 10px;
-                padding-right: 48px;
-                background-color: #F8F9FA;
-                font-size: 13px;
-                color: #111827;
-                font-family: 'Segoe UI', sans-serif;
-            }
-            QLineEdit:hover { border-color: #9CA3AF; }
-            QLineEdit:focus {
-                border: 1px solid #007AFF; 
-                background-color: #FFFFFF;
-            }
-        """)
-        
-        def on_search_changed(text):
-            self.tree.filter_items(text)
-            self.act_clear.setVisible(bool(text))
-            
-        self.search_bar.textChanged.connect(on_search_changed)
-        
-        # Add to Layout
-        header_layout.addWidget(back_btn)
-        header_layout.addWidget(self.btn_refresh)
-        header_layout.addWidget(self.path_bar, 1) # Expand address bar
-        header_layout.addWidget(self.search_bar)
-        
-        layout.addWidget(header_container)
-        
-        # --- Content Area with Splitter (VS Code-like layout) ---
-        self.content_splitter = QSplitter(Qt.Horizontal)
-        self.content_splitter.setHandleWidth(1)
-        self.content_splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #E5E7EB;
-            }
-            QSplitter::handle:hover {
-                background-color: #007AFF;
-            }
-        """)
-        
-        # Left Panel: Tree View (Sidebar)
-        tree_container = QFrame()
-        tree_container.setStyleSheet("background-color: #F8F9FA; border-right: 1px solid #E5E7EB;")
-        
-        tree_layout = QVBoxLayout(tree_container)
-        tree_layout.setContentsMargins(0, 0, 0, 0)
-        tree_layout.setSpacing(0)
-        
-        # Content (Tree)
-        self.tree = FileTreeWidget()
-        self.tree.filePreviewRequested.connect(self.preview_in_canvas)
-        tree_layout.addWidget(self.tree)
-        
-        # Right Panel: Canvas Preview (VS Code-like editor)
-        preview_container = QFrame()
-        preview_container.setStyleSheet("background-color: #FFFFFF;")
-        
-        preview_layout = QVBoxLayout(preview_container)
-        preview_layout.setContentsMargins(0, 0, 0, 0)
-        preview_layout.setSpacing(0)
-        
-        self.canvas_preview = CanvasPreview()
-        preview_layout.addWidget(self.canvas_preview)
-        
-        # Add panels to splitter
-        self.content_splitter.addWidget(tree_container)
-        self.content_splitter.addWidget(preview_container)
-        
-        # Set initial sizes (40% tree, 60% canvas)
-        self.content_splitter.setSizes([140, 420])
-        
-        # Add splitter with stretch to fill available space
-        layout.addWidget(self.content_splitter, 1)  # stretch=1 to fill height
-        
-        # Guide Label (Placed above the export bar border)
-        lbl_guide = QLabel("Select export formats (Multiple selection allowed)")
-        lbl_guide.setStyleSheet("font-size: 13px; font-weight: 500; color: #6B7280; margin-left: 12px; margin-bottom: 2px;")
-
-        # --- Export Action Bar (Bottom) ---
-        export_container = QFrame()
-        export_container.setFixedHeight(72)
-        export_container.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-            }
-        """)
-        
-        # Main Layout for Bar
-        bar_layout = QHBoxLayout(export_container)
-        bar_layout.setContentsMargins(24, 12, 24, 12)
-        bar_layout.setSpacing(12)
-        
-        # Label
-        lbl_format = QLabel("Format:")
-        lbl_format.setStyleSheet("font-size: 13px; font-weight: 600; color: #6B7280; border: none;")
-        bar_layout.addWidget(lbl_format)
-        
-        # Toggle Chips Logic
-        self.export_buttons = {}
-        
-        def create_chip(text, item_id, tooltip=""):
-            btn = QPushButton(text)
-            btn.setCheckable(True)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setMinimumHeight(32)
-            if tooltip:
-                btn.setToolTip(tooltip)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFFFFF;
-                    border: 1px solid #D1D5DB;
-                    border-radius: 6px;
-                    padding: 4px 16px;
-                    color: #374151;
-                    font-weight: 500;
-                    font-size: 13px;
-                    outline: none;
-                }
-                QPushButton:hover {
-                    background-color: #F9FAFB;
-                    border-color: #9CA3AF;
-                }
-                QPushButton:checked {
-                    background-color: #007AFF;
-                    border: 1px solid #0069D9;
-                    color: #FFFFFF;
-                    font-weight: 600;
-                }
-            """)
-            self.export_buttons[item_id] = btn
-            return btn
-
-        # Create Options
-        btn_full = create_chip("Full Structure", "txt_full", "Export full directory structure including all file contents.")
-        btn_tree = create_chip("Tree Only", "txt_tree", "Export only the directory structure view (no file contents).")
-        btn_json = create_chip("JSON", "json", "Export structure and file data in a machine-readable JSON format.")
-        btn_pdf = create_chip("PDF", "pdf", "Export structure and contents as a formatted PDF document.")
-
-        # Initial States from Settings
-        default_formats = SettingsManager().get_default_export_formats()
-        for fmt_id, btn in self.export_buttons.items():
-            btn.setChecked(fmt_id in default_formats)
-        
-        bar_layout.addWidget(btn_full)
-        bar_layout.addWidget(btn_tree)
-        bar_layout.addWidget(btn_json)
-        bar_layout.addWidget(btn_pdf)
-        
-        # Spacer
-        bar_layout.addStretch()
-        
-        # "Token Estimate" dropdown button - Modularized
-        from src.frontend.components.token_estimate_button import TokenEstimateButton
-        self.token_btn = TokenEstimateButton(
-            parent=export_container,
-            data_getter=lambda: self.current_data,
-            format_getter=self.get_selected_export_formats
-        )
-        bar_layout.addWidget(self.token_btn)
-        
-        # Connect Toggles to Live Update
-        for btn in self.export_buttons.values():
-            btn.toggled.connect(lambda: self.token_btn.update_estimate())
-        
-        # Spacer padding
-        bar_layout.addSpacing(12)
-
-        # Export Button (Right)
-        self.export_btn = QPushButton("Export Files")
-        self.export_btn.setCursor(Qt.PointingHandCursor)
-        self.export_btn.setFixedSize(140, 40)
-        
-        export_icon_path = resource_path("assets/export.png")
-        if os.path.exists(export_icon_path):
-            self.export_btn.setIcon(QIcon(export_icon_path))
-            self.export_btn.setIconSize(QSize(18, 18))
-
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding-left: 20px;
-                padding-right: 20px;
-                border: none;
-            }
-            QPushButton:hover { background-color: #0069D9; }
-            QPushButton:pressed { background-color: #0056B3; }
-        """)
-        self.export_btn.clicked.connect(self.export_current_data)
-        
-        bar_layout.addWidget(self.export_btn)
-        
-        layout.addWidget(lbl_guide)
-        layout.addWidget(export_container)
-        
-
-        
-        self.stack.addWidget(self.result_page)
-
-    def browse_folder(self):
-        path = QFileDialog.getExistingDirectory(self, "Select Project Folder")
-        if path:
-            self.on_folder_ready(path)
-
-    def get_abs_path_from_node(self, node_or_path):
-        """
-        Convert any node/path input into a valid absolute filesystem path.
-        This is the ONLY function allowed to touch OS paths.
-        """
-
-        if not node_or_path:
-            return None
-
-        # Case 1: full node dict
-        if isinstance(node_or_path, dict):
-            rel_path = node_or_path.get("path")
-        else:
-            rel_path = node_or_path
-
-        if not rel_path:
-            return None
-
-        # Already absolute (safety)
-        if os.path.isabs(rel_path):
-            return os.path.normpath(rel_path)
-
-        # Root folder itself
-        if not self.selected_folder_path:
-            return None
-
-        abs_path = os.path.normpath(
-            os.path.join(self.selected_folder_path, rel_path)
-        )
-
-        return abs_path
-
-    def reveal_in_explorer(self, node_or_path):
-        abs_path = self.get_abs_path_from_node(node_or_path)
-
-        if not abs_path:
-            QMessageBox.warning(self, "Not Found", "Invalid path.")
-            return
-
-        if not os.path.exists(abs_path):
-            QMessageBox.warning(
-                self,
-                "Not Found",
-                f"Path does not exist:\n{abs_path}"
-            )
-            return
-
-        try:
-            if platform.system() == "Windows":
-                if os.path.isdir(abs_path):
-                    subprocess.Popen(["explorer", abs_path])
-                else:
-                    subprocess.Popen(
-                        ["explorer", "/select,", abs_path]
-                    )
-
-            elif platform.system() == "Darwin":
-                subprocess.Popen(["open", "-R", abs_path])
-
-            else:
-                folder = abs_path if os.path.isdir(abs_path) else os.path.dirname(abs_path)
-                subprocess.Popen(["xdg-open", folder])
-
-        except Exception as e:
-            QMessageBox.critical(self, "Reveal Failed", str(e))
-            
-    def open_file_external(self, node_or_path):
-        abs_path = self.get_abs_path_from_node(node_or_path)
-
-        if not abs_path or not os.path.exists(abs_path):
-            QMessageBox.warning(self, "Not Found", "File does not exist.")
-            return
-
-        try:
-            if platform.system() == "Windows":
-                os.startfile(abs_path)
-            elif platform.system() == "Darwin":
-                subprocess.Popen(["open", abs_path])
-            else:
-                subprocess.Popen(["xdg-open", abs_path])
-        except Exception as e:
-            QMessageBox.critical(self, "Open Failed", str(e))
-
-    # preview_file_internal removed as it is legacy code replaced by canvas_preview
-
-    def preview_in_canvas(self, file_node):
-        """
-        Preview file content in the canvas panel (VS Code-like).
-        This is called when a file is clicked in the tree.
-        """
-        if not file_node:
-            self.canvas_preview.show_empty()
-            return
-        
-        abs_path = self.get_abs_path_from_node(file_node)
-        self.canvas_preview.preview_file(file_node, abs_path)
-        
-        # Start watching this file for content changes
-        if abs_path:
-            self.watcher.watch_file(abs_path)
-
-    def start_scan_loader(self):
-        self.drop_zone.start_scan_loader()
-
-    def stop_scan_loader(self):
-        self.drop_zone.stop_scan_loader()
-
-    def start_scan(self, path):
-        if not path:
-            # Cleared state
-            self.selected_folder_path = None
-            return
-
-        self.selected_folder_path = path
-
-        self.drop_zone.setEnabled(False)
-        self.start_scan_loader()
-        
-        self.path_bar.setText(path)
-        self.path_bar.setCursorPosition(0) # Reset scroll code? No simply show start.
-        
-        # Prepare ignore manager (Ensure patterns are fresh if modified recently)
-        # In this architecture, ignore_manager tracks its own state, so we just pass it.
-        # Use simple pattern refresh if needed, but manager.user_patterns is live.
-        self.ignore_manager.load_patterns() # Reload just in case external edit happened? Optional.
-        
-        # Threading
-        self.scan_thread = ScanThread(path, self.ignore_manager)
-        self.scan_thread.scan_finished.connect(self.on_scan_finished)
-        self.scan_thread.progress_update.connect(self.on_scan_progress)
-        self.scan_thread.start()
-        
-        # Update Button to Pause Mode
-        self.btn_start.setEnabled(True) # Keep enabled for Pause action
-        self.btn_start.setText("Pause")
-
-    def on_scan_progress(self, current, total):
-        self.drop_zone.set_scan_progress(current, total)
-
-    def on_scan_finished(self, data):
-        self.current_data = data
-        self.tree.populate(data)
-        
-        # Start watching the project root
-        if self.selected_folder_path:
-            self.watcher.start_watching_project(self.selected_folder_path)
-        
-        if 'name' in data:
-             self.search_bar.setPlaceholderText(f"Search {data['name']}")
-        
-        # Reset Home State
-        self.drop_zone.setEnabled(True)
-        self.stop_scan_loader()
-        self.btn_start.setText("Start Scan") # Reset button text
-        
-        # Switch View FIRST (before animation starts)
-        self.stack.setCurrentWidget(self.result_page)
-        
-        # Smart resize for tree view + Unlock (animate AFTER view switch)
-        self.animate_resize(*self.SIZE_RESULT, callback=lambda: self.unlock_window(min_width=620, min_height=480))
-
-        # Trigger initial estimate
-        self.token_btn.update_estimate()
-
-    def go_home(self):
-        self.stack.setCurrentWidget(self.home_page)
-        # self.current_data = None  <-- REMOVED to persist session
-        # self.tree.clear()         <-- REMOVED to persist session
-        
-        # Restore loaded state if folder is still selected
-        if self.selected_folder_path:
-            self.drop_zone.set_loaded(self.selected_folder_path)
-        else:
-            self.drop_zone.clear_loaded()
-
-        # Respect current toggle state for height
-        target_height = self.HOME_HEIGHT_ADV if self.home_advanced_enabled else self.HOME_HEIGHT
-        self.animate_resize(self.HOME_WIDTH, target_height, lock_after=True)
-
-    def toggle_advanced_ignore(self, checked):
-        if checked == self.home_advanced_enabled:
-            return
-
-        self.home_advanced_enabled = checked
-        
-        # 1. Animate Widget Height (Smooth content reveal)
-        self.animate_advanced_panel(checked) 
-        
-        # 2. Animate Window Height (Smooth container expansion)
-        target_height = self.HOME_HEIGHT_ADV if checked else self.HOME_HEIGHT
-        
-        # We must maintain current position and width
-        current_rect = self.geometry()
-        target_rect = QRect(
-            current_rect.x(), 
-            current_rect.y(), 
-            self.HOME_WIDTH, 
-            target_height
-        )
-        
-        
-        # 🔒 LOCK WIDTH STRICTLY
-        # Do NOT use _clear_size_constraints() here because it unlocks width.
-        # We want to allow HEIGHT change, but FORBID WIDTH change.
-        self.setFixedWidth(self.HOME_WIDTH)
-        self.setMinimumHeight(0)
-        self.setMaximumHeight(16777215)
-        
-        self.animate_window(target_rect, on_finished=lambda: self.setFixedSize(self.HOME_WIDTH, target_height))
-
-    def export_current_data(self):
-        if not self.current_data:
-            return
-            
-        formats = []
-        if self.export_buttons["txt_full"].isChecked(): formats.append("txt_full")
-        if self.export_buttons["txt_tree"].isChecked(): formats.append("txt_tree")
-        if self.export_buttons["json"].isChecked(): formats.append("json")
-        if self.export_buttons["pdf"].isChecked(): formats.append("pdf")
-        
-        if not formats:
-            QMessageBox.warning(self, "No Format Selected", "Please select at least one export format.")
-            return
-
-        # --- SMART DESTINATION LOGIC ---
-        settings = SettingsManager()
-        source_folder = self.selected_folder_path
-        # Use saved default only if toggle is ON
-        default_path = settings.get_default_export_path(source_folder) if settings.get_smart_toggle() else None
-        
-        # --- USER INTENT DETECTION ---
-        # If a default exists, check if manual history has shifted while toggle was off
-        if default_path and settings.get_smart_toggle():
-            history = settings.get_folder_history(source_folder)
-            # If user manually used a DIFFERENT path 3+ times
-            if history.get("count", 0) >= 3:
-                last_path = history.get("last_path")
-                if last_path and os.path.normpath(last_path).lower() != os.path.normpath(default_path).lower():
-                    if os.path.exists(last_path):
-                        from src.frontend.components.dialogs.smart_destination_dialog import SmartDestinationDialog
-                        smart_dlg = SmartDestinationDialog(last_path, self)
-                        if smart_dlg.exec_() == QDialog.Accepted and smart_dlg.remember:
-                            settings.set_default_export_path(source_folder, last_path)
-                            default_path = last_path
-        
-        target_dir = None
-        
-        if default_path and os.path.exists(default_path):
-            target_dir = default_path
-        else:
-            target_dir = QFileDialog.getExistingDirectory(self, "Select Export Directory")
-        
-        if target_dir:
-            # Check for large project
-            # Check for large project
-            # Stats are now centrally populated by scanner
-            total_files = self.current_data.get('stats', {}).get('files', 0)
-
-            if total_files > 3000:
-                reply = QMessageBox.question(
-                    self, 
-                    "Large Export Warning", 
-                    f"You are about to export {total_files:,} files.\nThis might take a while. Continue?",
-                    QMessageBox.Yes | QMessageBox.No, 
-                    QMessageBox.No
-                )
-                if reply == QMessageBox.No:
-                    return
-
-            # Show progress feedback for large exports
-            self.setCursor(Qt.WaitCursor)
-            QApplication.processEvents()  # Ensure cursor updates
-            
-            try:
-                files = export_data(self.current_data, target_dir, formats)
-                
-                self.unsetCursor()
-                
-                if files:
-                    # Success Dialog
-                    # Check setting using JSON manager
-                    if not SettingsManager().get("suppress_success_dialog", False):
-                        from src.frontend.components.dialogs.export_result_dialog import ExportResultDialog
-                        dialog = ExportResultDialog(target_dir, self)
-                        dialog.exec_()
-                    else:
-                        # Feedback: Green Export Button
-                        self.show_export_success_feedback()
-                else:
-                    QMessageBox.warning(self, "Export Warning", "No files were exported.")
-                
-                # --- SMART DESTINATION UPDATE ---
-                # Track manual history every time user picks a folder (background learning)
-                if not default_path and target_dir:
-                    new_count = settings.update_export_history(source_folder, target_dir)
-                    # Proactively ask to set default IF toggle is on and it's a clear favorite
-                    if settings.get_smart_toggle() and new_count >= 5:
-                        from src.frontend.components.dialogs.smart_destination_dialog import SmartDestinationDialog
-                        smart_dlg = SmartDestinationDialog(target_dir, self)
-                        if smart_dlg.exec_() == QDialog.Accepted and smart_dlg.remember:
-                            settings.set_default_export_path(source_folder, target_dir)
-                            # Optional: Feedback "Saved as default"
-                # --- SMART FORMAT UPDATE ---
-                current_defaults = settings.get_default_export_formats()
-                if sorted(formats) != sorted(current_defaults):
-                    usage_count = settings.update_format_history(formats)
-                    if usage_count >= 3:
-                        msg_formats = ", ".join([f.split('_')[-1].upper() for f in formats])
-                        reply = QMessageBox.question(
-                            self,
-                            "Update Default Formats",
-                            f"I noticed you've exported as {msg_formats} several times now.\n\n"
-                            "Would you like to make this your default export configuration?",
-                            QMessageBox.Yes | QMessageBox.No,
-                            QMessageBox.Yes
-                        )
-                        if reply == QMessageBox.Yes:
-                            settings.set_default_export_formats(formats)
-            except Exception as e:
-                self.unsetCursor()
-                # Show detailed error for debugging
-                error_msg = str(e)
-                if len(error_msg) > 500:
-                    error_msg = error_msg[:500] + "..."
-                QMessageBox.critical(
-                    self, 
-                    "Export Error", 
-                    f"Export failed:\n\n{error_msg}\n\nTip: For very large projects, try exporting Tree/Text only."
-                )
-
-    def reload_scan(self):
-        """Re-scan the currently selected folder without changing view"""
-        if not self.selected_folder_path:
-            return
-            
-        # UI Feedback
-        self.tree.setDisabled(True)
-        self.btn_refresh.setDisabled(True)
-        self.setCursor(Qt.WaitCursor)
-        
-        # Create new scan thread
-        self.scan_thread = ScanThread(self.selected_folder_path, self.ignore_manager)
-        
-        def on_reload_finished(data):
-            self.current_data = data
-            self.tree.populate(data)
-            self.tree.setDisabled(False)
-            self.btn_refresh.setDisabled(False)
-            self.unsetCursor()
-            
-            # Re-apply filter if search text exists
-            search_text = self.search_bar.text()
-            if search_text:
-                self.tree.filter_items(search_text)
-            
-            # Update estimate on reload
-            self.token_btn.update_estimate()
-                
-        self.scan_thread.scan_finished.connect(on_reload_finished)
-        self.scan_thread.start()
-
-    def preview_file(self, path):
-        """Open file in default system application"""
-        if not os.path.exists(path):
-            return
-            
-        try:
-            if platform.system() == "Windows":
-                os.startfile(path)
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", path], check=False)
-            else:
-                subprocess.run(["xdg-open", path], check=False)
-        except Exception as e:
-            print(f"Error opening file: {e}")
-
-    def export_folder(self, abs_path, tree_only=False):
-        """Export a specific sub-folder"""
-        if not os.path.exists(abs_path):
-            return
-
-        target_dir = QFileDialog.getExistingDirectory(self, f"Select Export Directory for '{os.path.basename(abs_path)}'")
-        if not target_dir:
-            return
-
-        # We need to scan just this folder to get its structure
-        self.setCursor(Qt.WaitCursor)
-        
-        # NOTE: We run this synchronously for simplicity since it's a sub-folder export, 
-        # or we could use another thread. For now, sync is acceptable for a "Save As" type action 
-        # unless folder is huge. Let's reuse scan logic but possibly sync or quick thread.
-        # To match architecture, let's just do it directly if we trust scanner is fast enough,
-        # or spin a thread if we want to be safe. 
-        # Given "safe, fast, predictable" goal, let's use a quick local scanner call.
-        
-        try:
-            # Re-import here to avoid circularity if any, though likely fine at top
-            from src.backend.scanner import scan_directory_structure
-            
-            sub_data = scan_directory_structure(abs_path, self.ignore_manager)
-            
-            formats = ["txt_tree"] if tree_only else ["txt_full"]
-            # If user wants customized "Tree + Code", maybe they want JSON/PDF too?
-            # The prompt says: "Tree Only" vs "Tree + Code".
-            # "Tree + Code" implies likely the standard full text dump.
-            
-            files = export_data(sub_data, target_dir, formats)
-            self.unsetCursor()
-            
-            # New Custom Dialog
-            if not SettingsManager().get("suppress_success_dialog", False):
-                from src.frontend.components.dialogs.export_result_dialog import ExportResultDialog
-                dialog = ExportResultDialog(target_dir, self)
-                dialog.exec_()
-                
-        except Exception as e:
-            self.unsetCursor()
-            QMessageBox.critical(self, "Export Error", str(e))
-
-    def get_selected_export_formats(self):
-        """Helper to get currently selected export formats for token estimation."""
-        if not hasattr(self, 'export_buttons'): 
-            return []
-        
-        formats = []
-        # Check keys against the IDs defined in create_chip
-        if self.export_buttons.get("txt_full") and self.export_buttons["txt_full"].isChecked(): 
-            formats.append("txt_full")
-        if self.export_buttons.get("txt_tree") and self.export_buttons["txt_tree"].isChecked(): 
-            formats.append("txt_tree")
-        if self.export_buttons.get("json") and self.export_buttons["json"].isChecked(): 
-            formats.append("json")
-        if self.export_buttons.get("pdf") and self.export_buttons["pdf"].isChecked(): 
-            formats.append("pdf")
-            
-        return formats
-
-    def _build_more_menu(self):
-        """Build the 'More' dropdown menu with About option."""
-        from PyQt5.QtWidgets import QMenu
-        from PyQt5.QtCore import Qt
-        from PyQt5.QtGui import QColor
-        
-        more_menu = QMenu(self)
-        more_menu.setFixedWidth(260) # Increased width for better layout
-        
-        # Transparent background for rounded corners to work
-        more_menu.setAttribute(Qt.WA_TranslucentBackground)
-        more_menu.setWindowFlags(more_menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-        
-        more_menu.setStyleSheet("""
-            QMenu {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 4px 0;
-                margin: 0px; /* Important for no shadow overlap */
-            }
-            QMenu::item {
-                padding: 8px 12px; /* Reduced padding for better alignment */
-                color: #374151;
-                font-size: 13px;
-                font-weight: 500;
-                border-radius: 4px; /* Rounded highlight */
-                margin: 2px 4px; /* Space for rounded highlight */
-            }
-            QMenu::item:selected {
-                background-color: #F3F4F6;
-                color: #111827;
-            }
-            QMenu::icon {
-                padding-left: 4px;
-            }
-        """)
-        
-        # --- Notification Toggle ---
-        from PyQt5.QtWidgets import QWidgetAction, QLabel, QWidget
-        from src.frontend.components.toggle_switch import ToggleSwitch
-        
-        # Container for Toggle
-        toggle_container = QWidget()
-        toggle_container.setStyleSheet("background: transparent;")
-        toggle_layout = QHBoxLayout(toggle_container)
-        toggle_layout.setContentsMargins(12, 4, 12, 4) 
-        toggle_layout.setSpacing(8)
-        
-        # Label
-        lbl_notify = QLabel("Show Export Notification")
-        lbl_notify.setStyleSheet("color: #374151; font-size: 13px; font-weight: 500; border: none;")
-        
-        # Switch
-        switch_notify = ToggleSwitch()
-        switch_notify.setFixedSize(36, 20)
-        
-        # Set initial state
-        is_suppressed = SettingsManager().get("suppress_success_dialog", False)
-        switch_notify.setChecked(not is_suppressed)
-        
-        # Connect
-        def on_toggle_notify(checked):
-            SettingsManager().set("suppress_success_dialog", not checked)
-            if more_menu.isVisible():
-                more_menu.show() # Keeps menu open
-            
-        switch_notify.toggled.connect(on_toggle_notify)
-        
-        toggle_layout.addWidget(lbl_notify)
-        toggle_layout.addStretch()
-        toggle_layout.addWidget(switch_notify)
-        
-        # Add to Menu
-        toggle_action = QWidgetAction(more_menu)
-        toggle_action.setDefaultWidget(toggle_container)
-        more_menu.addAction(toggle_action)
-        
-        # --- Smart Destination Toggle ---
-        
-        # Container
-        smart_container = QWidget()
-        smart_container.setStyleSheet("background: transparent;")
-        smart_layout = QHBoxLayout(smart_container)
-        smart_layout.setContentsMargins(12, 4, 12, 4)
-        smart_layout.setSpacing(8)
-        
-        # Label
-        lbl_smart = QLabel("Smart Destination Selection")
-        lbl_smart.setStyleSheet("color: #374151; font-size: 13px; font-weight: 500; border: none;")
-        
-        # Switch
-        switch_smart = ToggleSwitch()
-        switch_smart.setFixedSize(36, 20)
-        
-        # Init State
-        switch_smart.setChecked(SettingsManager().get_smart_toggle())
-        
-        def on_toggle_smart(checked):
-            SettingsManager().set_smart_toggle(checked)
-            if more_menu.isVisible():
-                more_menu.show() # Keeps menu open
-                
-        switch_smart.toggled.connect(on_toggle_smart)
-        
-        smart_layout.addWidget(lbl_smart)
-        smart_layout.addStretch()
-        smart_layout.addWidget(switch_smart)
-        
-        smart_action = QWidgetAction(more_menu)
-        smart_action.setDefaultWidget(smart_container)
-        more_menu.addAction(smart_action)
-
-        more_menu.addSeparator()
-
-        # About Action (Moved to Bottom)
-        about_action = more_menu.addAction("About")
-        about_icon_path = resource_path("assets/information.png")
-        if os.path.exists(about_icon_path):
-            about_action.setIcon(QIcon(about_icon_path))
-        about_action.triggered.connect(self._show_about_dialog)
-
-        
-        self.btn_more.setMenu(more_menu)
-
-    def _show_about_dialog(self):
-        """Show the About dialog with app information."""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
-        from PyQt5.QtCore import Qt
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("About")
-        dialog.setFixedWidth(340) # Slightly wider
-        # Remove fixed height to allow content to fit
-        
-        # Proper window flags for clean dialog
-        dialog.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setContentsMargins(24, 32, 24, 24)
-        layout.setSpacing(16)
-        
-        # Ensure dialog background is white
-        dialog.setStyleSheet("QDialog { background-color: white; }")
-        
-        # App Icon
-        icon_label = QLabel()
-        icon_path = resource_path("assets/app_icon.png")
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path).scaled(56, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            icon_label.setPixmap(pixmap)
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("background: transparent; border: none;")
-        layout.addWidget(icon_label)
-        
-        # Container for text to ensure proper spacing
-        text_container = QVBoxLayout()
-        text_container.setSpacing(4)
-        
-        # App Name
-        name_label = QLabel("Crawlsee")
-        name_label.setStyleSheet("font-size: 22px; font-weight: 800; color: #111827; background: transparent; border: none;")
-        name_label.setAlignment(Qt.AlignCenter)
-        text_container.addWidget(name_label)
-        
-        # Version
-        version_label = QLabel("Version 1.0.0")
-        version_label.setStyleSheet("font-size: 13px; color: #6B7280; background: transparent; border: none;")
-        version_label.setAlignment(Qt.AlignCenter)
-        text_container.addWidget(version_label)
-        
-        layout.addLayout(text_container)
-        
-        # Description
-        desc_label = QLabel("A powerful tool to scan, visualize, and export\nproject directory structures for LLM context.")
-        desc_label.setStyleSheet("font-size: 13px; color: #4B5563; line-height: 1.4; background: transparent; border: none;")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        layout.addWidget(desc_label)
-        
-        layout.addSpacing(8)
-        
-        # Developer Section with Custom PNG (Below label, larger)
-        dev_container = QVBoxLayout()
-        dev_container.setSpacing(8)
-        dev_container.setAlignment(Qt.AlignCenter)
-        
-        dev_text = QLabel("Developed by")
-        dev_text.setStyleSheet("font-size: 11px; color: #9CA3AF; font-weight: 600; background: transparent; border: none;")
-        dev_text.setAlignment(Qt.AlignCenter)
-        
-        dev_img_label = QLabel()
-        dev_img_path = resource_path("assets/AbdulKarim.png")
-        if os.path.exists(dev_img_path):
-            # Enlarge signature
-            dev_pixmap = QPixmap(dev_img_path).scaledToHeight(20, Qt.SmoothTransformation)
-            dev_img_label.setPixmap(dev_pixmap)
-        else:
-            dev_img_label.setText("Abdulkarim")
-            dev_img_label.setStyleSheet("font-size: 11px; color: #9CA3AF; font-weight: 600;")
-            
-        # Creative Tooltip (Name + Quote)
-        dev_img_label.setToolTip(
-            "<b>AbdulKarim</b><br/>"
-            "<i>\"A fantastic level of creativity is the bridge that turns<br/>"
-            "complex logic into an elegant masterpiece.\"</i>"
-        )
-            
-        dev_img_label.setAlignment(Qt.AlignCenter)
-        dev_container.addWidget(dev_text)
-        dev_container.addWidget(dev_img_label)
-        layout.addLayout(dev_container)
-        
-        layout.addStretch()
-        
-        # Close Button
-        close_btn = QPushButton("Close")
-        close_btn.setFixedSize(90, 36)
-        close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-            QPushButton:pressed {
-                background-color: #1D4ED8;
-            }
-        """)
-        close_btn.clicked.connect(dialog.accept)
-        
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        btn_layout.addWidget(close_btn)
-        btn_layout.addStretch()
-        layout.addLayout(btn_layout)
-        
-        dialog.exec_()
-
-    def on_file_changed(self, path):
-        """Handle external file changes."""
-        # Safety check: if file was deleted, ignore
-        if not os.path.exists(path):
-            return
-
-        # Update Canvas Content if open
-        try:
-            if path in self.canvas_preview.open_files:
-                if any(path.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp']):
-                    self.canvas_preview.reload_file_content(path)
-                else:
-                    # Text file
-                    try:
-                        with open(path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        self.canvas_preview.reload_file_content(path, content)
-                    except UnicodeDecodeError:
-                        pass # Binary file?
-        except Exception as e:
-            print(f"Error reading changed file {path}: {e}")
-
-    def on_directory_changed(self, path):
-        """Handle external directory structure changes."""
-        # 1. Check if project root still exists
-        if self.selected_folder_path and not os.path.exists(self.selected_folder_path):
-            # Project root deleted!
-            self._handle_project_disappeared()
-            return
-
-        # 2. Throttled reload
-        if not self.reload_cooldown_timer.isActive():
-            self.reload_cooldown_timer.start()
-
-    def _handle_project_disappeared(self):
-        """Cleanly reset UI when the active folder is deleted externally."""
-        self.selected_folder_path = None
-        self.current_data = None
-        self.tree.clear()
-        self.watcher.stop_watching_project()
-        
-        # Reset Home UI items
-        self.drop_zone.clear_loaded()
-        self.btn_start.setEnabled(False)
-        self.recent_widget.set_folders(load_recent()) # Refresh recent list
-        
-        self.go_home()
-        QMessageBox.warning(self, "Folder Disappeared", 
-                           "The currently opened folder has been deleted or moved externally.\n"
-                           "Application has been reset to the home screen.")
-
-    def quiet_reload_scan(self):
-        """Re-scan without blocking UI (for auto-updates)."""
-        if not self.selected_folder_path or not os.path.exists(self.selected_folder_path):
-            return
-            
-        # Avoid overlapping scans or interrupting active user scan
-        if self.scan_thread and self.scan_thread.isRunning():
-            return
-            
-        # We use a new thread instance
-        self.scan_thread = ScanThread(self.selected_folder_path, self.ignore_manager)
-        
-        def on_finished(data):
-            # Check if we still care about this path
-            if not self.selected_folder_path or data.get('path') != self.selected_folder_path:
-                return
-
-            self.current_data = data
-            self.tree.populate(data)
-            
-            search_text = self.search_bar.text()
-            if search_text:
-                self.tree.filter_items(search_text)
-            
-            self.token_btn.update_estimate()
-                
-        self.scan_thread.scan_finished.connect(on_finished)
-        self.scan_thread.start()
-
-    def show_export_success_feedback(self):
-        """Temporarily changes the export button to green to indicate success."""
-        if not hasattr(self, 'export_btn'):
-            return
-
-        original_text = "Export Files"
-        original_style = """
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding-left: 20px;
-                padding-right: 20px;
-                border: none;
-            }
-            QPushButton:hover { background-color: #0069D9; }
-            QPushButton:pressed { background-color: #0056B3; }
-        """
-        
-        success_style = """
-            QPushButton {
-                background-color: #10B981; /* Swift/Tailwind Emerald 500 */
-                color: white;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding-left: 20px;
-                padding-right: 20px;
-                border: none;
-            }
-            QPushButton:hover { background-color: #059669; }
-            QPushButton:pressed { background-color: #047857; }
-        """
-
-        self.export_btn.setText("Exported!")
-        self.export_btn.setStyleSheet(success_style)
-        
-        # Keep the icon or use a checkmark if available. User asked for "the icon used in the exported files button".
-        export_icon_path = resource_path("assets/export.png")
-        if os.path.exists(export_icon_path):
-            self.export_btn.setIcon(QIcon(export_icon_path))
-        
-        # Revert after 2 seconds
-        QTimer.singleShot(2000, lambda: self._revert_export_btn(original_text, original_style))
-
-    def _revert_export_btn(self, text, style):
-        if not hasattr(self, 'export_btn'):
-            return
-            
-        self.export_btn.setText(text)
-        self.export_btn.setStyleSheet(style)
-        
-        # Restore Icon
-        export_icon_path = resource_path("assets/export.png")
-        if os.path.exists(export_icon_path):
-             self.export_btn.setIcon(QIcon(export_icon_path))
+from PyQt5.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QStackedWidget, 
+    QLabel, QPushButton, QFileDialog, QMessageBox, QProgressBar, QCheckBox, QSizePolicy,
+    QLineEdit, QAction, QMenu, QApplication, QFrame, QSplitter, QDialog, QComboBox, QShortcut
+)
+from src.frontend.components.toggle_switch import ToggleSwitch
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect, QSize, QTimer
+# QSettings removed from imports as we use custom manager now
+from PyQt5.QtGui import QIcon, QPixmap, QKeySequence
+
+from src.frontend.styles.theme import STYLESHEET, COLOR_PRIMARY
+from src.frontend.components.drop_zone import DropZone
+from src.frontend.components.tree_view import FileTreeWidget
+from src.frontend.components.canvas_preview import CanvasPreview
+
+from src.backend.scanner import scan_directory_structure, MAX_FILE_SIZE
+from src.backend.exporter import export_data
+from src.backend.file_iterator import BREADTH_FIRST, DEPTH_FIRST, PATH_SORTED, SMALLEST_FIRST, RECENT_FIRST
+from src.backend.analyzers.token_logic import MODELS, resolve_token_budget
+from src.backend.analyzers.file_ranker import RankingWeights
+from src.backend.analyzers.token_aggregates import carry_over_tokens
+from src.backend.search_index import search_index
+from src.backend.node_table import node_table
+from src.frontend.components.dialogs.quick_open_dialog import QuickOpenDialog
+from src.frontend.components.content_search_panel import ContentSearchPanel
+from src.backend.content_index import content_index, CONTENT_INDEX_KEY
+from src.config import IGNORED_PATTERNS
+from src.backend.managers.ignore_manager import IgnoreManager
+from src.frontend.components.advanced_ignore import AdvancedIgnoreWidget
+from src.backend.managers.recent_manager import load_recent, add_recent
+from src.frontend.components.recent_folders import RecentFoldersWidget
+from src.backend.managers.watcher_manager import WatcherManager
+from src.config import resource_path
+import os
+import subprocess
+import platform
+from src.backend.managers.settings_manager import SettingsManager
+
+class AddressBar(QLineEdit):
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self._should_select_all = False
+        
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        # Select all on tab focus
+        QTimer.singleShot(0, self.selectAll)
+
+    def mousePressEvent(self, event):
+        if not self.hasFocus():
+            self._should_select_all = True
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self._should_select_all:
+            QTimer.singleShot(0, self.selectAll)
+            self._should_select_all = False
+
+    def contextMenuEvent(self, event):
+        from src.frontend.components.tree_context_menu.menu_base import ExplorerStyleMenu
+        menu = ExplorerStyleMenu(self)
+        
+        def add_action(name, shortcut, slot, icon_file=None):
+            from PyQt5.QtGui import QIcon
+            from src.config import resource_path
+            import os
+
+            icon = QIcon()
+            if icon_file:
+                p = resource_path(f"assets/{icon_file}")
+                if os.path.exists(p):
+                    icon = QIcon(p)
+            
+            action = menu.addAction(icon, name)
+            action.setShortcut(shortcut)
+            action.setShortcutVisibleInContextMenu(True)
+            action.triggered.connect(slot)
+
+        add_action("Cut", "Ctrl+X", self.cut, "cut.png")
+        add_action("Copy", "Ctrl+C", self.copy, "copy.png")
+        menu.addSeparator()
+        add_action("Select All", "Ctrl+A", self.selectAll)
+
+        menu.exec_(event.globalPos())
+
+class ScanThread(QThread):
+    scan_finished = pyqtSignal(dict)
+    progress_update = pyqtSignal(int, int) # current, total
+    
+    def __init__(self, path, ignore_manager=None):
+        super().__init__()
+        self.path = path
+        self.ignore_manager = ignore_manager
+        
+        # Pause Event (Set = Running, Clear = Paused)
+        from threading import Event
+        self.pause_event = Event()
+        self.pause_event.set() # Start running
+        
+        self.stop_event = Event()
+        self.stop_requested = False
+        
+    def run(self):
+        # 1. Pre-scan to get total files (for progress bar)
+        total_files = 0
+        try:
+           # Send initial status
+           self.progress_update.emit(0, 0)
+           
+           for root, dirs, files in os.walk(self.path):
+               if self.stop_event.is_set(): return
+               total_files += len(files)
+               # Optional: Emit "Calculating..." updates if really large
+        except Exception:
+            total_files = 100 
+            
+        if total_files == 0: total_files = 1
+        
+        # State for throttling
+        self._last_emit_percent = -1
+        self._last_emit_time = 0
+        import time
+        
+        # Define callback
+        def on_progress(count):
+            if self.stop_event.is_set(): return
+            
+            # Calculate percent
+            percent = int((count / total_files) * 100)
+            
+            # Throttle: Emit only if percent changes OR every 100ms
+            now = time.time()
+            if percent > self._last_emit_percent or (now - self._last_emit_time) > 0.1:
+                self.progress_update.emit(count, total_files)
+                self._last_emit_percent = percent
+                self._last_emit_time = now
+
+        # 2. Run Scan
+        result = scan_directory_structure(
+            self.path, 
+            self.ignore_manager, 
+            progress_callback=on_progress,
+            pause_event=self.pause_event,
+            stop_event=self.stop_event
+        )
+        # Build the explorer's search index here, off the GUI thread, once per scan
+        if result and not self.stop_event.is_set():
+            search_index(result)
+        self.scan_finished.emit(result)
+
+    def is_paused(self):
+        return not self.pause_event.is_set()
+
+    def pause(self):
+        self.pause_event.clear()
+
+    def resume(self):
+        self.pause_event.set()
+
+
+class ContentIndexThread(QThread):
+    """Builds the find-in-files trigram index after a scan (reusing the previous scan's index)."""
+
+    def __init__(self, data, previous=None, parent=None):
+        super().__init__(parent)
+        self.data = data
+        self.previous = previous
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            content_index(self.data, self.previous, cancelled=lambda: self._cancelled)
+        except Exception as e:
+            print(f"Content indexing failed: {e}")
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Crawlsee")
+        
+        # Window size presets (single source of truth)
+        self.HOME_WIDTH = 380
+        self.HOME_HEIGHT = 420
+        self.HOME_HEIGHT_ADV = 480
+        self.SIZE_RESULT = (940, 600) 
+
+        # Start in HOME size (Advanced enabled by default now)
+        self.setFixedSize(self.HOME_WIDTH, self.HOME_HEIGHT_ADV)
+        
+        # Load Settings Manager
+        self.settings = SettingsManager()
+        
+        # Pro-Desktop UI flags (Enable resize grips even if framed)
+        self.setWindowFlag(Qt.Window, True)
+        self.setMouseTracking(True)
+        
+        # Set App Icon
+        icon_path = resource_path("assets/app_icon.png")
+        if os.path.exists(icon_path):
+            self.setWindowIcon(QIcon(icon_path))
+        
+        # Apply Theme
+        self.setStyleSheet(STYLESHEET)
+        
+        # State Tracking
+        self.home_advanced_enabled = False
+        self.resize_anim = None
+        
+        # Central Widget & Stack
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+        self.stack = QStackedWidget()
+        
+        # layouts
+        self.main_layout = QVBoxLayout(self.central_widget)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.addWidget(self.stack)
+        
+        # Initialize Views
+        # Initialize Views
+        self.init_home_view()
+        self.init_result_view()
+        
+        # Start Home
+        self.stack.setCurrentWidget(self.home_page)
+        
+        # Restore UI Intent (Geometry / Layout)
+        self.restore_ui_intent()
+        
+        self.current_data = None
+        self.scan_thread = None
+        self.content_index_thread = None
+        self._content_index_pending = None  # (data, previous) to index once the running build is done
+        self.selected_folder_path = None # Track selected folder
+        
+        # Watcher & Auto-Reload Throttling
+        self.watcher = WatcherManager()
+        self.watcher.file_changed.connect(self.on_file_changed)
+        self.watcher.directory_changed.connect(self.on_directory_changed)
+        
+        self.reload_cooldown_timer = QTimer()
+        self.reload_cooldown_timer.setSingleShot(True)
+        self.reload_cooldown_timer.setInterval(2000) # 2s cooldown for auto-reloads
+        self.reload_cooldown_timer.timeout.connect(self.quiet_reload_scan)
+
+    def restore_ui_intent(self):
+        """Restores the user's previously expressed UI layout intent."""
+        # 1. Window Geometry
+        geo = self.settings.get_window_geometry()
+        if geo:
+            self.restoreGeometry(geo)
+        else:
+            self.center_window()
+            
+        # 2. Splitter Sizes
+        sizes = self.settings.get_splitter_sizes()
+        if hasattr(self, 'content_splitter'):
+            self.content_splitter.setSizes(sizes)
+
+    def closeEvent(self, event):
+        """Save UI intent on close."""
+        if hasattr(self, 'content_search'):
+            self.content_search.shutdown()
+        self._content_index_pending = None
+        if self.content_index_thread is not None:
+            self.content_index_thread.cancel()
+            self.content_index_thread.wait()
+        if hasattr(self, 'token_btn'):
+            self.token_btn.shutdown()
+        if hasattr(self, 'canvas_preview'):
+            self.canvas_preview.shutdown()
+        if hasattr(self, 'tree'):
+            self.tree.shutdown()
+            self.tree.save_expansion_state()
+        self.settings.set_window_geometry(self.saveGeometry())
+        if hasattr(self, 'content_splitter'):
+            self.settings.set_splitter_sizes(self.content_splitter.sizes())
+        super().closeEvent(event)
+
+    def center_window(self):
+        """Centers the window on the primary screen and ensures it fits."""
+        screen = QApplication.primaryScreen()
+        if not screen:
+            return
+            
+        screen_geo = screen.availableGeometry()
+        window_geo = self.frameGeometry()
+        
+        # Center point
+        center_point = screen_geo.center()
+        window_geo.moveCenter(center_point)
+        
+        # Iterate to ensure Top-Left is visible (handling multi-monitor weirdness or huge scaling)
+        # Move window top-left to calculated position, but clamp to 0,0 relative to screen
+        new_x = window_geo.x()
+        new_y = window_geo.y()
+        
+        # Basic Clamp: Ensure title bar isn't off-screen top
+        if new_y < screen_geo.y():
+            new_y = screen_geo.y()
+            
+        self.move(new_x, new_y)
+
+    def lock_window(self, width, height):
+        """Lock window size (no user resize)."""
+        self.setMinimumSize(width, height)
+        self.setMaximumSize(width, height)
+        self.resize(width, height)
+
+    def animate_home_height(self, target_height):
+        # STOP any running animation
+        if hasattr(self, "home_height_anim") and self.home_height_anim:
+            if self.home_height_anim.state() == QPropertyAnimation.Running:
+                self.home_height_anim.stop()
+
+        fixed_width = self.width()  # 🔒 LOCK WIDTH
+
+        self.home_height_anim = QPropertyAnimation(self, b"size")
+        self.home_height_anim.setDuration(200)
+        self.home_height_anim.setEasingCurve(QEasingCurve.InOutCubic)
+        self.home_height_anim.setStartValue(self.size())
+        self.home_height_anim.setEndValue(QSize(fixed_width, target_height))
+
+        self.home_height_anim.finished.connect(
+            lambda: self.setFixedSize(fixed_width, target_height)
+        )
+
+        self.home_height_anim.start()
+
+    def animate_advanced_panel(self, expand: bool):
+        start = self.ignore_widget.maximumHeight()
+        end = 36 if expand else 0  # exact height of your widget
+
+        self.panel_anim = QPropertyAnimation(
+            self.ignore_widget, b"maximumHeight"
+        )
+        self.panel_anim.setDuration(180)
+        self.panel_anim.setEasingCurve(QEasingCurve.InOutCubic)
+        self.panel_anim.setStartValue(start)
+        self.panel_anim.setEndValue(end)
+        self.panel_anim.start()
+
+    def animate_window(self, target_rect, on_finished=None):
+        # Keep a strong reference and parent the animation to avoid GC
+        if hasattr(self, '_geometry_anim') and self._geometry_anim:
+            try:
+                self._geometry_anim.stop()
+            except Exception:
+                pass
+
+        self._geometry_anim = QPropertyAnimation(self, b"geometry", self)
+        self._geometry_anim.setDuration(350)  # Smoother, more premium feel
+        self._geometry_anim.setEasingCurve(QEasingCurve.OutCubic)  # Expands smoothly, decelerates at end
+        self._geometry_anim.setStartValue(self.geometry())
+        self._geometry_anim.setEndValue(target_rect)
+        
+        if on_finished is not None:
+            def _finish_and_release():
+                try:
+                    on_finished()
+                finally:
+                    self._geometry_anim = None
+            self._geometry_anim.finished.connect(_finish_and_release)
+        else:
+            def _release():
+                self._geometry_anim = None
+            self._geometry_anim.finished.connect(_release)
+            
+        self._geometry_anim.start()
+
+    def _clear_size_constraints(self):
+        try:
+            self.setMinimumSize(0, 0)
+            self.setMaximumSize(16777215, 16777215)
+            # Ensure central widget doesn't block
+            if self.centralWidget():
+                self.centralWidget().setMinimumSize(0, 0)
+        except Exception:
+            pass
+    
+    # Deprecated old resize animations in favor of animate_window
+    def animate_resize(self, width, height, lock_after=False, callback=None):
+        # Calculate centered position for the new size
+        screen = QApplication.primaryScreen()
+        target_rect = QRect(self.x(), self.y(), width, height)
+        
+        if screen:
+             avail = screen.availableGeometry()
+             # Center X
+             center_x = avail.center().x() - (width // 2)
+             # Center Y
+             center_y = avail.center().y() - (height // 2)
+             
+             # Clamp top safety
+             if center_y < avail.y(): 
+                 center_y = avail.y()
+             
+             target_rect = QRect(center_x, center_y, width, height)
+        
+        def _done():
+            if lock_after:
+                self.setFixedSize(width, height)
+            if callback:
+                callback()
+                
+        self._clear_size_constraints()
+        self.animate_window(target_rect, on_finished=_done)
+
+    def unlock_window(self, min_width=620, min_height=480):
+        """
+        Unlocks the window constraints so the user can resize.
+        Also performs a safety check to ensure window fits on screen.
+        """
+        self.setMinimumSize(min_width, min_height)
+        self.setMaximumSize(16777215, 16777215)
+        
+        screen = QApplication.primaryScreen()
+        if screen:
+            avail_geo = screen.availableGeometry()
+            screen_h = avail_geo.height()
+            screen_w = avail_geo.width()
+            
+            # If current height exceeds screen height, clamp it
+            current_h = self.height()
+            current_w = self.width()
+            
+            new_h = current_h
+            new_w = current_w
+            
+            if current_h > screen_h:
+                new_h = int(screen_h * 0.9) # 90% of screen height
+            
+            if current_w > screen_w:
+                new_w = int(screen_w * 0.9)
+                
+            if new_h != current_h or new_w != current_w:
+                self.resize(new_w, new_h)
+                self.center_window() # Re-center after forceful resize
+            elif self.y() < avail_geo.y():
+                # Just reposition if off-top without resize needed
+                self.move(self.x(), avail_geo.y())
+
+    def init_home_view(self):
+        self.home_page = QWidget()
+        layout = QVBoxLayout(self.home_page)
+        # Narrower margins for mobile-like width
+        layout.setContentsMargins(24, 0, 24, 0) # Top/Bottom handled by stretch
+        layout.setSpacing(0) # Spacing handled manually
+        
+        # Top Bar (More Menu)
+        top_bar = QHBoxLayout()
+        top_bar.setContentsMargins(0, 16, 0, 0) # Top margin for spacing
+        top_bar.addStretch()
+        
+        self.btn_more = QPushButton()
+        self.btn_more.setCursor(Qt.PointingHandCursor)
+        self.btn_more.setFixedSize(32, 32)
+        self.btn_more.setToolTip("More")
+        
+        # Try more.png first, fallback to settings.png
+        more_icon_path = resource_path("assets/more.png")
+        if os.path.exists(more_icon_path):
+            self.btn_more.setIcon(QIcon(more_icon_path))
+            self.btn_more.setIconSize(QSize(20, 20))
+            
+        self.btn_more.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                border-radius: 6px;
+            }
+            QPushButton:hover {
+                background-color: #F3F4F6;
+            }
+            QPushButton:pressed {
+                background-color: #E5E7EB;
+            }
+            QPushButton::menu-indicator {
+                image: none;
+                width: 0px;
+            }
+        """)
+        
+        # Create More Menu
+        self._build_more_menu()
+        
+        top_bar.addWidget(self.btn_more)
+        layout.addLayout(top_bar)
+
+        # Drop Zone
+        self.drop_zone = DropZone()
+        self.drop_zone.setFixedSize(332, 260) # Fixed Card Size (380 - 48 margins = 332 available width)
+        self.drop_zone.folderDropped.connect(self.on_folder_ready)
+        self.drop_zone.clicked.connect(self.browse_folder)
+        
+        layout.addStretch(1)
+        layout.addWidget(self.drop_zone, 0, Qt.AlignCenter)
+        
+        layout.addSpacing(8)
+        
+        # Initialize Ignore Manager (Loads patterns + defaults)
+        self.ignore_manager = IgnoreManager(use_persistence=True)
+
+        # Advanced Ignore Toggle
+        self.advanced_check = ToggleSwitch("Advanced ignore patterns")
+        self.advanced_check.toggled.connect(self.toggle_advanced_ignore)
+        layout.addWidget(self.advanced_check, 0, Qt.AlignLeft)
+        
+        # Default: ON (User wants clarity)
+        # Note: SetChecked triggers toggled signal usually, so we need to handle state init first.
+        self.home_advanced_enabled = True 
+        self.advanced_check.setChecked(True)
+        
+        # Advanced Ignore Input (hidden by default)
+        self.ignore_widget = AdvancedIgnoreWidget(self.ignore_manager)
+        self.ignore_widget.patterns_changed.connect(self.reload_scan)
+        self.ignore_widget.patterns_added.connect(self.apply_added_ignore_patterns)
+        # self.ignore_widget.setVisible(False) <--- REMOVED
+        
+        # ✅ Correct Layout Initialization
+        # Since we default to ON, we need to set proper initial height
+        self.ignore_widget.setMaximumHeight(36) # Default expanded height
+        self.ignore_widget.setMinimumHeight(0)
+        self.ignore_widget.setSizePolicy(
+            QSizePolicy.Expanding,
+            QSizePolicy.Fixed
+        )
+        layout.addWidget(self.ignore_widget)
+        
+        # Recent Folders
+        self.recent_widget = RecentFoldersWidget()
+        self.recent_widget.set_folders(load_recent())
+        self.recent_widget.folderClicked.connect(self.on_folder_ready)
+        layout.addWidget(self.recent_widget)
+        
+        layout.addSpacing(8)
+        
+        # Start Scan Button (Bottom Right)
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        
+        self.btn_start = QPushButton("Start Scan")
+        self.btn_start.setCursor(Qt.PointingHandCursor)
+        self.btn_start.setFixedWidth(120)
+        self.btn_start.setFixedHeight(36)
+        self.btn_start.setEnabled(False) # Disabled initially
+        
+        self.btn_start.setStyleSheet("""
+            QPushButton {
+                background-color: #007AFF;
+                color: white;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+                border: none;
+            }
+            QPushButton:hover {
+                background-color: #0069D9;
+            }
+            QPushButton:pressed {
+                background-color: #0056B3;
+            }
+            QPushButton:disabled {
+                background-color: #E5E7EB;
+                color: #9CA3AF;
+            }
+        """)
+        self.btn_start.clicked.connect(self.start_scan_action)
+        
+        btn_layout.addWidget(self.btn_start)
+        layout.addLayout(btn_layout)
+        
+        layout.addStretch(1)
+        
+        self.stack.addWidget(self.home_page)
+        
+        # State for pending scan
+        self.pending_path = None
+
+    def on_folder_ready(self, path):
+        """Called when folder is dropped, selected, or loaded from recent."""
+        
+        # CRITICAL: Stop any running/paused scan first
+        if hasattr(self, 'scan_thread') and self.scan_thread and self.scan_thread.isRunning():
+            self.scan_thread.stop_requested = True
+            self.scan_thread.stop_event.set()
+            self.scan_thread.pause_event.set()  # unblock if paused 
+            self.scan_thread.wait() # Ensure it's dead
+            self.scan_thread = None
+            
+        # Reset UI Control States (Button text, etc.)
+        self.btn_start.setText("Start Scan")
+        self.drop_zone.stop_scan_loader() # Clear any frozen progress bar state
+        
+        self.pending_path = path
+        
+        if path:
+            # Update recent folders immediately when folder is loaded
+            recent = add_recent(path)
+            self.recent_widget.set_folders(recent)
+            
+            # Enable scan button
+            self.btn_start.setEnabled(True)
+            
+            # Show loaded state in drop zone
+            self.drop_zone.set_loaded(path) # Ensure visual feedback with full path
+        else:
+            # Handle Removal / Clear
+            self.btn_start.setEnabled(False)
+            # Guard against recursion: Only clear if not already cleared
+            if self.drop_zone.is_loaded:
+                self.drop_zone.clear_loaded()
+                
+            self.current_data = None # Clear cached data on removal
+            self.tree.clear()
+
+    def start_scan_action(self):
+        """Triggered by button click - Supports Pause/Resume"""
+        # If currently scanning, handle Pause/Resume
+        if hasattr(self, 'scan_thread') and self.scan_thread and self.scan_thread.isRunning():
+            if self.scan_thread.is_paused():
+                self.scan_thread.resume()
+                self.btn_start.setText("Pause")
+                self.drop_zone.set_status_text("Resuming...")
+                self.drop_zone.setEnabled(False) # Lock UI
+            else:
+                self.scan_thread.pause()
+                self.btn_start.setText("Resume")
+                self.drop_zone.set_status_text("Paused - You can remove folder")
+                self.drop_zone.setEnabled(True) # Unlock UI so user can click 'X'
+            return
+
+        # Normal Start
+        if self.pending_path:
+             # Check for Smart Cache (Persist Session)
+            if self.current_data and self.current_data.get('path') == os.path.abspath(self.pending_path):
+                 # Reuse existing data without rescan
+                 self.stack.setCurrentWidget(self.result_page)
+                 
+                 # Logic to restore tree size/scroll if needed?
+                 self.animate_resize(*self.SIZE_RESULT, callback=lambda: self.unlock_window(min_width=620, min_height=480))
+                 return
+
+            self.start_scan(self.pending_path)
+
+    def init_result_view(self):
+        self.result_page = QWidget()
+        layout = QVBoxLayout(self.result_page)
+        layout.setContentsMargins(12, 12, 12, 10)
+        
+        # Header
+        # Header (Explorer Toolbar Style)
+        from PyQt5.QtWidgets import QFrame
+        header_container = QFrame()
+        header_container.setFixedHeight(48)
+        header_container.setStyleSheet("""
+            QFrame {
+                background-color: #F8F9FA;
+                border: 1px solid #E5E7EB;
+                border-radius: 4px;
+            }
+        """)
+        header_layout = QHBoxLayout(header_container)
+        header_layout.setContentsMargins(6, 6, 6, 6)
+        header_layout.setSpacing(8)
+        
+        # Back Button (Minimal)
+        back_btn = QPushButton()
+        back_btn.setCursor(Qt.PointingHandCursor)
+        back_btn.setFixedSize(32, 32)
+        back_btn.setToolTip("Back to Home")
+        
+        back_icon_path = resource_path("assets/left-arrow.png")
+        if os.path.exists(back_icon_path):
+            back_btn.setIcon(QIcon(back_icon_path))
+            back_btn.setIconSize(QSize(16, 16)) # Use 16-20px for toolbar icons
+        else:
+            back_btn.setText("←") # Fallback
+            
+        back_btn.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                border-radius: 4px; /* Subtle hover shape */
+            }
+            QPushButton:hover {
+                background-color: #F3F4F6;
+            }
+            QPushButton:pressed { background-color: #E5E7EB; }
+        """)
+        back_btn.clicked.connect(self.go_home)
+        
+        # Refresh Button
+        self.btn_refresh = QPushButton()
+        self.btn_refresh.setCursor(Qt.PointingHandCursor)
+        self.btn_refresh.setFixedSize(30, 30)
+        self.btn_refresh.setToolTip("Refresh Folder")
+        
+        refresh_icon_path = resource_path("assets/refresh.png")
+        if os.path.exists(refresh_icon_path):
+            self.btn_refresh.setIcon(QIcon(refresh_icon_path))
+            self.btn_refresh.setIconSize(QSize(16, 16))
+        else:
+            self.btn_refresh.setText("⟳")
+            
+        self.btn_refresh.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                border-radius: 4px;
+            }
+            QPushButton:hover { background-color: #E5E7EB; }
+            QPushButton:pressed { background-color: #D1D5DB; }
+        """)
+        self.btn_refresh.clicked.connect(self.reload_scan)
+        
+        # Address Bar (Path)
+        self.path_bar = AddressBar("/path/to/project")
+        self.path_bar.setReadOnly(False)
+        self.path_bar.setStyleSheet("""
+            QLineEdit {
+                background-color: #F8F9FA;
+                border: 1px solid #D1D5DB;
+                border-radius: 4px;
+                padding: 4px 10px;
+                font-family: 'Segoe UI', sans-serif;
+                font-size: 13px;
+                color: #374151;
+            }
+            QLineEdit:hover { border-color: #9CA3AF; }
+            QLineEdit:focus { 
+                border: 1px solid #007AFF;
+                background-color: #FFFFFF;
+            }
+        """)
+        
+        # Search Bar
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search...")
+        self.search_bar.setFixedWidth(240) 
+        self.search_bar.setClearButtonEnabled(False) # Disable native, use custom
+        
+        # Actions Setup (Order matters for visual stacking)
+        # We want: [ Text ... (Clear) (Search) ]
+        # For TrailingPosition: First added is usually Rightmost? Or inner?
+        # PyQt behaviour: Actions are stacked. Let's add Search (Permanent) first, then Clear (Conditional).
+        
+        # 1. Search Icon (Rightmost)
+        search_icon_path = resource_path("assets/search.png")
+        if os.path.exists(search_icon_path):
+            self.search_bar.addAction(QIcon(search_icon_path), QLineEdit.TrailingPosition)
+            
+        # 2. Custom Clear Action (Left of search icon)
+        clear_icon_path = resource_path("assets/clear.png")
+        self.act_clear = QAction(self.search_bar)
+        if os.path.exists(clear_icon_path):
+            # Resize icon to standard toolbar size (16x16) for crisp look
+            pix = QPixmap(clear_icon_path)
+            scaled = pix.scaled(16, 16, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.act_clear.setIcon(QIcon(scaled))
+        else:
+            self.act_clear.setText("✕")
+        
+        self.act_clear.triggered.connect(self.search_bar.clear)
+        self.search_bar.addAction(self.act_clear, QLineEdit.TrailingPosition)
+        self.act_clear.setVisible(False) # Ensure hidden initially THIS IS CRITICAL
+
+        self.search_bar.setStyleSheet("""
+            QLineEdit {
+                border: 1px solid #D1D5DB;
+                border-radius: 4px; 
+                padding: 4px 10px;
+                padding-right: 48px;
+                background-color: #F8F9FA;
+                font-size: 13px;
+                color: #111827;
+                font-family: 'Segoe UI', sans-serif;
+            }
+            QLineEdit:hover { border-color: #9CA3AF; }
+            QLineEdit:focus {
+                border: 1px solid #007AFF; 
+                background-color: #FFFFFF;
+            }
+        """)
+        
+        def on_search_changed(text):
+            self.tree.filter_items(text)
+            self.act_clear.setVisible(bool(text))
+            
+        self.search_bar.textChanged.connect(on_search_changed)
+        
+        # Add to Layout
+        header_layout.addWidget(back_btn)
+        header_layout.addWidget(self.btn_refresh)
+        header_layout.addWidget(self.path_bar, 1) # Expand address bar
+        header_layout.addWidget(self.search_bar)
+        
+        layout.addWidget(header_container)
+        
+        # --- Content Area with Splitter (VS Code-like layout) ---
+        self.content_splitter = QSplitter(Qt.Horizontal)
+        self.content_splitter.setHandleWidth(1)
+        self.content_splitter.setStyleSheet("""
+            QSplitter::handle {
+                background-color: #E5E7EB;
+            }
+            QSplitter::handle:hover {
+                background-color: #007AFF;
+            }
+        """)
+        
+        # Left Panel: Tree View (Sidebar)
+        tree_container = QFrame()
+        tree_container.setStyleSheet("background-color: #F8F9FA; border-right: 1px solid #E5E7EB;")
+        
+        tree_layout = QVBoxLayout(tree_container)
+        tree_layout.setContentsMargins(0, 0, 0, 0)
+        tree_layout.setSpacing(0)
+        
+        # Content (Tree)
+        self.tree = FileTreeWidget()
+        self.tree.filePreviewRequested.connect(self.preview_in_canvas)
+
+        # Find in files, below the tree (hidden until Ctrl+Shift+F)
+        self.content_search = ContentSearchPanel(data_getter=lambda: self.current_data)
+        self.content_search.hitActivated.connect(self._open_content_hit)
+        self.content_search.closeRequested.connect(self.close_content_search)
+        self.content_search.hide()
+
+        self.sidebar_splitter = QSplitter(Qt.Vertical)
+        self.sidebar_splitter.setHandleWidth(1)
+        self.sidebar_splitter.addWidget(self.tree)
+        self.sidebar_splitter.addWidget(self.content_search)
+        tree_layout.addWidget(self.sidebar_splitter)
+
+        # Ctrl+P: fuzzy "go to file"; Ctrl+Shift+F: find in files
+        QShortcut(QKeySequence("Ctrl+P"), self, activated=self.open_quick_open)
+        QShortcut(QKeySequence("Ctrl+Shift+F"), self, activated=self.open_content_search)
+        
+        # Right Panel: Canvas Preview (VS Code-like editor)
+        preview_container = QFrame()
+        preview_container.setStyleSheet("background-color: #FFFFFF;")
+        
+        preview_layout = QVBoxLayout(preview_container)
+        preview_layout.setContentsMargins(0, 0, 0, 0)
+        preview_layout.setSpacing(0)
+        
+        self.canvas_preview = CanvasPreview()
+        preview_layout.addWidget(self.canvas_preview)
+        
+        # Add panels to splitter
+        self.content_splitter.addWidget(tree_container)
+        self.content_splitter.addWidget(preview_container)
+        
+        # Set initial sizes (40% tree, 60% canvas)
+        self.content_splitter.setSizes([140, 420])
+        
+        # Add splitter with stretch to fill available space
+        layout.addWidget(self.content_splitter, 1)  # stretch=1 to fill height
+        
+        # Guide Label (Placed above the export bar border)
+        lbl_guide = QLabel("Select export formats (Multiple selection allowed)")
+        lbl_guide.setStyleSheet("font-size: 13px; font-weight: 500; color: #6B7280; margin-left: 12px; margin-bottom: 2px;")
+
+        # --- Export Action Bar (Bottom) ---
+        export_container = QFrame()
+        export_container.setFixedHeight(72)
+        export_container.setStyleSheet("""
+            QFrame {
+                background-color: #FFFFFF;
+                border: 1px solid #E5E7EB;
+                border-radius: 8px;
+            }
+        """)
+        
+        # Main Layout for Bar
+        bar_layout = QHBoxLayout(export_container)
+        bar_layout.setContentsMargins(24, 12, 24, 12)
+        bar_layout.setSpacing(12)
+        
+        # Label
+        lbl_format = QLabel("Format:")
+        lbl_format.setStyleSheet("font-size: 13px; font-weight: 600; color: #6B7280; border: none;")
+        bar_layout.addWidget(lbl_format)
+        
+        # Toggle Chips Logic
+        self.export_buttons = {}
+        
+        def create_chip(text, item_id, tooltip=""):
+            btn = QPushButton(text)
+            btn.setCheckable(True)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setMinimumHeight(32)
+            if tooltip:
+                btn.setToolTip(tooltip)
+            btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #FFFFFF;
+                    border: 1px solid #D1D5DB;
+                    border-radius: 6px;
+                    padding: 4px 16px;
+                    color: #374151;
+                    font-weight: 500;
+                    font-size: 13px;
+                    outline: none;
+                }
+                QPushButton:hover {
+                    background-color: #F9FAFB;
+                    border-color: #9CA3AF;
+                }
+                QPushButton:checked {
+                    background-color: #007AFF;
+                    border: 1px solid #0069D9;
+                    color: #FFFFFF;
+                    font-weight: 600;
+                }
+            """)
+            self.export_buttons[item_id] = btn
+            return btn
+
+        # Create Options
+        btn_full = create_chip("Full Structure", "txt_full", "Export full directory structure including all file contents.")
+        btn_tree = create_chip("Tree Only", "txt_tree", "Export only the directory structure view (no file contents).")
+        btn_json = create_chip("JSON", "json", "Export structure and file data in a machine-readable JSON format.")
+        btn_pdf = create_chip("PDF", "pdf", "Export structure and contents as a formatted PDF document.")
+        btn_parts = create_chip("Split Parts", "txt_shards", "Export full contents split into parts that each fit the selected model's context window.")
+        btn_best = create_chip("Best Fit", "txt_budget", "Export the most relevant files that fit the selected model's context window.")
+
+        # Target model for "Split Parts" / "Best Fit" (shown only while one of them is checked)
+        self.shard_model_combo = QComboBox()
+        self.shard_model_combo.setCursor(Qt.PointingHandCursor)
+        self.shard_model_combo.setMinimumHeight(32)
+        self.shard_model_combo.setToolTip("Exports are sized to fit this model's context window (10% kept free for your prompt).")
+        self.shard_model_combo.setStyleSheet("""
+            QComboBox {
+                background-color: #FFFFFF;
+                border: 1px solid #D1D5DB;
+                border-radius: 6px;
+                padding: 4px 10px;
+                color: #374151;
+                font-size: 13px;
+            }
+            QComboBox:hover { border-color: #9CA3AF; }
+        """)
+        for model in MODELS:
+            self.shard_model_combo.addItem(f"{model.name} ({model.max_tokens // 1000:,}K)", model.name)
+        saved_model = self.shard_model_combo.findData(SettingsManager().get_shard_target_model())
+        self.shard_model_combo.setCurrentIndex(max(0, saved_model))
+        self.shard_model_combo.currentIndexChanged.connect(
+            lambda: SettingsManager().set_shard_target_model(self.shard_model_combo.currentData())
+        )
+
+        # Order of the file sections in exports with contents (shown only while one is checked)
+        self.file_order_combo = QComboBox()
+        self.file_order_combo.setCursor(Qt.PointingHandCursor)
+        self.file_order_combo.setMinimumHeight(32)
+        self.file_order_combo.setToolTip("Order of the files in exports with file contents.")
+        self.file_order_combo.setStyleSheet(self.shard_model_combo.styleSheet())
+        for order, label in (
+            (BREADTH_FIRST, "Folder by folder"),
+            (DEPTH_FIRST, "Tree order"),
+            (PATH_SORTED, "By path"),
+            (SMALLEST_FIRST, "Smallest first"),
+            (RECENT_FIRST, "Newest first"),
+        ):
+            self.file_order_combo.addItem(label, order)
+        saved_order = self.file_order_combo.findData(SettingsManager().get_export_file_order())
+        self.file_order_combo.setCurrentIndex(max(0, saved_order))
+        self.file_order_combo.currentIndexChanged.connect(
+            lambda: SettingsManager().set_export_file_order(self.file_order_combo.currentData())
+        )
+
+        # Initial States from Settings
+        default_formats = SettingsManager().get_default_export_formats()
+        for fmt_id, btn in self.export_buttons.items():
+            btn.setChecked(fmt_id in default_formats)
+        
+        bar_layout.addWidget(btn_full)
+        bar_layout.addWidget(btn_tree)
+        bar_layout.addWidget(btn_json)
+        bar_layout.addWidget(btn_pdf)
+        bar_layout.addWidget(btn_parts)
+        bar_layout.addWidget(btn_best)
+        bar_layout.addWidget(self.shard_model_combo)
+        bar_layout.addWidget(self.file_order_combo)
+
+        def sync_model_combo():
+            self.shard_model_combo.setVisible(btn_parts.isChecked() or btn_best.isChecked())
+            self.file_order_combo.setVisible(
+                btn_full.isChecked() or btn_pdf.isChecked() or btn_parts.isChecked() or btn_best.isChecked()
+            )
+        sync_model_combo()
+        btn_full.toggled.connect(sync_model_combo)
+        btn_pdf.toggled.connect(sync_model_combo)
+        btn_parts.toggled.connect(sync_model_combo)
+        btn_best.toggled.connect(sync_model_combo)
+        
+        # Spacer
+        bar_layout.addStretch()
+        
+        # "Token Estimate" dropdown button - Modularized
+        from src.frontend.components.token_estimate_button import TokenEstimateButton
+        self.token_btn = TokenEstimateButton(
+            parent=export_container,
+            data_getter=lambda: self.current_data,
+            format_getter=self.get_selected_export_formats
+        )
+        bar_layout.addWidget(self.token_btn)
+        self.token_btn.estimateUpdated.connect(self.tree.refresh_token_column)
+        
+        # Connect Toggles to Live Update
+        for btn in self.export_buttons.values():
+            btn.toggled.connect(lambda: self.token_btn.update_estimate())
+        
+        # Spacer padding
+        bar_layout.addSpacing(12)
+
+        # Export Button (Right)
+        self.export_btn = QPushButton("Export Files")
+        self.export_btn.setCursor(Qt.PointingHandCursor)
+        self.export_btn.setFixedSize(140, 40)
+        
+        export_icon_path = resource_path("assets/export.png")
+        if os.path.exists(export_icon_path):
+            self.export_btn.setIcon(QIcon(export_icon_path))
+            self.export_btn.setIconSize(QSize(18, 18))
+
+        self.export_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #007AFF;
+                color: white;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+                padding-left: 20px;
+                padding-right: 20px;
+                border: none;
+            }
+            QPushButton:hover { background-color: #0069D9; }
+            QPushButton:pressed { background-color: #0056B3; }
+        """)
+        self.export_btn.clicked.connect(self.export_current_data)
+        
+        bar_layout.addWidget(self.export_btn)
+        
+        layout.addWidget(lbl_guide)
+        layout.addWidget(export_container)
+        
+
+        
+        self.stack.addWidget(self.result_page)
+
+    def browse_folder(self):
+        path = QFileDialog.getExistingDirectory(self, "Select Project Folder")
+        if path:
+            self.on_folder_ready(path)
+
+    def get_abs_path_from_node(self, node_or_path):
+        """
+        Convert any node/path input into a valid absolute filesystem path.
+        This is the ONLY function allowed to touch OS paths.
+        """
+
+        if not node_or_path:
+            return None
+
+        # Case 1: full node dict
+        if isinstance(node_or_path, dict):
+            rel_path = node_or_path.get("path")
+        else:
+            rel_path = node_or_path
+
+        if not rel_path:
+            return None
+
+        # Already absolute (safety)
+        if os.path.isabs(rel_path):
+            return os.path.normpath(rel_path)
+
+        # Root folder itself
+        if not self.selected_folder_path:
+            return None
+
+        abs_path = os.path.normpath(
+            os.path.join(self.selected_folder_path, rel_path)
+        )
+
+        return abs_path
+
+    def reveal_in_explorer(self, node_or_path):
+        abs_path = self.get_abs_path_from_node(node_or_path)
+
+        if not abs_path:
+            QMessageBox.warning(self, "Not Found", "Invalid path.")
+            return
+
+        if not os.path.exists(abs_path):
+            QMessageBox.warning(
+                self,
+                "Not Found",
+                f"Path does not exist:\n{abs_path}"
+            )
+            return
+
+        try:
+            if platform.system() == "Windows":
+                if os.path.isdir(abs_path):
+                    subprocess.Popen(["explorer", abs_path])
+                else:
+                    subprocess.Popen(
+                        ["explorer", "/select,", abs_path]
+                    )
+
+            elif platform.system() == "Darwin":
+                subprocess.Popen(["open", "-R", abs_path])
+
+            else:
+                folder = abs_path if os.path.isdir(abs_path) else os.path.dirname(abs_path)
+                subprocess.Popen(["xdg-open", folder])
+
+        except Exception as e:
+            QMessageBox.critical(self, "Reveal Failed", str(e))
+            
+    def open_file_external(self, node_or_path):
+        abs_path = self.get_abs_path_from_node(node_or_path)
+
+        if not abs_path or not os.path.exists(abs_path):
+            QMessageBox.warning(self, "Not Found", "File does not exist.")
+            return
+
+        try:
+            if platform.system() == "Windows":
+                os.startfile(abs_path)
+            elif platform.system() == "Darwin":
+                subprocess.Popen(["open", abs_path])
+            else:
+                subprocess.Popen(["xdg-open", abs_path])
+        except Exception as e:
+            QMessageBox.critical(self, "Open Failed", str(e))
+
+    # preview_file_internal removed as it is legacy code replaced by canvas_preview
+
+    def preview_in_canvas(self, file_node):
+        """
+        Preview file content in the canvas panel (VS Code-like).
+        This is called when a file is clicked in the tree.
+        """
+        if not file_node:
+            self.canvas_preview.show_empty()
+            return
+        
+        abs_path = self.get_abs_path_from_node(file_node)
+        self.canvas_preview.preview_file(file_node, abs_path)
+        
+        # Start watching this file for content changes
+        if abs_path:
+            self.watcher.watch_file(abs_path)
+
+    def open_quick_open(self):
+        """Fuzzy-find a file by its relative path and open it in the preview."""
+        if not self.current_data:
+            return
+        dialog = QuickOpenDialog(search_index(self.current_data), self)
+        dialog.fileChosen.connect(self._open_quick_open_result)
+        dialog.exec_()
+
+    def _open_quick_open_result(self, node_id):
+        if not self.current_data:
+            return
+        self.preview_in_canvas(node_table(self.current_data).node(node_id))
+        self.tree.reveal_node(node_id)
+
+    def open_content_search(self):
+        """Show the find-in-files panel, seeded with the editor's selected text."""
+        if not self.current_data:
+            return
+        selected = ""
+        editor = self.canvas_preview.tabs.currentWidget()
+        if hasattr(editor, 'selectedText'):
+            selected = editor.selectedText()
+        if not self.content_search.isVisible():
+            self.content_search.show()
+            self.sidebar_splitter.setSizes([1, 1])
+        self.content_search.focus_input(selected if selected and '\n' not in selected else None)
+
+    def close_content_search(self):
+        self.content_search.hide()
+        self.tree.setFocus()
+
+    def _open_content_hit(self, node_id, line, column, length):
+        if not self.current_data:
+            return
+        node = node_table(self.current_data).node(node_id)
+        self.preview_in_canvas(node)
+        self.canvas_preview.go_to_line(self.get_abs_path_from_node(node) or node.get('name'), line, column, length)
+
+    def _start_content_index(self, data, previous=None):
+        """Index the new scan's file contents in the background (changed files only after a rescan)."""
+        if self.content_index_thread is not None and self.content_index_thread.isRunning():
+            # One build at a time: the next one reuses the index this one is still syncing
+            self._content_index_pending = (data, self.content_index_thread.data)
+            return
+        thread = ContentIndexThread(data, previous, self)
+        thread.finished.connect(self._on_content_index_finished)
+        self.content_index_thread = thread
+        thread.start()
+
+    def _on_content_index_finished(self):
+        thread, self.content_index_thread = self.content_index_thread, None
+        if thread is not None:
+            thread.deleteLater()
+        pending, self._content_index_pending = self._content_index_pending, None
+        if pending is not None:
+            self._start_content_index(*pending)
+        else:
+            self.content_search.refresh()
+
+    def start_scan_loader(self):
+        self.drop_zone.start_scan_loader()
+
+    def stop_scan_loader(self):
+        self.drop_zone.stop_scan_loader()
+
+    def start_scan(self, path):
+        if not path:
+            # Cleared state
+            self.selected_folder_path = None
+            return
+
+        self.selected_folder_path = path
+
+        self.drop_zone.setEnabled(False)
+        self.start_scan_loader()
+        
+        self.path_bar.setText(path)
+        self.path_bar.setCursorPosition(0) # Reset scroll code? No simply show start.
+        
+        # Prepare ignore manager (Ensure patterns are fresh if modified recently)
+        # In this architecture, ignore_manager tracks its own state, so we just pass it.
+        # Use simple pattern refresh if needed, but manager.user_patterns is live.
+        self.ignore_manager.load_patterns() # Reload just in case external edit happened? Optional.
+        
+        # Threading
+        self.scan_thread = ScanThread(path, self.ignore_manager)
+        self.scan_thread.scan_finished.connect(self.on_scan_finished)
+        self.scan_thread.progress_update.connect(self.on_scan_progress)
+        self.scan_thread.start()
+        
+        # Update Button to Pause Mode
+        self.btn_start.setEnabled(True) # Keep enabled for Pause action
+        self.btn_start.setText("Pause")
+
+    def on_scan_progress(self, current, total):
+        self.drop_zone.set_scan_progress(current, total)
+
+    def on_scan_finished(self, data):
+        self._start_content_index(data, self.current_data)
+        self.current_data = data
+        self.tree.populate(data)
+        
+        # Start watching the project root
+        if self.selected_folder_path:
+            self.watcher.start_watching_project(self.selected_folder_path)
+        
+        if 'name' in data:
+             self.search_bar.setPlaceholderText(f"Search {data['name']}")
+        
+        # Reset Home State
+        self.drop_zone.setEnabled(True)
+        self.stop_scan_loader()
+        self.btn_start.setText("Start Scan") # Reset button text
+        
+        # Switch View FIRST (before animation starts)
+        self.stack.setCurrentWidget(self.result_page)
+        
+        # Smart resize for tree view + Unlock (animate AFTER view switch)
+        self.animate_resize(*self.SIZE_RESULT, callback=lambda: self.unlock_window(min_width=620, min_height=480))
+
+        # Trigger initial estimate
+        self.token_btn.update_estimate()
+
+    def go_home(self):
+        self.stack.setCurrentWidget(self.home_page)
+        # self.current_data = None  <-- REMOVED to persist session
+        # self.tree.clear()         <-- REMOVED to persist session
+        
+        # Restore loaded state if folder is still selected
+        if self.selected_folder_path:
+            self.drop_zone.set_loaded(self.selected_folder_path)
+        else:
+            self.drop_zone.clear_loaded()
+
+        # Respect current toggle state for height
+        target_height = self.HOME_HEIGHT_ADV if self.home_advanced_enabled else self.HOME_HEIGHT
+        self.animate_resize(self.HOME_WIDTH, target_height, lock_after=True)
+
+    def toggle_advanced_ignore(self, checked):
+        if checked == self.home_advanced_enabled:
+            return
+
+        self.home_advanced_enabled = checked
+        
+        # 1. Animate Widget Height (Smooth content reveal)
+        self.animate_advanced_panel(checked) 
+        
+        # 2. Animate Window Height (Smooth container expansion)
+        target_height = self.HOME_HEIGHT_ADV if checked else self.HOME_HEIGHT
+        
+        # We must maintain current position and width
+        current_rect = self.geometry()
+        target_rect = QRect(
+            current_rect.x(), 
+            current_rect.y(), 
+            self.HOME_WIDTH, 
+            target_height
+        )
+        
+        
+        # 🔒 LOCK WIDTH STRICTLY
+        # Do NOT use _clear_size_constraints() here because it unlocks width.
+        # We want to allow HEIGHT change, but FORBID WIDTH change.
+        self.setFixedWidth(self.HOME_WIDTH)
+        self.setMinimumHeight(0)
+        self.setMaximumHeight(16777215)
+        
+        self.animate_window(target_rect, on_finished=lambda: self.setFixedSize(self.HOME_WIDTH, target_height))
+
+    def export_current_data(self):
+        if not self.current_data:
+            return
+            
+        formats = []
+        if self.export_buttons["txt_full"].isChecked(): formats.append("txt_full")
+        if self.export_buttons["txt_tree"].isChecked(): formats.append("txt_tree")
+        if self.export_buttons["json"].isChecked(): formats.append("json")
+        if self.export_buttons["pdf"].isChecked(): formats.append("pdf")
+        if self.export_buttons["txt_shards"].isChecked(): formats.append("txt_shards")
+        if self.export_buttons["txt_budget"].isChecked(): formats.append("txt_budget")
+        
+        if not formats:
+            QMessageBox.warning(self, "No Format Selected", "Please select at least one export format.")
+            return
+
+        # --- SMART DESTINATION LOGIC ---
+        settings = SettingsManager()
+        source_folder = self.selected_folder_path
+        # Use saved default only if toggle is ON
+        default_path = settings.get_default_export_path(source_folder) if settings.get_smart_toggle() else None
+        
+        # --- USER INTENT DETECTION ---
+        # If a default exists, check if manual history has shifted while toggle was off
+        if default_path and settings.get_smart_toggle():
+            history = settings.get_folder_history(source_folder)
+            # If user manually used a DIFFERENT path 3+ times
+            if history.get("count", 0) >= 3:
+                last_path = history.get("last_path")
+                if last_path and os.path.normpath(last_path).lower() != os.path.normpath(default_path).lower():
+                    if os.path.exists(last_path):
+                        from src.frontend.components.dialogs.smart_destination_dialog import SmartDestinationDialog
+                        smart_dlg = SmartDestinationDialog(last_path, self)
+                        if smart_dlg.exec_() == QDialog.Accepted and smart_dlg.remember:
+                            settings.set_default_export_path(source_folder, last_path)
+                            default_path = last_path
+        
+        target_dir = None
+        
+        if default_path and os.path.exists(default_path):
+            target_dir = default_path
+        else:
+            target_dir = QFileDialog.getExistingDirectory(self, "Select Export Directory")
+        
+        if target_dir:
+            # Check for large project
+            # Check for large project
+            # Stats are now centrally populated by scanner
+            total_files = self.current_data.get('stats', {}).get('files', 0)
+
+            if total_files > 3000:
+                reply = QMessageBox.question(
+                    self, 
+                    "Large Export Warning", 
+                    f"You are about to export {total_files:,} files.\nThis might take a while. Continue?",
+                    QMessageBox.Yes | QMessageBox.No, 
+                    QMessageBox.No
+                )
+                if reply == QMessageBox.No:
+                    return
+
+            # Show progress feedback for large exports
+            self.setCursor(Qt.WaitCursor)
+            QApplication.processEvents()  # Ensure cursor updates
+            
+            try:
+                files = export_data(
+                    self.current_data, target_dir, formats,
+                    order=settings.get_export_file_order(),
+                    token_budget=resolve_token_budget(self.shard_model_combo.currentData()),
+                    ranking_weights=RankingWeights.from_dict(settings.get_ranking_weights())
+                )
+                
+                self.unsetCursor()
+                
+                if files:
+                    # Success Dialog
+                    # Check setting using JSON manager
+                    if not SettingsManager().get("suppress_success_dialog", False):
+                        from src.frontend.components.dialogs.export_result_dialog import ExportResultDialog
+                        dialog = ExportResultDialog(target_dir, self)
+                        dialog.exec_()
+                    else:
+                        # Feedback: Green Export Button
+                        self.show_export_success_feedback()
+                else:
+                    QMessageBox.warning(self, "Export Warning", "No files were exported.")
+                
+                # --- SMART DESTINATION UPDATE ---
+                # Track manual history every time user picks a folder (background learning)
+                if not default_path and target_dir:
+                    new_count = settings.update_export_history(source_folder, target_dir)
+                    # Proactively ask to set default IF toggle is on and it's a clear favorite
+                    if settings.get_smart_toggle() and new_count >= 5:
+                        from src.frontend.components.dialogs.smart_destination_dialog import SmartDestinationDialog
+                        smart_dlg = SmartDestinationDialog(target_dir, self)
+                        if smart_dlg.exec_() == QDialog.Accepted and smart_dlg.remember:
+                            settings.set_default_export_path(source_folder, target_dir)
+                            # Optional: Feedback "Saved as default"
+                # --- SMART FORMAT UPDATE ---
+                current_defaults = settings.get_default_export_formats()
+                if sorted(formats) != sorted(current_defaults):
+                    usage_count = settings.update_format_history(formats)
+                    if usage_count >= 3:
+                        msg_formats = ", ".join([f.split('_')[-1].upper() for f in formats])
+                        reply = QMessageBox.question(
+                            self,
+                            "Update Default Formats",
+                            f"I noticed you've exported as {msg_formats} several times now.\n\n"
+                            "Would you like to make this your default export configuration?",
+                            QMessageBox.Yes | QMessageBox.No,
+                            QMessageBox.Yes
+                        )
+                        if reply == QMessageBox.Yes:
+                            settings.set_default_export_formats(formats)
+            except Exception as e:
+                self.unsetCursor()
+                # Show detailed error for debugging
+                error_msg = str(e)
+                if len(error_msg) > 500:
+                    error_msg = error_msg[:500] + "..."
+                QMessageBox.critical(
+                    self, 
+                    "Export Error", 
+                    f"Export failed:\n\n{error_msg}\n\nTip: For very large projects, try exporting Tree/Text only."
+                )
+
+    def apply_added_ignore_patterns(self, patterns):
+        """New ignore patterns only hide nodes, so prune the loaded scan instead of re-scanning it."""
+        if not self.current_data:
+            return
+        self.tree.fast_remove_matching(patterns)
+
+    def reload_scan(self):
+        """Re-scan the currently selected folder without changing view"""
+        if not self.selected_folder_path:
+            return
+            
+        # UI Feedback
+        self.tree.setDisabled(True)
+        self.btn_refresh.setDisabled(True)
+        self.setCursor(Qt.WaitCursor)
+        
+        # Create new scan thread
+        self.scan_thread = ScanThread(self.selected_folder_path, self.ignore_manager)
+        
+        def on_reload_finished(data):
+            carry_over_tokens(self.current_data, data)
+            self._start_content_index(data, self.current_data)
+            self.current_data = data
+            self.tree.populate(data)
+            self.tree.setDisabled(False)
+            self.btn_refresh.setDisabled(False)
+            self.unsetCursor()
+            
+            # Re-apply filter if search text exists
+            search_text = self.search_bar.text()
+            if search_text:
+                self.tree.filter_items(search_text)
+            
+            # Update estimate on reload
+            self.token_btn.update_estimate()
+                
+        self.scan_thread.scan_finished.connect(on_reload_finished)
+        self.scan_thread.start()
+
+    def preview_file(self, path):
+        """Open file in default system application"""
+        if not os.path.exists(path):
+            return
+            
+        try:
+            if platform.system() == "Windows":
+                os.startfile(path)
+            elif platform.system() == "Darwin":
+                subprocess.run(["open", path], check=False)
+            else:
+                subprocess.run(["xdg-open", path], check=False)
+        except Exception as e:
+            print(f"Error opening file: {e}")
+
+    def export_folder(self, abs_path, tree_only=False):
+        """Export a specific sub-folder"""
+        if not os.path.exists(abs_path):
+            return
+
+        target_dir = QFileDialog.getExistingDirectory(self, f"Select Export Directory for '{os.path.basename(abs_path)}'")
+        if not target_dir:
+            return
+
+        # We need to scan just this folder to get its structure
+        self.setCursor(Qt.WaitCursor)
+        
+        # NOTE: We run this synchronously for simplicity since it's a sub-folder export, 
+        # or we could use another thread. For now, sync is acceptable for a "Save As" type action 
+        # unless folder is huge. Let's reuse scan logic but possibly sync or quick thread.
+        # To match architecture, let's just do it directly if we trust scanner is fast enough,
+        # or spin a thread if we want to be safe. 
+        # Given "safe, fast, predictable" goal, let's use a quick local scanner call.
+        
+        try:
+            # Re-import here to avoid circularity if any, though likely fine at top
+            from src.backend.scanner import scan_directory_structure
+            
+            sub_data = scan_directory_structure(abs_path, self.ignore_manager)
+            
+            formats = ["txt_tree"] if tree_only else ["txt_full"]
+            # If user wants customized "Tree + Code", maybe they want JSON/PDF too?
+            # The prompt says: "Tree Only" vs "Tree + Code".
+            # "Tree + Code" implies likely the standard full text dump.
+            
+            files = export_data(sub_data, target_dir, formats, order=SettingsManager().get_export_file_order())
+            self.unsetCursor()
+            
+            # New Custom Dialog
+            if not SettingsManager().get("suppress_success_dialog", False):
+                from src.frontend.components.dialogs.export_result_dialog import ExportResultDialog
+                dialog = ExportResultDialog(target_dir, self)
+                dialog.exec_()
+                
+        except Exception as e:
+            self.unsetCursor()
+            QMessageBox.critical(self, "Export Error", str(e))
+
+    def get_selected_export_formats(self):
+        """Helper to get currently selected export formats for token estimation."""
+        if not hasattr(self, 'export_buttons'): 
+            return []
+        
+        formats = []
+        # Check keys against the IDs defined in create_chip
+        if self.export_buttons.get("txt_full") and self.export_buttons["txt_full"].isChecked(): 
+            formats.append("txt_full")
+        if self.export_buttons.get("txt_tree") and self.export_buttons["txt_tree"].isChecked(): 
+            formats.append("txt_tree")
+        if self.export_buttons.get("json") and self.export_buttons["json"].isChecked(): 
+            formats.append("json")
+        if self.export_buttons.get("pdf") and self.export_buttons["pdf"].isChecked(): 
+            formats.append("pdf")
+        if self.export_buttons.get("txt_shards") and self.export_buttons["txt_shards"].isChecked(): 
+            formats.append("txt_shards")
+        if self.export_buttons.get("txt_budget") and self.export_buttons["txt_budget"].isChecked(): 
+            formats.append("txt_budget")
+            
+        return formats
+
+    def _build_more_menu(self):
+        """Build the 'More' dropdown menu with About option."""
+        from PyQt5.QtWidgets import QMenu
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QColor
+        
+        more_menu = QMenu(self)
+        more_menu.setFixedWidth(260) # Increased width for better layout
+        
+        # Transparent background for rounded corners to work
+        more_menu.setAttribute(Qt.WA_TranslucentBackground)
+        more_menu.setWindowFlags(more_menu.windowFlags() | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
+        
+        more_menu.setStyleSheet("""
+            QMenu {
+                background-color: white;
+                border: 1px solid #E5E7EB;
+                border-radius: 8px;
+                padding: 4px 0;
+                margin: 0px; /* Important for no shadow overlap */
+            }
+            QMenu::item {
+                padding: 8px 12px; /* Reduced padding for better alignment */
+                color: #374151;
+                font-size: 13px;
+                font-weight: 500;
+                border-radius: 4px; /* Rounded highlight */
+                margin: 2px 4px; /* Space for rounded highlight */
+            }
+            QMenu::item:selected {
+                background-color: #F3F4F6;
+                color: #111827;
+            }
+            QMenu::icon {
+                padding-left: 4px;
+            }
+        """)
+        
+        # --- Notification Toggle ---
+        from PyQt5.QtWidgets import QWidgetAction, QLabel, QWidget
+        from src.frontend.components.toggle_switch import ToggleSwitch
+        
+        # Container for Toggle
+        toggle_container = QWidget()
+        toggle_container.setStyleSheet("background: transparent;")
+        toggle_layout = QHBoxLayout(toggle_container)
+        toggle_layout.setContentsMargins(12, 4, 12, 4) 
+        toggle_layout.setSpacing(8)
+        
+        # Label
+        lbl_notify = QLabel("Show Export Notification")
+        lbl_notify.setStyleSheet("color: #374151; font-size: 13px; font-weight: 500; border: none;")
+        
+        # Switch
+        switch_notify = ToggleSwitch()
+        switch_notify.setFixedSize(36, 20)
+        
+        # Set initial state
+        is_suppressed = SettingsManager().get("suppress_success_dialog", False)
+        switch_notify.setChecked(not is_suppressed)
+        
+        # Connect
+        def on_toggle_notify(checked):
+            SettingsManager().set("suppress_success_dialog", not checked)
+            if more_menu.isVisible():
+                more_menu.show() # Keeps menu open
+            
+        switch_notify.toggled.connect(on_toggle_notify)
+        
+        toggle_layout.addWidget(lbl_notify)
+        toggle_layout.addStretch()
+        toggle_layout.addWidget(switch_notify)
+        
+        # Add to Menu
+        toggle_action = QWidgetAction(more_menu)
+        toggle_action.setDefaultWidget(toggle_container)
+        more_menu.addAction(toggle_action)
+        
+        # --- Smart Destination Toggle ---
+        
+        # Container
+        smart_container = QWidget()
+        smart_container.setStyleSheet("background: transparent;")
+        smart_layout = QHBoxLayout(smart_container)
+        smart_layout.setContentsMargins(12, 4, 12, 4)
+        smart_layout.setSpacing(8)
+        
+        # Label
+        lbl_smart = QLabel("Smart Destination Selection")
+        lbl_smart.setStyleSheet("color: #374151; font-size: 13px; font-weight: 500; border: none;")
+        
+        # Switch
+        switch_smart = ToggleSwitch()
+        switch_smart.setFixedSize(36, 20)
+        
+        # Init State
+        switch_smart.setChecked(SettingsManager().get_smart_toggle())
+        
+        def on_toggle_smart(checked):
+            SettingsManager().set_smart_toggle(checked)
+            if more_menu.isVisible():
+                more_menu.show() # Keeps menu open
+                
+        switch_smart.toggled.connect(on_toggle_smart)
+        
+        smart_layout.addWidget(lbl_smart)
+        smart_layout.addStretch()
+        smart_layout.addWidget(switch_smart)
+        
+        smart_action = QWidgetAction(more_menu)
+        smart_action.setDefaultWidget(smart_container)
+        more_menu.addAction(smart_action)
+
+        more_menu.addSeparator()
+
+        # About Action (Moved to Bottom)
+        about_action = more_menu.addAction("About")
+        about_icon_path = resource_path("assets/information.png")
+        if os.path.exists(about_icon_path):
+            about_action.setIcon(QIcon(about_icon_path))
+        about_action.triggered.connect(self._show_about_dialog)
+
+        
+        self.btn_more.setMenu(more_menu)
+
+    def _show_about_dialog(self):
+        """Show the About dialog with app information."""
+        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
+        from PyQt5.QtCore import Qt
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("About")
+        dialog.setFixedWidth(340) # Slightly wider
+        # Remove fixed height to allow content to fit
+        
+        # Proper window flags for clean dialog
+        dialog.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint)
+        
+        layout = QVBoxLayout(dialog)
+        layout.setContentsMargins(24, 32, 24, 24)
+        layout.setSpacing(16)
+        
+        # Ensure dialog background is white
+        dialog.setStyleSheet("QDialog { background-color: white; }")
+        
+        # App Icon
+        icon_label = QLabel()
+        icon_path = resource_path("assets/app_icon.png")
+        if os.path.exists(icon_path):
+            pixmap = QPixmap(icon_path).scaled(56, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            icon_label.setPixmap(pixmap)
+        icon_label.setAlignment(Qt.AlignCenter)
+        icon_label.setStyleSheet("background: transparent; border: none;")
+        layout.addWidget(icon_label)
+        
+        # Container for text to ensure proper spacing
+        text_container = QVBoxLayout()
+        text_container.setSpacing(4)
+        
+        # App Name
+        name_label = QLabel("Crawlsee")
+        name_label.setStyleSheet("font-size: 22px; font-weight: 800; color: #111827; background: transparent; border: none;")
+        name_label.setAlignment(Qt.AlignCenter)
+        text_container.addWidget(name_label)
+        
+        # Version
+        version_label = QLabel("Version 1.0.0")
+        version_label.setStyleSheet("font-size: 13px; color: #6B7280; background: transparent; border: none;")
+        version_label.setAlignment(Qt.AlignCenter)
+        text_container.addWidget(version_label)
+        
+        layout.addLayout(text_container)
+        
+        # Description
+        desc_label = QLabel("A powerful tool to scan, visualize, and export\nproject directory structures for LLM context.")
+        desc_label.setStyleSheet("font-size: 13px; color: #4B5563; line-height: 1.4; background: transparent; border: none;")
+        desc_label.setAlignment(Qt.AlignCenter)
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        layout.addSpacing(8)
+        
+        # Developer Section with Custom PNG (Below label, larger)
+        dev_container = QVBoxLayout()
+        dev_container.setSpacing(8)
+        dev_container.setAlignment(Qt.AlignCenter)
+        
+        dev_text = QLabel("Developed by")
+        dev_text.setStyleSheet("font-size: 11px; color: #9CA3AF; font-weight: 600; background: transparent; border: none;")
+        dev_text.setAlignment(Qt.AlignCenter)
+        
+        dev_img_label = QLabel()
+        dev_img_path = resource_path("assets/AbdulKarim.png")
+        if os.path.exists(dev_img_path):
+            # Enlarge signature
+            dev_pixmap = QPixmap(dev_img_path).scaledToHeight(20, Qt.SmoothTransformation)
+            dev_img_label.setPixmap(dev_pixmap)
+        else:
+            dev_img_label.setText("Abdulkarim")
+            dev_img_label.setStyleSheet("font-size: 11px; color: #9CA3AF; font-weight: 600;")
+            
+        # Creative Tooltip (Name + Quote)
+        dev_img_label.setToolTip(
+            "<b>AbdulKarim</b><br/>"
+            "<i>\"A fantastic level of creativity is the bridge that turns<br/>"
+            "complex logic into an elegant masterpiece.\"</i>"
+        )
+            
+        dev_img_label.setAlignment(Qt.AlignCenter)
+        dev_container.addWidget(dev_text)
+        dev_container.addWidget(dev_img_label)
+        layout.addLayout(dev_container)
+        
+        layout.addStretch()
+        
+        # Close Button
+        close_btn = QPushButton("Close")
+        close_btn.setFixedSize(90, 36)
+        close_btn.setCursor(Qt.PointingHandCursor)
+        close_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #3B82F6;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: #2563EB;
+            }
+            QPushButton:pressed {
+                background-color: #1D4ED8;
+            }
+        """)
+        close_btn.clicked.connect(dialog.accept)
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_layout.addWidget(close_btn)
+        btn_layout.addStretch()
+        layout.addLayout(btn_layout)
+        
+        dialog.exec_()
+
+    def on_file_changed(self, path):
+        """Handle external file changes."""
+        # Safety check: if file was deleted, ignore
+        if not os.path.exists(path):
+            return
+
+        # Update Canvas Content if open
+        try:
+            if any(path.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.webp']):
+                if path in self.canvas_preview.open_files:
+                    self.canvas_preview.reload_file_content(path)
+            elif os.path.getsize(path) > MAX_FILE_SIZE:
+                # Too big to read here: a paged preview re-reads what it shows, and the scan never indexed it
+                if path in self.canvas_preview.open_files:
+                    self.canvas_preview.reload_file_content(path)
+                self._update_content_index(path, None)
+            else:
+                # Text file
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                except UnicodeDecodeError:
+                    return # Binary file?
+                if path in self.canvas_preview.open_files:
+                    self.canvas_preview.reload_file_content(path, content)
+                self._update_content_index(path, content)
+        except Exception as e:
+            print(f"Error reading changed file {path}: {e}")
+
+    def _update_content_index(self, path, content):
+        """Re-index one changed file for find in files (if the project's index is built)."""
+        data = self.current_data
+        index = data.get(CONTENT_INDEX_KEY) if data else None
+        if index is None or not data.get('abs_path'):
+            return
+        rel_path = os.path.relpath(os.path.abspath(path), data['abs_path'])
+        if index.update_file(rel_path, content):
+            self.content_search.refresh()
+
+    def on_directory_changed(self, path):
+        """Handle external directory structure changes."""
+        # 1. Check if project root still exists
+        if self.selected_folder_path and not os.path.exists(self.selected_folder_path):
+            # Project root deleted!
+            self._handle_project_disappeared()
+            return
+
+        # 2. Throttled reload
+        if not self.reload_cooldown_timer.isActive():
+            self.reload_cooldown_timer.start()
+
+    def _handle_project_disappeared(self):
+        """Cleanly reset UI when the active folder is deleted externally."""
+        self.selected_folder_path = None
+        self.current_data = None
+        self.tree.clear()
+        self.watcher.stop_watching_project()
+        
+        # Reset Home UI items
+        self.drop_zone.clear_loaded()
+        self.btn_start.setEnabled(False)
+        self.recent_widget.set_folders(load_recent()) # Refresh recent list
+        
+        self.go_home()
+        QMessageBox.warning(self, "Folder Disappeared", 
+                           "The currently opened folder has been deleted or moved externally.\n"
+                           "Application has been reset to the home screen.")
+
+    def quiet_reload_scan(self):
+        """Re-scan without blocking UI (for auto-updates)."""
+        if not self.selected_folder_path or not os.path.exists(self.selected_folder_path):
+            return
+            
+        # Avoid overlapping scans or interrupting active user scan
+        if self.scan_thread and self.scan_thread.isRunning():
+            return
+            
+        # We use a new thread instance
+        self.scan_thread = ScanThread(self.selected_folder_path, self.ignore_manager)
+        
+        def on_finished(data):
+            # Check if we still care about this path (the root's 'path' is always '.')
+            if not self.selected_folder_path or os.path.normcase(data.get('abs_path', '')) != \
+                    os.path.normcase(os.path.abspath(self.selected_folder_path)):
+                return
+
+            carry_over_tokens(self.current_data, data)
+            self._start_content_index(data, self.current_data)
+            self.current_data = data
+            self.tree.populate(data)
+            
+            search_text = self.search_bar.text()
+            if search_text:
+                self.tree.filter_items(search_text)
+            
+            self.token_btn.update_estimate()
+                
+        self.scan_thread.scan_finished.connect(on_finished)
+        self.scan_thread.start()
+
+    def show_export_success_feedback(self):
+        """Temporarily changes the export button to green to indicate success."""
+        if not hasattr(self, 'export_btn'):
+            return
+
+        original_text = "Export Files"
+        original_style = """
+            QPushButton {
+                background-color: #007AFF;
+                color: white;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+                padding-left: 20px;
+                padding-right: 20px;
+                border: none;
+            }
+            QPushButton:hover { background-color: #0069D9; }
+            QPushButton:pressed { background-color: #0056B3; }
+        """
+        
+        success_style = """
+            QPushButton {
+                background-color: #10B981; /* Swift/Tailwind Emerald 500 */
+                color: white;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+                padding-left: 20px;
+                padding-right: 20px;
+                border: none;
+            }
+            QPushButton:hover { background-color: #059669; }
+            QPushButton:pressed { background-color: #047857; }
+        """
+
+        self.export_btn.setText("Exported!")
+        self.export_btn.setStyleSheet(success_style)
+        
+        # Keep the icon or use a checkmark if available. User asked for "the icon used in the exported files button".
+        export_icon_path = resource_path("assets/export.png")
+        if os.path.exists(export_icon_path):
+            self.export_btn.setIcon(QIcon(export_icon_path))
+        
+        # Revert after 2 seconds
+        QTimer.singleShot(2000, lambda: self._revert_export_btn(original_text, original_style))
+
+    def _revert_export_btn(self, text, style):
+        if not hasattr(self, 'export_btn'):
+            return
+            
+        self.export_btn.setText(text)
+        self.export_btn.setStyleSheet(style)
+        
+        # Restore Icon
+        export_icon_path = resource_path("assets/export.png")
+        if os.path.exists(export_icon_path):
+             self.export_btn.setIcon(QIcon(export_icon_path))